@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.geometry import Pointcloud
+
+# The number of faces of the synthetic grid meshes in the X and Y direction.
+# Point clouds have the same number of points as the grid meshes have vertices.
+SIZES = {
+    "small": 10,
+    "medium": 100,
+    "large": 300,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--problem-size",
+        action="append",
+        choices=sorted(SIZES),
+        help="Problem size(s) of the benchmarks. Defaults to small and medium.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        names = metafunc.config.getoption("problem_size") or ["small", "medium"]
+        metafunc.parametrize("size", [SIZES[name] for name in names], ids=names)
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    machine_info["compas"] = {
+        "version": compas.__version__,
+        "numpy": numpy.__version__ if numpy else None,
+    }
+
+
+@pytest.fixture
+def grid(size):
+    return Mesh.from_meshgrid(dx=10, nx=size)
+
+
+@pytest.fixture
+def cloud(size):
+    return Pointcloud.from_bounds(10, 10, 10, (size + 1) ** 2)
+
+
+@pytest.fixture
+def files(grid, tmp_path):
+    """Write the grid mesh to files in all supported formats."""
+    trimesh = grid.copy()
+    trimesh.quads_to_triangles()
+    paths = {name: os.path.join(str(tmp_path), name) for name in ("grid.obj", "grid.ply", "grid.stl", "grid_binary.stl")}
+    grid.to_obj(paths["grid.obj"])
+    grid.to_ply(paths["grid.ply"])
+    trimesh.to_stl(paths["grid.stl"])
+    trimesh.to_stl(paths["grid_binary.stl"], binary=True)
+    return paths
@@ -0,0 +1,112 @@
+import pytest
+
+import compas
+from compas.data import Data
+from compas.data import binary_dumps
+from compas.data import binary_loads
+from compas.datastructures import CompactMesh
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
+from compas.datastructures.mesh.subdivision import mesh_subdivide_catmullclark
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_from_vertices_and_faces(benchmark, grid):
+    vertices, faces = grid.to_vertices_and_faces()
+    mesh = benchmark(Mesh.from_vertices_and_faces, vertices, faces)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_from_data(benchmark, grid):
+    data = grid.__data__
+    mesh = benchmark(Mesh.__from_data__, data)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_copy(benchmark, grid):
+    mesh = benchmark(grid.copy)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_copy_on_write(benchmark, grid):
+    mesh = benchmark(grid.copy, copy_on_write=True)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_sha256(benchmark, grid):
+    # the base implementation does not cache the digest
+    digest = benchmark(Data.sha256, grid)
+    assert digest == grid.sha256()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_sha256_cached(benchmark, grid):
+    mesh = grid.copy()
+    digest = mesh.sha256()
+    assert benchmark(mesh.sha256) == digest
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_subdivide_catmullclark(benchmark, grid):
+    mesh = benchmark(mesh_subdivide_catmullclark, grid, k=1)
+    assert mesh.number_of_faces() == 4 * grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="mesh")
+def test_mesh_faces_normals(benchmark, grid):
+    normals = benchmark(grid.faces_normals)
+    assert len(normals) == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="compactmesh")
+@pytest.mark.parametrize("cls", [Mesh, CompactMesh], ids=["Mesh", "CompactMesh"])
+def test_compactmesh_throughput(benchmark, grid, cls):
+    vertices, faces = grid.to_vertices_and_faces()
+
+    def build_and_query():
+        mesh = cls.from_vertices_and_faces(vertices, faces)
+        for face in mesh.faces():
+            mesh.face_area(face)
+        for vertex in mesh.vertices():
+            mesh.vertex_neighbors(vertex, ordered=True)
+        return mesh
+
+    mesh = benchmark(build_and_query)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="graph")
+def test_graph_from_lines(benchmark, grid):
+    lines = [grid.edge_coordinates(edge) for edge in grid.edges()]
+    graph = benchmark(Graph.from_lines, lines)
+    assert graph.number_of_edges() == grid.number_of_edges()
+
+
+@pytest.mark.benchmark(group="json")
+def test_json_dumps(benchmark, grid):
+    string = benchmark(compas.json_dumps, grid)
+    assert string
+
+
+@pytest.mark.benchmark(group="json")
+def test_json_loads(benchmark, grid):
+    string = compas.json_dumps(grid)
+    mesh = benchmark(compas.json_loads, string)
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="binary")
+def test_binary_dumps(benchmark, grid):
+    string = benchmark(binary_dumps, grid)
+    assert string
+
+
+@pytest.mark.benchmark(group="binary")
+def test_binary_loads(benchmark, grid):
+    string = binary_dumps(grid)
+    mesh = benchmark(binary_loads, string)
+    assert mesh.number_of_faces() == grid.number_of_faces()
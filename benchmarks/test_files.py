@@ -0,0 +1,39 @@
+import pytest
+
+from compas.datastructures import Mesh
+
+
+@pytest.mark.benchmark(group="files")
+def test_read_obj(benchmark, grid, files):
+    mesh = benchmark(Mesh.from_obj, files["grid.obj"])
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="files")
+def test_read_ply(benchmark, grid, files):
+    mesh = benchmark(Mesh.from_ply, files["grid.ply"])
+    assert mesh.number_of_faces() == grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="files")
+def test_read_stl_ascii(benchmark, grid, files):
+    mesh = benchmark(Mesh.from_stl, files["grid.stl"])
+    assert mesh.number_of_faces() == 2 * grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="files")
+def test_read_stl_binary(benchmark, grid, files):
+    mesh = benchmark(Mesh.from_stl, files["grid_binary.stl"])
+    assert mesh.number_of_faces() == 2 * grid.number_of_faces()
+
+
+@pytest.mark.benchmark(group="files")
+def test_write_obj(benchmark, grid, tmp_path):
+    benchmark(grid.to_obj, str(tmp_path / "grid.obj"))
+
+
+@pytest.mark.benchmark(group="files")
+def test_write_stl_binary(benchmark, grid, tmp_path):
+    trimesh = grid.copy()
+    trimesh.quads_to_triangles()
+    benchmark(trimesh.to_stl, str(tmp_path / "grid.stl"), binary=True)
@@ -0,0 +1,161 @@
+import random
+
+import pytest
+
+import compas
+from compas.geometry import Frame
+from compas.geometry import KDTree
+from compas.geometry import Line
+from compas.geometry import NurbsCurve
+from compas.geometry import NurbsSurface
+from compas.geometry import Rotation
+from compas.geometry import convex_hull
+from compas.geometry import transform_many
+from compas.geometry import transform_points
+from compas.tolerance import TOL
+
+
+@pytest.mark.benchmark(group="kdtree")
+def test_kdtree_build(benchmark, cloud):
+    tree = benchmark(KDTree, cloud)
+    assert len(tree) == len(cloud)
+
+
+@pytest.mark.benchmark(group="kdtree")
+def test_kdtree_nearest_neighbor(benchmark, cloud):
+    tree = KDTree(cloud)
+    points = cloud.points[:100]
+    result = benchmark(lambda: [tree.nearest_neighbor(point) for point in points])
+    assert all(distance == 0 for _, _, distance in result)
+
+
+@pytest.mark.benchmark(group="kdtree")
+def test_kdtree_nearest_neighbors_batch(benchmark, cloud):
+    tree = KDTree(cloud)
+    points = cloud.points[:100]
+    result = benchmark(tree.nearest_neighbors_batch, points, 10)
+    assert len(result) == len(points)
+
+
+@pytest.mark.benchmark(group="transformations")
+def test_transform_points(benchmark, cloud):
+    R = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    points = benchmark(transform_points, cloud.points, R)
+    assert len(points) == len(cloud)
+
+
+@pytest.mark.benchmark(group="transformations")
+def test_transform_points_numpy(benchmark, cloud):
+    numpy = pytest.importorskip("numpy")
+    from compas.geometry import transform_points_numpy
+
+    R = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    points = numpy.array(cloud.points)
+    result = benchmark(transform_points_numpy, points, R)
+    assert len(result) == len(cloud)
+
+
+@pytest.mark.benchmark(group="transformations")
+def test_transform_each(benchmark, cloud):
+    R = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    points = cloud.copy().points
+    benchmark(lambda: [point.transform(R) for point in points])
+
+
+@pytest.mark.benchmark(group="transformations")
+def test_transform_many(benchmark, cloud):
+    R = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    points = cloud.copy().points
+    benchmark(transform_many, points, R)
+
+
+@pytest.mark.benchmark(group="hull")
+def test_convex_hull(benchmark, cloud):
+    faces = benchmark(convex_hull, cloud.points)
+    assert faces
+
+
+@pytest.mark.benchmark(group="hull")
+def test_quickhull_numpy(benchmark, cloud):
+    numpy = pytest.importorskip("numpy")
+    from compas.geometry import quickhull_numpy
+
+    points = numpy.array(cloud.points)
+    faces = benchmark(quickhull_numpy, points)
+    assert faces
+
+
+@pytest.mark.benchmark(group="hull")
+def test_convex_hull_numpy(benchmark, cloud):
+    numpy = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    from compas.geometry import convex_hull_numpy
+
+    points = numpy.array(cloud.points)
+    _, faces = benchmark(convex_hull_numpy, points)
+    assert len(faces)
+
+
+@pytest.mark.benchmark(group="icp")
+def test_icp_numpy(benchmark, cloud):
+    numpy = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    from compas.geometry import Translation
+    from compas.geometry import icp_numpy
+
+    target = numpy.array(cloud.points)
+    T = Translation.from_vector([0.1, 0.2, 0.3]) * Rotation.from_axis_and_angle([0, 0, 1], 0.05)
+    source = numpy.array(cloud.transformed(T).points)
+    points, X = benchmark(icp_numpy, source, target, samples=1000, maxdistance=1.0, seed=0)
+    assert len(points) == len(cloud)
+
+
+@pytest.fixture(scope="module")
+def million_points():
+    generator = random.Random(0)
+    return [[generator.uniform(-100, 100) for _ in range(3)] for _ in range(1000000)]
+
+
+@pytest.mark.benchmark(group="geometric_keys")
+def test_geometric_key(benchmark, million_points):
+    keys = benchmark.pedantic(lambda: [TOL.geometric_key(point) for point in million_points], rounds=3)
+    assert len(keys) == len(million_points)
+
+
+@pytest.mark.benchmark(group="geometric_keys")
+def test_geometric_key_numeric(benchmark, million_points):
+    keys = benchmark.pedantic(lambda: [TOL.geometric_key_numeric(point) for point in million_points], rounds=3)
+    assert len(keys) == len(million_points)
+
+
+@pytest.mark.benchmark(group="geometric_keys")
+def test_geometric_keys_numpy(benchmark, million_points):
+    numpy = pytest.importorskip("numpy")
+    points = numpy.array(million_points)
+    keys = benchmark.pedantic(TOL.geometric_keys_numpy, args=(points,), rounds=3)
+    assert keys.shape == (len(million_points), 3)
+
+
+@pytest.mark.benchmark(group="json")
+def test_json_loads_geometry(benchmark, cloud):
+    # nested collections of many small geometry objects
+    points = cloud.points
+    frames = [Frame(point, [1, 0, 0], [0, 1, 0]) for point in points]
+    lines = [Line(a, b) for a, b in zip(points[:-1], points[1:])]
+    string = compas.json_dumps({"points": points, "frames": frames, "collections": [lines, [points, frames]]})
+    data = benchmark(compas.json_loads, string)
+    assert len(data["points"]) == len(points)
+
+
+@pytest.mark.benchmark(group="nurbs")
+def test_nurbscurve_to_points(benchmark):
+    curve = NurbsCurve.from_points([[i, (-1) ** i, 0] for i in range(20)])
+    points = benchmark(curve.to_points, 10000)
+    assert len(points) == 10000
+
+
+@pytest.mark.benchmark(group="nurbs")
+def test_nurbssurface_to_vertices_and_faces(benchmark):
+    surface = NurbsSurface.from_meshgrid(nu=10, nv=10)
+    vertices, faces = benchmark(surface.to_vertices_and_faces, 100, 100)
+    assert len(faces) == 10000
@@ -7,6 +7,13 @@ import compas
 from compas.geometry import allclose
 
 
+def pytest_configure(config):
+    # do not read or write the plugin manifest in the user data directory during the tests
+    from compas.plugins import plugin_manager
+
+    plugin_manager.CACHE = False
+
+
 def pytest_ignore_collect(path):
     if "rhino" in str(path):
         return True
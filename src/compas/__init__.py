@@ -131,7 +131,10 @@ __all__ = [
 ]
 
 __all_plugins__ = [
+    "compas.geometry.aabbtree",
     "compas.geometry.booleans_shapely",
+    "compas.geometry.curves.nurbs_default",
+    "compas.geometry.surfaces.nurbs_default",
     "compas.scene",
 ]
 
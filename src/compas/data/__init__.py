@@ -8,8 +8,11 @@ from __future__ import absolute_import
 from .exceptions import DecoderError
 from .encoders import DataEncoder
 from .encoders import DataDecoder
+from .encoders import register_dtype
 from .data import Data
 from .json import json_load, json_loads, json_loadz, json_dump, json_dumps, json_dumpz
+from .binary import binary_load, binary_loads, binary_dump, binary_dumps
+from .archive import DataArchiveReader, DataArchiveWriter
 from .schema import dataclass_dataschema, dataclass_typeschema, dataclass_jsonschema
 from .schema import compas_dataclasses
 
@@ -18,12 +21,19 @@ __all__ = [
     "DataEncoder",
     "DataDecoder",
     "DecoderError",
+    "DataArchiveReader",
+    "DataArchiveWriter",
     "json_load",
     "json_loads",
     "json_loadz",
     "json_dump",
     "json_dumps",
     "json_dumpz",
+    "register_dtype",
+    "binary_load",
+    "binary_loads",
+    "binary_dump",
+    "binary_dumps",
     "dataclass_dataschema",
     "dataclass_typeschema",
     "dataclass_jsonschema",
@@ -0,0 +1,461 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gzip
+import json
+import re
+import sys
+import zipfile
+from collections import OrderedDict
+
+from compas.data import Data
+from compas.data import DataDecoder
+from compas.data import DataEncoder
+
+PY3 = sys.version_info[0] == 3
+
+# ==============================================================================
+# Format
+# ==============================================================================
+#
+# An archive contains a sequence of objects, that are encoded one at a time.
+# Every object is stored as a JSON object with the same envelope as in the JSON format,
+# but with the data last, such that the type, the guid and the name of an object
+# can be read without decoding its data.
+# Values that are not COMPAS data objects are stored without type, guid and name.
+#
+# In the JSONL format, every line of the file contains one object.
+# The file is optionally compressed with gzip.
+#
+# In the ZIP format, every object is stored in a separate member,
+# and the type, guid, name and member of all objects are stored in an index member,
+# that is written when the archive is closed.
+
+ARCHIVE_VERSION = 1
+ARCHIVE_INDEX_FILENAME = "index.json"
+ARCHIVE_MEMBER_TEMPLATE = "objects/{:08d}.json"
+
+FORMATS = ("jsonl", "zip")
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZIP_MAGIC = b"PK\x03\x04"
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_decoder = json.JSONDecoder()
+
+
+def _guess_format(filepath):
+    if hasattr(filepath, "endswith") and filepath.lower().endswith(".zip"):
+        return "zip"
+    return "jsonl"
+
+
+def _is_gzip_path(filepath):
+    return hasattr(filepath, "endswith") and filepath.lower().endswith(".gz")
+
+
+def _encode(obj, minimal):
+    if isinstance(obj, Data):
+        header = OrderedDict([("dtype", obj.__dtype__), ("guid", None if minimal else str(obj.guid)), ("name", obj._name)])
+        record = OrderedDict(header)
+        record["data"] = obj.__data__
+    else:
+        header = OrderedDict([("dtype", None), ("guid", None), ("name", None)])
+        record = {"data": obj}
+    DataEncoder.minimal = minimal
+    return header, json.dumps(record, cls=DataEncoder, separators=(",", ":"))
+
+
+def _decode(text):
+    obj = json.loads(text, cls=DataDecoder)
+    if isinstance(obj, dict) and "dtype" not in obj:
+        return obj.get("data")
+    return obj
+
+
+def parse_header(text):
+    """Parse the type, guid and name of an encoded object, without decoding its data.
+
+    Parameters
+    ----------
+    text : str
+        The encoded object.
+
+    Returns
+    -------
+    dict
+        A dict with the keys ``"dtype"``, ``"guid"`` and ``"name"``.
+        Values that are not available are None.
+
+    """
+    header = OrderedDict([("dtype", None), ("guid", None), ("name", None)])
+    pos = WHITESPACE.match(text, 0).end()
+    if text[pos : pos + 1] != "{":
+        return header
+    pos += 1
+    while True:
+        pos = WHITESPACE.match(text, pos).end()
+        if text[pos : pos + 1] in ("}", ""):
+            return header
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = WHITESPACE.match(text, pos).end() + 1
+        pos = WHITESPACE.match(text, pos).end()
+        if key == "data":
+            break
+        value, pos = _decoder.raw_decode(text, pos)
+        if key in header:
+            header[key] = value
+        pos = WHITESPACE.match(text, pos).end()
+        if text[pos : pos + 1] == ",":
+            pos += 1
+
+    if header["dtype"] is None:
+        # the data of objects that were not written by an archive writer can come before the header
+        record = json.loads(text)
+        for key in header:
+            header[key] = record.get(key)
+    return header
+
+
+class DataArchiveWriter(object):
+    """Writer for archives of COMPAS data objects, which are encoded and written one at a time.
+
+    Parameters
+    ----------
+    fp : path string | file-like object
+        The path to the archive, or a writeable binary file-like object.
+    format : Literal["jsonl", "zip"], optional
+        The format of the archive.
+        Defaults to ``"zip"`` for paths ending with ``.zip``, and to ``"jsonl"`` otherwise.
+    compresslevel : int, optional
+        The compression level, between 0 (no compression) and 9 (maximum compression).
+        For the ZIP format, the objects are compressed with the default level of zlib if no level is given.
+        For the JSONL format, the file is compressed with gzip if a level is given or if the path ends with ``.gz``.
+    minimal : bool, optional
+        If True, exclude the GUID of the objects from the archive.
+
+    Attributes
+    ----------
+    entries : list[dict]
+        The type, guid and name of the objects that were written to the archive.
+
+    See Also
+    --------
+    :class:`compas.data.DataArchiveReader`
+
+    Examples
+    --------
+    >>> from compas.data import DataArchiveWriter
+    >>> from compas.geometry import Point
+    >>> with DataArchiveWriter("points.jsonl") as archive:
+    ...     for i in range(10):
+    ...         index = archive.write(Point(i, 0, 0))
+
+    """
+
+    def __init__(self, fp, format=None, compresslevel=None, minimal=False):
+        format = format or _guess_format(fp)
+        if format not in FORMATS:
+            raise ValueError("Archive format not supported: {}".format(format))
+        self.format = format
+        self.compresslevel = compresslevel
+        self.minimal = minimal
+        self.entries = []
+        self._file = None
+        self._stream = None
+        self._zipfile = None
+        self._close_source = not hasattr(fp, "write")
+        self._file = open(fp, "wb") if self._close_source else fp
+
+        if format == "zip":
+            kwargs = {}
+            if compresslevel is not None and PY3:
+                kwargs["compresslevel"] = compresslevel
+            compression = zipfile.ZIP_STORED if compresslevel == 0 else zipfile.ZIP_DEFLATED
+            self._zipfile = zipfile.ZipFile(self._file, "w", compression, allowZip64=True, **kwargs)
+        elif compresslevel is not None or _is_gzip_path(fp):
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=9 if compresslevel is None else compresslevel)
+        else:
+            self._stream = self._file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, obj):
+        """Encode an object and write it to the archive.
+
+        Parameters
+        ----------
+        obj : :class:`compas.data.Data` | Any
+            A COMPAS data object, or any other JSON serializable value.
+
+        Returns
+        -------
+        int
+            The index of the object in the archive.
+
+        """
+        if self._file is None:
+            raise ValueError("The archive is closed.")
+        header, text = _encode(obj, self.minimal)
+        data = text.encode("utf-8")
+        index = len(self.entries)
+        if self._zipfile:
+            member = ARCHIVE_MEMBER_TEMPLATE.format(index)
+            self._zipfile.writestr(member, data)
+            header["member"] = member
+        else:
+            self._stream.write(data)
+            self._stream.write(b"\n")
+        self.entries.append(header)
+        return index
+
+    def close(self):
+        """Write the index of the archive, if necessary, and close the archive.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._file is None:
+            return
+        if self._zipfile:
+            index = {"version": ARCHIVE_VERSION, "entries": self.entries}
+            self._zipfile.writestr(ARCHIVE_INDEX_FILENAME, json.dumps(index).encode("utf-8"))
+            self._zipfile.close()
+        elif self._stream is not self._file:
+            self._stream.close()
+        if self._close_source:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+        self._stream = None
+        self._zipfile = None
+
+
+class DataArchiveReader(object):
+    """Reader for archives of COMPAS data objects, with random access to the individual objects by index, guid or name.
+
+    Only the type, guid and name of the objects are read when the archive is opened.
+    The objects themselves are decoded when they are accessed.
+
+    Parameters
+    ----------
+    fp : path string | file-like object
+        The path to the archive, or a readable and seekable binary file-like object.
+    format : Literal["jsonl", "zip"], optional
+        The format of the archive.
+        By default, the format is detected from the contents of the file.
+
+    Attributes
+    ----------
+    entries : list[dict]
+        The type, guid and name of the objects in the archive.
+
+    See Also
+    --------
+    :class:`compas.data.DataArchiveWriter`
+
+    Examples
+    --------
+    >>> from compas.data import DataArchiveReader, DataArchiveWriter
+    >>> from compas.geometry import Point
+    >>> with DataArchiveWriter("points.jsonl") as archive:
+    ...     for i in range(10):
+    ...         index = archive.write(Point(i, 0, 0))
+    >>> with DataArchiveReader("points.jsonl") as archive:
+    ...     point = archive.get(archive.entries[3]["guid"])
+    ...     points = list(archive)
+    >>> point.x
+    3.0
+    >>> len(points)
+    10
+
+    """
+
+    def __init__(self, fp, format=None):
+        self.entries = []
+        self._locations = []
+        self._guids = {}
+        self._stream = None
+        self._zipfile = None
+        self._close_source = not hasattr(fp, "read")
+        self._file = open(fp, "rb") if self._close_source else fp
+
+        if format is None:
+            start = self._file.tell()
+            magic = self._file.read(4)
+            self._file.seek(start)
+            format = "zip" if magic == ZIP_MAGIC else "jsonl"
+        elif format not in FORMATS:
+            raise ValueError("Archive format not supported: {}".format(format))
+        self.format = format
+
+        if format == "zip":
+            self._zipfile = zipfile.ZipFile(self._file)
+            self._read_zip_index()
+        else:
+            start = self._file.tell()
+            magic = self._file.read(2)
+            self._file.seek(start)
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="rb") if magic == GZIP_MAGIC else self._file
+            self._read_jsonl_index()
+
+        for index, entry in enumerate(self.entries):
+            if entry["guid"] is not None:
+                self._guids[entry["guid"]] = index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        for index in range(len(self.entries)):
+            yield self.read(index)
+
+    def __getitem__(self, index):
+        return self.read(index)
+
+    def _read_zip_index(self):
+        names = self._zipfile.namelist()
+        if ARCHIVE_INDEX_FILENAME in names:
+            index = json.loads(self._zipfile.read(ARCHIVE_INDEX_FILENAME).decode("utf-8"))
+            for entry in index["entries"]:
+                member = entry.pop("member")
+                self.entries.append(entry)
+                self._locations.append(member)
+        else:
+            # the index is missing if the archive was not closed properly
+            for member in sorted(name for name in names if name.startswith("objects/")):
+                self.entries.append(parse_header(self._zipfile.read(member).decode("utf-8")))
+                self._locations.append(member)
+
+    def _read_jsonl_index(self):
+        stream = self._stream
+        while True:
+            offset = stream.tell()
+            line = stream.readline()
+            if not line:
+                break
+            line = line.decode("utf-8")
+            if not line.strip():
+                continue
+            self.entries.append(parse_header(line))
+            self._locations.append(offset)
+
+    def close(self):
+        """Close the archive.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._file is None:
+            return
+        if self._zipfile:
+            self._zipfile.close()
+        elif self._stream is not self._file:
+            self._stream.close()
+        if self._close_source:
+            self._file.close()
+        self._file = None
+        self._stream = None
+        self._zipfile = None
+
+    def read_text(self, index):
+        """Read the encoded form of an object, without decoding it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object in the archive.
+
+        Returns
+        -------
+        str
+
+        """
+        if self._file is None:
+            raise ValueError("The archive is closed.")
+        location = self._locations[index]
+        if self._zipfile:
+            return self._zipfile.read(location).decode("utf-8")
+        self._stream.seek(location)
+        return self._stream.readline().decode("utf-8")
+
+    def read(self, index):
+        """Read and decode an object.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object in the archive.
+
+        Returns
+        -------
+        :class:`compas.data.Data` | Any
+
+        """
+        return _decode(self.read_text(index))
+
+    def get(self, guid):
+        """Read and decode the object with a given guid.
+
+        Parameters
+        ----------
+        guid : str | UUID
+            The guid of the object.
+
+        Returns
+        -------
+        :class:`compas.data.Data`
+
+        Raises
+        ------
+        KeyError
+            If the archive contains no object with this guid.
+
+        Notes
+        -----
+        If the archive contains multiple objects with the same guid, the last one is returned.
+
+        """
+        return self.read(self._guids[str(guid)])
+
+    def find(self, name):
+        """Read and decode the objects with a given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the objects.
+
+        Returns
+        -------
+        list[:class:`compas.data.Data`]
+
+        """
+        return [self.read(index) for index, entry in enumerate(self.entries) if entry["name"] == name]
+
+    def guids(self):
+        """The guids of the objects in the archive.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return [entry["guid"] for entry in self.entries]
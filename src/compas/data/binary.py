@@ -0,0 +1,656 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+import sys
+
+from compas import _iotools
+from compas.data import DataDecoder
+from compas.data.exceptions import DecoderError
+
+numpy_support = False
+
+try:
+    import numpy as np
+
+    numpy_support = True
+except (ImportError, SyntaxError):
+    numpy_support = False
+
+PY3 = sys.version_info[0] == 3
+
+if not PY3:
+    string_types = basestring  # noqa: F821
+    integer_types = (int, long)  # noqa: F821
+else:
+    string_types = str
+    integer_types = (int,)
+
+# ==============================================================================
+# Format
+# ==============================================================================
+#
+# A file starts with an 8-byte header: the magic bytes, the format version and padding.
+# The header is followed by a single encoded value.
+#
+# Every value starts with a one-byte tag.
+# Counts, lengths and sizes are unsigned LEB128 varints.
+# Integers are zigzag varints and floats are little-endian IEEE 754 doubles.
+#
+# Strings of at most INTERN_MAXSIZE bytes are stored once,
+# and referenced by their index in the order of first appearance afterwards.
+#
+# Homogeneous lists of numbers, and lists of lists of numbers of equal length,
+# are stored as packed little-endian typed arrays with their shape.
+# Integers are stored with the smallest type that fits all values of the list.
+# The payload of arrays of at least ALIGN_MINSIZE bytes is aligned to 8 bytes w.r.t. the start of the buffer,
+# such that they can be viewed directly in a memory-mapped file.
+# Lists of lists of numbers of different length (e.g. the faces of a mesh)
+# are stored as an array of lengths and a flat array of values.
+# Lists of strings representing integers (e.g. the stringified keys of a mesh)
+# are stored as an array of integers.
+#
+# Dicts are stored as the number of items, followed by a list of keys and a list of values.
+# Dicts of which all values are dicts with the same keys (e.g. the vertex attributes of a mesh)
+# are stored column by column, such that the columns can be stored as typed arrays.
+#
+# COMPAS data objects are stored with the same envelope as in the JSON format:
+# the data type, the name, the guid and the data.
+
+MAGIC = b"CMPSBIN"
+VERSION = 1
+
+INTERN_MAXSIZE = 64
+ALIGN_MINSIZE = 64
+
+TAG_NONE = 0x4E  # N
+TAG_TRUE = 0x54  # T
+TAG_FALSE = 0x46  # F
+TAG_INT = 0x69  # i
+TAG_FLOAT = 0x64  # d
+TAG_STR = 0x73  # s
+TAG_STRREF = 0x72  # r
+TAG_BYTES = 0x62  # b
+TAG_LIST = 0x6C  # l
+TAG_DICT = 0x6D  # m
+TAG_TABLE = 0x4D  # M
+TAG_ARRAY = 0x61  # a
+TAG_RAGGED = 0x52  # R
+TAG_NUMSTR = 0x6E  # n
+TAG_DATA = 0x6F  # o
+
+_TAGS = {
+    tag: struct.pack("<B", tag)
+    for tag in (
+        TAG_NONE,
+        TAG_TRUE,
+        TAG_FALSE,
+        TAG_INT,
+        TAG_FLOAT,
+        TAG_STR,
+        TAG_STRREF,
+        TAG_BYTES,
+        TAG_LIST,
+        TAG_DICT,
+        TAG_TABLE,
+        TAG_ARRAY,
+        TAG_RAGGED,
+        TAG_NUMSTR,
+        TAG_DATA,
+    )
+}
+
+_FLOAT = struct.Struct("<d")
+
+# struct type codes of the array types, by numpy kind and item size
+_NUMPY_TYPECODES = {
+    ("b", 1): "?",
+    ("i", 1): "b",
+    ("i", 2): "h",
+    ("i", 4): "i",
+    ("i", 8): "q",
+    ("u", 1): "B",
+    ("u", 2): "H",
+    ("u", 4): "I",
+    ("u", 8): "Q",
+    ("f", 4): "f",
+    ("f", 8): "d",
+}
+
+_INTEGER_RANGES = [
+    ("b", -(2**7), 2**7 - 1),
+    ("h", -(2**15), 2**15 - 1),
+    ("i", -(2**31), 2**31 - 1),
+    ("q", -(2**63), 2**63 - 1),
+]
+
+
+def _header():
+    return MAGIC + struct.pack("<B", VERSION)
+
+
+def _varint(value):
+    parts = []
+    while value > 0x7F:
+        parts.append((value & 0x7F) | 0x80)
+        value >>= 7
+    parts.append(value)
+    return struct.pack("<{}B".format(len(parts)), *parts)
+
+
+# ==============================================================================
+# Encoder
+# ==============================================================================
+
+
+class _BinaryEncoder(object):
+    """Encode (COMPAS) data into a list of byte chunks."""
+
+    def __init__(self, minimal=False):
+        self.minimal = minimal
+        self.chunks = []
+        self.offset = 0
+        self.strings = {}
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+        self.offset += len(chunk)
+
+    def encode(self, o):
+        write = self.write
+
+        if o is None:
+            write(_TAGS[TAG_NONE])
+        elif o is True:
+            write(_TAGS[TAG_TRUE])
+        elif o is False:
+            write(_TAGS[TAG_FALSE])
+        elif isinstance(o, float):
+            write(_TAGS[TAG_FLOAT] + _FLOAT.pack(o))
+        elif isinstance(o, integer_types):
+            write(_TAGS[TAG_INT] + _varint(o << 1 if o >= 0 else ((-o) << 1) - 1))
+        elif isinstance(o, string_types):
+            self.encode_string(o)
+        elif isinstance(o, (bytes, bytearray)):
+            write(_TAGS[TAG_BYTES] + _varint(len(o)))
+            write(bytes(o))
+        elif isinstance(o, (list, tuple)):
+            self.encode_list(o)
+        elif isinstance(o, dict):
+            self.encode_dict(o)
+        elif hasattr(o, "__jsondump__"):
+            self.encode_data(o)
+        elif numpy_support and isinstance(o, np.ndarray):
+            self.encode_ndarray(o)
+        elif numpy_support and isinstance(o, np.generic):
+            self.encode(o.item())
+        elif hasattr(o, "__next__") or hasattr(o, "next"):
+            self.encode_list(list(o))
+        else:
+            raise TypeError("Object of type {} is not serializable.".format(type(o).__name__))
+
+    def encode_string(self, o):
+        index = self.strings.get(o)
+        if index is not None:
+            self.write(_TAGS[TAG_STRREF] + _varint(index))
+            return
+        value = o.encode("utf-8")
+        if len(value) <= INTERN_MAXSIZE:
+            self.strings[o] = len(self.strings)
+        self.write(_TAGS[TAG_STR] + _varint(len(value)))
+        self.write(value)
+
+    def encode_list(self, o):
+        if o:
+            types = set(map(type, o))
+            if len(types) == 1:
+                cls = types.pop()
+                if cls is float or cls in integer_types:
+                    array = _pack(o)
+                    if array:
+                        self.encode_array(array[0], (len(o),), array[1])
+                        return
+                elif cls is list or cls is tuple:
+                    if self.encode_nested(o):
+                        return
+                elif cls is str:
+                    if self.encode_numeric_strings(o):
+                        return
+        self.write(_TAGS[TAG_LIST] + _varint(len(o)))
+        for item in o:
+            self.encode(item)
+
+    def encode_nested(self, o):
+        lengths = list(map(len, o))
+        flat = [value for row in o for value in row]
+        if not flat:
+            return False
+        types = set(map(type, flat))
+        if len(types) != 1:
+            return False
+        cls = types.pop()
+        if cls is not float and cls not in integer_types:
+            return False
+        if min(lengths) == max(lengths):
+            array = _pack(flat)
+            if not array:
+                return False
+            self.encode_array(array[0], (len(o), lengths[0]), array[1])
+        else:
+            self.write(_TAGS[TAG_RAGGED])
+            self.encode_list(lengths)
+            self.encode_list(flat)
+        return True
+
+    def encode_numeric_strings(self, o):
+        try:
+            values = [int(value) for value in o]
+        except ValueError:
+            return False
+        if list(map(str, values)) != o:
+            return False
+        self.write(_TAGS[TAG_NUMSTR])
+        self.encode_list(values)
+        return True
+
+    def encode_dict(self, o):
+        if len(o) > 1:
+            names = _table_names(o)
+            if names is not None:
+                self.encode_table(o, names)
+                return
+        self.write(_TAGS[TAG_DICT] + _varint(len(o)))
+        if o:
+            self.encode_list(list(o.keys()))
+            self.encode_list(list(o.values()))
+
+    def encode_table(self, o, names):
+        self.write(_TAGS[TAG_TABLE])
+        self.encode_list(names)
+        self.encode_list(list(o.keys()))
+        rows = list(o.values())
+        for name in names:
+            self.encode_list([row[name] for row in rows])
+
+    def encode_data(self, o):
+        state = o.__jsondump__(minimal=self.minimal)
+        self.write(_TAGS[TAG_DATA])
+        self.encode(state["dtype"])
+        self.encode(state.get("name"))
+        self.encode(state.get("guid"))
+        self.encode(state["data"])
+
+    def encode_ndarray(self, o):
+        typecode = _NUMPY_TYPECODES.get((o.dtype.kind, o.dtype.itemsize))
+        if typecode is None or o.ndim == 0 or o.size == 0:
+            self.encode(o.tolist())
+            return
+        payload = np.ascontiguousarray(o, dtype=o.dtype.newbyteorder("<")).tobytes()
+        self.encode_array(typecode, o.shape, payload)
+
+    def encode_array(self, typecode, shape, payload):
+        self.write(_TAGS[TAG_ARRAY] + struct.pack("<c", typecode.encode("ascii")) + _varint(len(shape)) + b"".join(_varint(dim) for dim in shape))
+        if len(payload) >= ALIGN_MINSIZE:
+            self.write(b"\x00" * (-self.offset % 8))
+        self.write(payload)
+
+
+def _pack(values):
+    # Returns the type code and packed payload of a list of numbers of the same type, or None.
+    if type(values[0]) is float:
+        typecode = "d"
+    else:
+        low = min(values)
+        high = max(values)
+        for typecode, minimum, maximum in _INTEGER_RANGES:
+            if low >= minimum and high <= maximum:
+                break
+        else:
+            return
+    return typecode, struct.pack("<{}{}".format(len(values), typecode), *values)
+
+
+def _table_names(o):
+    # Returns the column names if all values of the dict are dicts with the same keys, or None.
+    names = None
+    for value in o.values():
+        if type(value) is not dict:
+            return
+        if names is None:
+            names = list(value.keys())
+        elif len(value) != len(names) or list(value.keys()) != names:
+            return
+    return names
+
+
+# ==============================================================================
+# Decoder
+# ==============================================================================
+
+
+class _BinaryDecoder(object):
+    """Decode (COMPAS) data from a buffer."""
+
+    def __init__(self, buffer, arrays=False):
+        self.buffer = buffer
+        self.offset = 0
+        self.strings = []
+        self.arrays = arrays and numpy_support
+        # the number of data objects and containers being decoded
+        # the contents of these are always decoded as Python lists
+        self.depth = 0
+        self.object_hook = DataDecoder().object_hook
+
+    def read_header(self):
+        size = len(MAGIC) + 1
+        header = bytes(self.buffer[:size])
+        if header[: len(MAGIC)] != MAGIC:
+            raise DecoderError("The data is not in the COMPAS binary format.")
+        version = struct.unpack("<B", header[len(MAGIC) :])[0]
+        if version > VERSION:
+            raise DecoderError("Unsupported version of the COMPAS binary format: {}.".format(version))
+        self.offset = size
+
+    def read_byte(self):
+        value = self.buffer[self.offset]
+        self.offset += 1
+        return value if PY3 else ord(value)
+
+    def read_varint(self):
+        result = 0
+        shift = 0
+        while True:
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def read_bytes(self, size):
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.buffer):
+            raise DecoderError("Unexpected end of data.")
+        return self.buffer[start : self.offset]
+
+    def decode(self):
+        tag = self.read_byte()
+
+        if tag == TAG_STRREF:
+            return self.strings[self.read_varint()]
+        if tag == TAG_FLOAT:
+            return _FLOAT.unpack(self.read_bytes(8))[0]
+        if tag == TAG_INT:
+            value = self.read_varint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        if tag == TAG_STR:
+            size = self.read_varint()
+            value = bytes(self.read_bytes(size)).decode("utf-8")
+            if size <= INTERN_MAXSIZE:
+                self.strings.append(value)
+            return value
+        if tag == TAG_ARRAY:
+            return self.decode_array()
+        if tag == TAG_LIST:
+            return [self.decode() for _ in range(self.read_varint())]
+        if tag == TAG_DICT:
+            if not self.read_varint():
+                return {}
+            self.depth += 1
+            keys = self.decode()
+            self.depth -= 1
+            return dict(zip(_keys(keys), self.decode()))
+        if tag == TAG_TABLE:
+            return self.decode_table()
+        if tag == TAG_RAGGED:
+            self.depth += 1
+            lengths = self.decode()
+            flat = self.decode()
+            self.depth -= 1
+            result = []
+            start = 0
+            for length in lengths:
+                result.append(flat[start : start + length])
+                start += length
+            return result
+        if tag == TAG_NUMSTR:
+            self.depth += 1
+            values = self.decode()
+            self.depth -= 1
+            return list(map(str, values))
+        if tag == TAG_DATA:
+            return self.decode_data()
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_BYTES:
+            return bytes(self.read_bytes(self.read_varint()))
+        raise DecoderError("Unknown tag in COMPAS binary data: {}.".format(tag))
+
+    def decode_array(self):
+        typecode = chr(self.read_byte())
+        shape = [self.read_varint() for _ in range(self.read_varint())]
+        count = 1
+        for dim in shape:
+            count *= dim
+        size = count * struct.calcsize("<" + typecode)
+        if size >= ALIGN_MINSIZE:
+            self.offset += -self.offset % 8
+
+        if self.arrays and not self.depth:
+            array = np.frombuffer(self.buffer, dtype=np.dtype("<" + typecode), count=count, offset=self.offset)
+            self.offset += size
+            return array.reshape(shape)
+
+        values = struct.unpack_from("<{}{}".format(count, typecode), self.buffer, self.offset)
+        self.offset += size
+        if len(shape) == 1:
+            return list(values)
+        return _nest(values, shape)
+
+    def decode_table(self):
+        self.depth += 1
+        names = self.decode()
+        keys = self.decode()
+        columns = [self.decode() for _ in names]
+        self.depth -= 1
+        if not names:
+            return dict((key, {}) for key in _keys(keys))
+        return dict(zip(_keys(keys), [dict(zip(names, row)) for row in zip(*columns)]))
+
+    def decode_data(self):
+        self.depth += 1
+        dtype = self.decode()
+        name = self.decode()
+        guid = self.decode()
+        data = self.decode()
+        self.depth -= 1
+        return self.object_hook({"dtype": dtype, "data": data, "guid": guid, "name": name})
+
+
+def _keys(keys):
+    if list in set(map(type, keys)):
+        return [_hashable(key) for key in keys]
+    return keys
+
+
+def _hashable(key):
+    if isinstance(key, list):
+        return tuple(_hashable(item) for item in key)
+    return key
+
+
+def _nest(values, shape):
+    # group the flat values per row, starting from the last axis
+    result = list(values)
+    for dim in reversed(shape[1:]):
+        result = [result[i : i + dim] for i in range(0, len(result), dim)]
+    return result
+
+
+# ==============================================================================
+# API
+# ==============================================================================
+
+
+def binary_dumps(data, minimal=False):  # type: (...) -> bytes
+    """Write a collection of COMPAS objects to a binary string.
+
+    Parameters
+    ----------
+    data : object
+        Any serializable object.
+        This includes any (combination of) COMPAS object(s).
+    minimal : bool, optional
+        If True, exclude the GUID from the output.
+
+    Returns
+    -------
+    bytes
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Notes
+    -----
+    The binary format supports the same data as the JSON format.
+    COMPAS objects are stored with the same envelope (data type, name, guid, data),
+    but homogeneous lists of numbers are stored as packed typed arrays,
+    and repeated strings are stored only once.
+
+    Examples
+    --------
+    >>> from compas.data import binary_dumps, binary_loads
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> data2 = binary_loads(binary_dumps(data1))
+    >>> data1 == data2
+    True
+
+    """
+    encoder = _BinaryEncoder(minimal=minimal)
+    encoder.write(_header())
+    encoder.encode(data)
+    return b"".join(encoder.chunks)
+
+
+def binary_dump(data, fp, minimal=False):
+    """Write a collection of COMPAS objects to a binary file.
+
+    Parameters
+    ----------
+    data : object
+        Any serializable object.
+        This includes any (combination of) COMPAS object(s).
+    fp : path string or file-like object
+        A writeable file-like object or the path to a file.
+    minimal : bool, optional
+        If True, exclude the GUID from the output.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dump, binary_load
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> binary_dump(data1, "data.bin")
+    >>> data2 = binary_load("data.bin")
+    >>> data1 == data2
+    True
+
+    """
+    with _iotools.open_file(fp, "wb") as f:
+        f.write(binary_dumps(data, minimal=minimal))
+
+
+def binary_loads(s, arrays=False):
+    """Read COMPAS object data from a binary string.
+
+    Parameters
+    ----------
+    s : bytes
+        The binary data.
+    arrays : bool, optional
+        If True, and NumPy is available, return the typed arrays that are not part of COMPAS objects as read-only NumPy arrays,
+        viewing the binary data without copying.
+        Otherwise, typed arrays are returned as (nested) lists.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the string.
+
+    Raises
+    ------
+    :class:`compas.data.DecoderError`
+        If the data is not in the COMPAS binary format.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+
+    """
+    decoder = _BinaryDecoder(s, arrays=arrays)
+    decoder.read_header()
+    return decoder.decode()
+
+
+def binary_load(fp, mmap=False, arrays=False):
+    """Read COMPAS object data from a binary file.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object or a URL pointing to a file.
+    mmap : bool, optional
+        If True, memory-map the file instead of reading it.
+        This requires ``fp`` to be a path or a file object of a file on disk.
+    arrays : bool, optional
+        If True, and NumPy is available, return the typed arrays that are not part of COMPAS objects as read-only NumPy arrays.
+        In combination with ``mmap``, the arrays are views of the memory-mapped file.
+        Otherwise, typed arrays are returned as (nested) lists.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the file.
+
+    Raises
+    ------
+    :class:`compas.data.DecoderError`
+        If the data is not in the COMPAS binary format.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_loads`
+
+    """
+    with _iotools.open_file(fp, "rb") as f:
+        if mmap:
+            import mmap as _mmap
+
+            buffer = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+
+    return binary_loads(buffer, arrays=arrays)
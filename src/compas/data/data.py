@@ -100,7 +100,7 @@ class Data(object):
             return state
         if self._name is not None:
             state["name"] = self._name
-        state["guid"] = str(self.guid)
+        state["guid"] = str(self._guid or self.guid)
         return state
 
     @classmethod
@@ -123,7 +123,8 @@ class Data(object):
         """
         obj = cls.__from_data__(data)
         if guid is not None:
-            obj._guid = UUID(guid)
+            # the guid is converted to a UUID when it is accessed for the first time
+            obj._guid = guid
         if name is not None:
             obj.name = name
         return obj
@@ -173,9 +174,12 @@ class Data(object):
 
     @property
     def guid(self):
-        if not self._guid:
-            self._guid = uuid4()
-        return self._guid
+        guid = self._guid
+        if not guid:
+            guid = self._guid = uuid4()
+        elif not isinstance(guid, UUID):
+            guid = self._guid = UUID(guid)
+        return guid
 
     @property
     def name(self):
@@ -290,6 +294,11 @@ class Data(object):
     def sha256(self, as_string=False):
         """Compute a hash of the data for comparison during version control using the sha256 algorithm.
 
+        The hash is computed from the type and the data of the object,
+        and not from the guid or the name.
+        Nested data objects contribute their own hash,
+        such that data structures that cache their hash are not rehashed if they are unchanged.
+
         Parameters
         ----------
         as_string : bool, optional
@@ -314,11 +323,30 @@ class Data(object):
 
         """
         h = hashlib.sha256()
-        h.update(compas.json_dumps(self).encode())
+        h.update(self.__dtype__.encode())
+        self._hash_content(h)
         if as_string:
             return h.hexdigest()
         return h.digest()
 
+    def _hash_content(self, h):
+        """Feed the content of the object to a hash object.
+
+        Parameters
+        ----------
+        h : hashlib.sha256
+            The hash object.
+
+        Returns
+        -------
+        list[tuple[:class:`compas.data.Data`, bytes]]
+            The nested data objects that contributed their own digest to the hash, with those digests.
+
+        """
+        from compas.data.hashing import hash_data
+
+        return hash_data(h, self.__data__)
+
     @classmethod
     def validate_data(cls, data):
         """Validate the data against the object's data schema.
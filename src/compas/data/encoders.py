@@ -35,6 +35,43 @@ except (ImportError, SyntaxError):
     numpy_support = False
 
 
+# the classes of the data types that were resolved or registered so far
+DTYPES = {}
+
+
+def register_dtype(cls, dtype=None):
+    """Register the class corresponding to a COMPAS data type specification.
+
+    Registered data types are resolved by the decoder without importing the module of the data type.
+    Extension packages can use this to decode data types of classes
+    that can't be imported from the module in the specification,
+    for example because the class was moved to a different module or package.
+
+    Parameters
+    ----------
+    cls : Type[:class:`compas.data.Data`]
+        The class.
+    dtype : str, optional
+        The data type specification.
+        Defaults to the data type generated from the module and the name of the class,
+        in the same way as :attr:`compas.data.Data.__dtype__`.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> from compas.data import register_dtype
+    >>> from compas.geometry import Point
+    >>> register_dtype(Point, "mypackage.geometry/Point")
+
+    """
+    if not dtype:
+        dtype = "{}/{}".format(".".join(cls.__module__.split(".")[:2]), cls.__name__)
+    DTYPES[dtype] = cls
+
+
 def cls_from_dtype(dtype):  # type: (...) -> Type[Data]
     """Get the class object corresponding to a COMPAS data type specification.
 
@@ -57,10 +94,20 @@ def cls_from_dtype(dtype):  # type: (...) -> Type[Data]
     AttributeError
         If the module doesn't contain the specified data type.
 
+    Notes
+    -----
+    The resolved classes are cached,
+    such that the module of a data type is imported only once.
+
     """
+    try:
+        return DTYPES[dtype]
+    except (KeyError, TypeError):
+        pass
     mod_name, attr_name = dtype.split("/")
     module = __import__(mod_name, fromlist=[attr_name])
-    return getattr(module, attr_name)
+    cls = DTYPES[dtype] = getattr(module, attr_name)
+    return cls
 
 
 class DataEncoder(json.JSONEncoder):
@@ -125,29 +172,11 @@ class DataEncoder(json.JSONEncoder):
         if numpy_support:
             if isinstance(o, np.ndarray):
                 return o.tolist()
-            if isinstance(
-                o,
-                (
-                    np.int_,
-                    np.intc,
-                    np.intp,
-                    np.int8,
-                    np.int16,
-                    np.int32,
-                    np.int64,
-                    np.uint8,
-                    np.uint16,
-                    np.uint32,
-                    np.uint64,
-                ),  # type: ignore
-            ):
-                return int(o)
-            if isinstance(o, (np.float_, np.float16, np.float32, np.float64)):  # type: ignore
-                return float(o)
-            if isinstance(o, np.bool_):
-                return bool(o)
-            if isinstance(o, np.void):
-                return None
+            if isinstance(o, np.generic):
+                if isinstance(o, np.void):
+                    return None
+                # numpy integers, floats and booleans are converted to their Python equivalent
+                return o.item()
 
         if dotnet_support:
             if isinstance(o, (System.Decimal, System.Double, System.Single)):
@@ -211,7 +240,26 @@ class DataDecoder(json.JSONDecoder):
             return o
 
         try:
-            cls = cls_from_dtype(o["dtype"])
+            cls = DTYPES[o["dtype"]]
+
+        except (KeyError, TypeError):
+            cls = self._cls_from_dtype(o)
+
+        data = o["data"]
+        guid = o.get("guid")
+        name = o.get("name")
+
+        # Kick-off __from_data__ from a rebuilt Python dictionary instead of the C# data type
+        if IDictionary and isinstance(o, IDictionary[str, object]):
+            data = {key: data[key] for key in data.Keys}
+
+        obj = cls.__jsonload__(data, guid=guid, name=name)
+
+        return obj
+
+    def _cls_from_dtype(self, o):
+        try:
+            return cls_from_dtype(o["dtype"])
 
         except ValueError:
             raise DecoderError(
@@ -226,15 +274,3 @@ class DataDecoder(json.JSONDecoder):
 
         except AttributeError:
             raise DecoderError("The data type can't be found in the specified module: {}.".format(o["dtype"]))
-
-        data = o["data"]
-        guid = o.get("guid")
-        name = o.get("name")
-
-        # Kick-off __from_data__ from a rebuilt Python dictionary instead of the C# data type
-        if IDictionary and isinstance(o, IDictionary[str, object]):
-            data = {key: data[key] for key in data.Keys}
-
-        obj = cls.__jsonload__(data, guid=guid, name=name)
-
-        return obj
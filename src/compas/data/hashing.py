@@ -0,0 +1,289 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+import sys
+
+from .encoders import DataEncoder
+
+PY3 = sys.version_info[0] == 3
+
+if not PY3:
+    string_types = basestring  # noqa: F821
+    integer_types = (int, long)  # noqa: F821
+else:
+    string_types = str
+    integer_types = (int,)
+
+# ==============================================================================
+# Content hashing
+# ==============================================================================
+#
+# The content of a data object is fed to the hash as a stream of tagged values,
+# without converting the data to JSON text first.
+# Every value starts with a one-byte tag.
+# Integers that fit in 64 bits and floats are packed as little-endian 64-bit values,
+# strings are prefixed with the length of their UTF-8 encoding,
+# and lists and dicts are prefixed with their number of items.
+# Lists of which all items are floats, or all items are integers, are packed in one go.
+# The same is done for the values of dicts of which all values are floats,
+# of dicts of such dicts with the same keys, and of dicts of lists of integers.
+#
+# Nested data objects are not expanded.
+# Instead, their own digest is fed to the hash,
+# such that objects that cache their digest are not rehashed.
+
+CHUNKSIZE = 1 << 16
+
+_FLOAT = struct.Struct("<cd")
+_INT = struct.Struct("<cq")
+_SIZE = struct.Struct("<cQ")
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+FLOAT_TYPES = set([float])
+STR_TYPES = set([str])
+DICT_TYPES = set([dict])
+LIST_TYPES = set([list])
+INT_TYPES = [set([t]) for t in integer_types]
+
+_encoder = DataEncoder()
+
+
+def hash_data(h, data):
+    """Feed raw data to a hash object.
+
+    Parameters
+    ----------
+    h : hashlib.sha256
+        The hash object.
+    data : Any
+        The raw data, consisting of dicts, lists, tuples, strings, numbers, booleans, None,
+        and anything else that can be serialised with :class:`compas.data.DataEncoder`.
+
+    Returns
+    -------
+    list[tuple[:class:`compas.data.Data`, bytes]]
+        The nested data objects that were encountered, with the digests that were fed to the hash.
+
+    Raises
+    ------
+    TypeError
+        If the data contains values that cannot be serialised.
+
+    """
+    children = []
+    chunks = []
+    walk = _walker(h, chunks, children)
+    walk(data)
+    h.update(b"".join(chunks))
+    return children
+
+
+def hash_digests(h, children, objects):
+    """Feed the digests of data objects to a hash object.
+
+    Parameters
+    ----------
+    h : hashlib.sha256
+        The hash object.
+    children : list[tuple[:class:`compas.data.Data`, bytes]]
+        The list to which the data objects and their digests are added.
+    objects : iterable[:class:`compas.data.Data`]
+        The data objects.
+
+    Returns
+    -------
+    None
+
+    """
+    objects = list(objects)
+    h.update(_SIZE.pack(b"D", len(objects)))
+    for obj in objects:
+        digest = obj.sha256()
+        h.update(digest)
+        children.append((obj, digest))
+
+
+def _pack_record(keys):
+    if not all(type(key) is str for key in keys):
+        return None
+    chunks = [_SIZE.pack(b"r", len(keys))]
+    for key in keys:
+        key = key.encode("utf-8")
+        chunks.append(_SIZE.pack(b"s", len(key)))
+        chunks.append(key)
+    return b"".join(chunks)
+
+
+def _walker(h, chunks, children):
+    append = chunks.append
+    pack_float = _FLOAT.pack
+    pack_int = _INT.pack
+    pack_size = _SIZE.pack
+    strings = {}
+    arrays = {}
+    records = {}
+
+    def flush():
+        if len(chunks) >= CHUNKSIZE:
+            h.update(b"".join(chunks))
+            del chunks[:]
+
+    def walk_str(value):
+        try:
+            append(strings[value])
+        except KeyError:
+            encoded = value.encode("utf-8")
+            encoded = strings[value] = pack_size(b"s", len(encoded)) + encoded
+            append(encoded)
+
+    def walk_int(value):
+        if _INT_MIN <= value <= _INT_MAX:
+            append(pack_int(b"i", value))
+        else:
+            walk_str(str(value))
+            append(b"I")
+
+    def get_record(keys):
+        try:
+            return records[keys]
+        except KeyError:
+            record = records[keys] = _pack_record(keys)
+            return record
+
+    def pack_array(code, n, value):
+        try:
+            packer = arrays[code, n]
+        except KeyError:
+            packer = arrays[code, n] = struct.Struct("<{}{}".format(n, code))
+        return packer.pack(*value)
+
+    def walk_list(value):
+        n = len(value)
+        if n > 1:
+            types = set(map(type, value))
+            if len(types) == 1:
+                vtype = types.pop()
+                if vtype is float:
+                    append(pack_size(b"d", n))
+                    append(pack_array("d", n, value))
+                    return
+                if vtype in integer_types:
+                    try:
+                        packed = pack_array("q", n, value)
+                    except struct.error:
+                        pass
+                    else:
+                        append(pack_size(b"q", n))
+                        append(packed)
+                        return
+        append(pack_size(b"l", n))
+        for item in value:
+            if type(item) is float:
+                append(pack_float(b"f", item))
+            else:
+                walk(item)
+        flush()
+
+    def walk_keys(keys):
+        # keys are packed as one array of lengths and one blob if they are all strings
+        n = len(keys)
+        if set(map(type, keys)) == STR_TYPES:
+            encoded = [key.encode("utf-8") for key in keys]
+            append(pack_size(b"S", n))
+            append(pack_array("q", n, list(map(len, encoded))))
+            append(b"".join(encoded))
+        else:
+            walk_list(keys)
+
+    def walk_dict(value):
+        n = len(value)
+        if n > 1:
+            values = list(value.values())
+            vtypes = set(map(type, values))
+            if vtypes == FLOAT_TYPES:
+                # dicts with string keys and float values, such as the attributes of a vertex,
+                # are packed as the keys followed by an array of values
+                record = get_record(tuple(value))
+                if record is not None:
+                    append(record)
+                    append(pack_array("d", n, values))
+                    return
+            elif vtypes == DICT_TYPES:
+                # dicts of such dicts with the same keys, such as the vertices of a mesh,
+                # are packed as the keys, the keys of the inner dicts and one array of values
+                layouts = set(map(tuple, values))
+                if len(layouts) == 1:
+                    record = get_record(layouts.pop())
+                    flat = [item for inner in values for item in inner.values()]
+                    if record is not None and (not flat or set(map(type, flat)) == FLOAT_TYPES):
+                        append(pack_size(b"t", n))
+                        walk_keys(list(value))
+                        append(record)
+                        append(pack_array("d", len(flat), flat))
+                        flush()
+                        return
+            elif vtypes == LIST_TYPES:
+                # dicts of lists of integers, such as the faces of a mesh,
+                # are packed as the keys, an array of lengths and one array of values
+                flat = [item for inner in values for item in inner]
+                if set(map(type, flat)) in INT_TYPES:
+                    try:
+                        packed = pack_array("q", len(flat), flat)
+                    except struct.error:
+                        pass
+                    else:
+                        append(pack_size(b"R", n))
+                        walk_keys(list(value))
+                        append(pack_array("q", n, list(map(len, values))))
+                        append(packed)
+                        flush()
+                        return
+        append(pack_size(b"m", n))
+        for key, item in value.items():
+            if type(key) is str:
+                walk_str(key)
+            else:
+                walk(key)
+            if type(item) is float:
+                append(pack_float(b"f", item))
+            else:
+                walk(item)
+        flush()
+
+    def walk(value):
+        vtype = type(value)
+        if vtype is float:
+            append(pack_float(b"f", value))
+        elif vtype is bool:
+            append(b"T" if value else b"F")
+        elif vtype in integer_types:
+            walk_int(value)
+        elif isinstance(value, string_types):
+            walk_str(value)
+        elif value is None:
+            append(b"N")
+        elif vtype is dict:
+            walk_dict(value)
+        elif vtype is list or vtype is tuple:
+            walk_list(value)
+        elif hasattr(value, "sha256") and hasattr(value, "__data__"):
+            digest = value.sha256()
+            append(b"D")
+            append(digest)
+            children.append((value, digest))
+        elif isinstance(value, bool):
+            append(b"T" if value else b"F")
+        elif isinstance(value, integer_types):
+            walk_int(int(value))
+        elif isinstance(value, float):
+            append(pack_float(b"f", value))
+        elif isinstance(value, dict):
+            walk_dict(value)
+        else:
+            walk(_encoder.default(value))
+
+    return walk
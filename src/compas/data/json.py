@@ -2,7 +2,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import io
 import json
+import sys
 import zipfile
 
 from compas import _iotools
@@ -10,6 +12,8 @@ from compas.data import Data  # noqa: F401
 from compas.data import DataDecoder
 from compas.data import DataEncoder
 
+PY3 = sys.version_info[0] == 3
+
 _JSON_CONTENT_FILENAME = "content.json"
 
 
@@ -114,7 +118,7 @@ def json_dumps(data, pretty=False, compact=False, minimal=False):  # type: (...)
     return json.dumps(data, cls=DataEncoder, **kwargs)
 
 
-def json_dumpz(data, zip_filename, pretty=False, compact=False, minimal=False):
+def json_dumpz(data, zip_filename, pretty=False, compact=False, minimal=False, compresslevel=None):
     """Write a collection of COMPAS objects to a compressed JSON file (using ZIP compression).
 
     Parameters
@@ -128,10 +132,13 @@ def json_dumpz(data, zip_filename, pretty=False, compact=False, minimal=False):
         If True, format the output without any whitespace.
     minimal : bool, optional
         If True, exclude the GUID from the JSON output.
+    compresslevel : int, optional
+        The compression level, between 0 (no compression) and 9 (maximum compression).
+        Defaults to the default level of zlib.
 
     Returns
     -------
-    str
+    None
 
     See Also
     --------
@@ -139,11 +146,38 @@ def json_dumpz(data, zip_filename, pretty=False, compact=False, minimal=False):
     :class:`compas.data.json_load`
     :class:`compas.data.json_loads`
     :class:`compas.data.json_loadz`
+    :class:`compas.data.DataArchiveWriter`
+
+    Notes
+    -----
+    On Python 3, the JSON text is written to the ZIP file while it is being encoded,
+    without building the entire string in memory first.
+
     """
-    json_str = json_dumps(data, pretty=pretty, compact=compact, minimal=minimal)
+    DataEncoder.minimal = minimal
+
+    kwargs = {}
+    if pretty:
+        kwargs["sort_keys"] = True
+        kwargs["indent"] = 4
+    if compact:
+        kwargs["indent"] = None
+        kwargs["separators"] = (",", ":")
 
-    with zipfile.ZipFile(zip_filename, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(_JSON_CONTENT_FILENAME, json_str)
+    zipkwargs = {}
+    if compresslevel is not None and PY3:
+        zipkwargs["compresslevel"] = compresslevel
+    compression = zipfile.ZIP_STORED if compresslevel == 0 else zipfile.ZIP_DEFLATED
+
+    with zipfile.ZipFile(zip_filename, "w", compression, **zipkwargs) as zf:
+        if PY3:
+            with zf.open(_JSON_CONTENT_FILENAME, "w", force_zip64=True) as f:
+                writer = io.TextIOWrapper(f, encoding="utf-8")
+                json.dump(data, writer, cls=DataEncoder, **kwargs)
+                writer.flush()
+                writer.detach()
+        else:
+            zf.writestr(_JSON_CONTENT_FILENAME, json.dumps(data, cls=DataEncoder, **kwargs))
 
 
 def json_loadz(zip_file):
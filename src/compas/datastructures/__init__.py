@@ -49,6 +49,7 @@ from .mesh.subdivision import trimesh_subdivide_loop  # noqa: F401
 
 from .graph.graph import Graph
 from .mesh.mesh import Mesh
+from .mesh.compactmesh import CompactMesh
 from .volmesh.volmesh import VolMesh
 from .assembly.exceptions import AssemblyError, FeatureError
 from .assembly.assembly import Assembly
@@ -63,6 +64,7 @@ __all__ = [
     "Datastructure",
     "CellNetwork",
     "Mesh",
+    "CompactMesh",
     "VolMesh",
     "Assembly",
     "Part",
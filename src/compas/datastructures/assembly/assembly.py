@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from compas.data.hashing import hash_data
+from compas.data.hashing import hash_digests
 from compas.datastructures import Datastructure
 from compas.datastructures import Graph
 
@@ -64,6 +66,16 @@ class Assembly(Datastructure):
         tpl = "<Assembly with {} parts and {} connections>"
         return tpl.format(self.graph.number_of_nodes(), self.graph.number_of_edges())
 
+    def _caches_sha256(self):
+        return type(self).__data__ is Assembly.__data__
+
+    def _hash_content(self, h):
+        # the graph contributes its own digest,
+        # which is cached and which is combined from the digests of the parts
+        children = hash_data(h, self.attributes)
+        hash_digests(h, children, [self.graph])
+        return children
+
     # ==========================================================================
     # Constructors
     # ==========================================================================
@@ -6,13 +6,30 @@ from compas.datastructures._mutablemapping import MutableMapping
 
 
 class AttributeView(MutableMapping):
-    """Base class for attribute dict views."""
-
-    def __init__(self, defaults, attr, custom_only=False):
+    """Base class for attribute dict views.
+
+    Parameters
+    ----------
+    defaults : dict[str, Any]
+        The default attributes.
+    attr : dict[str, Any]
+        The custom attributes.
+    custom_only : bool, optional
+        If True, only the custom attributes are included in the iteration over the view.
+    modify : callable, optional
+        A function that is called before the attributes are modified through the view,
+        and that returns the dict of custom attributes to modify.
+        Data structures use it to invalidate their cached hash,
+        and to replace attribute dicts that are shared with a copy-on-write copy.
+
+    """
+
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
         super(AttributeView, self).__init__()
         self.defaults = defaults
         self.attr = attr
         self.custom_only = custom_only
+        self.modify = modify
 
     def __str__(self):
         s = []
@@ -30,9 +47,13 @@ class AttributeView(MutableMapping):
         return self.attr.get(name, self.defaults.get(name))
 
     def __setitem__(self, name, value):
+        if self.modify:
+            self.attr = self.modify()
         self.attr[name] = value
 
     def __delitem__(self, name):
+        if self.modify:
+            self.attr = self.modify()
         del self.attr[name]
 
     def __iter__(self):
@@ -49,37 +70,37 @@ class NodeAttributeView(AttributeView):
     """Mutable Mapping that provides a read/write view of the custom attributes of a node
     combined with the default attributes of all nodes."""
 
-    def __init__(self, defaults, attr, custom_only=False):
-        super(NodeAttributeView, self).__init__(defaults, attr, custom_only)
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
+        super(NodeAttributeView, self).__init__(defaults, attr, custom_only, modify)
 
 
 class VertexAttributeView(AttributeView):
     """Mutable Mapping that provides a read/write view of the custom attributes of a vertex
     combined with the default attributes of all vertices."""
 
-    def __init__(self, defaults, attr, custom_only=False):
-        super(VertexAttributeView, self).__init__(defaults, attr, custom_only)
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
+        super(VertexAttributeView, self).__init__(defaults, attr, custom_only, modify)
 
 
 class EdgeAttributeView(AttributeView):
     """Mutable Mapping that provides a read/write view of the custom attributes of an edge
     combined with the default attributes of all edges."""
 
-    def __init__(self, defaults, attr, custom_only=False):
-        super(EdgeAttributeView, self).__init__(defaults, attr, custom_only)
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
+        super(EdgeAttributeView, self).__init__(defaults, attr, custom_only, modify)
 
 
 class FaceAttributeView(AttributeView):
     """Mutable Mapping that provides a read/write view of the custom attributes of a face
     combined with the default attributes of all faces."""
 
-    def __init__(self, defaults, attr, custom_only=False):
-        super(FaceAttributeView, self).__init__(defaults, attr, custom_only)
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
+        super(FaceAttributeView, self).__init__(defaults, attr, custom_only, modify)
 
 
 class CellAttributeView(AttributeView):
     """Mutable Mapping that provides a read/write view of the custom attributes of a cell
     combined with the default attributes of all faces."""
 
-    def __init__(self, defaults, attr, custom_only=False):
-        super(CellAttributeView, self).__init__(defaults, attr, custom_only)
+    def __init__(self, defaults, attr, custom_only=False, modify=None):
+        super(CellAttributeView, self).__init__(defaults, attr, custom_only, modify)
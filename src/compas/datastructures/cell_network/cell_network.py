@@ -286,6 +286,7 @@ class CellNetwork(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self._vertex
         del self._edge
         del self._face
@@ -304,6 +305,56 @@ class CellNetwork(Datastructure):
         self._max_face = -1
         self._max_cell = -1
 
+    def _caches_sha256(self):
+        return type(self).__data__ is CellNetwork.__data__
+
+    def copy(self, cls=None):
+        """Make an independent copy of the cell network.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.datastructures.CellNetwork`], optional
+            The type of cell network to return.
+            Defaults to the type of the current cell network.
+
+        Returns
+        -------
+        :class:`compas.datastructures.CellNetwork`
+            An independent copy of this cell network.
+
+        Notes
+        -----
+        The storage containers of the cell network are copied directly, without converting the cell network to data and back.
+        Cell networks with a custom data representation are copied through their data.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not self._supports_structural_copy(cls, CellNetwork):
+            return super(CellNetwork, self).copy(cls=cls)
+
+        copy_attributes = self._copy_attributes
+        cell_network = cls(
+            default_vertex_attributes=copy_attributes(self.default_vertex_attributes),
+            default_edge_attributes=copy_attributes(self.default_edge_attributes),
+            default_face_attributes=copy_attributes(self.default_face_attributes),
+            default_cell_attributes=copy_attributes(self.default_cell_attributes),
+        )
+        cell_network.attributes.update(copy_attributes(self.attributes))
+        cell_network.name = self.name
+        cell_network._vertex = {key: copy_attributes(attr) for key, attr in self._vertex.items()}
+        cell_network._edge = {u: {v: dict(attr) for v, attr in nbrs.items()} for u, nbrs in self._edge.items()}
+        cell_network._face = {key: vertices[:] for key, vertices in self._face.items()}
+        cell_network._plane = {u: {v: dict(nbrs) for v, nbrs in plane.items()} for u, plane in self._plane.items()}
+        cell_network._cell = {key: {u: dict(nbrs) for u, nbrs in cell.items()} for key, cell in self._cell.items()}
+        cell_network._edge_data = {key: copy_attributes(attr) for key, attr in self._edge_data.items()}
+        cell_network._face_data = {key: copy_attributes(attr) for key, attr in self._face_data.items()}
+        cell_network._cell_data = {key: copy_attributes(attr) for key, attr in self._cell_data.items()}
+        cell_network._max_vertex = self._max_vertex
+        cell_network._max_face = self._max_face
+        cell_network._max_cell = self._max_cell
+        return cell_network
+
     def vertex_sample(self, size=1):
         """Get the identifiers of a set of random vertices.
 
@@ -488,6 +539,7 @@ class CellNetwork(Datastructure):
         :meth:`add_face`, :meth:`add_cell`, :meth:`add_edge`
 
         """
+        self._sha256 = None
         if key is None:
             key = self._max_vertex = self._max_vertex + 1
         key = int(key)
@@ -535,6 +587,7 @@ class CellNetwork(Datastructure):
         However, whenever a face is added all edges of that face are added as well.
 
         """
+        self._sha256 = None
         if u not in self._vertex:
             raise ValueError("Cannot add edge {}, {} has no vertex {}".format((u, v), self.name, u))
         if v not in self._vertex:
@@ -602,6 +655,7 @@ class CellNetwork(Datastructure):
         However, the cycle direction doesn't matter.
 
         """
+        self._sha256 = None
         if len(vertices) < 3:
             return
 
@@ -695,6 +749,7 @@ class CellNetwork(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         mesh = self._faces_to_unified_mesh(faces)
         if mesh is None:
             raise ValueError("Cannot add cell, faces {} do not form a closed cell.".format(faces))
@@ -765,6 +820,7 @@ class CellNetwork(Datastructure):
         None
 
         """
+        self._sha256 = None
         u, v = edge
         if self._plane[u] and v in self._plane[u]:
             faces = self._plane[u][v].keys()
@@ -797,6 +853,7 @@ class CellNetwork(Datastructure):
         -------
         None
         """
+        self._sha256 = None
         vertices = self.face_vertices(face)
         # check first
         for u, v in pairwise(vertices + vertices[:1]):
@@ -830,6 +887,7 @@ class CellNetwork(Datastructure):
         :meth:`delete_vertex`, :meth:`delete_halfface`
 
         """
+        self._sha256 = None
         # remove the cell from the faces
         cell_faces = self.cell_faces(cell)
         for face in cell_faces:
@@ -1439,6 +1497,7 @@ class CellNetwork(Datastructure):
         Named arguments overwrite correpsonding name-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1477,6 +1536,7 @@ class CellNetwork(Datastructure):
         if vertex not in self._vertex:
             raise KeyError(vertex)
         if value is not None:
+            self._sha256 = None
             self._vertex[vertex][name] = value
             return None
         if name in self._vertex[vertex]:
@@ -1515,6 +1575,7 @@ class CellNetwork(Datastructure):
 
         """
         if name in self._vertex[vertex]:
+            self._sha256 = None
             del self._vertex[vertex][name]
 
     def vertex_attributes(self, vertex, names=None, values=None):
@@ -1553,13 +1614,15 @@ class CellNetwork(Datastructure):
             raise KeyError(vertex)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self._vertex[vertex][name] = value
             return
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
-            return VertexAttributeView(self.default_vertex_attributes, self._vertex[vertex])
+            self._sha256 = None
+            return VertexAttributeView(self.default_vertex_attributes, self._vertex[vertex], modify=self._attributes_modifier("_vertex", vertex))
         values = []
         for name in names:
             if name in self._vertex[vertex]:
@@ -2084,6 +2147,7 @@ class CellNetwork(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2126,6 +2190,7 @@ class CellNetwork(Datastructure):
             return self.default_edge_attributes[name]
 
     def unset_edge_attribute(self, edge, name):
+        self._sha256 = None
         """Unset the attribute of an edge.
 
         Parameters
@@ -2193,11 +2258,13 @@ class CellNetwork(Datastructure):
             raise KeyError(edge)
 
         if names and values:
+            self._sha256 = None
             for name, value in zip(names, values):
                 self._edge_data[tuple(sorted(edge))][name] = value
             return
         if not names:
-            return EdgeAttributeView(self.default_edge_attributes, self._edge_data[tuple(sorted(edge))])
+            self._sha256 = None
+            return EdgeAttributeView(self.default_edge_attributes, self._edge_data[tuple(sorted(edge))], modify=self._attributes_modifier("_edge_data", tuple(sorted(edge))))
         values = []
         for name in names:
             value = self.edge_attribute(edge, name)
@@ -2736,6 +2803,7 @@ class CellNetwork(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2774,6 +2842,7 @@ class CellNetwork(Datastructure):
             raise KeyError(face)
 
         if value is not None:
+            self._sha256 = None
             if face not in self._face_data:
                 self._face_data[face] = {}
             self._face_data[face][name] = value
@@ -2816,6 +2885,7 @@ class CellNetwork(Datastructure):
             raise KeyError(face)
 
         if face in self._face_data and name in self._face_data[face]:
+            self._sha256 = None
             del self._face_data[face][name]
 
     def face_attributes(self, face, names=None, values=None):
@@ -2852,6 +2922,7 @@ class CellNetwork(Datastructure):
             raise KeyError(face)
 
         if names and values:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if face not in self._face_data:
                     self._face_data[face] = {}
@@ -2859,7 +2930,8 @@ class CellNetwork(Datastructure):
             return
 
         if not names:
-            return FaceAttributeView(self.default_face_attributes, self._face_data.setdefault(face, {}))
+            self._sha256 = None
+            return FaceAttributeView(self.default_face_attributes, self._face_data.setdefault(face, {}), modify=self._attributes_modifier("_face_data", face))
 
         values = []
         for name in names:
@@ -3459,6 +3531,7 @@ class CellNetwork(Datastructure):
         Named arguments overwrite corresponding cell-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -3496,6 +3569,7 @@ class CellNetwork(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if value is not None:
+            self._sha256 = None
             if cell not in self._cell_data:
                 self._cell_data[cell] = {}
             self._cell_data[cell][name] = value
@@ -3538,6 +3612,7 @@ class CellNetwork(Datastructure):
             raise KeyError(cell)
         if cell in self._cell_data:
             if name in self._cell_data[cell]:
+                self._sha256 = None
                 del self._cell_data[cell][name]
 
     def cell_attributes(self, cell, names=None, values=None):
@@ -3573,13 +3648,15 @@ class CellNetwork(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if names and values is not None:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if cell not in self._cell_data:
                     self._cell_data[cell] = {}
                 self._cell_data[cell][name] = value
             return
         if not names:
-            return CellAttributeView(self.default_cell_attributes, self._cell_data.setdefault(cell, {}))
+            self._sha256 = None
+            return CellAttributeView(self.default_cell_attributes, self._cell_data.setdefault(cell, {}), modify=self._attributes_modifier("_cell_data", cell))
         values = []
         for name in names:
             value = self.cell_attribute(cell, name)
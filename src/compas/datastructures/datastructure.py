@@ -9,7 +9,15 @@ except ImportError:
 else:
     G = TypeVar("G", bound="Datastructure")
 
+import binascii
+import hashlib
+from copy import deepcopy
+
 from compas.data import Data
+from compas.data.hashing import hash_data
+
+# attribute values of these types can be shared between copies of a data structure
+ATOMIC_TYPES = frozenset([bool, int, float, str, type(None)])
 
 
 class Datastructure(Data):
@@ -20,6 +28,8 @@ class Datastructure(Data):
         self.attributes = attributes or {}
         self._aabb = None
         self._obb = None
+        self._shared_attributes = set()
+        self._sha256 = None
 
     @property
     def aabb(self):
@@ -33,6 +43,163 @@ class Datastructure(Data):
             self._obb = self.compute_obb()
         return self._obb
 
+    def _supports_structural_copy(self, cls, base):
+        # a structural copy is only possible if the source and the target
+        # use the storage and the data representation of the base class
+        return (
+            isinstance(self, base)
+            and issubclass(cls, base)
+            and type(self).__data__ is base.__data__
+            and cls.__data__ is base.__data__
+            and cls.__from_data__.__func__ is base.__from_data__.__func__
+        )
+
+    @staticmethod
+    def _copy_attributes(attr):
+        """Make an independent copy of an attribute dict.
+
+        Parameters
+        ----------
+        attr : dict[str, Any]
+            The attribute dict.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        if ATOMIC_TYPES.issuperset(map(type, attr.values())):
+            return dict(attr)
+        return deepcopy(attr)
+
+    @staticmethod
+    def _share_attributes(attr):
+        """Share an attribute dict with a copy-on-write copy.
+
+        Parameters
+        ----------
+        attr : dict[str, Any]
+            The attribute dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            The attribute dict itself, if all its values are atomic,
+            or an independent deep copy otherwise.
+
+        Notes
+        -----
+        Mutable values, such as lists, can be modified in place without going through the attribute methods.
+        Therefore, attribute dicts with mutable values are never shared.
+
+        """
+        if ATOMIC_TYPES.issuperset(map(type, attr.values())):
+            return attr
+        return deepcopy(attr)
+
+    def _modify_attributes(self, name):
+        """Prepare the attribute dicts of a container for modification.
+
+        The cached hash of the data structure is invalidated,
+        and attribute dicts that are shared with a copy-on-write copy are replaced by independent copies.
+
+        Parameters
+        ----------
+        name : str
+            The name of the container of attribute dicts.
+
+        Returns
+        -------
+        None
+
+        """
+        self._sha256 = None
+        if name not in self._shared_attributes:
+            return
+        self._shared_attributes.remove(name)
+        container = getattr(self, name)
+        copy_attributes = self._copy_attributes
+        container.update([(key, copy_attributes(attr)) for key, attr in container.items()])
+
+    def _attributes_modifier(self, name, *keys):
+        """Construct a function that prepares an attribute dict of a container for modification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the container of attribute dicts.
+        *keys : hashable
+            The keys of the attribute dict in the (nested) container.
+
+        Returns
+        -------
+        callable
+            A function without parameters that calls :meth:`_modify_attributes`
+            and returns the current attribute dict, which may have been replaced by a copy.
+
+        """
+
+        def modify():
+            self._modify_attributes(name)
+            attr = getattr(self, name)
+            for key in keys:
+                attr = attr[key]
+            return attr
+
+        return modify
+
+    def _caches_sha256(self):
+        # the hash can only be cached by data structures
+        # that invalidate it whenever their data is modified
+        return False
+
+    def sha256(self, as_string=False):
+        """Compute a hash of the data for comparison during version control using the sha256 algorithm.
+
+        Parameters
+        ----------
+        as_string : bool, optional
+            If True, return the digest in hexadecimal format rather than as bytes.
+
+        Returns
+        -------
+        bytes | str
+
+        Notes
+        -----
+        Mesh, graph, volmesh, cell network and assembly data structures cache their hash.
+        The cached hash is invalidated by the methods that modify the data structure,
+        and by modifications through the attribute views returned by methods such as ``vertex_attributes``, ``face_attributes`` and ``edge_attributes``.
+        Direct modifications of the underlying attribute dicts, such as ``mesh.vertex[key]``, ``mesh.facedata`` or ``mesh.edgedata``,
+        are not tracked and leave a stale hash.
+        The general attributes, and the data objects contained in the data structure, such as the parts of an assembly,
+        are checked for modifications whenever the hash is requested.
+
+        """
+        if not self._caches_sha256():
+            return super(Datastructure, self).sha256(as_string=as_string)
+
+        h = hashlib.sha256()
+        hash_data(h, self.attributes)
+        attributes = h.digest()
+
+        cache = self._sha256
+        if cache is not None:
+            digest, cached_attributes, children = cache
+            if attributes != cached_attributes or any(obj.sha256() != child for obj, child in children):
+                cache = None
+
+        if cache is None:
+            h = hashlib.sha256()
+            h.update(self.__dtype__.encode())
+            children = self._hash_content(h)
+            digest = h.digest()
+            self._sha256 = digest, attributes, children
+
+        if as_string:
+            return binascii.hexlify(digest).decode("ascii")
+        return digest
+
     def compute_aabb(self):
         """Compute the axis-aligned bounding box of the datastructure.
 
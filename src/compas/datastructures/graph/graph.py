@@ -49,6 +49,15 @@ from .planarity import graph_is_xy
 from .smoothing import graph_smooth_centroid
 
 
+def _literal_key(key):
+    # the keys of the serialized data are the representations of the original keys,
+    # which are mostly integers
+    try:
+        return int(key)
+    except ValueError:
+        return literal_eval(key)
+
+
 class Graph(Datastructure):
     """Data structure for describing the relationships between nodes connected by edges.
 
@@ -136,7 +145,7 @@ class Graph(Datastructure):
         return data
 
     def __after_json_load__(self, data):
-        l_e = literal_eval
+        l_e = _literal_key
         nodes = data["node"] or {}
         edges = data["edge"] or {}
         data["node"] = {l_e(node): attr for node, attr in nodes.items()}
@@ -151,11 +160,10 @@ class Graph(Datastructure):
         )
         graph.attributes.update(data["attributes"] or {})
         data = graph.__after_json_load__(data)
-        for node, attr in iter(data["node"].items()):
-            graph.add_node(key=node, attr_dict=attr)
-        for u, nbrs in iter(data["edge"].items()):
-            for v, attr in iter(nbrs.items()):
-                graph.add_edge(u, v, attr_dict=attr)
+        graph._add_nodes_and_edges(
+            data["node"].items(),
+            ((u, v, attr) for u, nbrs in data["edge"].items() for v, attr in nbrs.items()),
+        )
         graph._max_node = data.get("max_node", graph._max_node)
         return graph
 
@@ -299,8 +307,8 @@ class Graph(Datastructure):
         for line in lines:
             sp = line[0]
             ep = line[1]
-            a = TOL.geometric_key(sp, precision)
-            b = TOL.geometric_key(ep, precision)
+            a = TOL.geometric_key_numeric(sp, precision)
+            b = TOL.geometric_key_numeric(ep, precision)
             node[a] = sp
             node[b] = ep
             edges.append((a, b))
@@ -500,6 +508,82 @@ class Graph(Datastructure):
         self.node = {}
         self.edge = {}
         self.adjacency = {}
+        self._shared_attributes.clear()
+        self._sha256 = None
+
+    def copy(self, cls=None, copy_on_write=False):
+        """Make an independent copy of the graph.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.datastructures.Graph`], optional
+            The type of graph to return.
+            Defaults to the type of the current graph.
+        copy_on_write : bool, optional
+            If True, the attribute dicts of the nodes and edges are shared by the graph and the copy,
+            until the attributes of the nodes or edges are modified on either one of them.
+            Attribute dicts with mutable values, such as lists, are copied immediately.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Graph`
+            An independent copy of this graph.
+
+        Notes
+        -----
+        The storage containers of the graph are copied directly, without converting the graph to data and back.
+        Graphs with a custom data representation are copied through their data.
+
+        With ``copy_on_write=True``, modifications of the shared attributes are only detected
+        if they are made through the attribute methods of the graph, such as :meth:`node_attribute`,
+        or through the attribute dicts returned by :meth:`node_attributes` and :meth:`edge_attributes`,
+        and not if the attribute dicts in :attr:`node` and :attr:`edge` are modified directly.
+        Attribute values that are not of an atomic type (bool, int, float, str or None) can be modified in place,
+        for example with ``graph.node_attribute(0, "loads").append(load)``.
+        Therefore, attribute dicts with such values are never shared, but deep-copied immediately.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not self._supports_structural_copy(cls, Graph):
+            return super(Graph, self).copy(cls=cls)
+
+        copy_attributes = self._copy_attributes
+        graph = cls(
+            default_node_attributes=copy_attributes(self.default_node_attributes),
+            default_edge_attributes=copy_attributes(self.default_edge_attributes),
+        )
+        graph.attributes.update(copy_attributes(self.attributes))
+        graph.name = self.name
+
+        if copy_on_write:
+            share_attributes = self._share_attributes
+            graph.node = {key: share_attributes(attr) for key, attr in self.node.items()}
+            graph.edge = {u: {v: share_attributes(attr) for v, attr in nbrs.items()} for u, nbrs in self.edge.items()}
+            shared = ("node", "edge")
+            self._shared_attributes.update(shared)
+            graph._shared_attributes.update(shared)
+        else:
+            graph.node = {key: copy_attributes(attr) for key, attr in self.node.items()}
+            graph.edge = {u: {v: copy_attributes(attr) for v, attr in nbrs.items()} for u, nbrs in self.edge.items()}
+
+        graph.adjacency = {key: dict(nbrs) for key, nbrs in self.adjacency.items()}
+        graph._max_node = self._max_node
+        return graph
+
+    def _caches_sha256(self):
+        return type(self).__data__ is Graph.__data__
+
+    def _modify_attributes(self, name):
+        if name != "edge":
+            return super(Graph, self)._modify_attributes(name)
+        self._sha256 = None
+        if name not in self._shared_attributes:
+            return
+        self._shared_attributes.remove(name)
+        copy_attributes = self._copy_attributes
+        for nbrs in self.edge.values():
+            nbrs.update([(v, copy_attributes(attr)) for v, attr in nbrs.items()])
 
     def node_sample(self, size=1):
         """Get a list of identifiers of a random set of n nodes.
@@ -707,9 +791,12 @@ class Graph(Datastructure):
             pass
 
         if key not in self.node:
+            self._sha256 = None
             self.node[key] = {}
             self.edge[key] = {}
             self.adjacency[key] = {}
+        else:
+            self._modify_attributes("node")
         attr = attr_dict or {}
         attr.update(kwattr)
         self.node[key].update(attr)
@@ -750,6 +837,10 @@ class Graph(Datastructure):
             u = self.add_node(u)
         if v not in self.node:
             v = self.add_node(v)
+        if v in self.edge[u]:
+            self._modify_attributes("edge")
+        else:
+            self._sha256 = None
         data = self.edge[u].get(v, {})
         data.update(attr)
         self.edge[u][v] = data
@@ -759,6 +850,59 @@ class Graph(Datastructure):
             self.adjacency[v][u] = None
         return u, v
 
+    def _add_nodes_and_edges(self, nodes, edges):
+        """Add nodes and edges to the graph in bulk.
+
+        This is equivalent to adding the nodes and edges one by one with :meth:`add_node` and :meth:`add_edge`,
+        but the node, edge and adjacency dicts are filled in one pass per kind of element.
+
+        Parameters
+        ----------
+        nodes : iterable[tuple[hashable, dict[str, Any] | None]]
+            Pairs of node identifiers and node attributes.
+        edges : iterable[tuple[hashable, hashable, dict[str, Any] | None]]
+            Triplets of the identifiers of the nodes of the edges and edge attributes.
+            Nodes that do not exist yet are added automatically.
+
+        Returns
+        -------
+        None
+
+        """
+        self._sha256 = None
+        node = self.node
+        edge = self.edge
+        adjacency = self.adjacency
+        max_node = self._max_node
+        for key, attr in nodes:
+            try:
+                if key > max_node:
+                    max_node = key
+            except (ValueError, TypeError):
+                pass
+            if key not in node:
+                node[key] = dict(attr) if attr else {}
+                edge[key] = {}
+                adjacency[key] = {}
+            elif attr:
+                node[key].update(attr)
+        self._max_node = max_node
+
+        for u, v, attr in edges:
+            if u not in node:
+                self.add_node(u)
+            if v not in node:
+                self.add_node(v)
+            data = edge[u].get(v)
+            if data is None:
+                edge[u][v] = dict(attr) if attr else {}
+            elif attr:
+                data.update(attr)
+            adjacency[u][v] = None
+            nbrs = adjacency[v]
+            if u not in nbrs:
+                nbrs[u] = None
+
     # --------------------------------------------------------------------------
     # Modifiers
     # --------------------------------------------------------------------------
@@ -785,6 +929,7 @@ class Graph(Datastructure):
         >>>
 
         """
+        self._sha256 = None
         if key in self.edge:
             del self.edge[key]
         if key in self.adjacency:
@@ -823,6 +968,7 @@ class Graph(Datastructure):
 
         """
         u, v = edge
+        self._sha256 = None
 
         if u in self.edge and v in self.edge[u]:
             del self.edge[u][v]
@@ -1075,6 +1221,8 @@ class Graph(Datastructure):
         :meth:`nodes`, :meth:`nodes_where`, :meth:`nodes_where_predicate`
 
         """
+        if data:
+            self._modify_attributes("edge")
         for u, nbrs in iter(self.edge.items()):
             for v, attr in iter(nbrs.items()):
                 if data:
@@ -1203,7 +1351,7 @@ class Graph(Datastructure):
         :meth:`compas.topology.astar_shortest_path`
 
         """
-        return astar_shortest_path(self.adjacency, u, v)
+        return astar_shortest_path(self, u, v)
 
     # --------------------------------------------------------------------------
     # Default attributes
@@ -1231,6 +1379,7 @@ class Graph(Datastructure):
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
+        self._sha256 = None
         self.default_node_attributes.update(attr_dict)
 
     def update_default_edge_attributes(self, attr_dict=None, **kwattr):
@@ -1255,6 +1404,7 @@ class Graph(Datastructure):
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
+        self._sha256 = None
         self.default_edge_attributes.update(attr_dict)
 
     # --------------------------------------------------------------------------
@@ -1294,6 +1444,7 @@ class Graph(Datastructure):
         if key not in self.node:
             raise KeyError(key)
         if value is not None:
+            self._modify_attributes("node")
             self.node[key][name] = value
             return
         if name in self.node[key]:
@@ -1328,6 +1479,7 @@ class Graph(Datastructure):
 
         """
         if name in self.node[key]:
+            self._modify_attributes("node")
             del self.node[key][name]
 
     def node_attributes(self, key, names=None, values=None):
@@ -1366,13 +1518,15 @@ class Graph(Datastructure):
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._modify_attributes("node")
             for name, value in zip(names, values):
                 self.node[key][name] = value
             return
         # use it as a getter
         if not names:
             # return all node attributes as a dict
-            return NodeAttributeView(self.default_node_attributes, self.node[key])
+            self._modify_attributes("node")
+            return NodeAttributeView(self.default_node_attributes, self.node[key], modify=self._attributes_modifier("node", key))
         values = []
         for name in names:
             if name in self.node[key]:
@@ -1496,10 +1650,11 @@ class Graph(Datastructure):
         u, v = key
         if u not in self.edge or v not in self.edge[u]:
             raise KeyError(key)
-        attr = self.edge[u][v]
         if value is not None:
-            attr[name] = value
+            self._modify_attributes("edge")
+            self.edge[u][v][name] = value
             return
+        attr = self.edge[u][v]
         if name in attr:
             return attr[name]
         if name in self.default_edge_attributes:
@@ -1537,9 +1692,9 @@ class Graph(Datastructure):
         u, v = key
         if u not in self.edge or v not in self.edge[u]:
             raise KeyError(key)
-        attr = self.edge[u][v]
-        if name in attr:
-            del attr[name]
+        if name in self.edge[u][v]:
+            self._modify_attributes("edge")
+            del self.edge[u][v][name]
 
     def edge_attributes(self, key, names=None, values=None):
         """Get or set multiple attributes of an edge.
@@ -1582,7 +1737,8 @@ class Graph(Datastructure):
         # use it as a getter
         if not names:
             # get the entire attribute dict
-            return EdgeAttributeView(self.default_edge_attributes, self.edge[u][v])
+            self._modify_attributes("edge")
+            return EdgeAttributeView(self.default_edge_attributes, self.edge[u][v], modify=self._attributes_modifier("edge", u, v))
         # get only the values of the named attributes
         values = []
         for name in names:
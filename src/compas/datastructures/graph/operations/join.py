@@ -92,7 +92,7 @@ def graph_polylines(graph, splits=None):
     # geometric keys of split points
     if splits is None:
         splits = []
-    stop_geom_keys = set([TOL.geometric_key(xyz) for xyz in splits])
+    stop_geom_keys = set([TOL.geometric_key_numeric(xyz) for xyz in splits])
 
     polylines = []
     edges_to_visit = set(graph.edges())
@@ -104,9 +104,9 @@ def graph_polylines(graph, splits=None):
         # get adjacent edges until the polyline is closed...
         while polyline[0] != polyline[-1]:
             # ... or until both end are non-two-valent vertices
-            if len(graph.neighbors(polyline[-1])) != 2 or TOL.geometric_key(graph.node_coordinates(polyline[-1])) in stop_geom_keys:
+            if len(graph.neighbors(polyline[-1])) != 2 or TOL.geometric_key_numeric(graph.node_coordinates(polyline[-1])) in stop_geom_keys:
                 polyline = list(reversed(polyline))
-                if len(graph.neighbors(polyline[-1])) != 2 or TOL.geometric_key(graph.node_coordinates(polyline[-1])) in stop_geom_keys:
+                if len(graph.neighbors(polyline[-1])) != 2 or TOL.geometric_key_numeric(graph.node_coordinates(polyline[-1])) in stop_geom_keys:
                     break
 
             # add next edge
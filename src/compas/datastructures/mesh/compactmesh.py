@@ -0,0 +1,969 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+import compas
+
+if compas.PY2:
+    from collections import Mapping
+else:
+    from collections.abc import Mapping
+
+from compas.datastructures._mutablemapping import Mapping as _Mapping
+from compas.datastructures._mutablemapping import MutableMapping as _MutableMapping
+from compas.datastructures.datastructure import Datastructure
+from compas.itertools import pairwise
+from compas.tolerance import TOL
+from compas.topology import unify_cycles
+
+from .mesh import Mesh
+
+XYZ = ("x", "y", "z")
+
+
+# ==============================================================================
+# Views
+# ==============================================================================
+
+
+class CompactVertexAttributes(_MutableMapping):
+    """Mutable mapping exposing the attributes of a single vertex of a compact mesh.
+
+    The coordinates are read from and written to the coordinate buffer of the mesh.
+    All other attributes are stored in a sparse dict that is only created when needed.
+
+    """
+
+    __slots__ = ("mesh", "key")
+
+    def __init__(self, mesh, key):
+        self.mesh = mesh
+        self.key = key
+
+    def __getitem__(self, name):
+        if name in XYZ:
+            return self.mesh._xyz[3 * self.key + XYZ.index(name)]
+        attr = self.mesh._vertexdata.get(self.key)
+        if attr is None:
+            raise KeyError(name)
+        return attr[name]
+
+    def __setitem__(self, name, value):
+        if name in XYZ:
+            self.mesh._xyz[3 * self.key + XYZ.index(name)] = value
+        else:
+            self.mesh._vertexdata.setdefault(self.key, {})[name] = value
+
+    def __delitem__(self, name):
+        if name in XYZ:
+            # coordinates are always stored
+            # removing them resets them to their default values
+            self.mesh._xyz[3 * self.key + XYZ.index(name)] = self.mesh.default_vertex_attributes.get(name, 0.0)
+            return
+        attr = self.mesh._vertexdata.get(self.key)
+        if attr is None:
+            raise KeyError(name)
+        del attr[name]
+
+    def __contains__(self, name):
+        if name in XYZ:
+            return True
+        attr = self.mesh._vertexdata.get(self.key)
+        return attr is not None and name in attr
+
+    def __iter__(self):
+        for name in XYZ:
+            yield name
+        attr = self.mesh._vertexdata.get(self.key)
+        if attr:
+            for name in attr:
+                yield name
+
+    def __len__(self):
+        return 3 + len(self.mesh._vertexdata.get(self.key) or ())
+
+
+class CompactVertexView(_Mapping):
+    """Read-only mapping of vertex identifiers to vertex attribute mappings."""
+
+    __slots__ = ("mesh",)
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return CompactVertexAttributes(self.mesh, key)
+
+    def __contains__(self, key):
+        alive = self.mesh._vertex_alive
+        return isinstance(key, int) and 0 <= key < len(alive) and alive[key] == 1
+
+    def __iter__(self):
+        for key, alive in enumerate(self.mesh._vertex_alive):
+            if alive:
+                yield key
+
+    def __len__(self):
+        return self.mesh._vertex_alive.count(1)
+
+
+class CompactFaceView(_MutableMapping):
+    """Mapping of face identifiers to lists of vertex identifiers.
+
+    Assigning a new list of vertices to an existing face replaces the vertices of the face.
+    Deleting a face removes it from the face buffers and updates its halfedges in the halfedge index.
+
+    """
+
+    __slots__ = ("mesh",)
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def __getitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        start = self.mesh._face_start[fkey]
+        return self.mesh._face_indices[start : start + self.mesh._face_size[fkey]].tolist()
+
+    def __setitem__(self, fkey, vertices):
+        if fkey not in self:
+            raise KeyError(fkey)
+        self.mesh._set_face_vertices(fkey, vertices)
+
+    def __delitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        self.mesh._remove_face(fkey)
+
+    def __contains__(self, fkey):
+        alive = self.mesh._face_alive
+        return isinstance(fkey, int) and 0 <= fkey < len(alive) and alive[fkey] == 1
+
+    def __iter__(self):
+        for fkey, alive in enumerate(self.mesh._face_alive):
+            if alive:
+                yield fkey
+
+    def __len__(self):
+        return self.mesh._face_alive.count(1)
+
+
+class CompactHalfedgeRow(_Mapping):
+    """Read-only mapping of the neighbors of a vertex to the faces of the corresponding halfedges.
+
+    Halfedges that were removed from the row after the halfedge index was built have a negative target, and are skipped.
+
+    """
+
+    __slots__ = ("mesh", "start", "stop")
+
+    def __init__(self, mesh, start, stop):
+        self.mesh = mesh
+        self.start = start
+        self.stop = stop
+
+    def __getitem__(self, v):
+        i = self.mesh._halfedge_slot(self.start, self.stop, v)
+        if i is None:
+            raise KeyError(v)
+        face = self.mesh._halfedge_faces[i]
+        return None if face == -1 else face
+
+    def __contains__(self, v):
+        return self.mesh._halfedge_slot(self.start, self.stop, v) is not None
+
+    def __iter__(self):
+        targets = self.mesh._halfedge_targets
+        for i in range(self.start, self.stop):
+            if targets[i] >= 0:
+                yield targets[i]
+
+    def __len__(self):
+        targets = self.mesh._halfedge_targets
+        return sum(1 for i in range(self.start, self.stop) if targets[i] >= 0)
+
+
+class CompactHalfedgeView(_Mapping):
+    """Read-only mapping of vertex identifiers to their halfedge rows.
+
+    The halfedge index is (re)built from the face buffers on first access after a topological change.
+
+    """
+
+    __slots__ = ("mesh",)
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def __getitem__(self, u):
+        if u not in self.mesh._vertex_view:
+            raise KeyError(u)
+        offsets = self.mesh._halfedge_index()
+        return CompactHalfedgeRow(self.mesh, offsets[u], offsets[u + 1])
+
+    def __contains__(self, u):
+        return u in self.mesh._vertex_view
+
+    def __iter__(self):
+        return iter(self.mesh._vertex_view)
+
+    def __len__(self):
+        return len(self.mesh._vertex_view)
+
+
+# ==============================================================================
+# Mesh
+# ==============================================================================
+
+
+class CompactMesh(Mesh):
+    """Mesh data structure with an array-based storage engine.
+
+    The compact mesh is a drop-in replacement for :class:`compas.datastructures.Mesh`
+    for large, mostly static meshes.
+    Instead of a dict of attribute dicts per vertex, a dict of lists per face, and a dict of dicts for the halfedges,
+    the compact mesh stores
+
+    * the vertex coordinates in one contiguous buffer of doubles,
+    * the faces as offsets into one contiguous buffer of vertex indices, and
+    * the halfedges as flat integer arrays, indexed per vertex.
+
+    Parameters
+    ----------
+    default_vertex_attributes : dict[str, Any], optional
+        Default values for vertex attributes.
+    default_edge_attributes : dict[str, Any], optional
+        Default values for edge attributes.
+    default_face_attributes : dict[str, Any], optional
+        Default values for face attributes.
+    name : str, optional
+        Then name of the mesh.
+    **kwargs : dict, optional
+        Additional keyword arguments, which are stored in the attributes dict.
+
+    Notes
+    -----
+    Vertex and face identifiers are indices into the storage buffers.
+    Deleted vertices and faces leave an unused slot behind, which is why identifiers remain stable.
+
+    The attributes :attr:`vertex`, :attr:`face` and :attr:`halfedge` are views on the storage buffers.
+    All accessors, attribute methods, and geometry queries of :class:`compas.datastructures.Mesh` work unchanged,
+    as do the builders and modifiers that are implemented in terms of :meth:`add_vertex`, :meth:`add_face`, :meth:`delete_vertex` and :meth:`delete_face`.
+    Operations that edit the halfedge dictionaries directly, such as :meth:`collapse_edge`, are not supported.
+    Convert to a regular mesh first with ``mesh.copy(cls=Mesh)``.
+
+    Examples
+    --------
+    >>> from compas.datastructures import CompactMesh
+    >>> mesh = CompactMesh.from_meshgrid(dx=10, nx=10)
+    >>> mesh.number_of_vertices()
+    121
+    >>> mesh.vertex_coordinates(120)
+    [10.0, 10.0, 0.0]
+    >>> mesh.face_vertices(0)
+    [0, 11, 12, 1]
+
+    """
+
+    def __init__(self, default_vertex_attributes=None, default_edge_attributes=None, default_face_attributes=None, name=None, **kwargs):  # fmt: skip
+        # the storage buffers replace the dicts of the base class
+        # therefore the base class constructor is skipped
+        Datastructure.__init__(self, kwargs, name=name)
+        self._max_vertex = -1
+        self._max_face = -1
+        self._xyz = array("d")
+        self._vertex_alive = bytearray()
+        self._vertexdata = {}
+        self._face_start = array("i")
+        self._face_size = array("i")
+        self._face_indices = array("i")
+        self._face_alive = bytearray()
+        self._face_garbage = 0
+        self._halfedge_offsets = None
+        self._halfedge_targets = None
+        self._halfedge_faces = None
+        self._vertex_view = CompactVertexView(self)
+        self._face_view = CompactFaceView(self)
+        self._halfedge_view = CompactHalfedgeView(self)
+        self.facedata = {}
+        self.edgedata = {}
+        self.default_vertex_attributes = {"x": 0.0, "y": 0.0, "z": 0.0}
+        self.default_edge_attributes = {}
+        self.default_face_attributes = {}
+        if default_vertex_attributes:
+            self.default_vertex_attributes.update(default_vertex_attributes)
+        if default_edge_attributes:
+            self.default_edge_attributes.update(default_edge_attributes)
+        if default_face_attributes:
+            self.default_face_attributes.update(default_face_attributes)
+
+    def __str__(self):
+        tpl = "<CompactMesh with {} vertices, {} faces, {} edges>"
+        return tpl.format(self.number_of_vertices(), self.number_of_faces(), self.number_of_edges())
+
+    @property
+    def __data__(self):
+        return {
+            "attributes": self.attributes,
+            "default_vertex_attributes": self.default_vertex_attributes,
+            "default_edge_attributes": self.default_edge_attributes,
+            "default_face_attributes": self.default_face_attributes,
+            "vertex": {str(vertex): dict(attr) for vertex, attr in self._vertex_view.items()},
+            "face": {str(face): vertices for face, vertices in self._face_view.items()},
+            "facedata": {str(face): attr for face, attr in self.facedata.items()},
+            "edgedata": self.edgedata,
+            "max_vertex": self._max_vertex,
+            "max_face": self._max_face,
+        }
+
+    # --------------------------------------------------------------------------
+    # Properties
+    # --------------------------------------------------------------------------
+
+    @property
+    def vertex(self):
+        return self._vertex_view
+
+    @property
+    def face(self):
+        return self._face_view
+
+    @property
+    def halfedge(self):
+        return self._halfedge_view
+
+    # --------------------------------------------------------------------------
+    # Constructors
+    # --------------------------------------------------------------------------
+
+    @classmethod
+    def from_vertices_and_faces(cls, vertices, faces):  # type: (...) -> CompactMesh
+        """Construct a compact mesh object from a list of vertices and faces.
+
+        Parameters
+        ----------
+        vertices : list[list[float]] | dict[int, list[float]]
+            A list of vertices, represented by their XYZ coordinates,
+            or a dictionary of vertex keys pointing to their XYZ coordinates.
+        faces : list[list[int]] | dict[int, list[int]]
+            A list of faces, represented by a list of indices referencing the list of vertex coordinates,
+            or a dictionary of face keys pointing to a list of indices referencing the list of vertex coordinates.
+
+        Returns
+        -------
+        :class:`compas.datastructures.CompactMesh`
+            A compact mesh object.
+
+        Notes
+        -----
+        If the vertices and faces are provided as lists,
+        the storage buffers are filled in bulk.
+
+        """
+        if isinstance(vertices, Mapping) or isinstance(faces, Mapping):
+            return super(CompactMesh, cls).from_vertices_and_faces(vertices, faces)
+
+        mesh = cls()
+        xyz = mesh._xyz
+        for x, y, z in iter(vertices):
+            xyz.extend((x, y, z))
+        n = len(xyz) // 3
+        mesh._vertex_alive = bytearray([1]) * n
+        mesh._max_vertex = n - 1
+
+        for face in faces:
+            mesh.add_face(face)
+        return mesh
+
+    # --------------------------------------------------------------------------
+    # Helpers
+    # --------------------------------------------------------------------------
+
+    def clear(self):
+        """Clear all the mesh data.
+
+        Returns
+        -------
+        None
+
+        """
+        self._xyz = array("d")
+        self._vertex_alive = bytearray()
+        self._vertexdata = {}
+        self._face_start = array("i")
+        self._face_size = array("i")
+        self._face_indices = array("i")
+        self._face_alive = bytearray()
+        self._face_garbage = 0
+        self._invalidate_halfedges()
+        self.facedata = {}
+        self.edgedata = {}
+        self._max_vertex = -1
+        self._max_face = -1
+
+    def _invalidate_halfedges(self):
+        self._halfedge_offsets = None
+        self._halfedge_targets = None
+        self._halfedge_faces = None
+
+    def _halfedge_index(self):
+        """Build the halfedge index from the face buffers, if necessary.
+
+        Returns
+        -------
+        array
+            The offsets of the halfedge rows of the vertices.
+
+        """
+        if self._halfedge_offsets is not None:
+            return self._halfedge_offsets
+
+        nv = len(self._vertex_alive)
+        start = self._face_start
+        size = self._face_size
+        indices = self._face_indices
+
+        # count the outgoing halfedges of the faces per vertex
+        degree = [0] * nv
+        for fkey, alive in enumerate(self._face_alive):
+            if alive:
+                a = start[fkey]
+                for i in range(a, a + size[fkey]):
+                    degree[indices[i]] += 1
+
+        offsets = [0] * (nv + 1)
+        for u in range(nv):
+            offsets[u + 1] = offsets[u] + degree[u]
+
+        # scatter the face halfedges into their vertex rows
+        fill = offsets[:-1]
+        targets = array("i", [0]) * offsets[nv]
+        faces = array("i", [0]) * offsets[nv]
+        for fkey, alive in enumerate(self._face_alive):
+            if alive:
+                a = start[fkey]
+                b = a + size[fkey]
+                for i in range(a, b):
+                    u = indices[i]
+                    v = indices[i + 1] if i + 1 < b else indices[a]
+                    j = fill[u]
+                    targets[j] = v
+                    faces[j] = fkey
+                    fill[u] = j + 1
+
+        # find the halfedges without a twin
+        # the twins are added with the "outside" face
+        boundary = [[] for _ in range(nv)]
+        for u in range(nv):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                for j in range(offsets[v], offsets[v + 1]):
+                    if targets[j] == u:
+                        break
+                else:
+                    boundary[v].append(u)
+
+        if any(boundary):
+            merged_offsets = [0] * (nv + 1)
+            merged_targets = array("i")
+            merged_faces = array("i")
+            for u in range(nv):
+                a, b = offsets[u], offsets[u + 1]
+                merged_targets.extend(targets[a:b])
+                merged_faces.extend(faces[a:b])
+                for v in boundary[u]:
+                    merged_targets.append(v)
+                    merged_faces.append(-1)
+                merged_offsets[u + 1] = len(merged_targets)
+            offsets, targets, faces = merged_offsets, merged_targets, merged_faces
+
+        self._halfedge_offsets = array("i", offsets)
+        self._halfedge_targets = targets
+        self._halfedge_faces = faces
+        return self._halfedge_offsets
+
+    def _halfedge_slot(self, start, stop, v, face=None):
+        # the position of the halfedge to v in a row of the halfedge index
+        # optionally, only the halfedge of a specific face is considered
+        if v == -1:
+            return None
+        targets = self._halfedge_targets
+        faces = self._halfedge_faces
+        for i in range(start, stop):
+            if targets[i] == v and (face is None or faces[i] == face):
+                return i
+        return None
+
+    def _set_face_vertices(self, fkey, vertices):
+        size = len(vertices)
+        previous = self._face_size[fkey]
+        if size == previous:
+            start = self._face_start[fkey]
+            self._face_indices[start : start + size] = array("i", vertices)
+        else:
+            self._face_start[fkey] = len(self._face_indices)
+            self._face_size[fkey] = size
+            self._face_indices.extend(vertices)
+            self._discard_face_indices(previous)
+        self._invalidate_halfedges()
+
+    def _remove_face(self, fkey):
+        """Remove a face from the face buffers and from the halfedge index.
+
+        Parameters
+        ----------
+        fkey : int
+            The identifier of the face.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The edges of the face that no longer have a face on either side.
+            The list is empty if the halfedge index was not built.
+
+        Notes
+        -----
+        The halfedges of the face are updated in place, such that deleting faces one by one does not rebuild the halfedge index every time.
+        The halfedges of the face become boundary halfedges,
+        unless their twin is a boundary halfedge already, in which case both are removed from their rows.
+
+        """
+        removed = []
+        offsets = self._halfedge_offsets
+        if offsets is not None:
+            targets = self._halfedge_targets
+            faces = self._halfedge_faces
+            for u, v in self.face_halfedges(fkey):
+                i = self._halfedge_slot(offsets[u], offsets[u + 1], v, face=fkey)
+                j = self._halfedge_slot(offsets[v], offsets[v + 1], u)
+                if i is None or j is None:
+                    # the index does not match the faces, for example because of non-manifold edges
+                    self._invalidate_halfedges()
+                    removed = []
+                    break
+                faces[i] = -1
+                if faces[j] == -1:
+                    targets[i] = -1
+                    targets[j] = -1
+                    removed.append((u, v))
+        self._face_alive[fkey] = 0
+        self._discard_face_indices(self._face_size[fkey])
+        return removed
+
+    def _discard_face_indices(self, count):
+        # the face buffer is compacted once more than half of it is no longer used
+        self._face_garbage += count
+        if self._face_garbage > len(self._face_indices) // 2:
+            self._compact_faces()
+
+    def _compact_faces(self):
+        start = self._face_start
+        size = self._face_size
+        indices = self._face_indices
+        compacted = array("i")
+        for fkey, alive in enumerate(self._face_alive):
+            if alive:
+                a = start[fkey]
+                start[fkey] = len(compacted)
+                compacted.extend(indices[a : a + size[fkey]])
+            else:
+                start[fkey] = 0
+                size[fkey] = 0
+        self._face_indices = compacted
+        self._face_garbage = 0
+
+    def compact(self):
+        """Reclaim the storage of deleted faces and of replaced face vertices.
+
+        Returns
+        -------
+        None
+            The mesh is modified in place.
+
+        Notes
+        -----
+        The vertex indices of the faces are copied into a new buffer without gaps, and the halfedge index is rebuilt on next access.
+        The identifiers of vertices and faces do not change.
+        The face buffer is also compacted automatically, when more than half of it is no longer in use.
+
+        """
+        self._compact_faces()
+        self._invalidate_halfedges()
+
+    # --------------------------------------------------------------------------
+    # Builders & Modifiers
+    # --------------------------------------------------------------------------
+
+    def add_vertex(self, key=None, attr_dict=None, **kwattr):
+        """Add a vertex to the mesh object.
+
+        Parameters
+        ----------
+        key : int, optional
+            The vertex identifier.
+        attr_dict : dict[str, Any], optional
+            A dictionary of vertex attributes.
+        **kwattr : dict[str, Any], optional
+            A dictionary of additional attributes compiled of remaining named arguments.
+
+        Returns
+        -------
+        int
+            The identifier of the vertex.
+
+        Notes
+        -----
+        The identifier of a vertex is its index in the coordinate buffer.
+        Providing a key that is much higher than the current number of vertices reserves storage for all intermediate vertices.
+
+        """
+        if key is None:
+            key = self._max_vertex = self._max_vertex + 1
+        key = int(key)
+        if key > self._max_vertex:
+            self._max_vertex = key
+        n = len(self._vertex_alive)
+        if key >= n:
+            self._vertex_alive.extend(bytearray(key + 1 - n))
+            self._xyz.extend([0.0] * (3 * (key + 1 - n)))
+        if not self._vertex_alive[key]:
+            self._vertex_alive[key] = 1
+            self._xyz[3 * key : 3 * key + 3] = array("d", [self.default_vertex_attributes.get(name, 0.0) for name in XYZ])
+            self._vertexdata.pop(key, None)
+            self._invalidate_halfedges()
+        attr = attr_dict or {}
+        attr.update(kwattr)
+        if attr:
+            view = CompactVertexAttributes(self, key)
+            for name, value in attr.items():
+                view[name] = value
+        return key
+
+    def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
+        """Add a face to the mesh object.
+
+        Parameters
+        ----------
+        vertices : list[int]
+            A list of vertex keys.
+        attr_dict : dict[str, Any], optional
+            A dictionary of face attributes.
+        **kwattr : dict[str, Any], optional
+            A dictionary of additional attributes compiled of remaining named arguments.
+
+        Returns
+        -------
+        int
+            The key of the face.
+
+        Raises
+        ------
+        KeyError
+            If one of the vertices does not exist.
+
+        """
+        if vertices[-1] == vertices[0]:
+            vertices = vertices[:-1]
+        vertices = [int(key) for key in vertices]
+        vertices[:] = [u for u, v in pairwise(vertices + vertices[:1]) if u != v]
+        if len(vertices) < 3:
+            return
+        for key in vertices:
+            if key not in self._vertex_view:
+                raise KeyError(key)
+        if fkey is None:
+            fkey = self._max_face = self._max_face + 1
+        fkey = int(fkey)
+        if fkey > self._max_face:
+            self._max_face = fkey
+        n = len(self._face_alive)
+        if fkey >= n:
+            self._face_alive.extend(bytearray(fkey + 1 - n))
+            self._face_start.extend([0] * (fkey + 1 - n))
+            self._face_size.extend([0] * (fkey + 1 - n))
+        elif self._face_alive[fkey]:
+            self._face_garbage += self._face_size[fkey]
+        self._face_alive[fkey] = 1
+        self._face_start[fkey] = len(self._face_indices)
+        self._face_size[fkey] = len(vertices)
+        self._face_indices.extend(vertices)
+        attr = attr_dict or {}
+        attr.update(kwattr)
+        if attr:
+            self.facedata.setdefault(fkey, {}).update(attr)
+        self._invalidate_halfedges()
+        return fkey
+
+    def _add_vertices_and_faces(self, vertices, faces, validate=True):
+        # the compact storage is filled through the regular builders
+        for key, attr in vertices:
+            self.add_vertex(key=key, attr_dict=dict(attr) if attr else None)
+        for fkey, corners, attr in faces:
+            self.add_face(corners, fkey=fkey, attr_dict=dict(attr) if attr else None)
+
+    def delete_vertex(self, key):
+        """Delete a vertex from the mesh and everything that is attached to it.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        None
+
+        """
+        if key not in self._vertex_view:
+            raise KeyError(key)
+        for fkey in set(self.vertex_faces(key)):
+            self.delete_face(fkey)
+        for nbr in self.vertex_neighbors(key):
+            self.edgedata.pop(str(tuple(sorted((key, nbr)))), None)
+        self._vertex_alive[key] = 0
+        self._vertexdata.pop(key, None)
+
+    def delete_face(self, fkey):
+        """Delete a face from the mesh object.
+
+        Parameters
+        ----------
+        fkey : int
+            The identifier of the face.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The halfedges of the face are updated in the halfedge index,
+        which therefore does not have to be rebuilt after every deletion.
+
+        """
+        if fkey not in self._face_view:
+            raise KeyError(fkey)
+        self._halfedge_index()
+        for u, v in self._remove_face(fkey):
+            self.edgedata.pop(str(tuple(sorted((u, v)))), None)
+        self.facedata.pop(fkey, None)
+
+    def remove_unused_vertices(self):
+        """Remove all unused vertices from the mesh object.
+
+        Returns
+        -------
+        None
+
+        """
+        offsets = self._halfedge_index()
+        targets = self._halfedge_targets
+        for u in list(self.vertices()):
+            if all(targets[i] == -1 for i in range(offsets[u], offsets[u + 1])):
+                self._vertex_alive[u] = 0
+                self._vertexdata.pop(u, None)
+
+    cull_vertices = remove_unused_vertices
+
+    def flip_cycles(self):
+        """Flip the cycle directions of all faces.
+
+        Returns
+        -------
+        None
+            The mesh is modified in place.
+
+        """
+        indices = self._face_indices
+        for fkey in self.faces():
+            a = self._face_start[fkey]
+            b = a + self._face_size[fkey]
+            indices[a:b] = indices[a:b][::-1]
+        self._invalidate_halfedges()
+
+    def unify_cycles(self, root=None):
+        """Unify the cycles of the mesh.
+
+        Returns
+        -------
+        None
+            The mesh is modified in place.
+
+        """
+        index_vertex = list(self.vertices())
+        vertex_index = {vertex: index for index, vertex in enumerate(index_vertex)}
+        index_face = list(self.faces())
+
+        vertices = self.vertices_attributes("xyz")
+        faces = [[vertex_index[vertex] for vertex in self.face_vertices(face)] for face in index_face]
+
+        unify_cycles(vertices, faces)
+
+        for face, indices in zip(index_face, faces):
+            self._set_face_vertices(face, [index_vertex[index] for index in indices])
+
+    def remove_duplicate_vertices(self, precision=None):
+        """Remove all duplicate vertices and clean up any affected faces.
+
+        Parameters
+        ----------
+        precision : int, optional
+            Precision for converting numbers to strings.
+            Default is :attr:`TOL.precision`.
+
+        Returns
+        -------
+        None
+            The mesh is modified in-place.
+
+        """
+        gkey_vertex = {}
+        vertex_vertex = {}
+        for vertex in self.vertices():
+            gkey = TOL.geometric_key_numeric(self.vertex_coordinates(vertex), precision=precision)
+            vertex_vertex[vertex] = gkey_vertex.setdefault(gkey, vertex)
+
+        for vertex, test in vertex_vertex.items():
+            if test != vertex:
+                self._vertex_alive[vertex] = 0
+                self._vertexdata.pop(vertex, None)
+
+        for face in list(self.faces()):
+            seen = set()
+            vertices = []
+            for vertex in self.face_vertices(face):
+                vertex = vertex_vertex[vertex]
+                if vertex not in seen:
+                    seen.add(vertex)
+                    vertices.append(vertex)
+            self._set_face_vertices(face, vertices)
+
+    # --------------------------------------------------------------------------
+    # Accessors
+    # --------------------------------------------------------------------------
+
+    def vertices(self, data=False):
+        """Iterate over the vertices of the mesh.
+
+        Parameters
+        ----------
+        data : bool, optional
+            If True, yield the vertex attributes in addition to the vertex identifiers.
+
+        Yields
+        ------
+        int | tuple[int, dict[str, Any]]
+            If `data` is False, the next vertex identifier.
+            If `data` is True, the next vertex as a (key, attr) tuple.
+
+        """
+        for key, alive in enumerate(self._vertex_alive):
+            if alive:
+                if not data:
+                    yield key
+                else:
+                    yield key, self.vertex_attributes(key)
+
+    def faces(self, data=False):
+        """Iterate over the faces of the mesh.
+
+        Parameters
+        ----------
+        data : bool, optional
+            If True, yield the face attributes in addition to the face identifiers.
+
+        Yields
+        ------
+        int | tuple[int, dict[str, Any]]
+            If `data` is False, the next face identifier.
+            If `data` is True, the next face as a (fkey, attr) tuple.
+
+        """
+        for key, alive in enumerate(self._face_alive):
+            if alive:
+                if not data:
+                    yield key
+                else:
+                    yield key, self.face_attributes(key)
+
+    # --------------------------------------------------------------------------
+    # Info
+    # --------------------------------------------------------------------------
+
+    def number_of_vertices(self):
+        """Count the number of vertices in the mesh.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._vertex_alive.count(1)
+
+    def number_of_faces(self):
+        """Count the number of faces in the mesh.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._face_alive.count(1)
+
+    # --------------------------------------------------------------------------
+    # Vertex geometry
+    # --------------------------------------------------------------------------
+
+    def vertex_coordinates(self, key, axes="xyz"):
+        """Return the coordinates of a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+        axes : str, optional
+            The axes along which to take the coordinates.
+            Should be a combination of x, y, and z.
+
+        Returns
+        -------
+        list[float]
+            Coordinates of the vertex.
+
+        """
+        if key not in self._vertex_view:
+            raise KeyError(key)
+        if axes == "xyz":
+            return self._xyz[3 * key : 3 * key + 3].tolist()
+        return [self._xyz[3 * key + XYZ.index(axis)] for axis in axes]
+
+    # --------------------------------------------------------------------------
+    # Face geometry
+    # --------------------------------------------------------------------------
+
+    def face_coordinates(self, fkey, axes="xyz"):
+        """Compute the coordinates of the vertices of a face.
+
+        Parameters
+        ----------
+        fkey : int
+            The identifier of the face.
+        axes : str, optional
+            The axes alon which to take the coordinates.
+            Should be a combination of x, y, and z.
+
+        Returns
+        -------
+        list[list[float]]
+            The coordinates of the vertices of the face.
+
+        """
+        xyz = self._xyz
+        if axes == "xyz":
+            return [xyz[3 * key : 3 * key + 3].tolist() for key in self.face_vertices(fkey)]
+        return [self.vertex_coordinates(key, axes=axes) for key in self.face_vertices(fkey)]
@@ -0,0 +1,265 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import add
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import frombuffer
+from numpy import intc
+from numpy import repeat
+from numpy import sqrt
+from numpy import where
+from numpy import zeros
+
+
+def mesh_vertices_xyz_numpy(mesh):
+    """Gather the coordinates of the vertices of a mesh in one array.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The vertex coordinates as an array of shape (n, 3).
+    dict[int, int] | None
+        A mapping of vertex identifiers to rows of the coordinate array,
+        or None if the identifiers are the row indices.
+
+    Notes
+    -----
+    For a :class:`compas.datastructures.CompactMesh` the coordinate buffer of the mesh is used directly, without copying.
+
+    """
+    from compas.datastructures import CompactMesh
+
+    if isinstance(mesh, CompactMesh):
+        return frombuffer(mesh._xyz, dtype=float).reshape((-1, 3)), None
+    vertex_index = mesh.vertex_index()
+    return array(mesh.vertices_attributes("xyz"), dtype=float).reshape((-1, 3)), vertex_index
+
+
+def mesh_face_corners_numpy(mesh, faces):
+    """Gather the corners of a collection of faces in flat arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    faces : list[int]
+        The identifiers of the faces.
+
+    Returns
+    -------
+    ndarray
+        The vertex coordinates as an array of shape (n, 3).
+    dict[int, int] | None
+        A mapping of vertex identifiers to rows of the coordinate array,
+        or None if the identifiers are the row indices.
+    ndarray
+        The rows of the coordinate array corresponding to the corners of the faces, face after face.
+    ndarray
+        The number of corners per face.
+
+    """
+    from compas.datastructures import CompactMesh
+
+    xyz, vertex_index = mesh_vertices_xyz_numpy(mesh)
+
+    if isinstance(mesh, CompactMesh):
+        # the corners are gathered directly from the face buffers
+        faces = asarray(faces, dtype=int)
+        starts = frombuffer(mesh._face_start, dtype=intc)[faces]
+        sizes = frombuffer(mesh._face_size, dtype=intc)[faces].astype(int)
+        offsets = sizes.cumsum() - sizes
+        positions = arange(sizes.sum()) - repeat(offsets, sizes) + repeat(starts, sizes)
+        return xyz, None, frombuffer(mesh._face_indices, dtype=intc)[positions].astype(int), sizes
+
+    corners = []
+    sizes = []
+    for face in faces:
+        vertices = mesh.face_vertices(face)
+        corners.extend(vertices)
+        sizes.append(len(vertices))
+    if vertex_index is not None:
+        corners = [vertex_index[vertex] for vertex in corners]
+    return xyz, vertex_index, asarray(corners, dtype=int), asarray(sizes, dtype=int)
+
+
+def _face_fans(xyz, corners, sizes):
+    # the fan triangles connecting the centroid of every face
+    # to the consecutive pairs of corners of the face
+    starts = zeros(len(sizes), dtype=int)
+    starts[1:] = sizes.cumsum()[:-1]
+    ends = starts + sizes - 1
+    owner = repeat(arange(len(sizes)), sizes)
+    points = xyz[corners]
+    centroids = add.reduceat(points, starts, axis=0) / sizes[:, None]
+    nxt = arange(len(corners)) + 1
+    nxt[ends] = starts
+    oa = points - centroids[owner]
+    ob = oa[nxt]
+    return cross(oa, ob), centroids, starts, ends, owner
+
+
+def _unitize(vectors):
+    lengths = sqrt(einsum("ij,ij->i", vectors, vectors))
+    lengths[lengths == 0] = 1.0
+    return vectors / lengths[:, None]
+
+
+def mesh_faces_normals_numpy(mesh, faces, unitized=True):
+    """Compute the normals of multiple faces of a mesh in a single vectorised pass.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    faces : list[int]
+        The identifiers of the faces.
+    unitized : bool, optional
+        If True, unitize the normal vectors.
+
+    Returns
+    -------
+    ndarray
+        The normals as an array of shape (f, 3).
+
+    See Also
+    --------
+    :func:`compas.geometry.normal_polygon`
+
+    """
+    if not faces:
+        return zeros((0, 3))
+    xyz, _, corners, sizes = mesh_face_corners_numpy(mesh, faces)
+    fans, _, starts, _, _ = _face_fans(xyz, corners, sizes)
+    normals = 0.5 * add.reduceat(fans, starts, axis=0)
+    if unitized:
+        return _unitize(normals)
+    return normals
+
+
+def mesh_faces_areas_numpy(mesh, faces):
+    """Compute the areas of multiple faces of a mesh in a single vectorised pass.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    faces : list[int]
+        The identifiers of the faces.
+
+    Returns
+    -------
+    ndarray
+        The areas as an array of shape (f,).
+
+    See Also
+    --------
+    :func:`compas.geometry.area_polygon`
+
+    """
+    if not faces:
+        return zeros(0)
+    xyz, _, corners, sizes = mesh_face_corners_numpy(mesh, faces)
+    fans, _, starts, ends, owner = _face_fans(xyz, corners, sizes)
+    # the contribution of every fan triangle is signed
+    # according to its orientation w.r.t. the triangle of the last and first corner
+    reference = fans[ends][owner]
+    lengths = sqrt(einsum("ij,ij->i", fans, fans))
+    signs = where(einsum("ij,ij->i", fans, reference) > 0, 1.0, -1.0)
+    signs[ends] = 1.0
+    return abs(0.5 * add.reduceat(signs * lengths, starts))
+
+
+def mesh_faces_centroids_numpy(mesh, faces):
+    """Compute the centroids of multiple faces of a mesh in a single vectorised pass.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    faces : list[int]
+        The identifiers of the faces.
+
+    Returns
+    -------
+    ndarray
+        The centroids as an array of shape (f, 3).
+
+    See Also
+    --------
+    :func:`compas.geometry.centroid_points`
+
+    """
+    if not faces:
+        return zeros((0, 3))
+    xyz, _, corners, sizes = mesh_face_corners_numpy(mesh, faces)
+    starts = zeros(len(sizes), dtype=int)
+    starts[1:] = sizes.cumsum()[:-1]
+    return add.reduceat(xyz[corners], starts, axis=0) / sizes[:, None]
+
+
+def mesh_edges_lengths_numpy(mesh, edges):
+    """Compute the lengths of multiple edges of a mesh in a single vectorised pass.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    edges : list[tuple[int, int]]
+        The identifiers of the edges.
+
+    Returns
+    -------
+    ndarray
+        The lengths as an array of shape (e,).
+
+    """
+    if not edges:
+        return zeros(0)
+    xyz, vertex_index = mesh_vertices_xyz_numpy(mesh)
+    if vertex_index is not None:
+        edges = [(vertex_index[u], vertex_index[v]) for u, v in edges]
+    edges = asarray(edges, dtype=int)
+    vectors = xyz[edges[:, 1]] - xyz[edges[:, 0]]
+    return sqrt(einsum("ij,ij->i", vectors, vectors))
+
+
+def mesh_vertices_normals_numpy(mesh, vertices):
+    """Compute the normals of multiple vertices of a mesh in a single vectorised pass.
+
+    The normal at a vertex is the normalized sum of the area-weighted normals of the connected faces.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    vertices : list[int]
+        The identifiers of the vertices.
+
+    Returns
+    -------
+    ndarray
+        The normals as an array of shape (v, 3).
+
+    """
+    if not vertices:
+        return zeros((0, 3))
+    faces = list(mesh.faces())
+    xyz, vertex_index, corners, sizes = mesh_face_corners_numpy(mesh, faces)
+    normals = zeros(xyz.shape)
+    if faces:
+        fans, _, starts, _, owner = _face_fans(xyz, corners, sizes)
+        facenormals = 0.5 * add.reduceat(fans, starts, axis=0)
+        add.at(normals, corners, facenormals[owner])
+    if vertex_index is not None:
+        vertices = [vertex_index[vertex] for vertex in vertices]
+    return _unitize(normals[asarray(vertices, dtype=int)])
@@ -217,11 +217,11 @@ class Mesh(Datastructure):
         facedata = data.get("facedata") or {}
         edgedata = data.get("edgedata") or {}
 
-        for key, attr in iter(vertex.items()):
-            mesh.add_vertex(key=key, attr_dict=attr)
-
-        for fkey, vertices in iter(face.items()):
-            mesh.add_face(vertices, fkey=fkey, attr_dict=facedata.get(fkey))
+        mesh._add_vertices_and_faces(
+            vertex.items(),
+            ((fkey, vertices, facedata.get(fkey)) for fkey, vertices in face.items()),
+            validate=False,
+        )
 
         mesh.edgedata = edgedata
         mesh._max_vertex = data.get("max_vertex", mesh._max_vertex)
@@ -430,13 +430,13 @@ class Mesh(Datastructure):
         """
         corners = []
         for polyline in boundary_polylines + other_polylines:
-            corners.append(TOL.geometric_key(polyline[0]))
-            corners.append(TOL.geometric_key(polyline[-1]))
+            corners.append(TOL.geometric_key_numeric(polyline[0]))
+            corners.append(TOL.geometric_key_numeric(polyline[-1]))
 
         boundary = []
         for polyline in boundary_polylines:
             for xyz in polyline:
-                boundary.append(TOL.geometric_key(xyz))
+                boundary.append(TOL.geometric_key_numeric(xyz))
 
         lines = []
         for polyline in boundary_polylines + other_polylines:
@@ -450,7 +450,7 @@ class Mesh(Datastructure):
 
         internal = []
         for vertex in mesh.vertices():
-            if TOL.geometric_key(mesh.vertex_coordinates(vertex)) in corners:
+            if TOL.geometric_key_numeric(mesh.vertex_coordinates(vertex)) in corners:
                 internal.append(vertex)
 
         vertices = [mesh.vertex_coordinates(vertex) for vertex in internal]
@@ -460,14 +460,14 @@ class Mesh(Datastructure):
         for face in mesh.faces():
             notonboundary = []
             for vertex in mesh.face_vertices(face):
-                gkey = TOL.geometric_key(mesh.vertex_coordinates(vertex))
+                gkey = TOL.geometric_key_numeric(mesh.vertex_coordinates(vertex))
                 if gkey not in boundary:
                     notonboundary.append(vertex)
 
             if len(notonboundary):
                 indices = []
                 for vertex in mesh.face_vertices(face):
-                    gkey = TOL.geometric_key(mesh.vertex_coordinates(vertex))
+                    gkey = TOL.geometric_key_numeric(mesh.vertex_coordinates(vertex))
                     if gkey in corners:
                         indices.append(vertex_index[vertex])
                 faces.append(indices)
@@ -496,18 +496,16 @@ class Mesh(Datastructure):
         mesh = cls()
 
         if isinstance(vertices, Mapping):
-            for key, xyz in vertices.items():
-                mesh.add_vertex(key=key, attr_dict=dict(zip(("x", "y", "z"), xyz)))
+            vertices = ((key, dict(zip(("x", "y", "z"), xyz))) for key, xyz in vertices.items())
         else:
-            for x, y, z in iter(vertices):
-                mesh.add_vertex(x=x, y=y, z=z)
+            vertices = ((None, {"x": x, "y": y, "z": z}) for x, y, z in vertices)
 
         if isinstance(faces, Mapping):
-            for fkey, vertices in faces.items():
-                mesh.add_face(vertices, fkey)
+            faces = ((fkey, face, None) for fkey, face in faces.items())
         else:
-            for face in iter(faces):
-                mesh.add_face(face)
+            faces = ((None, face, None) for face in faces)
+
+        mesh._add_vertices_and_faces(vertices, faces)
 
         return mesh
 
@@ -596,7 +594,7 @@ class Mesh(Datastructure):
         for points in polygons:
             face = []
             for xyz in points:
-                gkey = TOL.geometric_key(xyz, precision=precision)
+                gkey = TOL.geometric_key_numeric(xyz, precision=precision)
                 gkey_xyz[gkey] = xyz
                 face.append(gkey)
             faces.append(face)
@@ -828,6 +826,82 @@ class Mesh(Datastructure):
     # Helpers
     # --------------------------------------------------------------------------
 
+    def copy(self, cls=None, copy_on_write=False):
+        """Make an independent copy of the mesh.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.datastructures.Mesh`], optional
+            The type of mesh to return.
+            Defaults to the type of the current mesh.
+        copy_on_write : bool, optional
+            If True, the attribute dicts of the vertices, faces and edges are shared by the mesh and the copy,
+            until the attributes of the vertices, faces or edges are modified on either one of them.
+            Attribute dicts with mutable values, such as lists, are copied immediately.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+            An independent copy of this mesh.
+
+        Notes
+        -----
+        The storage containers of the mesh are copied directly, without converting the mesh to data and back.
+        Meshes with a custom data representation are copied through their data.
+
+        With ``copy_on_write=True``, modifications of the shared attributes are only detected
+        if they are made through the attribute methods of the mesh, such as :meth:`vertex_attribute`,
+        or through the attribute dicts returned by :meth:`vertex_attributes`, :meth:`face_attributes` and :meth:`edge_attributes`,
+        and not if the attribute dicts in :attr:`vertex`, :attr:`facedata` and :attr:`edgedata` are modified directly.
+        Attribute values that are not of an atomic type (bool, int, float, str or None) can be modified in place,
+        for example with ``mesh.vertex_attribute(0, "loads").append(load)``.
+        Therefore, attribute dicts with such values are never shared, but deep-copied immediately.
+
+        Examples
+        --------
+        >>> mesh = Mesh.from_meshgrid(10, 10)
+        >>> other = mesh.copy(copy_on_write=True)
+        >>> other.vertex_attribute(0, "z", 1.0)
+        >>> mesh.vertex_attribute(0, "z")
+        0.0
+
+        """
+        if not cls:
+            cls = type(self)
+        if not self._supports_structural_copy(cls, Mesh):
+            return super(Mesh, self).copy(cls=cls)
+
+        copy_attributes = self._copy_attributes
+        mesh = cls(
+            default_vertex_attributes=copy_attributes(self.default_vertex_attributes),
+            default_edge_attributes=copy_attributes(self.default_edge_attributes),
+            default_face_attributes=copy_attributes(self.default_face_attributes),
+        )
+        mesh.attributes.update(copy_attributes(self.attributes))
+        mesh.name = self.name
+
+        if copy_on_write:
+            share_attributes = self._share_attributes
+            mesh.vertex = {key: share_attributes(attr) for key, attr in self.vertex.items()}
+            mesh.facedata = {key: share_attributes(attr) for key, attr in self.facedata.items()}
+            mesh.edgedata = {key: share_attributes(attr) for key, attr in self.edgedata.items()}
+            shared = ("vertex", "facedata", "edgedata")
+            self._shared_attributes.update(shared)
+            mesh._shared_attributes.update(shared)
+        else:
+            mesh.vertex = {key: copy_attributes(attr) for key, attr in self.vertex.items()}
+            mesh.facedata = {key: copy_attributes(attr) for key, attr in self.facedata.items()}
+            mesh.edgedata = {key: copy_attributes(attr) for key, attr in self.edgedata.items()}
+
+        mesh.face = {key: vertices[:] for key, vertices in self.face.items()}
+        mesh.halfedge = {key: dict(nbrs) for key, nbrs in self.halfedge.items()}
+        mesh._max_vertex = self._max_vertex
+        mesh._max_face = self._max_face
+        return mesh
+
+    def _caches_sha256(self):
+        return type(self).__data__ is Mesh.__data__
+
     def clear(self):
         """Clear all the mesh data.
 
@@ -836,6 +910,7 @@ class Mesh(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self.vertex
         del self.edgedata
         del self.halfedge
@@ -848,6 +923,7 @@ class Mesh(Datastructure):
         self.facedata = {}
         self._max_vertex = -1
         self._max_face = -1
+        self._shared_attributes.clear()
 
     def vertex_sample(self, size=1):
         """A random sample of the vertices.
@@ -1036,8 +1112,11 @@ class Mesh(Datastructure):
         if key > self._max_vertex:
             self._max_vertex = key
         if key not in self.vertex:
+            self._sha256 = None
             self.vertex[key] = {}
             self.halfedge[key] = {}
+        else:
+            self._modify_attributes("vertex")
         attr = attr_dict or {}
         attr.update(kwattr)
         self.vertex[key].update(attr)
@@ -1080,6 +1159,7 @@ class Mesh(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if vertices[-1] == vertices[0]:
             vertices = vertices[:-1]
         vertices = [int(key) for key in vertices]
@@ -1101,6 +1181,83 @@ class Mesh(Datastructure):
                 self.halfedge[v][u] = None
         return fkey
 
+    def _add_vertices_and_faces(self, vertices, faces, validate=True):
+        """Add vertices and faces to the mesh in bulk.
+
+        This is equivalent to adding the vertices and faces one by one with :meth:`add_vertex` and :meth:`add_face`,
+        but the vertex, face and halfedge dicts are filled in one pass per kind of element.
+
+        Parameters
+        ----------
+        vertices : iterable[tuple[int | str | None, dict[str, Any] | None]]
+            Pairs of vertex identifiers and vertex attributes.
+            If the identifier is None, one is generated automatically.
+        faces : iterable[tuple[int | str | None, list[int], dict[str, Any] | None]]
+            Triplets of face identifiers, face vertices and face attributes.
+            If the identifier is None, one is generated automatically.
+        validate : bool, optional
+            If True, the faces are cleaned up and validated as in :meth:`add_face`.
+            Closing vertices and consecutive duplicate vertices are removed,
+            faces with less than three vertices are skipped,
+            and a KeyError is raised for faces referring to vertices that do not exist.
+            If False, the faces are trusted to be valid, e.g. when they are loaded from the data of a mesh.
+
+        Returns
+        -------
+        None
+
+        """
+        self._sha256 = None
+        vertex = self.vertex
+        halfedge = self.halfedge
+        max_vertex = self._max_vertex
+        for key, attr in vertices:
+            if key is None:
+                key = max_vertex = max_vertex + 1
+            else:
+                key = int(key)
+                if key > max_vertex:
+                    max_vertex = key
+            if key not in vertex:
+                vertex[key] = dict(attr) if attr else {}
+                halfedge[key] = {}
+            elif attr:
+                vertex[key].update(attr)
+        self._max_vertex = max_vertex
+
+        face = self.face
+        facedata = self.facedata
+        max_face = self._max_face
+        for fkey, corners, attr in faces:
+            if validate:
+                if corners[-1] == corners[0]:
+                    corners = corners[:-1]
+                corners = list(map(int, corners))
+                if len(set(corners)) < len(corners):
+                    corners = [u for u, v in zip(corners, corners[1:] + corners[:1]) if u != v]
+                if len(corners) < 3:
+                    continue
+                for key in corners:
+                    if key not in vertex:
+                        raise KeyError(key)
+            else:
+                corners = list(corners)
+            if fkey is None:
+                fkey = max_face = max_face + 1
+            else:
+                fkey = int(fkey)
+                if fkey > max_face:
+                    max_face = fkey
+            face[fkey] = corners
+            if fkey not in facedata:
+                facedata[fkey] = dict(attr) if attr else {}
+            for u, v in zip(corners, corners[1:] + corners[:1]):
+                halfedge[u][v] = fkey
+                nbrs = halfedge[v]
+                if u not in nbrs:
+                    nbrs[u] = None
+        self._max_face = max_face
+
     # rename this to "add"
     # and add an alias
     def join(self, other, weld=False, precision=None):
@@ -1189,6 +1346,7 @@ class Mesh(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._sha256 = None
         nbrs = self.vertex_neighbors(key)
         for nbr in nbrs:
             fkey = self.halfedge[key][nbr]
@@ -1239,6 +1397,7 @@ class Mesh(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._sha256 = None
         for u, v in self.face_halfedges(fkey):
             if self.halfedge[u][v] == fkey:
                 # if the halfedge still points to the face
@@ -1267,6 +1426,7 @@ class Mesh(Datastructure):
         :meth:`delete_vertex`
 
         """
+        self._sha256 = None
         for u in list(self.vertices()):
             if u not in self.halfedge:
                 del self.vertex[u]
@@ -1291,6 +1451,7 @@ class Mesh(Datastructure):
         just reverses whatever direction it finds.
 
         """
+        self._sha256 = None
         self.halfedge = {key: {} for key in self.vertices()}
         for fkey in self.faces():
             self.face[fkey][:] = self.face[fkey][::-1]
@@ -1769,6 +1930,7 @@ class Mesh(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1808,6 +1970,7 @@ class Mesh(Datastructure):
         if key not in self.vertex:
             raise KeyError(key)
         if value is not None:
+            self._modify_attributes("vertex")
             self.vertex[key][name] = value
             return None
         if name in self.vertex[key]:
@@ -1848,6 +2011,7 @@ class Mesh(Datastructure):
 
         """
         if name in self.vertex[key]:
+            self._modify_attributes("vertex")
             del self.vertex[key][name]
 
     def vertex_attributes(self, key, names=None, values=None):
@@ -1887,13 +2051,15 @@ class Mesh(Datastructure):
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._modify_attributes("vertex")
             for name, value in zip(names, values):
                 self.vertex[key][name] = value
             return
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
-            return VertexAttributeView(self.default_vertex_attributes, self.vertex[key])
+            self._modify_attributes("vertex")
+            return VertexAttributeView(self.default_vertex_attributes, self.vertex[key], modify=self._attributes_modifier("vertex", key))
         values = []
         for name in names:
             if name in self.vertex[key]:
@@ -2008,6 +2174,7 @@ class Mesh(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2046,6 +2213,7 @@ class Mesh(Datastructure):
         if key not in self.face:
             raise KeyError(key)
         if value is not None:
+            self._modify_attributes("facedata")
             if key not in self.facedata:
                 self.facedata[key] = {}
             self.facedata[key][name] = value
@@ -2090,6 +2258,7 @@ class Mesh(Datastructure):
             raise KeyError(key)
         if key in self.facedata:
             if name in self.facedata[key]:
+                self._modify_attributes("facedata")
                 del self.facedata[key][name]
 
     def face_attributes(self, key, names=None, values=None):
@@ -2129,6 +2298,7 @@ class Mesh(Datastructure):
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._modify_attributes("facedata")
             for name, value in zip(names, values):
                 if key not in self.facedata:
                     self.facedata[key] = {}
@@ -2136,7 +2306,8 @@ class Mesh(Datastructure):
             return
         # use it as a getter
         if not names:
-            return FaceAttributeView(self.default_face_attributes, self.facedata.setdefault(key, {}))
+            self._modify_attributes("facedata")
+            return FaceAttributeView(self.default_face_attributes, self.facedata.setdefault(key, {}), modify=self._attributes_modifier("facedata", key))
         values = []
         for name in names:
             value = self.face_attribute(key, name)
@@ -2249,6 +2420,7 @@ class Mesh(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2290,6 +2462,7 @@ class Mesh(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if value is not None:
+            self._modify_attributes("edgedata")
             if key not in self.edgedata:
                 self.edgedata[key] = {}
             self.edgedata[key][name] = value
@@ -2335,6 +2508,7 @@ class Mesh(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if key in self.edgedata and name in self.edgedata[key]:
+            self._modify_attributes("edgedata")
             del self.edgedata[key][name]
 
     def edge_attributes(self, edge, names=None, values=None):
@@ -2382,7 +2556,8 @@ class Mesh(Datastructure):
         if not names:
             key = str(tuple(sorted(edge)))
             # get the entire attribute dict
-            return EdgeAttributeView(self.default_edge_attributes, self.edgedata.setdefault(key, {}))
+            self._modify_attributes("edgedata")
+            return EdgeAttributeView(self.default_edge_attributes, self.edgedata.setdefault(key, {}), modify=self._attributes_modifier("edgedata", key))
         # get only the values of the named attributes
         values = []
         for name in names:
@@ -2867,16 +3042,17 @@ class Mesh(Datastructure):
         36
 
         """
+        self._sha256 = None
         vertex_gkey = {}
         for vertex in self.vertices():
-            gkey = TOL.geometric_key(self.vertex_coordinates(vertex), precision=precision)
+            gkey = TOL.geometric_key_numeric(self.vertex_coordinates(vertex), precision=precision)
             vertex_gkey[vertex] = gkey
 
         gkey_vertex = {gkey: vertex for vertex, gkey in iter(vertex_gkey.items())}
 
         for boundary in self.vertices_on_boundaries():
             for vertex in boundary:
-                gkey = TOL.geometric_key(self.vertex_coordinates(vertex), precision=precision)
+                gkey = TOL.geometric_key_numeric(self.vertex_coordinates(vertex), precision=precision)
                 gkey_vertex[gkey] = vertex
 
         for vertex in list(self.vertices()):
@@ -2941,6 +3117,7 @@ class Mesh(Datastructure):
             The mesh is modified in place.
 
         """
+        self._sha256 = None
         vertex_index = {}
         index_vertex = {}
         for index, vertex in enumerate(self.vertices()):
@@ -3864,7 +4041,7 @@ class Mesh(Datastructure):
             The area.
 
         """
-        return sum(self.face_area(fkey) for fkey in self.faces())
+        return sum(self.faces_areas())
 
     def centroid(self):
         """Calculate the mesh centroid.
@@ -3875,9 +4052,10 @@ class Mesh(Datastructure):
             The coordinates of the mesh centroid.
 
         """
+        areas = self.faces_areas()
         return scale_vector(
-            sum_vectors([scale_vector(self.face_centroid(fkey), self.face_area(fkey)) for fkey in self.faces()]),
-            1.0 / self.area(),
+            sum_vectors([scale_vector(centroid, area) for centroid, area in zip(self.faces_centroids(), areas)]),
+            1.0 / sum(areas),
         )
 
     def normal(self):
@@ -3889,9 +4067,10 @@ class Mesh(Datastructure):
             The coordinates of the mesh normal.
 
         """
+        areas = self.faces_areas()
         return scale_vector(
-            sum_vectors([scale_vector(self.face_normal(fkey), self.face_area(fkey)) for fkey in self.faces()]),
-            1.0 / self.area(),
+            sum_vectors([scale_vector(normal, area) for normal, area in zip(self.faces_normals(), areas)]),
+            1.0 / sum(areas),
         )
 
     def aabb(self):
@@ -4563,6 +4742,168 @@ class Mesh(Datastructure):
         point, xaxis, yaxis = bestfit_frame_numpy(self.face_coordinates(face))
         return Frame(point, xaxis, yaxis)
 
+    # --------------------------------------------------------------------------
+    # Bulk geometry
+    # --------------------------------------------------------------------------
+
+    def faces_normals(self, faces=None, unitized=True):
+        """Compute the normals of multiple faces at once.
+
+        Parameters
+        ----------
+        faces : list[int], optional
+            The identifiers of the faces.
+            Default is all faces.
+        unitized : bool, optional
+            If True, the vectors are unitized.
+
+        Returns
+        -------
+        list[list[float]]
+            The normal vectors, in the order of the faces.
+
+        See Also
+        --------
+        :meth:`face_normal`
+
+        Notes
+        -----
+        If NumPy is available, the coordinates of the vertices are gathered once,
+        and all normals are computed in a single vectorised pass.
+
+        """
+        faces = list(self.faces() if faces is None else faces)
+        try:
+            from .geometry_numpy import mesh_faces_normals_numpy
+        except ImportError:
+            return [normal_polygon(self.face_coordinates(face), unitized=unitized) for face in faces]
+        return mesh_faces_normals_numpy(self, faces, unitized=unitized).tolist()
+
+    def faces_areas(self, faces=None):
+        """Compute the areas of multiple faces at once.
+
+        Parameters
+        ----------
+        faces : list[int], optional
+            The identifiers of the faces.
+            Default is all faces.
+
+        Returns
+        -------
+        list[float]
+            The areas, in the order of the faces.
+
+        See Also
+        --------
+        :meth:`face_area`
+
+        Notes
+        -----
+        If NumPy is available, the coordinates of the vertices are gathered once,
+        and all areas are computed in a single vectorised pass.
+
+        """
+        faces = list(self.faces() if faces is None else faces)
+        try:
+            from .geometry_numpy import mesh_faces_areas_numpy
+        except ImportError:
+            return [area_polygon(self.face_coordinates(face)) for face in faces]
+        return mesh_faces_areas_numpy(self, faces).tolist()
+
+    def faces_centroids(self, faces=None):
+        """Compute the centroids of multiple faces at once.
+
+        Parameters
+        ----------
+        faces : list[int], optional
+            The identifiers of the faces.
+            Default is all faces.
+
+        Returns
+        -------
+        list[list[float]]
+            The centroids, in the order of the faces.
+
+        See Also
+        --------
+        :meth:`face_centroid`
+
+        Notes
+        -----
+        If NumPy is available, the coordinates of the vertices are gathered once,
+        and all centroids are computed in a single vectorised pass.
+
+        """
+        faces = list(self.faces() if faces is None else faces)
+        try:
+            from .geometry_numpy import mesh_faces_centroids_numpy
+        except ImportError:
+            return [centroid_points(self.face_coordinates(face)) for face in faces]
+        return mesh_faces_centroids_numpy(self, faces).tolist()
+
+    def edges_lengths(self, edges=None):
+        """Compute the lengths of multiple edges at once.
+
+        Parameters
+        ----------
+        edges : list[tuple[int, int]], optional
+            The identifiers of the edges.
+            Default is all edges.
+
+        Returns
+        -------
+        list[float]
+            The lengths, in the order of the edges.
+
+        See Also
+        --------
+        :meth:`edge_length`
+
+        Notes
+        -----
+        If NumPy is available, the coordinates of the vertices are gathered once,
+        and all lengths are computed in a single vectorised pass.
+
+        """
+        edges = list(self.edges() if edges is None else edges)
+        try:
+            from .geometry_numpy import mesh_edges_lengths_numpy
+        except ImportError:
+            return [distance_point_point(*self.edge_coordinates(edge)) for edge in edges]
+        return mesh_edges_lengths_numpy(self, edges).tolist()
+
+    def vertices_normals(self, vertices=None):
+        """Compute the normals of multiple vertices at once.
+
+        Parameters
+        ----------
+        vertices : list[int], optional
+            The identifiers of the vertices.
+            Default is all vertices.
+
+        Returns
+        -------
+        list[list[float]]
+            The normal vectors, in the order of the vertices.
+
+        See Also
+        --------
+        :meth:`vertex_normal`
+
+        Notes
+        -----
+        The normals of the faces are computed only once,
+        and, if NumPy is available, in a single vectorised pass.
+
+        """
+        vertices = list(self.vertices() if vertices is None else vertices)
+        try:
+            from .geometry_numpy import mesh_vertices_normals_numpy
+        except ImportError:
+            normals = dict(zip(self.faces(), self.faces_normals(unitized=False)))
+            return [normalize_vector(sum_vectors([normals[face] for face in self.vertex_faces(vertex)])) for vertex in vertices]
+        return mesh_vertices_normals_numpy(self, vertices).tolist()
+
     # --------------------------------------------------------------------------
     # Boundaries
     # --------------------------------------------------------------------------
@@ -118,9 +118,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
 
     # move U
     x, y, z = mesh.edge_point(edge, t)
-    mesh.vertex[u]["x"] = x
-    mesh.vertex[u]["y"] = y
-    mesh.vertex[u]["z"] = z
+    mesh.vertex_attributes(u, "xyz", [x, y, z])
 
     # UV face
     fkey = mesh.halfedge[u][v]
@@ -268,9 +266,7 @@ def trimesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
     # move U
     x, y, z = mesh.edge_point(edge, t)
 
-    mesh.vertex[u]["x"] = x
-    mesh.vertex[u]["y"] = y
-    mesh.vertex[u]["z"] = z
+    mesh.vertex_attributes(u, "xyz", [x, y, z])
 
     # UV face
     fkey = mesh.halfedge[u][v]
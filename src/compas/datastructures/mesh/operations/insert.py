@@ -48,6 +48,7 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     2
 
     """
+    mesh._sha256 = None
     vertices = mesh.face_vertices(fkey)
     i = vertices.index(v)
     u = vertices[i - 1]
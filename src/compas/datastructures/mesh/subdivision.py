@@ -13,6 +13,13 @@ from compas.itertools import pairwise
 
 
 def subd_factory(cls):
+    from compas.datastructures import CompactMesh
+    from compas.datastructures import Mesh
+
+    # the subdivision schemes operate directly on the dict-based storage of the mesh
+    if issubclass(cls, CompactMesh):
+        cls = Mesh
+
     class SubdMesh(cls):
         _add_vertex = cls.add_vertex
         _add_face = cls.add_face
@@ -52,10 +59,10 @@ def subd_factory(cls):
 def mesh_fast_copy(other):
     SubdMesh = subd_factory(type(other))
     subd = SubdMesh()
-    subd.vertex = deepcopy(other.vertex)
-    subd.face = deepcopy(other.face)
-    subd.facedata = deepcopy(other.facedata)
-    subd.halfedge = deepcopy(other.halfedge)
+    subd.vertex = {key: deepcopy(dict(attr)) for key, attr in other.vertex.items()}
+    subd.face = {fkey: list(vertices) for fkey, vertices in other.face.items()}
+    subd.facedata = {fkey: deepcopy(other.facedata.get(fkey, {})) for fkey in other.face}
+    subd.halfedge = {key: dict(nbrs) for key, nbrs in other.halfedge.items()}
     subd._max_vertex = other._max_vertex
     subd._max_face = other._max_face
     return subd
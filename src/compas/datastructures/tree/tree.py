@@ -5,6 +5,8 @@ from __future__ import division
 from __future__ import print_function
 
 from compas.data import Data
+from compas.data.hashing import hash_data
+from compas.data.hashing import hash_digests
 from compas.datastructures import Datastructure
 
 
@@ -81,6 +83,14 @@ class TreeNode(Data):
             return "<TreeNode: {}>".format(self._name)
         return "<TreeNode>"
 
+    def _hash_content(self, h):
+        if type(self).__data__ is not TreeNode.__data__:
+            return super(TreeNode, self)._hash_content(h)
+        # the children contribute their own digest
+        children = hash_data(h, [self.name, self.attributes])
+        hash_digests(h, children, self.children)
+        return children
+
     @property
     def is_root(self):
         return self._parent is None
@@ -282,6 +292,12 @@ class Tree(Datastructure):
     def __str__(self):
         return "<Tree with {} nodes>\n{}".format(len(list(self.nodes)), self.get_hierarchy_string(max_depth=3))
 
+    def _hash_content(self, h):
+        # the root contributes its own digest
+        children = hash_data(h, self.attributes)
+        hash_digests(h, children, [self.root] if self.root else [])
+        return children
+
     @property
     def root(self):
         return self._root
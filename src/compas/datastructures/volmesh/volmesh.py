@@ -170,7 +170,7 @@ class VolMesh(Datastructure):
             "cell": {str(cell): faces for cell, faces in _cell.items()},
             "edge_data": self._edge_data,
             "face_data": self._face_data,
-            "cell_data": {str(cell): attr for cell, attr in self._cell_data},
+            "cell_data": {str(cell): attr for cell, attr in self._cell_data.items()},
             "max_vertex": self._max_vertex,
             "max_face": self._max_face,
             "max_cell": self._max_cell,
@@ -193,11 +193,10 @@ class VolMesh(Datastructure):
         face_data = data.get("face_data") or {}
         cell_data = data.get("cell_data") or {}
 
-        for key, attr in iter(vertex.items()):
-            volmesh.add_vertex(key=key, attr_dict=attr)
-
-        for ckey, faces in iter(cell.items()):
-            volmesh.add_cell(faces, ckey=ckey, attr_dict=cell_data.get(ckey))
+        volmesh._add_vertices_and_cells(
+            vertex.items(),
+            ((ckey, faces, cell_data.get(ckey)) for ckey, faces in cell.items()),
+        )
 
         for edge in edge_data:
             volmesh._edge_data[edge] = edge_data[edge] or {}
@@ -443,14 +442,14 @@ class VolMesh(Datastructure):
         for mesh in meshes:
             for vertex in mesh.vertices():
                 xyz = mesh.vertex_attributes(vertex, "xyz")
-                gkey = TOL.geometric_key(xyz)
+                gkey = TOL.geometric_key_numeric(xyz)
                 gkey_xyz[gkey] = xyz
             cell = []
             for face in mesh.faces():
                 temp = []
                 for vertex in mesh.face_vertices(face):
                     xyz = mesh.vertex_attributes(vertex, "xyz")
-                    gkey = TOL.geometric_key(xyz)
+                    gkey = TOL.geometric_key_numeric(xyz)
                     temp.append(gkey)
                 cell.append(temp)
             cells.append(cell)
@@ -480,14 +479,14 @@ class VolMesh(Datastructure):
 
         for polyhedron in polyhedrons:
             for vertex in polyhedron.vertices:
-                gkey = TOL.geometric_key(vertex)
+                gkey = TOL.geometric_key_numeric(vertex)
                 gkey_xyz[gkey] = vertex
             cell = []
             for face in polyhedron.faces:
                 temp = []
                 for index in face:
                     xyz = polyhedron.vertices[index]
-                    gkey = TOL.geometric_key(xyz)
+                    gkey = TOL.geometric_key_numeric(xyz)
                     temp.append(gkey)
                 cell.append(temp)
             cells.append(cell)
@@ -622,6 +621,7 @@ class VolMesh(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self._vertex
         del self._halfface
         del self._cell
@@ -640,6 +640,56 @@ class VolMesh(Datastructure):
         self._max_face = -1
         self._max_cell = -1
 
+    def _caches_sha256(self):
+        return type(self).__data__ is VolMesh.__data__
+
+    def copy(self, cls=None):
+        # type: (type[VolMesh] | None) -> VolMesh
+        """Make an independent copy of the volmesh.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.datastructures.VolMesh`], optional
+            The type of volmesh to return.
+            Defaults to the type of the current volmesh.
+
+        Returns
+        -------
+        :class:`compas.datastructures.VolMesh`
+            An independent copy of this volmesh.
+
+        Notes
+        -----
+        The storage containers of the volmesh are copied directly, without converting the volmesh to data and back.
+        Volmeshes with a custom data representation are copied through their data.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not self._supports_structural_copy(cls, VolMesh):
+            return super(VolMesh, self).copy(cls=cls)
+
+        copy_attributes = self._copy_attributes
+        volmesh = cls(
+            default_vertex_attributes=copy_attributes(self.default_vertex_attributes),
+            default_edge_attributes=copy_attributes(self.default_edge_attributes),
+            default_face_attributes=copy_attributes(self.default_face_attributes),
+            default_cell_attributes=copy_attributes(self.default_cell_attributes),
+        )
+        volmesh.attributes.update(copy_attributes(self.attributes))
+        volmesh.name = self.name
+        volmesh._vertex = {key: copy_attributes(attr) for key, attr in self._vertex.items()}
+        volmesh._halfface = {key: vertices[:] for key, vertices in self._halfface.items()}
+        volmesh._cell = {key: {u: dict(nbrs) for u, nbrs in cell.items()} for key, cell in self._cell.items()}
+        volmesh._plane = {u: {v: dict(nbrs) for v, nbrs in plane.items()} for u, plane in self._plane.items()}
+        volmesh._edge_data = {key: copy_attributes(attr) for key, attr in self._edge_data.items()}
+        volmesh._face_data = {key: copy_attributes(attr) for key, attr in self._face_data.items()}
+        volmesh._cell_data = {key: copy_attributes(attr) for key, attr in self._cell_data.items()}
+        volmesh._max_vertex = self._max_vertex
+        volmesh._max_face = self._max_face
+        volmesh._max_cell = self._max_cell
+        return volmesh
+
     def vertex_sample(self, size=1):
         # type: (int) -> list[int]
         """Get the identifiers of a set of random vertices.
@@ -844,6 +894,7 @@ class VolMesh(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if key is None:
             key = self._max_vertex = self._max_vertex + 1
         key = int(key)
@@ -897,6 +948,7 @@ class VolMesh(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if len(vertices) < 3:
             raise ValueError("A half-face should have at least 3 vertices: {}".format(vertices))
 
@@ -966,6 +1018,7 @@ class VolMesh(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if ckey is None:
             ckey = self._max_cell = self._max_cell + 1
         ckey = int(ckey)
@@ -991,6 +1044,92 @@ class VolMesh(Datastructure):
 
         return ckey
 
+    def _add_vertices_and_cells(self, vertices, cells):
+        """Add vertices and cells to the volmesh in bulk.
+
+        This is equivalent to adding the vertices and cells one by one with :meth:`add_vertex` and :meth:`add_cell`,
+        but the vertex, halfface, plane and cell dicts are filled in one pass per kind of element.
+
+        Parameters
+        ----------
+        vertices : iterable[tuple[int | str | None, dict[str, Any] | None]]
+            Pairs of vertex identifiers and vertex attributes.
+            If the identifier is None, one is generated automatically.
+        cells : iterable[tuple[int | str | None, list[list[int]], dict[str, Any] | None]]
+            Triplets of cell identifiers, the faces of the cells, and cell attributes.
+            If the identifier is None, one is generated automatically.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If a face of a cell has less than 3 vertices.
+
+        """
+        self._sha256 = None
+        vertex = self._vertex
+        plane = self._plane
+        max_vertex = self._max_vertex
+        for key, attr in vertices:
+            if key is None:
+                key = max_vertex = max_vertex + 1
+            else:
+                key = int(key)
+                if key > max_vertex:
+                    max_vertex = key
+            if key not in vertex:
+                vertex[key] = dict(attr) if attr else {}
+                plane[key] = {}
+            elif attr:
+                vertex[key].update(attr)
+        self._max_vertex = max_vertex
+
+        halfface = self._halfface
+        cell = self._cell
+        max_face = self._max_face
+        max_cell = self._max_cell
+        for ckey, faces, attr in cells:
+            if ckey is None:
+                ckey = max_cell = max_cell + 1
+            else:
+                ckey = int(ckey)
+                if ckey > max_cell:
+                    max_cell = ckey
+            cell[ckey] = cellplanes = {}
+            if attr:
+                attr = {name: value for name, value in attr.items() if value is not None}
+                if attr:
+                    self._cell_data.setdefault(ckey, {}).update(attr)
+            for corners in faces:
+                if len(corners) < 3:
+                    raise ValueError("A half-face should have at least 3 vertices: {}".format(corners))
+                if corners[-1] == corners[0]:
+                    corners = corners[:-1]
+                corners = [int(key) for key in corners]
+                fkey = max_face = max_face + 1
+                halfface[fkey] = corners
+                uvw = list(uvw_from_vertices(corners))
+                for u, v, w in uvw:
+                    uplanes = plane[u]
+                    if v not in uplanes:
+                        uplanes[v] = {}
+                    uplanes[v][w] = None
+                    wplanes = plane[w]
+                    if v not in wplanes:
+                        wplanes[v] = {}
+                    if u not in wplanes[v]:
+                        wplanes[v][u] = None
+                for u, v, w in uvw:
+                    if u not in cellplanes:
+                        cellplanes[u] = {}
+                    cellplanes[u][v] = fkey
+                    plane[u][v][w] = ckey
+        self._max_face = max_face
+        self._max_cell = max_cell
+
     def delete_vertex(self, vertex):
         """Delete a vertex from the volmesh and everything that is attached to it.
 
@@ -1008,6 +1147,7 @@ class VolMesh(Datastructure):
         :meth:`delete_halfface`, :meth:`delete_cell`
 
         """
+        self._sha256 = None
         for cell in self.vertex_cells(vertex):
             self.delete_cell(cell)
 
@@ -1028,6 +1168,7 @@ class VolMesh(Datastructure):
         :meth:`delete_vertex`, :meth:`delete_halfface`
 
         """
+        self._sha256 = None
         cell_vertices = self.cell_vertices(cell)
         cell_faces = self.cell_faces(cell)
 
@@ -1067,6 +1208,7 @@ class VolMesh(Datastructure):
         None
 
         """
+        self._sha256 = None
         for vertex in list(self.vertices()):
             if vertex not in self._plane:
                 del self._vertex[vertex]
@@ -1357,6 +1499,7 @@ class VolMesh(Datastructure):
         Named arguments overwrite correpsonding name-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1395,6 +1538,7 @@ class VolMesh(Datastructure):
         if vertex not in self._vertex:
             raise KeyError(vertex)
         if value is not None:
+            self._sha256 = None
             self._vertex[vertex][name] = value
             return None
         if name in self._vertex[vertex]:
@@ -1433,6 +1577,7 @@ class VolMesh(Datastructure):
 
         """
         if name in self._vertex[vertex]:
+            self._sha256 = None
             del self._vertex[vertex][name]
 
     def vertex_attributes(self, vertex, names=None, values=None):
@@ -1471,13 +1616,15 @@ class VolMesh(Datastructure):
             raise KeyError(vertex)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self._vertex[vertex][name] = value
             return
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
-            return VertexAttributeView(self.default_vertex_attributes, self._vertex[vertex])
+            self._sha256 = None
+            return VertexAttributeView(self.default_vertex_attributes, self._vertex[vertex], modify=self._attributes_modifier("_vertex", vertex))
         values = []
         for name in names:
             if name in self._vertex[vertex]:
@@ -2043,6 +2190,7 @@ class VolMesh(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2082,6 +2230,7 @@ class VolMesh(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if value is not None:
+            self._sha256 = None
             if key not in self._edge_data:
                 self._edge_data[key] = {}
             self._edge_data[key][name] = value
@@ -2125,6 +2274,7 @@ class VolMesh(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if key in self._edge_data and name in self._edge_data[key]:
+            self._sha256 = None
             del self._edge_data[key][name]
 
     def edge_attributes(self, edge, names=None, values=None):
@@ -2162,14 +2312,16 @@ class VolMesh(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if names and values:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if key not in self._edge_data:
                     self._edge_data[key] = {}
                 self._edge_data[key][name] = value
             return
         if not names:
+            self._sha256 = None
             key = str(tuple(sorted(edge)))
-            return EdgeAttributeView(self.default_edge_attributes, self._edge_data.setdefault(key, {}))
+            return EdgeAttributeView(self.default_edge_attributes, self._edge_data.setdefault(key, {}), modify=self._attributes_modifier("_edge_data", key))
         values = []
         for name in names:
             value = self.edge_attribute(edge, name)
@@ -2746,6 +2898,7 @@ class VolMesh(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -2784,6 +2937,7 @@ class VolMesh(Datastructure):
             raise KeyError(face)
         key = str(tuple(sorted(self.halfface_vertices(face))))
         if value is not None:
+            self._sha256 = None
             if key not in self._face_data:
                 self._face_data[key] = {}
             self._face_data[key][name] = value
@@ -2826,6 +2980,7 @@ class VolMesh(Datastructure):
             raise KeyError(face)
         key = str(tuple(sorted(self.halfface_vertices(face))))
         if key in self._face_data and name in self._face_data[key]:
+            self._sha256 = None
             del self._face_data[key][name]
 
     def face_attributes(self, face, names=None, values=None):
@@ -2862,13 +3017,15 @@ class VolMesh(Datastructure):
             raise KeyError(face)
         key = str(tuple(sorted(self.halfface_vertices(face))))
         if names and values:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if key not in self._face_data:
                     self._face_data[key] = {}
                 self._face_data[key][name] = value
             return
         if not names:
-            return FaceAttributeView(self.default_face_attributes, self._face_data.setdefault(key, {}))
+            self._sha256 = None
+            return FaceAttributeView(self.default_face_attributes, self._face_data.setdefault(key, {}), modify=self._attributes_modifier("_face_data", key))
         values = []
         for name in names:
             value = self.face_attribute(face, name)
@@ -3650,6 +3807,7 @@ class VolMesh(Datastructure):
         Named arguments overwrite corresponding cell-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -3687,6 +3845,7 @@ class VolMesh(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if value is not None:
+            self._sha256 = None
             if cell not in self._cell_data:
                 self._cell_data[cell] = {}
             self._cell_data[cell][name] = value
@@ -3729,6 +3888,7 @@ class VolMesh(Datastructure):
             raise KeyError(cell)
         if cell in self._cell_data:
             if name in self._cell_data[cell]:
+                self._sha256 = None
                 del self._cell_data[cell][name]
 
     def cell_attributes(self, cell, names=None, values=None):
@@ -3764,13 +3924,15 @@ class VolMesh(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if names and values is not None:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if cell not in self._cell_data:
                     self._cell_data[cell] = {}
                 self._cell_data[cell][name] = value
             return
         if not names:
-            return CellAttributeView(self.default_cell_attributes, self._cell_data.setdefault(cell, {}))
+            self._sha256 = None
+            return CellAttributeView(self.default_cell_attributes, self._cell_data.setdefault(cell, {}), modify=self._attributes_modifier("_cell_data", cell))
         values = []
         for name in names:
             value = self.cell_attribute(cell, name)
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from array import array
 from collections import OrderedDict
 from collections import defaultdict
 
@@ -10,6 +11,31 @@ from compas import _iotools
 from compas.tolerance import TOL
 
 
+def _iter_logical_lines(lines):
+    # strip trailing whitespace, skip empty lines
+    # and join lines ending with a continuation character
+    current = None
+    needs_decode = None
+    for line in lines:
+        # Check this only one time
+        if needs_decode is None:
+            needs_decode = hasattr(line, "decode")
+        if needs_decode:
+            line = line.decode("utf-8")
+        line = line.rstrip()
+        if not line:
+            continue
+        if current is not None:
+            line = current[:-2] + line
+        if line[-1] == "\\":
+            current = line
+        else:
+            current = None
+            yield line
+    if current is not None:
+        yield current
+
+
 class OBJ(object):
     """Class for working with OBJ files.
 
@@ -87,6 +113,16 @@ class OBJ(object):
     ...     mesh.name = name
     ...     meshes.append(mesh)
 
+    Stream the objects of a (large) file one by one,
+    without keeping the entire contents of the file in memory.
+
+    >>> obj = OBJ("meshes.obj")
+    >>> meshes = []
+    >>> for name, vertices, faces in obj.iter_objects():
+    ...     mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    ...     mesh.name = name
+    ...     meshes.append(mesh)
+
     """
 
     def __init__(self, filepath, precision=None):
@@ -113,6 +149,35 @@ class OBJ(object):
         self._parser.parse()
         self._is_parsed = True
 
+    def iter_objects(self, groups=False, chunksize=None):
+        """Stream the objects of the file, as they are completed.
+
+        The file is read in blocks of lines,
+        and the vertices of every object are welded while parsing.
+
+        Parameters
+        ----------
+        groups : bool, optional
+            If True, every group (``g``) is yielded as a separate object as well.
+        chunksize : int, optional
+            The approximate number of bytes per block of lines.
+            Default is :attr:`OBJReader.CHUNKSIZE`.
+
+        Yields
+        ------
+        tuple[str, list[list[float]], list[list[int]]]
+            The name, the vertices and the faces of every object.
+
+        See Also
+        --------
+        :meth:`OBJParser.iter_objects`
+
+        """
+        reader = OBJReader(self.filepath)
+        parser = OBJParser(reader, precision=self.precision)
+        for item in parser.iter_objects(groups=groups, chunksize=chunksize):
+            yield item
+
     def write(self, mesh, unweld=False, **kwargs):
         """Write a mesh to the file.
 
@@ -199,6 +264,8 @@ class OBJReader(object):
 
     """
 
+    CHUNKSIZE = 2**20
+
     def __init__(self, filepath):
         self.filepath = filepath
         self.content = None
@@ -247,28 +314,7 @@ class OBJReader(object):
         None
 
         """
-        lines = []
-        is_continuation = False
-        needs_decode = None
-
-        for line in self.content:
-            # Check this only one time
-            if needs_decode is None:
-                needs_decode = hasattr(line, "decode")
-            if needs_decode:
-                line = line.decode("utf-8")
-            line = line.rstrip()
-            if not line:
-                continue
-            if is_continuation:
-                lines[-1] = lines[-1][:-2] + line
-            else:
-                lines.append(line)
-            if line[-1] == "\\":
-                is_continuation = True
-            else:
-                is_continuation = False
-        self.content = iter(lines)
+        self.content = iter(list(_iter_logical_lines(self.content)))
 
     def post(self):
         """Post-process the contents.
@@ -280,6 +326,39 @@ class OBJReader(object):
         """
         pass
 
+    def iter_lines(self, chunksize=None):
+        """Iterate over the pre-processed lines of the file, reading the file in blocks.
+
+        In contrast to :meth:`open` and :meth:`pre`,
+        the contents of the file are never loaded in memory in their entirety.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The approximate number of bytes per block of lines.
+            Default is :attr:`CHUNKSIZE`.
+
+        Yields
+        ------
+        str
+            The lines of the file, without trailing whitespace,
+            with continued lines joined, and with empty lines skipped.
+
+        """
+        chunksize = chunksize or self.CHUNKSIZE
+
+        def blocks(f):
+            while True:
+                block = f.readlines(chunksize)
+                if not block:
+                    break
+                for line in block:
+                    yield line
+
+        with _iotools.open_file(self.filepath, "r") as f:
+            for line in _iter_logical_lines(blocks(f)):
+                yield line
+
     def read(self):
         """Read the contents of the file, line by line.
 
@@ -522,7 +601,7 @@ class OBJParser(object):
         vertex = OrderedDict()
 
         for i, xyz in enumerate(iter(self.reader.vertices)):
-            key = TOL.geometric_key(xyz, self.precision)
+            key = TOL.geometric_key_numeric(xyz, self.precision)
             index_key[i] = key
             vertex[key] = xyz
 
@@ -547,6 +626,79 @@ class OBJParser(object):
                     vertices[vertex] = self.vertices[vertex]
             self.objects[name] = vertices, faces
 
+    def iter_objects(self, groups=False, chunksize=None):
+        """Parse the file of the reader line by line, and yield its objects as soon as they are completed.
+
+        The coordinates of all vertices encountered so far are stored in a flat array,
+        because faces may refer to vertices of preceding objects.
+        All other data is discarded when an object has been yielded.
+
+        Parameters
+        ----------
+        groups : bool, optional
+            If True, every group (``g``) is yielded as a separate object as well.
+        chunksize : int, optional
+            The approximate number of bytes per block of lines.
+            Default is :attr:`OBJReader.CHUNKSIZE`.
+
+        Yields
+        ------
+        tuple[str, list[list[float]], list[list[int]]]
+            The name, the vertices and the faces of every object with at least one face.
+            The vertices of an object are welded if they are identical up to the precision of the parser,
+            and the faces refer to the vertices by their index in the list of vertices of the object.
+
+        Notes
+        -----
+        Only vertices and faces are parsed.
+        Vertices are welded based on numeric geometric keys (see :meth:`compas.tolerance.Tolerance.geometric_key_numeric`).
+
+        """
+        precision = self.precision
+        xyz = array("d")
+        name = None
+        faces = []
+
+        for line in self.reader.iter_lines(chunksize=chunksize):
+            parts = line.split()
+            head = parts[0]
+            if head == "v":
+                if len(parts) > 3:
+                    xyz.extend((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif head == "f":
+                if len(parts) < 4:
+                    continue
+                n = len(xyz) // 3
+                face = []
+                for part in parts[1:]:
+                    index = int(part.split("/", 1)[0])
+                    # negative indices are relative to the end of the vertex list
+                    face.append(index - 1 if index > 0 else n + index)
+                faces.append(face)
+            elif head == "o" or (groups and head == "g"):
+                if faces:
+                    yield self._weld_object(name, xyz, faces, precision)
+                name = " ".join(parts[1:])
+                faces = []
+
+        if faces:
+            yield self._weld_object(name, xyz, faces, precision)
+
+    def _weld_object(self, name, xyz, faces, precision):
+        # the vertices of the object are welded in the order of the file
+        vertices = []
+        key_index = {}
+        index_index = {}
+        for index in sorted(set(index for face in faces for index in face)):
+            point = xyz[3 * index : 3 * index + 3].tolist()
+            key = TOL.geometric_key_numeric(point, precision)
+            if key not in key_index:
+                key_index[key] = len(vertices)
+                vertices.append(point)
+            index_index[index] = key_index[key]
+        faces = [[index_index[index] for index in face] for face in faces]
+        return name, vertices, faces
+
 
 class OBJWriter(object):
     """Class for writing geometric data to a OBJ file.
@@ -4,8 +4,8 @@ from __future__ import print_function
 
 import struct
 
-import compas
 from compas import _iotools
+from compas.tolerance import TOL
 
 
 class PLY(object):
@@ -636,8 +636,9 @@ class PLYWriter(object):
         The email of the author to include in the header.
     date : str, optional
         The date to include in the header.
-    precision : str, optional
-        COMPAS precision specification for parsing geometric data.
+    precision : int, optional
+        The number of decimals of the vertex coordinates.
+        Default is :attr:`TOL.precision`.
 
     """
 
@@ -647,8 +648,7 @@ class PLYWriter(object):
         self.author = author
         self.email = email
         self.date = date
-        self.precision = precision or compas.PRECISION
-        self.vertex_tpl = "{0:." + self.precision + "}" + " {1:." + self.precision + "}" + " {2:." + self.precision + "}\n"
+        self.precision = precision or TOL.precision
         self.v = mesh.number_of_vertices()
         self.f = mesh.number_of_faces()
         self.e = mesh.number_of_edges()
@@ -687,7 +687,13 @@ class PLYWriter(object):
     def _write_vertices(self):
         for key in self.mesh.vertices():
             x, y, z = self.mesh.vertex_coordinates(key)
-            self.file.write(self.vertex_tpl.format(x, y, z))
+            self.file.write(
+                "{0} {1} {2}\n".format(
+                    TOL.format_number(x, self.precision),
+                    TOL.format_number(y, self.precision),
+                    TOL.format_number(z, self.precision),
+                )
+            )
 
     def _write_faces(self):
         vertex_index = self.mesh.vertex_index()
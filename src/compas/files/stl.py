@@ -8,6 +8,16 @@ from compas import _iotools
 from compas.geometry import Translation
 from compas.tolerance import TOL
 
+try:
+    import numpy as np
+
+    numpy_support = True
+except (ImportError, SyntaxError):
+    numpy_support = False
+
+# normal, 3 vertices, attribute byte count
+FACET_BINARY = struct.Struct("<12fH")
+
 
 class STL(object):
     """Class for working with STL files.
@@ -93,6 +103,16 @@ class STLReader(object):
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
 
+    Attributes
+    ----------
+    header : bytes
+        The header of a binary file.
+    facets : list[dict]
+        The facets of the file, as dicts with a normal and three vertices.
+    buffer : bytes
+        The raw facet records of a binary file.
+        The records are decoded into :attr:`facets` only when that attribute is accessed.
+
     References
     ----------
     * http://paulbourke.net/dataformats/stl/
@@ -103,9 +123,26 @@ class STLReader(object):
         self.filepath = filepath
         self.file = None
         self.header = None
-        self.facets = []
+        self.buffer = None
+        self._facets = None
         self.read()
 
+    @property
+    def facets(self):
+        if self._facets is None:
+            self._facets = self._read_facets_binary() if self.buffer is not None else []
+        return self._facets
+
+    @facets.setter
+    def facets(self, facets):
+        self._facets = facets
+
+    @property
+    def number_of_facets(self):
+        if self.buffer is not None:
+            return len(self.buffer) // FACET_BINARY.size
+        return len(self.facets)
+
     def read(self):
         """Read the data.
 
@@ -237,8 +274,9 @@ class STLReader(object):
         with _iotools.open_file(self.filepath, "rb") as file:
             self.file = file
             self.file.seek(0)
+            self._facets = None
             self.header = self._read_header_binary()
-            self.facets = self._read_facets_binary()
+            self.buffer = self._read_buffer_binary()
 
     def _read_header_binary(self):
         bytes_ = self.file.read(80)
@@ -247,26 +285,26 @@ class STLReader(object):
     def _read_number_of_facets_binary(self):
         return self._read_uint32()
 
-    def _read_facet_binary(self):
-        # Read full facet at once
+    def _read_buffer_binary(self):
+        # read the records of all facets in one go
         # 4 bytes per float * 3 floats per vector/vertex * 4 items (1 vector + 3 vertices)
-        bytes_ = self.file.read(48)
-        floats_ = struct.unpack("<12f", bytes_)
-
-        normal = floats_[0:3]
-        vertices = (floats_[3:6], floats_[6:9], floats_[9:12])
-        keys = (bytes_[12:24], bytes_[24:36], bytes_[36:48])
-
-        # Skip two-byte attributes, it's not used anywhere (by anyone - on this planet)
-        self.file.seek(2, 1)
-
-        return {"normal": normal, "vertices": vertices, "keys": keys}
+        # + 2 bytes for the attribute byte count, which is not used anywhere (by anyone - on this planet)
+        n = self._read_number_of_facets_binary()
+        size = n * FACET_BINARY.size
+        buffer = self.file.read(size)
+        if len(buffer) != size:
+            raise ValueError("Expected {} facets, but the file ends after {}.".format(n, len(buffer) // FACET_BINARY.size))
+        return buffer
 
     def _read_facets_binary(self):
         facets = []
-        n = self._read_number_of_facets_binary()
-        for i in range(n):
-            facets.append(self._read_facet_binary())
+        buffer = self.buffer
+        for offset in range(0, len(buffer), FACET_BINARY.size):
+            floats_ = FACET_BINARY.unpack_from(buffer, offset)
+            normal = floats_[0:3]
+            vertices = (floats_[3:6], floats_[6:9], floats_[9:12])
+            keys = (buffer[offset + 12 : offset + 24], buffer[offset + 24 : offset + 36], buffer[offset + 36 : offset + 48])
+            facets.append({"normal": normal, "vertices": vertices, "keys": keys})
         return facets
 
 
@@ -306,7 +344,19 @@ class STLParser(object):
         -------
         None
 
+        Notes
+        -----
+        The facets of binary files are decoded and welded in bulk, directly from the raw buffer of the reader.
+        Vertices are welded if their binary representations are identical.
+
         """
+        if self.reader.buffer is not None and self.reader._facets is None:
+            if numpy_support:
+                self._parse_binary_numpy()
+            else:
+                self._parse_binary()
+            return
+
         gkey_index = {}
         vertices = []
         faces = []
@@ -318,7 +368,7 @@ class STLParser(object):
                 if "keys" in facet:
                     gkey = facet["keys"][i]
                 else:
-                    gkey = TOL.geometric_key(xyz, self.precision)
+                    gkey = TOL.geometric_key_numeric(xyz, self.precision)
                 if gkey not in gkey_index:
                     gkey_index[gkey] = len(vertices)
                     vertices.append(xyz)
@@ -327,6 +377,43 @@ class STLParser(object):
         self.vertices = vertices
         self.faces = faces
 
+    def _parse_binary(self):
+        buffer = self.reader.buffer
+        unpack_from = struct.Struct("<3f").unpack_from
+        key_index = {}
+        vertices = []
+        faces = []
+        for offset in range(0, len(buffer), FACET_BINARY.size):
+            face = []
+            for start in (offset + 12, offset + 24, offset + 36):
+                key = buffer[start : start + 12]
+                index = key_index.get(key)
+                if index is None:
+                    index = key_index[key] = len(vertices)
+                    vertices.append(list(unpack_from(buffer, start)))
+                face.append(index)
+            faces.append(face)
+        self.vertices = vertices
+        self.faces = faces
+
+    def _parse_binary_numpy(self):
+        dtype = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+        facets = np.frombuffer(self.reader.buffer, dtype=dtype)
+        corners = np.ascontiguousarray(facets["vertices"]).reshape((-1, 3))
+        if not len(corners):
+            self.vertices = []
+            self.faces = []
+            return
+        # weld the corners with identical binary representations
+        # and number the unique vertices in the order of their first occurrence
+        keys = corners.view(np.dtype((np.void, 12))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.vertices = corners[first[order]].astype(float).tolist()
+        self.faces = rank[inverse.ravel()].reshape((-1, 3)).tolist()
+
 
 class STLWriter(object):
     """Class for writing geometric data to a STL file.
@@ -425,12 +512,28 @@ class STLWriter(object):
             raise ValueError("Mesh must have fewer than 4294967295 faces to be written to binary STL.")
 
     def _write_binary_faces(self):
+        # all facet records are packed into one buffer
+        # which is written to the file in one go
         if not self.file:
             return
-        vertex_xyz = self._vertex_xyz
-        for face in self.mesh.faces():
-            normal = list(self.mesh.face_normal(face))
-            self.file.write(struct.pack("<3f", *normal))
-            for vertex in self.mesh.face_vertices(face):
-                self.file.write(struct.pack("<3f", *vertex_xyz[vertex]))
-            self.file.write(b"\0\0")
+        faces = list(self.mesh.faces())
+        if numpy_support:
+            from compas.datastructures.mesh.geometry_numpy import mesh_face_corners_numpy
+
+            xyz, _, corners, _ = mesh_face_corners_numpy(self.mesh, faces)
+            points = xyz[corners].reshape((-1, 3, 3))
+            normals = np.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0])
+            lengths = np.linalg.norm(normals, axis=1)
+            lengths[lengths == 0] = 1.0
+            records = np.zeros(len(faces), dtype=[("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+            records["normal"] = normals / lengths[:, None]
+            records["vertices"] = points
+            self.file.write(records.tobytes())
+        else:
+            normals = self.mesh.faces_normals(faces)
+            vertex_xyz = self._vertex_xyz
+            records = []
+            for face, normal in zip(faces, normals):
+                a, b, c = self.mesh.face_vertices(face)
+                records.append(FACET_BINARY.pack(*(normal + vertex_xyz[a] + vertex_xyz[b] + vertex_xyz[c] + [0])))
+            self.file.write(b"".join(records))
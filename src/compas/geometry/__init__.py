@@ -170,6 +170,7 @@ from ._core.size import (
 )
 from ._core.tangent import tangent_points_to_circle_xy
 from ._core.transformations import (
+    affine_from_matrix,
     local_axes,
     local_to_world_coordinates,
     mirror_point_plane,
@@ -249,6 +250,7 @@ from ._core.nurbs import (
     find_span,
     compute_basisfuncs,
     compute_basisfuncsderivs,
+    compute_basisfuncs_table,
     knots_and_mults_to_knotvector,
     knotvector_to_knots_and_mults,
 )
@@ -302,6 +304,7 @@ from .intersections import (
     intersection_ray_mesh,
 )
 from .kdtree import KDTree
+from .aabbtree import AABBTree
 from .offset import (
     offset_line,
     offset_polyline,
@@ -347,6 +350,7 @@ if not compas.IPY:
         bestfit_sphere_numpy,
     )
     from .hull_numpy import convex_hull_numpy, convex_hull_xy_numpy
+    from .quickhull_numpy import quickhull_numpy
     from .icp_numpy import icp_numpy
     from .trimesh_gradient_numpy import trimesh_gradient_numpy
     from .trimesh_descent_numpy import trimesh_descent_numpy
@@ -355,7 +359,7 @@ if not compas.IPY:
 # Class APIs
 # =============================================================================
 
-from .transformation import Transformation
+from .transformation import Transformation, transform_many
 from .projection import Projection
 from .reflection import Reflection
 from .rotation import Rotation
@@ -424,6 +428,7 @@ from .brep.trim import BrepTrim, BrepTrimIsoStatus
 
 
 __all__ = [
+    "AABBTree",
     "Arc",
     "Bezier",
     "Box",
@@ -482,6 +487,7 @@ __all__ = [
     "Vector",
     "add_vectors",
     "add_vectors_xy",
+    "affine_from_matrix",
     "allclose",
     "angle_planes",
     "angle_points",
@@ -539,6 +545,7 @@ __all__ = [
     "compose_matrix",
     "compute_basisfuncs",
     "compute_basisfuncsderivs",
+    "compute_basisfuncs_table",
     "conforming_delaunay_triangulation",
     "constrained_delaunay_triangulation",
     "construct_knotvector",
@@ -719,6 +726,7 @@ __all__ = [
     "transform_frames",
     "transform_points",
     "transform_vectors",
+    "transform_many",
     "translate_points",
     "translate_points_xy",
     "translation_from_matrix",
@@ -764,6 +772,7 @@ if not compas.IPY:
         "local_to_world_coordinates_numpy",
         "oriented_bounding_box_numpy",
         "oriented_bounding_box_xy_numpy",
+        "quickhull_numpy",
         "transform_points_numpy",
         "transform_vectors_numpy",
         "trimesh_descent_numpy",
@@ -365,3 +365,71 @@ def compute_basisfuncsderivs(degree, knotvector, i, u, n):
         r *= degree - k
 
     return derivs
+
+
+def compute_basisfuncs_table(n, degree, knotvector, params, nderivs=0):
+    """Compute the knot spans and the nonzero basis functions, and optionally their derivatives, for many parameter values.
+
+    Parameters
+    ----------
+    n : int
+        Number of control points minus 1.
+    degree : int
+        Degree of the curve.
+    knotvector : list[int | float]
+        Knot vector of the curve.
+    params : list[float]
+        Parameter values.
+    nderivs : int, optional
+        Number of derivatives to compute.
+
+    Returns
+    -------
+    tuple[list[int], list[list[list[float]]]]
+        The knot span index of every parameter,
+        and per parameter, the basis functions (row 0) and their derivatives (row k for the k-th derivative).
+
+    Raises
+    ------
+    ValueError
+        If a parameter value is greater than the maximum knot or less than the minimum knot.
+
+    See Also
+    --------
+    find_span
+    compute_basisfuncs
+    compute_basisfuncsderivs
+
+    Notes
+    -----
+    The basis functions only depend on the knot vector and the parameter,
+    and not on the control points.
+    Therefore, the table can be computed once for the parameters of a sampling,
+    and reused for all control points, or for all rows of control points of a surface.
+    Repeated parameter values are only computed once.
+
+    Examples
+    --------
+    >>> knotvector = construct_knotvector(2, 4)
+    >>> spans, table = compute_basisfuncs_table(3, 2, knotvector, [0.0, 0.5, 1.0])
+    >>> spans
+    [2, 3, 3]
+    >>> table[1]
+    [[0.5, 0.5, 0.0]]
+
+    """
+    spans = []
+    table = []
+    cache = {}
+    for u in params:
+        row = cache.get(u)
+        if row is None:
+            span = find_span(n, degree, knotvector, u)
+            if nderivs:
+                basis = compute_basisfuncsderivs(degree, knotvector, span, u, nderivs)
+            else:
+                basis = [compute_basisfuncs(degree, knotvector, span, u)]
+            row = cache[u] = span, basis
+        spans.append(row[0])
+        table.append(row[1])
+    return spans, table
@@ -190,6 +190,41 @@ def dehomogenize_and_unflatten_frames(points_and_vectors):
 # ==============================================================================
 
 
+def affine_from_matrix(M):
+    """Extract the coefficients of the affine part of a transformation matrix.
+
+    Parameters
+    ----------
+    M : list[list[float]]
+        A 4x4 transformation matrix.
+
+    Returns
+    -------
+    tuple[float, ...] | None
+        The 12 coefficients of the first three rows of the matrix, in row-major order,
+        or None if the transformation is not affine,
+        i.e. if the last row of the matrix is not ``[0, 0, 0, 1]``.
+
+    Examples
+    --------
+    >>> affine_from_matrix([[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    (1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 2.0, 0.0, 0.0, 1.0, 3.0)
+
+    """
+    a, b, c, d = M[3]
+    if a or b or c or d != 1:
+        return None
+    return tuple(float(value) for row in (M[0], M[1], M[2]) for value in row)
+
+
+def _affine(T):
+    # transformation objects cache the coefficients of their affine part
+    try:
+        return T.affine
+    except AttributeError:
+        return affine_from_matrix(T)
+
+
 def transform_points(points, T):
     """Transform multiple points with one transformation matrix.
 
@@ -212,7 +247,11 @@ def transform_points(points, T):
     >>> points_transformed = transform_points(points, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+    affine = _affine(T)
+    if affine is None:
+        return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+    a, b, c, d, e, f, g, h, i, j, k, m = affine
+    return [[a * x + b * y + c * z + d, e * x + f * y + g * z + h, i * x + j * y + k * z + m] for x, y, z in points]
 
 
 def transform_vectors(vectors, T):
@@ -237,7 +276,11 @@ def transform_vectors(vectors, T):
     >>> vectors_transformed = transform_vectors(vectors, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))
+    affine = _affine(T)
+    if affine is None:
+        return dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))
+    a, b, c, _, e, f, g, _, i, j, k, _ = affine
+    return [[a * x + b * y + c * z, e * x + f * y + g * z, i * x + j * y + k * z] for x, y, z in vectors]
 
 
 def transform_frames(frames, T):
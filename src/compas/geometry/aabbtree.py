@@ -0,0 +1,654 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from heapq import heappop
+from heapq import heappush
+
+from compas.plugins import plugin
+from compas.tolerance import TOL
+
+# a direction that is unlikely to be aligned with the edges or faces of a mesh
+CONTAINMENT_DIRECTION = (0.3511234415883917, 0.5326752289341837, 0.7700091133209479)
+
+
+class AABBTree(object):
+    """A bounding volume hierarchy of axis-aligned bounding boxes over the triangles of a mesh.
+
+    Polygonal faces are triangulated as a fan around their first vertex.
+    The tree is stored in flat arrays.
+    Every node covers a contiguous range of the triangles, reordered during construction,
+    and is split at the median of the centroids of the triangles along the longest axis of its bounding box.
+    Nodes with at most ``leafsize`` triangles are not split further.
+
+    Parameters
+    ----------
+    vertices : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+        The vertices of the mesh.
+    faces : sequence[sequence[int]]
+        The faces of the mesh, as lists of indices into the list of vertices.
+    leafsize : int, optional
+        The maximum number of triangles in a leaf node.
+
+    Attributes
+    ----------
+    leafsize : int
+        The maximum number of triangles in a leaf node.
+    keys : list[int]
+        The identifiers of the faces that are reported in query results.
+        By default, these are the indices of the faces in the list of faces.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas.geometry import Box
+    >>> mesh = Mesh.from_shape(Box(2.0))
+    >>> tree = AABBTree.from_mesh(mesh)
+    >>> hits = tree.intersect_ray(([0, 0, 5], [0, 0, -1]))
+    >>> [round(t, 3) for face, u, v, t in hits]
+    [4.0, 6.0]
+    >>> tree.contains_point([0.5, 0.5, 0.5])
+    True
+    >>> point, face, distance = tree.closest_point([0, 0, 3])
+    >>> point
+    [0.0, 0.0, 1.0]
+
+    """
+
+    def __init__(self, vertices, faces, leafsize=4):
+        self.leafsize = max(1, leafsize)
+        self.keys = list(range(len(faces)))
+
+        vertices = [(float(xyz[0]), float(xyz[1]), float(xyz[2])) for xyz in vertices]
+        triangles = []
+        owners = []
+        for index, face in enumerate(faces):
+            for i in range(1, len(face) - 1):
+                triangles.append((vertices[face[0]], vertices[face[i]], vertices[face[i + 1]]))
+                owners.append(index)
+
+        # the triangles, their faces and their bounding boxes, in tree order
+        self._triangles = []
+        self._owners = []
+        self._boxes = []
+        # the nodes
+        self._start = []
+        self._stop = []
+        self._box = []
+        self._left = []
+        self._right = []
+        self._build(triangles, owners)
+
+    def __len__(self):
+        return len(self._triangles)
+
+    @classmethod
+    def from_mesh(cls, mesh, leafsize=4):
+        """Construct a tree from the faces of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            A mesh object.
+        leafsize : int, optional
+            The maximum number of triangles in a leaf node.
+
+        Returns
+        -------
+        :class:`compas.geometry.AABBTree`
+            The identifiers of the faces in the query results are the face identifiers of the mesh.
+
+        """
+        vertex_index = mesh.vertex_index()
+        faces = list(mesh.faces())
+        tree = cls(
+            mesh.vertices_attributes("xyz"),
+            [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in faces],
+            leafsize=leafsize,
+        )
+        tree.keys = faces
+        return tree
+
+    # ==========================================================================
+    # Construction
+    # ==========================================================================
+
+    def _build(self, triangles, owners):
+        if not triangles:
+            return
+
+        boxes = []
+        centroids = ([], [], [])
+        for a, b, c in triangles:
+            boxes.append(
+                (
+                    min(a[0], b[0], c[0]),
+                    min(a[1], b[1], c[1]),
+                    min(a[2], b[2], c[2]),
+                    max(a[0], b[0], c[0]),
+                    max(a[1], b[1], c[1]),
+                    max(a[2], b[2], c[2]),
+                )
+            )
+            centroids[0].append(a[0] + b[0] + c[0])
+            centroids[1].append(a[1] + b[1] + c[1])
+            centroids[2].append(a[2] + b[2] + c[2])
+
+        columns = list(zip(*boxes))
+        order = list(range(len(triangles)))
+        stack = [self._add_node(0, len(order))]
+        while stack:
+            node = stack.pop()
+            start = self._start[node]
+            stop = self._stop[node]
+            segment = order[start:stop]
+            box = tuple(min(map(column.__getitem__, segment)) for column in columns[:3])
+            box += tuple(max(map(column.__getitem__, segment)) for column in columns[3:])
+            self._box[node] = box
+            if stop - start <= self.leafsize:
+                continue
+            extents = [box[3] - box[0], box[4] - box[1], box[5] - box[2]]
+            axis = extents.index(max(extents))
+            segment.sort(key=centroids[axis].__getitem__)
+            order[start:stop] = segment
+            middle = (start + stop) // 2
+            self._left[node] = self._add_node(start, middle)
+            self._right[node] = self._add_node(middle, stop)
+            stack.append(self._left[node])
+            stack.append(self._right[node])
+
+        self._triangles = [triangles[i] for i in order]
+        self._owners = [owners[i] for i in order]
+        self._boxes = [boxes[i] for i in order]
+
+    def _add_node(self, start, stop):
+        self._start.append(start)
+        self._stop.append(stop)
+        self._box.append(None)
+        self._left.append(-1)
+        self._right.append(-1)
+        return len(self._start) - 1
+
+    # ==========================================================================
+    # Rays
+    # ==========================================================================
+
+    def _intersect_ray(self, ray):
+        hits = []
+        if not self._triangles:
+            return hits
+        origin, direction = ray
+        ox, oy, oz = origin[0], origin[1], origin[2]
+        dx, dy, dz = direction[0], direction[1], direction[2]
+        # with a unit direction, the ray parameter of a hit is its distance to the origin
+        length = (dx * dx + dy * dy + dz * dz) ** 0.5
+        if not length:
+            raise ValueError("The direction vector of the ray has zero length.")
+        dx, dy, dz = dx / length, dy / length, dz / length
+        ix = 1.0 / dx if dx else 1e300
+        iy = 1.0 / dy if dy else 1e300
+        iz = 1.0 / dz if dz else 1e300
+        triangles = self._triangles
+        boxes = self._box
+        lefts = self._left
+        rights = self._right
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            box = boxes[node]
+            t1 = (box[0] - ox) * ix
+            t2 = (box[3] - ox) * ix
+            t3 = (box[1] - oy) * iy
+            t4 = (box[4] - oy) * iy
+            t5 = (box[2] - oz) * iz
+            t6 = (box[5] - oz) * iz
+            tmin = max(min(t1, t2), min(t3, t4), min(t5, t6))
+            tmax = min(max(t1, t2), max(t3, t4), max(t5, t6))
+            if tmax < 0 or tmin > tmax:
+                continue
+            if lefts[node] >= 0:
+                stack.append(lefts[node])
+                stack.append(rights[node])
+                continue
+            for i in range(self._start[node], self._stop[node]):
+                hit = _intersection_ray_triangle(ox, oy, oz, dx, dy, dz, triangles[i])
+                if hit:
+                    t, u, v = hit
+                    if t >= 0:
+                        hits.append((t, i, u, v))
+        hits.sort()
+        # a hit on an edge or a vertex shared by multiple triangles is reported only once
+        owners = self._owners
+        unique = []
+        for hit in hits:
+            if unique and TOL.is_close(unique[-1][0], hit[0]):
+                if owners[hit[1]] < owners[unique[-1][1]]:
+                    unique[-1] = hit
+                continue
+            unique.append(hit)
+        return unique
+
+    def intersect_ray(self, ray):
+        """Compute the intersections of a ray with the mesh.
+
+        Parameters
+        ----------
+        ray : tuple[[float, float, float], [float, float, float]]
+            The ray, as a start point and a direction vector.
+
+        Returns
+        -------
+        list[tuple[int, float, float, float]]
+            Per intersection, sorted by distance along the ray:
+
+            0. the identifier of the intersected face
+            1. the u coordinate of the intersection in the barycentric coordinates of the intersected triangle
+            2. the v coordinate of the intersection in the barycentric coordinates of the intersected triangle
+            3. the distance between the ray origin and the hit
+
+        Raises
+        ------
+        ValueError
+            If the direction vector of the ray has zero length.
+
+        Notes
+        -----
+        Hits at the same distance along the ray, for example on an edge shared by two faces,
+        are reported only once, for the face with the lowest index.
+
+        See Also
+        --------
+        :func:`compas.geometry.intersection_ray_mesh`
+
+        """
+        keys = self.keys
+        owners = self._owners
+        return [(keys[owners[i]], u, v, t) for t, i, u, v in self._intersect_ray(ray)]
+
+    def intersect_rays(self, rays):
+        """Compute the intersections of multiple rays with the mesh.
+
+        Parameters
+        ----------
+        rays : sequence[tuple[[float, float, float], [float, float, float]]]
+            The rays, as pairs of start points and direction vectors.
+
+        Returns
+        -------
+        list[list[tuple[int, float, float, float]]]
+            The intersections per ray, as returned by :meth:`intersect_ray`.
+
+        """
+        return [self.intersect_ray(ray) for ray in rays]
+
+    # ==========================================================================
+    # Points
+    # ==========================================================================
+
+    def closest_point(self, point):
+        """Compute the closest point on the mesh to a given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            XYZ coordinates of the base point.
+
+        Returns
+        -------
+        tuple[[float, float, float], int, float] | None
+            The closest point, the identifier of the face on which it lies, and its distance to the base point.
+            None if the mesh has no faces.
+
+        """
+        if not self._triangles:
+            return None
+        p = (point[0], point[1], point[2])
+        triangles = self._triangles
+        boxes = self._box
+        lefts = self._left
+        rights = self._right
+        best = None
+        best_d2 = float("inf")
+        heap = [(_distance_point_box_sqrd(p, boxes[0]), 0)]
+        while heap:
+            d2, node = heappop(heap)
+            if d2 >= best_d2:
+                break
+            if lefts[node] >= 0:
+                for child in (lefts[node], rights[node]):
+                    d2 = _distance_point_box_sqrd(p, boxes[child])
+                    if d2 < best_d2:
+                        heappush(heap, (d2, child))
+                continue
+            for i in range(self._start[node], self._stop[node]):
+                q = _closest_point_on_triangle(p, triangles[i])
+                d2 = (q[0] - p[0]) ** 2 + (q[1] - p[1]) ** 2 + (q[2] - p[2]) ** 2
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best = q, i
+        q, i = best
+        return list(q), self.keys[self._owners[i]], best_d2**0.5
+
+    def closest_points(self, points):
+        """Compute the closest points on the mesh to multiple points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            XYZ coordinates of the base points.
+
+        Returns
+        -------
+        list[tuple[[float, float, float], int, float]]
+            Per base point, the closest point, the identifier of the face on which it lies, and its distance to the base point.
+
+        """
+        return [self.closest_point(point) for point in points]
+
+    def contains_point(self, point):
+        """Verify if a point lies inside the mesh.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            XYZ coordinates of the point.
+
+        Returns
+        -------
+        bool
+            True if the point lies inside the mesh.
+
+        Notes
+        -----
+        The result is only meaningful for closed meshes.
+        The test is based on the parity of the number of crossings of a ray from the point with the mesh,
+        where hits at the same distance along the ray, for example on shared edges, are counted only once.
+
+        """
+        return len(self._intersect_ray((point, CONTAINMENT_DIRECTION))) % 2 == 1
+
+    # ==========================================================================
+    # Trees
+    # ==========================================================================
+
+    def _overlapping_triangles(self, other):
+        pairs = []
+        if not self._triangles or not other._triangles:
+            return pairs
+        stack = [(0, 0)]
+        while stack:
+            i, j = stack.pop()
+            a = self._box[i]
+            b = other._box[j]
+            if not _is_overlapping_boxes(a, b):
+                continue
+            leaf_a = self._left[i] < 0
+            leaf_b = other._left[j] < 0
+            if leaf_a and leaf_b:
+                for s in range(self._start[i], self._stop[i]):
+                    box = self._boxes[s]
+                    for o in range(other._start[j], other._stop[j]):
+                        if _is_overlapping_boxes(box, other._boxes[o]):
+                            pairs.append((s, o))
+            elif leaf_b or (not leaf_a and _box_size(a) >= _box_size(b)):
+                stack.append((self._left[i], j))
+                stack.append((self._right[i], j))
+            else:
+                stack.append((i, other._left[j]))
+                stack.append((i, other._right[j]))
+        return pairs
+
+    def intersection_candidates(self, other):
+        """Find the pairs of faces of this mesh and another mesh with overlapping bounding boxes.
+
+        Parameters
+        ----------
+        other : :class:`compas.geometry.AABBTree`
+            The tree of the other mesh.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The pairs of face identifiers of this mesh and the other mesh,
+            of which the triangles have overlapping bounding boxes.
+
+        """
+        pairs = []
+        seen = set()
+        for s, o in self._overlapping_triangles(other):
+            pair = self._owners[s], other._owners[o]
+            if pair not in seen:
+                seen.add(pair)
+                pairs.append(pair)
+        pairs.sort()
+        return [(self.keys[a], other.keys[b]) for a, b in pairs]
+
+    def intersect_tree(self, other):
+        """Compute the intersection of this mesh with another mesh.
+
+        Parameters
+        ----------
+        other : :class:`compas.geometry.AABBTree`
+            The tree of the other mesh.
+
+        Returns
+        -------
+        list[list[[float, float, float]]]
+            The intersection polylines.
+
+        See Also
+        --------
+        :func:`compas.geometry.intersection_mesh_mesh`
+
+        Notes
+        -----
+        Coplanar overlaps of triangles are ignored.
+
+        """
+        segments = []
+        for s, o in self._overlapping_triangles(other):
+            segment = _intersection_triangle_triangle(self._triangles[s], other._triangles[o])
+            if segment:
+                segments.append(segment)
+        return _join_segments(segments)
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _is_overlapping_boxes(a, b):
+    return a[0] <= b[3] and b[0] <= a[3] and a[1] <= b[4] and b[1] <= a[4] and a[2] <= b[5] and b[2] <= a[5]
+
+
+def _box_size(box):
+    return (box[3] - box[0]) + (box[4] - box[1]) + (box[5] - box[2])
+
+
+def _distance_point_box_sqrd(p, box):
+    d2 = 0.0
+    for axis in range(3):
+        if p[axis] < box[axis]:
+            d2 += (box[axis] - p[axis]) ** 2
+        elif p[axis] > box[axis + 3]:
+            d2 += (p[axis] - box[axis + 3]) ** 2
+    return d2
+
+
+def _intersection_ray_triangle(ox, oy, oz, dx, dy, dz, triangle):
+    # Moller-Trumbore
+    a, b, c = triangle
+    e1x, e1y, e1z = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    e2x, e2y, e2z = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    px = dy * e2z - dz * e2y
+    py = dz * e2x - dx * e2z
+    pz = dx * e2y - dy * e2x
+    det = e1x * px + e1y * py + e1z * pz
+    if abs(det) < 1e-15:
+        return None
+    inv = 1.0 / det
+    tx, ty, tz = ox - a[0], oy - a[1], oz - a[2]
+    u = (tx * px + ty * py + tz * pz) * inv
+    if u < 0.0 or u > 1.0:
+        return None
+    qx = ty * e1z - tz * e1y
+    qy = tz * e1x - tx * e1z
+    qz = tx * e1y - ty * e1x
+    v = (dx * qx + dy * qy + dz * qz) * inv
+    if v < 0.0 or u + v > 1.0:
+        return None
+    t = (e2x * qx + e2y * qy + e2z * qz) * inv
+    return t, u, v
+
+
+def _closest_point_on_triangle(p, triangle):
+    # Ericson, Real-Time Collision Detection, 5.1.5
+    a, b, c = triangle
+    ab = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    ac = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    ap = p[0] - a[0], p[1] - a[1], p[2] - a[2]
+    d1 = ab[0] * ap[0] + ab[1] * ap[1] + ab[2] * ap[2]
+    d2 = ac[0] * ap[0] + ac[1] * ap[1] + ac[2] * ap[2]
+    if d1 <= 0 and d2 <= 0:
+        return a
+    bp = p[0] - b[0], p[1] - b[1], p[2] - b[2]
+    d3 = ab[0] * bp[0] + ab[1] * bp[1] + ab[2] * bp[2]
+    d4 = ac[0] * bp[0] + ac[1] * bp[1] + ac[2] * bp[2]
+    if d3 >= 0 and d4 <= d3:
+        return b
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        v = d1 / (d1 - d3)
+        return a[0] + v * ab[0], a[1] + v * ab[1], a[2] + v * ab[2]
+    cp = p[0] - c[0], p[1] - c[1], p[2] - c[2]
+    d5 = ab[0] * cp[0] + ab[1] * cp[1] + ab[2] * cp[2]
+    d6 = ac[0] * cp[0] + ac[1] * cp[1] + ac[2] * cp[2]
+    if d6 >= 0 and d5 <= d6:
+        return c
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        w = d2 / (d2 - d6)
+        return a[0] + w * ac[0], a[1] + w * ac[1], a[2] + w * ac[2]
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and (d4 - d3) >= 0 and (d5 - d6) >= 0:
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        return b[0] + w * (c[0] - b[0]), b[1] + w * (c[1] - b[1]), b[2] + w * (c[2] - b[2])
+    denom = va + vb + vc
+    if not denom:
+        return a
+    v = vb / denom
+    w = vc / denom
+    return a[0] + ab[0] * v + ac[0] * w, a[1] + ab[1] * v + ac[1] * w, a[2] + ab[2] * v + ac[2] * w
+
+
+def _intersection_triangle_triangle(T1, T2):
+    # the points where the edges of each triangle cross the other triangle
+    points = []
+    for A, B in ((T1, T2), (T2, T1)):
+        for i in range(3):
+            p = A[i]
+            q = A[(i + 1) % 3]
+            hit = _intersection_ray_triangle(p[0], p[1], p[2], q[0] - p[0], q[1] - p[1], q[2] - p[2], B)
+            if hit and 0.0 <= hit[0] <= 1.0:
+                t = hit[0]
+                points.append([p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]), p[2] + t * (q[2] - p[2])])
+    unique = {}
+    for point in points:
+        unique.setdefault(TOL.geometric_key_numeric(point), point)
+    points = list(unique.values())
+    if len(points) < 2:
+        return None
+    if len(points) == 2:
+        return points
+    # numerical noise may produce more than two points,
+    # of which the extremes are kept
+    best = None
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            a, b = points[i], points[j]
+            d2 = (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+            if best is None or d2 > best[0]:
+                best = d2, [a, b]
+    return best[1]
+
+
+def _join_segments(segments):
+    points = {}
+    adjacency = {}
+    for a, b in segments:
+        u = TOL.geometric_key_numeric(a)
+        v = TOL.geometric_key_numeric(b)
+        if u == v:
+            continue
+        points.setdefault(u, a)
+        points.setdefault(v, b)
+        adjacency.setdefault(u, set()).add(v)
+        adjacency.setdefault(v, set()).add(u)
+    polylines = []
+    # open polylines start at the ends
+    starts = [key for key, nbrs in adjacency.items() if len(nbrs) != 2] + list(adjacency)
+    for start in starts:
+        while adjacency[start]:
+            polyline = [start]
+            current = start
+            while adjacency[current]:
+                key = adjacency[current].pop()
+                adjacency[key].discard(current)
+                polyline.append(key)
+                current = key
+                if current == start:
+                    break
+            polylines.append([points[key] for key in polyline])
+    return polylines
+
+
+# ==============================================================================
+# Plugins
+# ==============================================================================
+
+
+@plugin(category="intersections", trylast=True)
+def intersection_ray_mesh(ray, mesh):
+    """Compute the intersection(s) between a ray and a mesh, using an :class:`AABBTree` of the mesh.
+
+    Parameters
+    ----------
+    ray : tuple of point and vector
+        A ray represented by a point and a direction vector.
+    mesh : tuple of vertices and faces
+        A mesh represented by a list of vertices and a list of faces.
+
+    Returns
+    -------
+    list of tuple
+        Per intersection of the ray with the mesh:
+
+        0. the index of the intersected face
+        1. the u coordinate of the intersection in the barycentric coordinates of the face
+        2. the v coordinate of the intersection in the barycentric coordinates of the face
+        3. the distance between the ray origin and the hit
+
+    """
+    vertices, faces = mesh
+    return AABBTree(vertices, faces).intersect_ray(ray)
+
+
+@plugin(category="intersections", trylast=True)
+def intersection_mesh_mesh(A, B):
+    """Compute the intersection of two meshes, using an :class:`AABBTree` of each of the meshes.
+
+    Parameters
+    ----------
+    A : tuple of vertices and faces
+        Mesh A.
+    B : tuple of vertices and faces
+        Mesh B.
+
+    Returns
+    -------
+    list of list of points
+        The intersection polylines.
+
+    """
+    return AABBTree(*A).intersect_tree(AABBTree(*B))
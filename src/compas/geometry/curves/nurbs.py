@@ -328,7 +328,7 @@ class NurbsCurve(Curve):
         :class:`compas.geometry.NurbsCurve`
 
         """
-        return nurbscurve_from_parameters(cls, points, weights, knots, multiplicities, degree, is_periodic=False)
+        return nurbscurve_from_parameters(cls, points, weights, knots, multiplicities, degree, is_periodic=is_periodic)
 
     @classmethod
     def from_points(cls, points, degree=3):
@@ -0,0 +1,463 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import compute_basisfuncs
+from compas.geometry import compute_basisfuncsderivs
+from compas.geometry import construct_knotvector
+from compas.geometry import find_span
+from compas.geometry import knots_and_mults_to_knotvector
+from compas.geometry import knotvector_to_knots_and_mults
+from compas.geometry import transform_points
+from compas.itertools import linspace
+from compas.plugins import plugin
+
+from .nurbs import NurbsCurve
+
+
+def _binomial(n, k):
+    b = 1
+    for i in range(1, k + 1):
+        b = b * (n - k + i) // i
+    return b
+
+
+def _rational_derivatives(ders):
+    """Compute the derivatives of a rational curve from the derivatives of its homogeneous representation.
+
+    Parameters
+    ----------
+    ders : list[list[float]]
+        The homogeneous point (row 0) and its derivatives (row k for the k-th derivative),
+        as ``[wx, wy, wz, w]``.
+
+    Returns
+    -------
+    list[list[float]]
+        The point (row 0) and its derivatives (row k for the k-th derivative), as ``[x, y, z]``.
+
+    References
+    ----------
+    The NURBS Book. Chapter 4. Page 127. Algorithm A4.2.
+
+    """
+    w0 = ders[0][3]
+    result = []
+    for k, (ax, ay, az, _) in enumerate(ders):
+        for i in range(1, k + 1):
+            b = _binomial(k, i) * ders[i][3]
+            x, y, z = result[k - i]
+            ax -= b * x
+            ay -= b * y
+            az -= b * z
+        result.append([ax / w0, ay / w0, az / w0])
+    return result
+
+
+class DefaultNurbsCurve(NurbsCurve):
+    """NURBS curve that is evaluated in pure Python, without a CAD backend.
+
+    Instances of this class are created by the constructors of :class:`compas.geometry.NurbsCurve`,
+    if no other backend provides an implementation, for example through ``compas_occ`` or Rhino.
+
+    Parameters
+    ----------
+    points : list[[float, float, float] | :class:`compas.geometry.Point`]
+        The control points.
+    weights : list[float]
+        The weights of the control points.
+    knots : list[float]
+        The knots, without multiplicity.
+    multiplicities : list[int]
+        The multiplicities of the knots.
+    degree : int
+        The degree of the curve.
+    name : str, optional
+        The name of the curve.
+
+    Notes
+    -----
+    The knot vector should have the "standard" form, with a length equal to the number of control points plus the order of the curve.
+    Periodic curves are not supported.
+
+    Evaluating the curve at many parameters at once, with :meth:`points_at` or :meth:`to_points`,
+    is considerably faster than evaluating the parameters one by one.
+    The basis functions are only computed once per knot span, to convert the curve in that span to a polynomial,
+    which is then evaluated for all parameters in the span.
+
+    """
+
+    def __init__(self, points, weights, knots, multiplicities, degree, name=None):
+        super(DefaultNurbsCurve, self).__init__(name=name)
+        knotvector = knots_and_mults_to_knotvector(knots, multiplicities)
+        if len(weights) != len(points):
+            raise ValueError("The number of weights should be equal to the number of control points.")
+        if len(knotvector) != len(points) + degree + 1:
+            raise ValueError("The length of the knot vector should be equal to the number of control points plus the order of the curve.")
+        self._points = [Point(*point) for point in points]
+        self._weights = [float(weight) for weight in weights]
+        self._knotvector = [float(knot) for knot in knotvector]
+        self._degree = degree
+        self._homogeneous = None
+        self._polynomials = {}
+
+    # ==============================================================================
+    # Properties
+    # ==============================================================================
+
+    @property
+    def points(self):
+        return self._points
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @property
+    def knots(self):
+        return knotvector_to_knots_and_mults(self._knotvector)[0]
+
+    @property
+    def multiplicities(self):
+        return knotvector_to_knots_and_mults(self._knotvector)[1]
+
+    @property
+    def knotvector(self):
+        return self._knotvector
+
+    @property
+    def continuity(self):
+        mults = self.multiplicities[1:-1]
+        return self._degree - max(mults) if mults else self._degree
+
+    @property
+    def degree(self):
+        return self._degree
+
+    @property
+    def domain(self):
+        return self._knotvector[self._degree], self._knotvector[-self._degree - 1]
+
+    @property
+    def is_rational(self):
+        return any(weight != self._weights[0] for weight in self._weights)
+
+    @property
+    def is_periodic(self):
+        return False
+
+    @property
+    def is_closed(self):
+        return self._points[0] == self._points[-1]
+
+    @property
+    def _weighted_points(self):
+        # the weighted control points are cached
+        # and reset when the curve is transformed
+        if self._homogeneous is None:
+            self._homogeneous = [[x * w, y * w, z * w, w] for (x, y, z), w in zip(self._points, self._weights)]
+        return self._homogeneous
+
+    # ==============================================================================
+    # Conversions
+    # ==============================================================================
+
+    def to_points(self, n=10, domain=None):
+        """Convert the curve to a list of points.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of points in the list.
+            Default is ``10``.
+        domain : tuple, optional
+            Subset of the domain to use for the discretisation.
+            Default is ``None``, in which case the entire curve domain is used.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Point`]
+
+        """
+        start, end = domain or self.domain
+        return self.points_at(list(linspace(start, end, n)))
+
+    # ==============================================================================
+    # Transformations
+    # ==============================================================================
+
+    def transform(self, T):
+        """Transform the control points of the curve.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+            The curve is modified in-place.
+
+        """
+        self._points = [Point(*point) for point in transform_points(self._points, T)]
+        self._homogeneous = None
+        self._polynomials = {}
+
+    # ==============================================================================
+    # Methods
+    # ==============================================================================
+
+    def point_at(self, t):
+        """Compute a point of the curve at a parameter.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+
+        Returns
+        -------
+        :class:`compas.geometry.Point`
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain.
+
+        """
+        p = self._degree
+        span = find_span(len(self._points) - 1, p, self._knotvector, t)
+        basis = compute_basisfuncs(p, self._knotvector, span, t)
+        x = y = z = w = 0.0
+        for b, (px, py, pz, pw) in zip(basis, self._weighted_points[span - p : span + 1]):
+            x += b * px
+            y += b * py
+            z += b * pz
+            w += b * pw
+        return Point(x / w, y / w, z / w)
+
+    def points_at(self, params):
+        """Compute the points of the curve at many parameters at once.
+
+        Parameters
+        ----------
+        params : list[float]
+            The values of the curve parameter.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Point`]
+
+        Raises
+        ------
+        ValueError
+            If a parameter is not in the curve domain.
+
+        """
+        n = len(self._points) - 1
+        p = self._degree
+        knotvector = self._knotvector
+        polynomials = self._polynomials
+        points = []
+        for u in params:
+            span = find_span(n, p, knotvector, u)
+            polynomial = polynomials.get(span)
+            if polynomial is None:
+                polynomial = polynomials[span] = self._span_polynomial(span)
+            start, coefficients = polynomial
+            h = u - start
+            x, y, z, w = coefficients[0]
+            for cx, cy, cz, cw in coefficients[1:]:
+                x = x * h + cx
+                y = y * h + cy
+                z = z * h + cz
+                w = w * h + cw
+            points.append(Point(x / w, y / w, z / w))
+        return points
+
+    def _span_polynomial(self, span):
+        # the homogeneous curve is a polynomial in every knot span
+        # its coefficients are the scaled derivatives at the start of the span (Taylor expansion)
+        # in order of decreasing power, for evaluation with Horner's method
+        p = self._degree
+        start = self._knotvector[span]
+        derivs = compute_basisfuncsderivs(p, self._knotvector, span, start, p)
+        cpts = self._weighted_points[span - p : span + 1]
+        coefficients = []
+        factorial = 1.0
+        for k, row in enumerate(derivs):
+            if k:
+                factorial *= k
+            x = y = z = w = 0.0
+            for b, (cx, cy, cz, cw) in zip(row, cpts):
+                x += b * cx
+                y += b * cy
+                z += b * cz
+                w += b * cw
+            coefficients.append((x / factorial, y / factorial, z / factorial, w / factorial))
+        coefficients.reverse()
+        return start, coefficients
+
+    def derivatives_at(self, t, n=1):
+        """Compute the point and the derivatives of the curve at a parameter.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+        n : int, optional
+            The number of derivatives.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Vector`]
+            The position vector of the point of the curve (item 0),
+            and the derivatives (item k for the k-th derivative).
+            Derivatives of an order higher than the degree of the curve are zero.
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain.
+
+        """
+        p = self._degree
+        span = find_span(len(self._points) - 1, p, self._knotvector, t)
+        basis = compute_basisfuncsderivs(p, self._knotvector, span, t, min(n, p))
+        cpts = self._weighted_points[span - p : span + 1]
+        ders = []
+        for row in basis:
+            d = [0.0, 0.0, 0.0, 0.0]
+            for b, cpt in zip(row, cpts):
+                d[0] += b * cpt[0]
+                d[1] += b * cpt[1]
+                d[2] += b * cpt[2]
+                d[3] += b * cpt[3]
+            ders.append(d)
+        # the derivatives of the homogeneous curve beyond the degree are zero
+        ders += [[0.0, 0.0, 0.0, 0.0] for _ in range(n - p)]
+        return [Vector(*d) for d in _rational_derivatives(ders)]
+
+    def tangent_at(self, t):
+        """Compute the unit tangent vector of the curve at a parameter.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+
+        Returns
+        -------
+        :class:`compas.geometry.Vector`
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain.
+
+        """
+        return self.derivatives_at(t, 1)[1].unitized()
+
+    def normal_at(self, t):
+        """Compute the unit principal normal vector of the curve at a parameter.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+
+        Returns
+        -------
+        :class:`compas.geometry.Vector` | None
+            The normal vector, or None if the curve is straight at the parameter.
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain.
+
+        """
+        _, d1, d2 = self.derivatives_at(t, 2)
+        return self._normal(d1, d2)
+
+    def curvature_at(self, t):
+        """Compute the curvature vector of the curve at a parameter.
+
+        The curvature vector points from the point of the curve to the center of the osculating circle,
+        and its length is the curvature, which is the inverse of the radius of the osculating circle.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+
+        Returns
+        -------
+        :class:`compas.geometry.Vector`
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain.
+
+        """
+        _, d1, d2 = self.derivatives_at(t, 2)
+        length2 = d1.dot(d1)
+        tangent = d1 * (1.0 / length2**0.5)
+        return (d2 - tangent * d2.dot(tangent)) * (1.0 / length2)
+
+    def frame_at(self, t):
+        """Compute the local frame of the curve at a parameter.
+
+        The frame is defined by the point of the curve, the tangent vector, and the principal normal vector.
+
+        Parameters
+        ----------
+        t : float
+            The value of the curve parameter.
+
+        Returns
+        -------
+        :class:`compas.geometry.Frame`
+
+        Raises
+        ------
+        ValueError
+            If the parameter is not in the curve domain,
+            or if the curve is straight at the parameter.
+
+        """
+        point, d1, d2 = self.derivatives_at(t, 2)
+        normal = self._normal(d1, d2)
+        if normal is None:
+            raise ValueError("The frame is not defined where the curve is straight.")
+        return Frame(Point(*point), d1, normal)
+
+    def _normal(self, d1, d2):
+        normal = d2 - d1 * (d2.dot(d1) / d1.dot(d1))
+        length = normal.length
+        if length < 1e-12 * max(d2.length, 1.0):
+            return None
+        return normal * (1.0 / length)
+
+
+# ==============================================================================
+# Plugins
+# ==============================================================================
+
+
+@plugin(category="factories", trylast=True)
+def nurbscurve_from_parameters(cls, points, weights, knots, multiplicities, degree, is_periodic=False):
+    if is_periodic:
+        raise NotImplementedError("Periodic NURBS curves are not supported without a CAD backend.")
+    return DefaultNurbsCurve(points, weights, knots, multiplicities, degree)
+
+
+@plugin(category="factories", trylast=True)
+def nurbscurve_from_points(cls, points, degree=3):
+    knots, multiplicities = knotvector_to_knots_and_mults(construct_knotvector(degree, len(points)))
+    return DefaultNurbsCurve(points, [1.0] * len(points), knots, multiplicities, degree)
@@ -194,6 +194,29 @@ class Polyline(Curve):
     # Methods
     # ==========================================================================
 
+    def copy(self, cls=None):
+        """Make an independent copy of the polyline.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.geometry.Polyline`], optional
+            The type of polyline to return.
+            Defaults to the type of the current polyline.
+
+        Returns
+        -------
+        :class:`compas.geometry.Polyline`
+            An independent copy of this polyline.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not issubclass(cls, Polyline) or type(self).__data__ is not Polyline.__data__:
+            return super(Polyline, self).copy(cls=cls)
+        polyline = cls([[point.x, point.y, point.z] for point in self.points])
+        polyline.name = self.name
+        return polyline
+
     def append(self, point):
         """Append a point to the end of the polyline.
 
@@ -2,9 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from compas.geometry import cross_vectors
 from compas.geometry import cross_vectors_xy
-from compas.geometry import dot_vectors
 from compas.geometry import subtract_vectors
 
 
@@ -21,59 +19,238 @@ def convex_hull(points):
     list[[int, int, int]]
         The triangular faces of the convex hull as lists of vertex indices
         referring to the original point coordinates.
+        The vertices of the faces are ordered counter-clockwise when seen from the outside of the hull.
+
+    Raises
+    ------
+    ValueError
+        If there are less than four points, or if all points are coplanar.
 
     See Also
     --------
-    convex_hull_xy
+    convex_hull_xy, quickhull_numpy
 
     Notes
     -----
-    This algorithm is based on [1]_. Note that is not optimized and relatively
-    slow on large sets of points. For a more optimized version of this algorithm,
-    see [2]_.
+    This function implements the Quickhull algorithm [1]_ [2]_.
+    Every face of the hull keeps a list of the points that are outside of it.
+    Points that are not outside of any face are discarded as soon as they are found to be inside the hull.
+    The hull is expanded towards the furthest point of a face,
+    by replacing the faces visible from that point with a cone of new faces connecting the point to the horizon.
+    The neighbours of the faces are found through a map of directed edges.
+
+    Faces of the hull that are (nearly) coplanar are not merged.
 
     References
     ----------
-    .. [1] GitHubGist. *Convex Hull*.
-           Available at: https://gist.github.com/anonymous/5184ba0bcab21d3dd19781efd3aae543
+    .. [1] Barber, C. B., Dobkin, D. P. and Huhdanpaa, H., 1996.
+           *The Quickhull algorithm for convex hulls*.
+           ACM Transactions on Mathematical Software, 22(4), pp. 469-483.
     .. [2] Thomas Diewald. *Convex Hull 3D - Quickhull Algorithm*.
            Available at: https://web.archive.org/web/20180106161310/http://thomasdiewald.com/blog/?p=1888
 
+    Examples
+    --------
+    >>> points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.1, 0.1, 0.1]]
+    >>> faces = convex_hull(points)
+    >>> len(faces)
+    4
+
     """
+    xs = []
+    ys = []
+    zs = []
+    for point in points:
+        xs.append(float(point[0]))
+        ys.append(float(point[1]))
+        zs.append(float(point[2]))
+
+    a, b, c, d, tol = _quickhull_tetrahedron(xs, ys, zs)
+
+    # the faces are stored by key, with their vertices, their unit normal, the offset of their plane
+    # and the list of the points that are outside of them
+    face_vertices = {}
+    face_plane = {}
+    face_outside = {}
+    # the face on the left side of every directed edge
+    edge_face = {}
+    count = [0]
+
+    def add_face(u, v, w):
+        ux = xs[v] - xs[u]
+        uy = ys[v] - ys[u]
+        uz = zs[v] - zs[u]
+        vx = xs[w] - xs[u]
+        vy = ys[w] - ys[u]
+        vz = zs[w] - zs[u]
+        nx = uy * vz - uz * vy
+        ny = uz * vx - ux * vz
+        nz = ux * vy - uy * vx
+        length = (nx * nx + ny * ny + nz * nz) ** 0.5
+        if length:
+            nx /= length
+            ny /= length
+            nz /= length
+        key = count[0]
+        count[0] += 1
+        face_vertices[key] = (u, v, w)
+        face_plane[key] = (nx, ny, nz, nx * xs[u] + ny * ys[u] + nz * zs[u])
+        face_outside[key] = []
+        edge_face[u, v] = key
+        edge_face[v, w] = key
+        edge_face[w, u] = key
+        return key
+
+    def assign(indices, faces):
+        # add the points to the outside set of the first face that can see them
+        # and discard the points that are inside all faces
+        planes = [(face_plane[key], face_outside[key]) for key in faces]
+        for i in indices:
+            x = xs[i]
+            y = ys[i]
+            z = zs[i]
+            for (nx, ny, nz, offset), outside in planes:
+                if nx * x + ny * y + nz * z - offset > tol:
+                    outside.append(i)
+                    break
+
+    # the initial tetrahedron, with the faces oriented outwards
+    if _signed_volume(xs, ys, zs, a, b, c, d) > 0:
+        b, c = c, b
+    faces = [add_face(a, b, c), add_face(a, d, b), add_face(b, d, c), add_face(c, d, a)]
+    assign([i for i in range(len(xs)) if i != a and i != b and i != c and i != d], faces)
+
+    stack = [key for key in faces if face_outside[key]]
+
+    while stack:
+        key = stack.pop()
+        if key not in face_vertices or not face_outside[key]:
+            continue
+
+        # the furthest point outside the face
+        nx, ny, nz, offset = face_plane[key]
+        eye = max(face_outside[key], key=lambda i: nx * xs[i] + ny * ys[i] + nz * zs[i])
+        x = xs[eye]
+        y = ys[eye]
+        z = zs[eye]
+
+        # the faces visible from the point, and the horizon edges around them
+        visible = set([key])
+        horizon = []
+        todo = [key]
+        while todo:
+            current = todo.pop()
+            u, v, w = face_vertices[current]
+            for edge in ((u, v), (v, w), (w, u)):
+                other = edge_face[edge[1], edge[0]]
+                if other in visible:
+                    continue
+                nx, ny, nz, offset = face_plane[other]
+                if nx * x + ny * y + nz * z - offset > tol:
+                    visible.add(other)
+                    todo.append(other)
+                else:
+                    horizon.append(edge)
+
+        # remove the visible faces and collect their outside points
+        orphans = []
+        for current in visible:
+            u, v, w = face_vertices.pop(current)
+            del face_plane[current]
+            orphans += face_outside.pop(current)
+            for edge in ((u, v), (v, w), (w, u)):
+                if edge_face.get(edge) == current:
+                    del edge_face[edge]
+
+        # connect the point to the horizon
+        faces = [add_face(u, v, eye) for u, v in horizon]
+        assign([i for i in orphans if i != eye], faces)
+        stack += [key for key in faces if face_outside[key]]
+
+    return [list(vertices) for vertices in face_vertices.values()]
+
+
+def _signed_volume(xs, ys, zs, a, b, c, d):
+    ux = xs[b] - xs[a]
+    uy = ys[b] - ys[a]
+    uz = zs[b] - zs[a]
+    vx = xs[c] - xs[a]
+    vy = ys[c] - ys[a]
+    vz = zs[c] - zs[a]
+    wx = xs[d] - xs[a]
+    wy = ys[d] - ys[a]
+    wz = zs[d] - zs[a]
+    return ux * (vy * wz - vz * wy) - uy * (vx * wz - vz * wx) + uz * (vx * wy - vy * wx)
+
+
+def _quickhull_tetrahedron(xs, ys, zs):
+    # find four points that span a tetrahedron of maximal size, starting from the extreme points along the axes
+    # and compute the tolerance for points to be considered outside of the faces of the hull
+    n = len(xs)
+    if n < 4:
+        raise ValueError("At least four points are needed to compute a convex hull.")
+
+    indices = range(n)
+    extremes = []
+    for coords in (xs, ys, zs):
+        extremes.append(min(indices, key=coords.__getitem__))
+        extremes.append(max(indices, key=coords.__getitem__))
+
+    scale = sum(max(abs(coords[extremes[2 * k]]), abs(coords[extremes[2 * k + 1]])) for k, coords in enumerate((xs, ys, zs)))
+    tol = 3 * 2.220446049250313e-16 * scale
 
-    def _normal_face(face):
-        u = subtract_vectors(points[face[1]], points[face[0]])
-        v = subtract_vectors(points[face[-1]], points[face[0]])
-        return cross_vectors(u, v)
+    a = b = None
+    distance = -1.0
+    for i in extremes:
+        for j in extremes:
+            dx = xs[j] - xs[i]
+            dy = ys[j] - ys[i]
+            dz = zs[j] - zs[i]
+            d = dx * dx + dy * dy + dz * dz
+            if d > distance:
+                a, b, distance = i, j, d
+    if distance <= tol * tol:
+        raise ValueError("The points are coincident.")
 
-    def _seen(face, p):
-        normal = _normal_face(face)
-        vec = subtract_vectors(points[p], points[face[0]])
-        return dot_vectors(normal, vec) >= 0
+    # the point furthest from the line ab
+    ux = xs[b] - xs[a]
+    uy = ys[b] - ys[a]
+    uz = zs[b] - zs[a]
 
-    def _bdry(faces):
-        bdry_fw = set([(face[i - 1], face[i]) for face in faces for i in range(len(face))])
-        bdry_bk = set([(face[i], face[i - 1]) for face in faces for i in range(len(face))])
-        return bdry_fw - bdry_bk
+    def line_distance(i):
+        vx = xs[i] - xs[a]
+        vy = ys[i] - ys[a]
+        vz = zs[i] - zs[a]
+        cx = uy * vz - uz * vy
+        cy = uz * vx - ux * vz
+        cz = ux * vy - uy * vx
+        return cx * cx + cy * cy + cz * cz
 
-    def _add_point(hull, p):
-        seen_faces = [face for face in hull if _seen(face, p)]
+    c = max(indices, key=line_distance)
+    if line_distance(c) <= (tol * tol) * distance:
+        raise ValueError("The points are collinear.")
 
-        if len(seen_faces) == len(hull):
-            # if can see all faces, unsee ones looking "down"
-            normal = _normal_face(seen_faces[0])
-            seen_faces = [face for face in seen_faces if dot_vectors(_normal_face(face), normal) > 0]
+    # the point furthest from the plane abc
+    vx = xs[c] - xs[a]
+    vy = ys[c] - ys[a]
+    vz = zs[c] - zs[a]
+    nx = uy * vz - uz * vy
+    ny = uz * vx - ux * vz
+    nz = ux * vy - uy * vx
+    length = (nx * nx + ny * ny + nz * nz) ** 0.5
+    nx /= length
+    ny /= length
+    nz /= length
+    offset = nx * xs[a] + ny * ys[a] + nz * zs[a]
 
-        for face in seen_faces:
-            hull.remove(face)
+    def plane_distance(i):
+        return abs(nx * xs[i] + ny * ys[i] + nz * zs[i] - offset)
 
-        for edge in _bdry(seen_faces):
-            hull.append([edge[0], edge[1], p])
+    d = max(indices, key=plane_distance)
+    if plane_distance(d) <= tol:
+        raise ValueError("The points are coplanar.")
 
-    hull = [[0, 1, 2], [0, 2, 1]]
-    for i in range(3, len(points)):
-        _add_point(hull, i)
-    return hull
+    return a, b, c, d, tol
 
 
 def convex_hull_xy(points, strict=False):
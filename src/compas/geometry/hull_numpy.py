@@ -24,7 +24,7 @@ def convex_hull_numpy(points):
 
     See Also
     --------
-    convex_hull_xy_numpy
+    convex_hull_xy_numpy, quickhull_numpy
 
     Notes
     -----
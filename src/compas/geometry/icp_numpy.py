@@ -1,15 +1,14 @@
+import time
+
 import numpy as np
-from numpy import argmin
 from numpy import asarray
 from numpy.linalg import det
-from numpy.linalg import multi_dot
-from scipy.linalg import norm
+from numpy.linalg import eigh
+from numpy.linalg import lstsq
 from scipy.linalg import svd
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 
 from compas.geometry import pca_numpy
-from compas.geometry import transform_points_numpy
-from compas.linalg import normrow
 from compas.tolerance import TOL
 
 
@@ -37,7 +36,113 @@ def bestfit_transform(A, B):
     return X
 
 
-def icp_numpy(source, target, tol=None, maxiter=100):
+def bestfit_transform_planes(A, B, N):
+    """Compute the rigid transformation that minimises the distances of points to the tangent planes at their matches.
+
+    Parameters
+    ----------
+    A : ndarray[float](N, 3)
+        The source points.
+    B : ndarray[float](N, 3)
+        The matching target points.
+    N : ndarray[float](N, 3)
+        The unit normals of the target points.
+
+    Returns
+    -------
+    ndarray[float](4, 4)
+
+    Notes
+    -----
+    The rotation is linearised for small angles, which results in a linear least-squares problem
+    for the rotation vector and the translation vector.
+    The rotation matrix is then computed from the rotation vector.
+
+    """
+    J = np.hstack((np.cross(A, N), N))
+    r = ((B - A) * N).sum(axis=1)
+    x = lstsq(J, r, rcond=None)[0]
+    w = x[:3]
+    angle = np.sqrt(w.dot(w))
+    R = np.identity(3)
+    if angle > 0:
+        k = w / angle
+        K = np.array([[0.0, -k[2], k[1]], [k[2], 0.0, -k[0]], [-k[1], k[0], 0.0]])
+        R += np.sin(angle) * K + (1 - np.cos(angle)) * K.dot(K)
+    X = np.identity(4)
+    X[:3, :3] = R
+    X[:3, 3] = x[3:]
+    return X
+
+
+def voxel_downsample_numpy(points, voxelsize):
+    """Reduce a set of points to the centroids of the points in the cells of a voxel grid.
+
+    Parameters
+    ----------
+    points : array_like[point]
+        XYZ coordinates of the points.
+    voxelsize : float
+        The size of the cells of the voxel grid.
+
+    Returns
+    -------
+    ndarray[float](M, 3)
+        The centroids of the points in every non-empty cell.
+
+    Examples
+    --------
+    >>> points = [[0.1, 0.1, 0.1], [0.3, 0.3, 0.3], [1.5, 0.1, 0.1]]
+    >>> voxel_downsample_numpy(points, 1.0).tolist()
+    [[0.2, 0.2, 0.2], [1.5, 0.1, 0.1]]
+
+    """
+    points = asarray(points, dtype=float)[:, :3]
+    cells = np.floor((points - points.min(axis=0)) / voxelsize).astype(np.int64)
+    shape = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]
+    _, index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    counts = np.bincount(inverse)
+    centroids = np.empty((len(counts), 3))
+    for i in range(3):
+        centroids[:, i] = np.bincount(inverse, weights=points[:, i]) / counts
+    # keep the cells in the order of their first point
+    return centroids[np.argsort(index, kind="stable")]
+
+
+def _estimate_normals(points, tree, indices, k=10, chunksize=100000):
+    # the normal of a point is the direction of least variance of its k nearest neighbours
+    k = min(k, len(points))
+    normals = np.empty((len(indices), 3))
+    for start in range(0, len(indices), chunksize):
+        _, nbrs = tree.query(points[indices[start : start + chunksize]], k=k)
+        P = points[nbrs.reshape(-1, k)]
+        P = P - P.mean(axis=1)[:, None, :]
+        C = np.einsum("nki,nkj->nij", P, P)
+        _, vectors = eigh(C)
+        normals[start : start + chunksize] = vectors[:, :, 0]
+    return normals
+
+
+def _transform(points, X):
+    return points.dot(X[:3, :3].T) + X[:3, 3]
+
+
+def icp_numpy(
+    source,
+    target,
+    tol=None,
+    maxiter=100,
+    samples=None,
+    voxelsize=None,
+    method="point-to-point",
+    target_normals=None,
+    reject=None,
+    maxdistance=None,
+    callback=None,
+    seed=None,
+):
     """Align two point clouds using the Iterative Closest Point (ICP) method.
 
     Parameters
@@ -47,10 +152,47 @@ def icp_numpy(source, target, tol=None, maxiter=100):
     target : array_like[point]
         The target data.
     tol : float, optional
-        Tolerance for finding matches.
+        Tolerance for the convergence of the alignment error.
+        The iterations stop if the error is smaller than the tolerance,
+        or if the relative decrease of the error in an iteration is smaller than the tolerance.
         Default is :attr:`TOL.approximation`.
     maxiter : int, optional
-        The maximum number of iterations.
+        The maximum number of iterations, per level of resolution.
+    samples : int, optional
+        The maximum number of source points that are matched in every iteration.
+        If the source has more points, a random sample of points is taken at every level of resolution.
+        Default is None, in which case all points are used.
+    voxelsize : float | list[float], optional
+        The size of a voxel grid for downsampling the clouds before matching them.
+        A list of decreasing sizes defines a coarse-to-fine schedule,
+        where the alignment at every level of resolution is the starting point for the next.
+        Use ``None`` or ``0`` in the list for the original resolution.
+        Default is None, in which case the clouds are not downsampled.
+    method : {"point-to-point", "point-to-plane"}, optional
+        The error that is minimised.
+        With ``"point-to-point"``, the distances between the matched points are minimised.
+        With ``"point-to-plane"``, the distances between the source points
+        and the tangent planes at the matched target points are minimised.
+    target_normals : array_like[vector], optional
+        The normals of the target points, for the point-to-plane error.
+        If not provided, the normals are estimated from the neighbourhoods of the points,
+        as far as they are needed for the matched points.
+        The normals are only used at the original resolution of the target.
+    reject : float, optional
+        Percentile of the distances between matched points above which matches are rejected as outliers.
+        For example, with ``reject=90`` the 10% of the matches with the largest distances are rejected in every iteration.
+        Default is None, in which case all matches are used.
+    maxdistance : float, optional
+        The maximum distance between matched points.
+        Source points without a target point within this distance are not matched.
+        Bounding the distance also speeds up the search for the closest points, if there are outliers.
+        Default is None, in which case the distance is not bounded.
+    callback : callable, optional
+        A function that is called after every iteration with a dict of statistics of the iteration,
+        with the keys ``"level"``, ``"iteration"``, ``"rmse"`` (the root mean square distance of the accepted matches),
+        ``"matches"`` (the number of accepted matches), and ``"time"`` (the duration of the iteration in seconds).
+    seed : int, optional
+        Seed of the random number generator for sampling the source points.
 
     Returns
     -------
@@ -59,6 +201,12 @@ def icp_numpy(source, target, tol=None, maxiter=100):
     ndarray[float](4, 4)
         The bestfit transformation matrix.
 
+    Raises
+    ------
+    ValueError
+        If the method is not one of the supported methods.
+        If there are not enough matches between the source and the target points.
+
     Notes
     -----
     First we align the source with the target cloud using the frames resulting
@@ -68,21 +216,41 @@ def icp_numpy(source, target, tol=None, maxiter=100):
     the points of the two clouds.
 
     Then we iteratively improve the alignment by computing successive "best-fit"
-    transformations using SVD of the cross-covariance matrix of the two data sets.
+    transformations, using SVD of the cross-covariance matrix of the two data sets for the point-to-point error,
+    or by solving a linearised least-squares problem for the point-to-plane error.
     During this iterative process, we continuously update the correspondence
     between the point clouds by finding the closest point in the target to each
-    of the source points.
+    of the source points, using a KD tree of the target points.
+    The source points are not transformed in every iteration.
+    Only the sampled points are transformed with the accumulated transformation.
 
-    The algorithm terminates when the alignment error is below a specified tolerance.
+    The algorithm terminates when the alignment error is below a specified tolerance,
+    or when it no longer decreases significantly.
+
+    Examples
+    --------
+    >>> from compas.geometry import Rotation
+    >>> from compas.geometry import Translation
+    >>> from compas.geometry import Pointcloud
+    >>> target = Pointcloud.from_bounds(10, 5, 3, 1000)
+    >>> T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], 0.1)
+    >>> source = target.transformed(T)
+    >>> stats = []
+    >>> points, X = icp_numpy(source, target, samples=500, callback=stats.append)
+    >>> stats[-1]["rmse"] < 1e-3
+    True
 
     """
     from compas.geometry import Frame
     from compas.geometry import Transformation
 
+    if method not in ("point-to-point", "point-to-plane"):
+        raise ValueError("Unknown method: {}".format(method))
+
     tol = tol or TOL.approximation
 
-    A = asarray(source)
-    B = asarray(target)
+    A = asarray(source, dtype=float)[:, :3]
+    B = asarray(target, dtype=float)[:, :3]
 
     origin, axes, _ = pca_numpy(A)
     A_frame = Frame(origin, axes[0], axes[1])
@@ -90,24 +258,80 @@ def icp_numpy(source, target, tol=None, maxiter=100):
     origin, axes, _ = pca_numpy(B)
     B_frame = Frame(origin, axes[0], axes[1])
 
-    X = Transformation.from_frame_to_frame(A_frame, B_frame)
-    A = transform_points_numpy(A, X)
+    X = asarray(Transformation.from_frame_to_frame(A_frame, B_frame).matrix)
+
+    if isinstance(voxelsize, (list, tuple)):
+        schedule = list(voxelsize)
+    else:
+        schedule = [voxelsize]
+
+    random = np.random.RandomState(seed)
+
+    for level, size in enumerate(schedule):
+        if size:
+            A_level = voxel_downsample_numpy(A, size)
+            B_level = voxel_downsample_numpy(B, size)
+        else:
+            A_level = A
+            B_level = B
+
+        tree = cKDTree(B_level)
+
+        normals = None
+        if method == "point-to-plane":
+            if not size and target_normals is not None:
+                normals = asarray(target_normals, dtype=float)[:, :3]
+                normals = normals / np.sqrt((normals**2).sum(axis=1))[:, None]
+            else:
+                # normals are estimated when they are needed
+                normals = np.full(B_level.shape, np.nan)
+
+        if samples and len(A_level) > samples:
+            A_level = A_level[random.choice(len(A_level), samples, replace=False)]
+
+        previous = None
+
+        for i in range(maxiter):
+            t0 = time.time()
+
+            points = _transform(A_level, X)
+            if maxdistance:
+                distances, closest = tree.query(points, distance_upper_bound=maxdistance)
+                inliers = np.isfinite(distances)
+                points = points[inliers]
+                distances = distances[inliers]
+                closest = closest[inliers]
+            else:
+                distances, closest = tree.query(points)
+
+            if reject is not None and len(distances) > 1:
+                inliers = distances <= np.percentile(distances, reject)
+                points = points[inliers]
+                distances = distances[inliers]
+                closest = closest[inliers]
+
+            if len(distances) < 3:
+                raise ValueError("Not enough matches between the source and the target to compute an alignment.")
 
-    stack = [asarray(X.matrix)]
+            rmse = np.sqrt((distances**2).mean())
 
-    for i in range(maxiter):
-        D = cdist(A, B, "euclidean")
-        closest = argmin(D, axis=1)
-        residual = norm(normrow(A - B[closest]))
+            converged = TOL.is_zero(rmse, tol=tol) or (previous is not None and previous - rmse <= tol * previous)
+            if not converged:
+                if normals is None:
+                    dX = bestfit_transform(points, B_level[closest])
+                else:
+                    missing = np.unique(closest[np.isnan(normals[closest, 0])])
+                    if len(missing):
+                        normals[missing] = _estimate_normals(B_level, tree, missing)
+                    dX = bestfit_transform_planes(points, B_level[closest], normals[closest])
+                X = dX.dot(X)
 
-        if TOL.is_zero(residual, tol=tol):
-            break
+            if callback:
+                callback({"level": level, "iteration": i, "rmse": float(rmse), "matches": len(distances), "time": time.time() - t0})
 
-        X = bestfit_transform(A, B[closest])
-        A = transform_points_numpy(A, X)
+            if converged:
+                break
 
-        stack.append(X)
+            previous = rmse
 
-    if len(stack) == 1:
-        return stack[0]
-    return A, multi_dot(stack[::-1])
+    return _transform(A, X), X
@@ -2,50 +2,96 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import collections
+from heapq import heappush
+from heapq import heapreplace
 
-from ._core.distance import distance_point_point_sqrd
-
-Node = collections.namedtuple("Node", "point axis label left right")
+try:
+    from itertools import filterfalse
+except ImportError:
+    from itertools import ifilterfalse as filterfalse
 
 
 class KDTree(object):
     """A tree for nearest neighbor search in a k-dimensional space.
 
+    The tree is stored in flat arrays.
+    Every node of the tree covers a contiguous range of the points, reordered during construction,
+    and is split at the median of that range along the axis with the largest spread.
+    Nodes with at most ``leafsize`` points are not split further.
+
     Parameters
     ----------
     objects : sequence[[float, float, float] | :class:`compas.geometry.Point`], optional
         A list of objects to populate the tree with.
         If objects are provided, the tree is built automatically.
         Otherwise, use :meth:`build`.
+    leafsize : int, optional
+        The maximum number of points in a leaf node.
 
     Attributes
     ----------
-    root : Node
-        The root node of the built tree.
-        This is the median with respect to the different dimensions of the tree.
+    leafsize : int
+        The maximum number of points in a leaf node.
 
     Notes
     -----
     For more info, see [1]_ and [2]_.
 
+    If NumPy is available, large trees are built with a vectorised partitioning of the points at every node.
+    Queries are always performed in pure Python.
+
     References
     ----------
     .. [1] Wikipedia. *k-d tree*.
            Available at: https://en.wikipedia.org/wiki/K-d_tree.
-    .. [2] Dell'Amico, M. *KD-Tree for nearest neighbor search in a K-dimensional space (Python recipe)*.
-           Available at: http://code.activestate.com/recipes/577497-kd-tree-for-nearest-neighbor-search-in-a-k-dimensional-space/.
+    .. [2] Maneewongvatana, S. and Mount, D. M. *Analysis of approximate nearest neighbor searching with clustered point sets*.
+           Available at: https://arxiv.org/abs/cs/9901013.
 
     Examples
     --------
-    >>>
+    >>> from compas.geometry import Pointcloud
+    >>> cloud = Pointcloud.from_bounds(10, 10, 10, 100)
+    >>> tree = KDTree(cloud)
+    >>> point, index, distance = tree.nearest_neighbor(cloud[0])
+    >>> index, distance
+    (0, 0.0)
+    >>> len(tree.nearest_neighbors(cloud[0], 5))
+    5
 
     """
 
-    def __init__(self, objects=None):
-        self.root = None
+    NUMPY_THRESHOLD = 10000
+
+    def __init__(self, objects=None, leafsize=8):
+        self.leafsize = max(1, leafsize)
+        self._clear()
         if objects:
-            self.root = self.build([(o, i) for i, o in enumerate(objects)])
+            self.build([(o, i) for i, o in enumerate(objects)])
+
+    def __len__(self):
+        return len(self._xyz)
+
+    def _clear(self):
+        # the objects, labels and coordinates, in tree order
+        self._objects = []
+        self._labels = []
+        self._xyz = []
+        # the nodes
+        self._start = []
+        self._stop = []
+        self._axis = []
+        self._split = []
+        self._left = []
+        self._right = []
+
+    def _add_node(self, start, stop):
+        self._start.append(start)
+        self._stop.append(stop)
+        self._axis.append(-1)
+        self._split.append(0.0)
+        self._left.append(-1)
+        self._right.append(-1)
+        return len(self._start) - 1
 
     def build(self, objects, axis=0):
         """Populate a kd-tree with given objects.
@@ -55,29 +101,148 @@ class KDTree(object):
         objects : sequence[tuple[[float, float, float] | :class:`compas.geometry.Point`, int or str]]
             The tree objects as a sequence of point-label tuples.
         axis : int, optional
-            The axis along which to build.
+            This parameter is ignored.
+            The axis of every split is the axis along which the points of the node have the largest spread.
 
         Returns
         -------
-        Node or None
-            The root node, or None if the sequence of objects is empty.
+        None
 
         """
+        self._clear()
+        objects = list(objects)
         if not objects:
             return
 
-        objects.sort(key=lambda o: o[0][axis])
-        median_idx = len(objects) // 2
-        median_point, median_label = objects[median_idx]
-        next_axis = (axis + 1) % 3
+        coords = ([], [], [])
+        for point, _ in objects:
+            coords[0].append(float(point[0]))
+            coords[1].append(float(point[1]))
+            coords[2].append(float(point[2]))
+
+        order = None
+        if len(objects) > self.NUMPY_THRESHOLD:
+            try:
+                order = self._build_numpy(coords)
+            except ImportError:
+                order = None
+        if order is None:
+            order = self._build(coords)
+
+        x, y, z = coords
+        self._objects = [objects[i][0] for i in order]
+        self._labels = [objects[i][1] for i in order]
+        self._xyz = [(x[i], y[i], z[i]) for i in order]
+
+    def _build(self, coords):
+        # the points of every node are kept sorted along each of the axes, in three lists of indices,
+        # such that the median and the spread of a node are known without sorting or selection.
+        # the points are sorted once, and the lists are partitioned stably at every split,
+        # which takes linear time per level of the tree.
+        n = len(coords[0])
+        ordered = [sorted(range(n), key=coords[axis].__getitem__) for axis in range(3)]
+        stack = [self._add_node(0, n)]
+        while stack:
+            node = stack.pop()
+            start = self._start[node]
+            stop = self._stop[node]
+            if stop - start <= self.leafsize:
+                continue
+            axis = 0
+            spread = -1.0
+            for a in range(3):
+                values = coords[a]
+                extent = values[ordered[a][stop - 1]] - values[ordered[a][start]]
+                if extent > spread:
+                    axis = a
+                    spread = extent
+            middle = (start + stop) // 2
+            left = set(ordered[axis][start:middle])
+            for a in range(3):
+                if a != axis:
+                    segment = ordered[a][start:stop]
+                    ordered[a][start:stop] = list(filter(left.__contains__, segment)) + list(filterfalse(left.__contains__, segment))
+            self._axis[node] = axis
+            self._split[node] = coords[axis][ordered[axis][middle]]
+            self._left[node] = self._add_node(start, middle)
+            self._right[node] = self._add_node(middle, stop)
+            stack.append(self._left[node])
+            stack.append(self._right[node])
+        return ordered[0]
+
+    def _build_numpy(self, coords):
+        from numpy import arange
+        from numpy import argpartition
+        from numpy import array
+
+        xyz = array(coords, dtype=float).T
+        order = arange(len(xyz))
+        stack = [self._add_node(0, len(order))]
+        while stack:
+            node = stack.pop()
+            start = self._start[node]
+            stop = self._stop[node]
+            if stop - start <= self.leafsize:
+                continue
+            segment = order[start:stop]
+            points = xyz[segment]
+            axis = int((points.max(axis=0) - points.min(axis=0)).argmax())
+            middle = (start + stop) // 2
+            partition = argpartition(points[:, axis], middle - start)
+            order[start:stop] = segment[partition]
+            self._axis[node] = axis
+            self._split[node] = float(points[partition[middle - start], axis])
+            self._left[node] = self._add_node(start, middle)
+            self._right[node] = self._add_node(middle, stop)
+            stack.append(self._left[node])
+            stack.append(self._right[node])
+        return order.tolist()
+
+    def _search(self, point, number, exclude=None):
+        # bounded max-heap of the squared distances of the nearest neighbors found so far
+        heap = []
+        if not self._xyz:
+            return heap
+        px, py, pz = point[0], point[1], point[2]
+        p = (px, py, pz)
+        xyz = self._xyz
+        labels = self._labels
+        start = self._start
+        stop = self._stop
+        axes = self._axis
+        splits = self._split
+        lefts = self._left
+        rights = self._right
+        stack = [(0, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if len(heap) == number and bound >= -heap[0][0]:
+                continue
+            axis = axes[node]
+            if axis < 0:
+                for i in range(start[node], stop[node]):
+                    x, y, z = xyz[i]
+                    d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if len(heap) < number:
+                        if exclude and labels[i] in exclude:
+                            continue
+                        heappush(heap, (-d2, i))
+                    elif d2 < -heap[0][0]:
+                        if exclude and labels[i] in exclude:
+                            continue
+                        heapreplace(heap, (-d2, i))
+                continue
+            d = p[axis] - splits[node]
+            if d < 0:
+                stack.append((rights[node], max(bound, d * d)))
+                stack.append((lefts[node], bound))
+            else:
+                stack.append((lefts[node], max(bound, d * d)))
+                stack.append((rights[node], bound))
+        return heap
 
-        return Node(
-            median_point,
-            axis,
-            median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1 :], next_axis),
-        )
+    def _result(self, heap):
+        return [[self._objects[i], self._labels[i], (-d2) ** 0.5] for d2, i in sorted(heap, reverse=True)]
 
     def nearest_neighbor(self, point, exclude=None):
         """Find the nearest neighbor to a given point,
@@ -98,31 +263,10 @@ class KDTree(object):
             Distance to the base point.
 
         """
-
-        def search(node):
-            if node is None:
-                return
-
-            d2 = distance_point_point_sqrd(point, node.point)
-            if d2 < best[2]:
-                if node.label not in exclude:
-                    best[:] = node.point, node.label, d2
-
-            d = point[node.axis] - node.point[node.axis]
-            if d <= 0:
-                close, far = node.left, node.right
-            else:
-                close, far = node.right, node.left
-
-            search(close)
-            if d**2 < best[2]:
-                search(far)
-
-        exclude = set(exclude or [])
-        best = [None, None, float("inf")]
-        search(self.root)
-        best[2] **= 0.5
-        return best
+        heap = self._search(point, 1, set(exclude) if exclude else None)
+        if not heap:
+            return [None, None, float("inf")]
+        return self._result(heap)[0]
 
     def nearest_neighbors(self, point, number, distance_sort=False):
         """Find the N nearest neighbors to a given point.
@@ -135,19 +279,107 @@ class KDTree(object):
             The number of nearest neighbors.
         distance_sort : bool, optional
             Sort the nearest neighbors by distance to the base point.
+            This parameter is ignored, because the neighbors are always sorted.
+
+        Returns
+        -------
+        list[[[float, float, float], int or str, float]]
+            A list of N nearest neighbors, sorted by distance to the base point.
+
+        """
+        return self._result(self._search(point, number))
+
+    def nearest_neighbors_batch(self, points, number):
+        """Find the N nearest neighbors to each point of a collection of points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            XYZ coordinates of the base points.
+        number : int
+            The number of nearest neighbors per base point.
+
+        Returns
+        -------
+        list[list[[[float, float, float], int or str, float]]]
+            For every base point, a list of N nearest neighbors, sorted by distance to the base point.
+
+        """
+        search = self._search
+        result = self._result
+        return [result(search(point, number)) for point in points]
+
+    def radius_neighbors(self, point, radius, distance_sort=False):
+        """Find all neighbors within a given distance from a point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
 
         Returns
         -------
         list[[[float, float, float], int or str, float]]
-            A list of N nearest neighbors.
+            The neighbors within the search radius.
 
         """
-        nnbrs = []
-        exclude = set()
-        for i in range(number):
-            nnbr = self.nearest_neighbor(point, exclude)
-            nnbrs.append(nnbr)
-            exclude.add(nnbr[1])
+        found = []
+        if not self._xyz:
+            return found
+        px, py, pz = point[0], point[1], point[2]
+        p = (px, py, pz)
+        r2 = radius * radius
+        xyz = self._xyz
+        start = self._start
+        stop = self._stop
+        axes = self._axis
+        splits = self._split
+        lefts = self._left
+        rights = self._right
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            axis = axes[node]
+            if axis < 0:
+                for i in range(start[node], stop[node]):
+                    x, y, z = xyz[i]
+                    d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if d2 <= r2:
+                        found.append((d2, i))
+                continue
+            d = p[axis] - splits[node]
+            if d < 0:
+                stack.append(lefts[node])
+                if d * d <= r2:
+                    stack.append(rights[node])
+            else:
+                stack.append(rights[node])
+                if d * d <= r2:
+                    stack.append(lefts[node])
         if distance_sort:
-            return sorted(nnbrs, key=lambda nnbr: nnbr[2])
-        return nnbrs
+            found.sort()
+        return [[self._objects[i], self._labels[i], d2**0.5] for d2, i in found]
+
+    def radius_neighbors_batch(self, points, radius, distance_sort=False):
+        """Find all neighbors within a given distance from each point of a collection of points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            XYZ coordinates of the base points.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
+
+        Returns
+        -------
+        list[list[[[float, float, float], int or str, float]]]
+            For every base point, the neighbors within the search radius.
+
+        """
+        return [self.radius_neighbors(point, radius, distance_sort=distance_sort) for point in points]
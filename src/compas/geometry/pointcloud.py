@@ -9,7 +9,6 @@ from compas.geometry import KDTree
 from compas.geometry import Point
 from compas.geometry import bounding_box
 from compas.geometry import centroid_points
-from compas.geometry import closest_point_in_cloud
 from compas.geometry import transform_points
 from compas.tolerance import TOL
 
@@ -68,6 +67,7 @@ class Pointcloud(Geometry):
         if key > len(self) - 1:
             raise KeyError
         self.points[key] = value
+        self._tree = None
 
     def __iter__(self):
         return iter(self.points)
@@ -275,11 +275,35 @@ class Pointcloud(Geometry):
             self.points[index].x = point[0]
             self.points[index].y = point[1]
             self.points[index].z = point[2]
+        self._tree = None
 
     # ==========================================================================
     # Methods
     # ==========================================================================
 
+    def copy(self, cls=None):
+        """Make an independent copy of the pointcloud.
+
+        Parameters
+        ----------
+        cls : Type[:class:`compas.geometry.Pointcloud`], optional
+            The type of pointcloud to return.
+            Defaults to the type of the current pointcloud.
+
+        Returns
+        -------
+        :class:`compas.geometry.Pointcloud`
+            An independent copy of this pointcloud.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not issubclass(cls, Pointcloud) or type(self).__data__ is not Pointcloud.__data__:
+            return super(Pointcloud, self).copy(cls=cls)
+        pointcloud = cls([[point.x, point.y, point.z] for point in self.points])
+        pointcloud.name = self.name
+        return pointcloud
+
     def closest_point(self, point):
         """Compute the closest point on the pointcloud to a given point.
 
@@ -293,8 +317,16 @@ class Pointcloud(Geometry):
         :class:`compas.geometry.Point`
             The closest point on the pointcloud.
 
+        Notes
+        -----
+        The search uses the KD tree of the cloud, which is cached and rebuilt only
+        when the points are replaced through ``cloud.points = ...`` or ``cloud[i] = ...``, or when the cloud is transformed.
+        Changes made in place to the list returned by :attr:`points`, such as ``cloud.points[i] = point`` or ``cloud.points.append(point)``,
+        or to the coordinates of individual points, are not tracked and leave the tree stale.
+        In that case, reset the tree with ``cloud.points = cloud.points``.
+
         """
-        distance, point, index = closest_point_in_cloud(point, self.points)
+        point, index, distance = self.tree.nearest_neighbor(point)
         return point
 
     def closest_points(self, point, k=1):
@@ -312,9 +344,14 @@ class Pointcloud(Geometry):
         list of :class:`~compas.geometry.Point`
             The closest points on the pointcloud.
 
+        Notes
+        -----
+        The search uses the cached KD tree of the cloud.
+        See :meth:`closest_point` for the changes that leave the tree stale.
+
         """
         tree = self.tree
-        return [self.points[nbr[1]] for nbr in tree.nearest_neighbors(point, k, True)]
+        return [self.points[nbr[1]] for nbr in tree.nearest_neighbors(point, k)]
 
     def add(self, other, tol=None):
         """Add another pointcloud to this pointcloud.
@@ -0,0 +1,213 @@
+from numpy import absolute
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import delete
+from numpy import finfo
+from numpy import split
+from numpy import sqrt
+
+
+def quickhull_numpy(points):
+    """Construct the convex hull of a set of points with the Quickhull algorithm, using NumPy.
+
+    Parameters
+    ----------
+    points : array_like[point]
+        XYZ coordinates of the points.
+
+    Returns
+    -------
+    list[[int, int, int]]
+        The triangular faces of the convex hull as lists of vertex indices
+        referring to the original point coordinates.
+        The vertices of the faces are ordered counter-clockwise when seen from the outside of the hull.
+
+    Raises
+    ------
+    ValueError
+        If the input data is not 3D.
+        If there are less than four points, or if all points are coplanar.
+
+    See Also
+    --------
+    :func:`compas.geometry.convex_hull`, convex_hull_numpy
+
+    Notes
+    -----
+    This is the same algorithm as :func:`compas.geometry.convex_hull`,
+    but the distances of the points to the faces of the hull are computed in bulk,
+    for all points that have to be assigned to a set of new faces at once.
+    It does not depend on SciPy, and, unlike :func:`convex_hull_numpy`,
+    returns the faces in the same format and orientation as :func:`compas.geometry.convex_hull`.
+
+    The bulk computations pay off for large sets of points of which most are inside the hull.
+    If most of the points are on the hull, every expansion step only handles a few points,
+    and the pure Python implementation is faster.
+
+    Examples
+    --------
+    >>> points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.1, 0.1, 0.1]]
+    >>> faces = quickhull_numpy(points)
+    >>> len(faces)
+    4
+
+    """
+    points = asarray(points, dtype=float)
+    n, dim = points.shape
+
+    if dim < 3:
+        raise ValueError("The point coordinates should be at least 3D: %i" % dim)
+
+    points = points[:, :3]
+    a, b, c, d, tol = _quickhull_tetrahedron_numpy(points)
+
+    face_vertices = {}
+    face_plane = {}
+    face_outside = {}
+    face_distance = {}
+    edge_face = {}
+    count = [0]
+
+    def add_faces(triangles):
+        # add a set of faces, computing their planes in one go
+        vertices = array(triangles)
+        origins = points[vertices[:, 0]]
+        normals = cross(points[vertices[:, 1]] - origins, points[vertices[:, 2]] - origins)
+        lengths = sqrt((normals**2).sum(axis=1))
+        lengths[lengths == 0] = 1.0
+        normals /= lengths[:, None]
+        offsets = (normals * origins).sum(axis=1)
+        keys = []
+        for (u, v, w), plane in zip(triangles, concatenate([normals, offsets[:, None]], axis=1).tolist()):
+            key = count[0]
+            count[0] += 1
+            face_vertices[key] = (u, v, w)
+            face_plane[key] = plane
+            face_outside[key] = None
+            edge_face[u, v] = key
+            edge_face[v, w] = key
+            edge_face[w, u] = key
+            keys.append(key)
+        return keys, normals, offsets
+
+    def assign(indices, faces, normals, offsets):
+        # add the points to the outside set of the first face that can see them
+        # and discard the points that are inside all faces
+        if not len(indices):
+            return
+        distances = points[indices].dot(normals.T) - offsets
+        outside = distances > tol
+        first = outside.argmax(axis=1)
+        rows = arange(len(indices))
+        keep = outside[rows, first]
+        indices = indices[keep]
+        distances = distances[rows[keep], first[keep]]
+        first = first[keep]
+        order = argsort(first, kind="stable")
+        bounds = cumsum(bincount(first, minlength=len(faces)))[:-1]
+        for key, group, distance in zip(faces, split(indices[order], bounds), split(distances[order], bounds)):
+            if len(group):
+                face_outside[key] = group
+                face_distance[key] = distance
+
+    if _signed_volume_numpy(points, a, b, c, d) > 0:
+        b, c = c, b
+    faces, normals, offsets = add_faces([(a, b, c), (a, d, b), (b, d, c), (c, d, a)])
+    assign(delete(arange(n), [a, b, c, d]), faces, normals, offsets)
+
+    stack = [key for key in faces if face_outside[key] is not None]
+
+    while stack:
+        key = stack.pop()
+        if key not in face_vertices or face_outside[key] is None:
+            continue
+
+        # the furthest point outside the face
+        eye = int(face_outside[key][face_distance[key].argmax()])
+        x, y, z = points[eye].tolist()
+
+        # the faces visible from the point, and the horizon edges around them
+        visible = set([key])
+        horizon = []
+        todo = [key]
+        while todo:
+            current = todo.pop()
+            u, v, w = face_vertices[current]
+            for edge in ((u, v), (v, w), (w, u)):
+                other = edge_face[edge[1], edge[0]]
+                if other in visible:
+                    continue
+                nx, ny, nz, offset = face_plane[other]
+                if nx * x + ny * y + nz * z - offset > tol:
+                    visible.add(other)
+                    todo.append(other)
+                else:
+                    horizon.append(edge)
+
+        # remove the visible faces and collect their outside points
+        orphans = []
+        for current in visible:
+            u, v, w = face_vertices.pop(current)
+            del face_plane[current]
+            outside = face_outside.pop(current)
+            face_distance.pop(current, None)
+            if outside is not None:
+                orphans.append(outside)
+            for edge in ((u, v), (v, w), (w, u)):
+                if edge_face.get(edge) == current:
+                    del edge_face[edge]
+
+        # connect the point to the horizon
+        faces, normals, offsets = add_faces([(u, v, eye) for u, v in horizon])
+        if orphans:
+            orphans = concatenate(orphans)
+            assign(orphans[orphans != eye], faces, normals, offsets)
+        stack += [key for key in faces if face_outside[key] is not None]
+
+    return [[int(u), int(v), int(w)] for u, v, w in face_vertices.values()]
+
+
+def _signed_volume_numpy(points, a, b, c, d):
+    return cross(points[b] - points[a], points[c] - points[a]).dot(points[d] - points[a])
+
+
+def _quickhull_tetrahedron_numpy(points):
+    # find four points that span a tetrahedron of maximal size, starting from the extreme points along the axes
+    # and compute the tolerance for points to be considered outside of the faces of the hull
+    n = len(points)
+    if n < 4:
+        raise ValueError("At least four points are needed to compute a convex hull.")
+
+    extremes = concatenate([points.argmin(axis=0), points.argmax(axis=0)])
+    tol = 3 * finfo(float).eps * absolute(points[extremes]).max(axis=0).sum()
+
+    vectors = points[extremes][:, None, :] - points[extremes][None, :, :]
+    distances = (vectors**2).sum(axis=2)
+    i, j = divmod(int(distances.argmax()), len(extremes))
+    a = int(extremes[i])
+    b = int(extremes[j])
+    distance = distances[i, j]
+    if distance <= tol * tol:
+        raise ValueError("The points are coincident.")
+
+    # the point furthest from the line ab
+    distances = (cross(points[b] - points[a], points - points[a]) ** 2).sum(axis=1)
+    c = int(distances.argmax())
+    if distances[c] <= (tol * tol) * distance:
+        raise ValueError("The points are collinear.")
+
+    # the point furthest from the plane abc
+    normal = cross(points[b] - points[a], points[c] - points[a])
+    normal /= sqrt(normal.dot(normal))
+    distances = absolute((points - points[a]).dot(normal))
+    d = int(distances.argmax())
+    if distances[d] <= tol:
+        raise ValueError("The points are coplanar.")
+
+    return a, b, c, d, tol
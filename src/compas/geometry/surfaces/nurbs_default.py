@@ -0,0 +1,437 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import compute_basisfuncs
+from compas.geometry import compute_basisfuncs_table
+from compas.geometry import compute_basisfuncsderivs
+from compas.geometry import construct_knotvector
+from compas.geometry import find_span
+from compas.geometry import knots_and_mults_to_knotvector
+from compas.geometry import knotvector_to_knots_and_mults
+from compas.geometry import transform_points
+from compas.itertools import linspace
+from compas.plugins import plugin
+
+from .nurbs import NurbsSurface
+
+
+class DefaultNurbsSurface(NurbsSurface):
+    """NURBS surface that is evaluated in pure Python, without a CAD backend.
+
+    Instances of this class are created by the constructors of :class:`compas.geometry.NurbsSurface`,
+    if no other backend provides an implementation, for example through ``compas_occ`` or Rhino.
+
+    Parameters
+    ----------
+    points : list[list[[float, float, float] | :class:`compas.geometry.Point`]]
+        The control points, with one row per control point in the U direction.
+    weights : list[list[float]]
+        The weights of the control points.
+    knots_u : list[float]
+        The knots in the U direction, without multiplicity.
+    knots_v : list[float]
+        The knots in the V direction, without multiplicity.
+    mults_u : list[int]
+        Multiplicity of the knots in the U direction.
+    mults_v : list[int]
+        Multiplicity of the knots in the V direction.
+    degree_u : int
+        Degree in the U direction.
+    degree_v : int
+        Degree in the V direction.
+    name : str, optional
+        The name of the surface.
+
+    Notes
+    -----
+    Periodic surfaces are not supported.
+
+    The points of a grid of parameters, as computed by :meth:`pointgrid` and :meth:`to_vertices_and_faces`,
+    are computed from one table of basis functions per direction.
+    Per parameter in the U direction, the rows of control points are first combined into one row of intermediate points,
+    from which the points for all parameters in the V direction are computed.
+    This is considerably faster than evaluating the points one by one.
+
+    """
+
+    def __init__(self, points, weights, knots_u, knots_v, mults_u, mults_v, degree_u, degree_v, name=None):
+        super(DefaultNurbsSurface, self).__init__(name=name)
+        knotvector_u = knots_and_mults_to_knotvector(knots_u, mults_u)
+        knotvector_v = knots_and_mults_to_knotvector(knots_v, mults_v)
+        if len(weights) != len(points) or any(len(w) != len(row) for w, row in zip(weights, points)):
+            raise ValueError("The number of weights should be equal to the number of control points.")
+        if len(knotvector_u) != len(points) + degree_u + 1:
+            raise ValueError("The length of the knot vector in the U direction should be equal to the number of control points in the U direction plus the order.")
+        if len(knotvector_v) != len(points[0]) + degree_v + 1:
+            raise ValueError("The length of the knot vector in the V direction should be equal to the number of control points in the V direction plus the order.")
+        self._points = [[Point(*point) for point in row] for row in points]
+        self._weights = [[float(weight) for weight in row] for row in weights]
+        self._knotvector_u = [float(knot) for knot in knotvector_u]
+        self._knotvector_v = [float(knot) for knot in knotvector_v]
+        self._degree_u = degree_u
+        self._degree_v = degree_v
+        self._homogeneous = None
+
+    # ==============================================================================
+    # Properties
+    # ==============================================================================
+
+    @property
+    def points(self):
+        return self._points
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @property
+    def knots_u(self):
+        return knotvector_to_knots_and_mults(self._knotvector_u)[0]
+
+    @property
+    def mults_u(self):
+        return knotvector_to_knots_and_mults(self._knotvector_u)[1]
+
+    @property
+    def knotvector_u(self):
+        return self._knotvector_u
+
+    @property
+    def knots_v(self):
+        return knotvector_to_knots_and_mults(self._knotvector_v)[0]
+
+    @property
+    def mults_v(self):
+        return knotvector_to_knots_and_mults(self._knotvector_v)[1]
+
+    @property
+    def knotvector_v(self):
+        return self._knotvector_v
+
+    @property
+    def degree_u(self):
+        return self._degree_u
+
+    @property
+    def degree_v(self):
+        return self._degree_v
+
+    @property
+    def domain_u(self):
+        return self._knotvector_u[self._degree_u], self._knotvector_u[-self._degree_u - 1]
+
+    @property
+    def domain_v(self):
+        return self._knotvector_v[self._degree_v], self._knotvector_v[-self._degree_v - 1]
+
+    @property
+    def is_periodic_u(self):
+        return False
+
+    @property
+    def is_periodic_v(self):
+        return False
+
+    @property
+    def _weighted_points(self):
+        # the weighted control points are cached
+        # and reset when the surface is transformed
+        if self._homogeneous is None:
+            self._homogeneous = [[[x * w, y * w, z * w, w] for (x, y, z), w in zip(row, weights)] for row, weights in zip(self._points, self._weights)]
+        return self._homogeneous
+
+    # ==============================================================================
+    # Conversions
+    # ==============================================================================
+
+    def to_vertices_and_faces(self, nu=16, nv=16, du=None, dv=None):
+        """Convert the surface to a list of vertices and faces.
+
+        Parameters
+        ----------
+        nu : int, optional
+            The number of faces in the u direction.
+            Default is ``16``.
+        nv : int, optional
+            The number of faces in the v direction.
+            Default is ``16``.
+        du : tuple, optional
+            The subset of the domain in the u direction.
+            Default is ``None``, in which case the entire domain is used.
+        dv : tuple, optional
+            The subset of the domain in the v direction.
+            Default is ``None``, in which case the entire domain is used.
+
+        Returns
+        -------
+        vertices : list of :class:`compas.geometry.Point`
+            The vertices of the surface discretisation.
+        faces : list of list of int
+            The faces of the surface discretisation as lists of vertex indices.
+
+        """
+        umin, umax = du or self.domain_u
+        vmin, vmax = dv or self.domain_v
+        grid = self.points_at_grid(list(linspace(umin, umax, nu + 1)), list(linspace(vmin, vmax, nv + 1)))
+        vertices = [point for row in grid for point in row]
+        faces = []
+        for i in range(nu):
+            for j in range(nv):
+                a = i * (nv + 1) + j
+                faces.append([a, a + nv + 1, a + nv + 2, a + 1])
+        return vertices, faces
+
+    # ==============================================================================
+    # Transformations
+    # ==============================================================================
+
+    def transform(self, T):
+        """Transform the control points of the surface.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+            The surface is modified in-place.
+
+        """
+        self._points = [[Point(*point) for point in transform_points(row, T)] for row in self._points]
+        self._homogeneous = None
+
+    # ==============================================================================
+    # Methods
+    # ==============================================================================
+
+    def pointgrid(self, nu=10, nv=10):
+        """Compute point locations corresponding to evenly spaced parameters over the surface domain.
+
+        Parameters
+        ----------
+        nu : int, optional
+            The size of the grid in the U direction.
+        nv : int, optional
+            The size of the grid in the V direction.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Point`]
+            The points, ordered per parameter in the U direction.
+
+        """
+        grid = self.points_at_grid(list(self.space_u(nu)), list(self.space_v(nv)))
+        return [point for row in grid for point in row]
+
+    def points_at_grid(self, us, vs):
+        """Compute the points of the surface at a grid of parameters.
+
+        Parameters
+        ----------
+        us : list[float]
+            The parameters in the U direction.
+        vs : list[float]
+            The parameters in the V direction.
+
+        Returns
+        -------
+        list[list[:class:`compas.geometry.Point`]]
+            One row of points per parameter in the U direction,
+            with one point per parameter in the V direction.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is not in the surface domain.
+
+        """
+        p = self._degree_u
+        q = self._degree_v
+        cpts = self._weighted_points
+        spans_u, table_u = compute_basisfuncs_table(len(cpts) - 1, p, self._knotvector_u, us)
+        spans_v, table_v = compute_basisfuncs_table(len(cpts[0]) - 1, q, self._knotvector_v, vs)
+        columns = range(len(cpts[0]))
+
+        grid = []
+        for span_u, (basis_u,) in zip(spans_u, table_u):
+            rows = cpts[span_u - p : span_u + 1]
+            # combine the rows of control points into one row of intermediate points
+            temp = []
+            for j in columns:
+                x = y = z = w = 0.0
+                for b, row in zip(basis_u, rows):
+                    cx, cy, cz, cw = row[j]
+                    x += b * cx
+                    y += b * cy
+                    z += b * cz
+                    w += b * cw
+                temp.append((x, y, z, w))
+
+            points = []
+            for span_v, (basis_v,) in zip(spans_v, table_v):
+                x = y = z = w = 0.0
+                for b, (cx, cy, cz, cw) in zip(basis_v, temp[span_v - q : span_v + 1]):
+                    x += b * cx
+                    y += b * cy
+                    z += b * cz
+                    w += b * cw
+                points.append(Point(x / w, y / w, z / w))
+            grid.append(points)
+        return grid
+
+    def point_at(self, u, v):
+        """Compute a point on the surface.
+
+        Parameters
+        ----------
+        u : float
+        v : float
+
+        Returns
+        -------
+        :class:`compas.geometry.Point`
+
+        Raises
+        ------
+        ValueError
+            If the parameters are not in the surface domain.
+
+        """
+        p = self._degree_u
+        q = self._degree_v
+        cpts = self._weighted_points
+        span_u = find_span(len(cpts) - 1, p, self._knotvector_u, u)
+        span_v = find_span(len(cpts[0]) - 1, q, self._knotvector_v, v)
+        basis_u = compute_basisfuncs(p, self._knotvector_u, span_u, u)
+        basis_v = compute_basisfuncs(q, self._knotvector_v, span_v, v)
+        x = y = z = w = 0.0
+        for bu, row in zip(basis_u, cpts[span_u - p : span_u + 1]):
+            for bv, (cx, cy, cz, cw) in zip(basis_v, row[span_v - q : span_v + 1]):
+                b = bu * bv
+                x += b * cx
+                y += b * cy
+                z += b * cz
+                w += b * cw
+        return Point(x / w, y / w, z / w)
+
+    def derivatives_at(self, u, v):
+        """Compute the point and the first partial derivatives of the surface at a pair of parameters.
+
+        Parameters
+        ----------
+        u : float
+        v : float
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Vector`]
+            The position vector of the point of the surface,
+            the derivative with respect to u, and the derivative with respect to v.
+
+        Raises
+        ------
+        ValueError
+            If the parameters are not in the surface domain.
+
+        References
+        ----------
+        The NURBS Book. Chapter 4. Page 137. Algorithm A4.4.
+
+        """
+        p = self._degree_u
+        q = self._degree_v
+        cpts = self._weighted_points
+        span_u = find_span(len(cpts) - 1, p, self._knotvector_u, u)
+        span_v = find_span(len(cpts[0]) - 1, q, self._knotvector_v, v)
+        basis_u = compute_basisfuncsderivs(p, self._knotvector_u, span_u, u, 1)
+        basis_v = compute_basisfuncsderivs(q, self._knotvector_v, span_v, v, 1)
+
+        # derivatives of the homogeneous surface: S, dS/du, dS/dv
+        ders = [[0.0, 0.0, 0.0, 0.0] for _ in range(3)]
+        for a, row in enumerate(cpts[span_u - p : span_u + 1]):
+            for b, cpt in enumerate(row[span_v - q : span_v + 1]):
+                for d, (i, j) in zip(ders, ((0, 0), (1, 0), (0, 1))):
+                    c = basis_u[i][a] * basis_v[j][b]
+                    d[0] += c * cpt[0]
+                    d[1] += c * cpt[1]
+                    d[2] += c * cpt[2]
+                    d[3] += c * cpt[3]
+
+        (ax, ay, az, w), du, dv = ders
+        point = Vector(ax / w, ay / w, az / w)
+        return [
+            point,
+            (Vector(du[0], du[1], du[2]) - point * du[3]) * (1.0 / w),
+            (Vector(dv[0], dv[1], dv[2]) - point * dv[3]) * (1.0 / w),
+        ]
+
+    def normal_at(self, u, v):
+        """Compute the unit normal of the surface at a pair of parameters.
+
+        Parameters
+        ----------
+        u : float
+        v : float
+
+        Returns
+        -------
+        :class:`compas.geometry.Vector`
+
+        Raises
+        ------
+        ValueError
+            If the parameters are not in the surface domain.
+
+        """
+        _, du, dv = self.derivatives_at(u, v)
+        return du.cross(dv).unitized()
+
+    def frame_at(self, u, v):
+        """Compute the local frame of the surface at a pair of parameters.
+
+        The X axis of the frame is aligned with the derivative with respect to u,
+        and the Z axis with the normal of the surface.
+
+        Parameters
+        ----------
+        u : float
+        v : float
+
+        Returns
+        -------
+        :class:`compas.geometry.Frame`
+
+        Raises
+        ------
+        ValueError
+            If the parameters are not in the surface domain.
+
+        """
+        point, du, dv = self.derivatives_at(u, v)
+        return Frame(Point(*point), du, dv)
+
+
+# ==============================================================================
+# Plugins
+# ==============================================================================
+
+
+@plugin(category="factories", trylast=True)
+def nurbssurface_from_parameters(cls, points, weights, knots_u, knots_v, mults_u, mults_v, degree_u, degree_v, is_periodic_u=False, is_periodic_v=False):
+    if is_periodic_u or is_periodic_v:
+        raise NotImplementedError("Periodic NURBS surfaces are not supported without a CAD backend.")
+    return DefaultNurbsSurface(points, weights, knots_u, knots_v, mults_u, mults_v, degree_u, degree_v)
+
+
+@plugin(category="factories", trylast=True)
+def nurbssurface_from_points(cls, points, degree_u=3, degree_v=3):
+    knots_u, mults_u = knotvector_to_knots_and_mults(construct_knotvector(degree_u, len(points)))
+    knots_v, mults_v = knotvector_to_knots_and_mults(construct_knotvector(degree_v, len(points[0])))
+    weights = [[1.0] * len(row) for row in points]
+    return DefaultNurbsSurface(points, weights, knots_u, knots_v, mults_u, mults_v, degree_u, degree_v)
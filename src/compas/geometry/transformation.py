@@ -12,6 +12,7 @@ Ippoliti for providing code and documentation.
 """
 
 from compas.data import Data
+from compas.geometry import affine_from_matrix
 from compas.geometry import basis_vectors_from_matrix
 from compas.geometry import decompose_matrix
 from compas.geometry import identity_matrix
@@ -21,6 +22,8 @@ from compas.geometry import matrix_from_frame
 from compas.geometry import matrix_from_translation
 from compas.geometry import matrix_inverse
 from compas.geometry import multiply_matrices
+from compas.geometry import transform_points
+from compas.geometry import transform_vectors
 from compas.geometry import translation_from_matrix
 from compas.geometry import transpose_matrix
 from compas.tolerance import TOL
@@ -67,6 +70,17 @@ class Transformation(Data):
         Flattens the 4x4 transformation matrix into a list of 16 numbers.
     determinant : float, read-only
         The determinant of the matrix of the transformation.
+    affine : tuple[float, ...] | None, read-only
+        The 12 coefficients of the affine part of the transformation matrix,
+        or None if the transformation is projective.
+        The coefficients are cached until the matrix is changed.
+
+    Notes
+    -----
+    Values that are derived from the matrix, such as the affine coefficients, are cached
+    for repeated application of the same transformation.
+    The cache is cleared when the matrix is replaced, or when an entry is changed with ``T[i, j] = value``.
+    Changing the rows of the matrix directly does not clear the cache.
 
     Examples
     --------
@@ -104,6 +118,8 @@ class Transformation(Data):
         super(Transformation, self).__init__(name=name)
         if not matrix:
             matrix = identity_matrix(4)
+        self._matrix = None
+        self._cache = {}
         self.matrix = matrix
 
     def __mul__(self, other):
@@ -119,6 +135,7 @@ class Transformation(Data):
     def __setitem__(self, key, value):
         i, j = key
         self.matrix[i][j] = value
+        self._cache = {}
 
     def __iter__(self):
         return iter(self.matrix)
@@ -152,6 +169,15 @@ class Transformation(Data):
     # Properties
     # ==========================================================================
 
+    @property
+    def matrix(self):
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix):
+        self._matrix = matrix
+        self._cache = {}
+
     @property
     def scale(self):
         S, H, R, T, P = self.decomposed()
@@ -199,6 +225,12 @@ class Transformation(Data):
     def determinant(self):
         return matrix_determinant(self.matrix)
 
+    @property
+    def affine(self):
+        if "affine" not in self._cache:
+            self._cache["affine"] = affine_from_matrix(self.matrix)
+        return self._cache["affine"]
+
     # ==========================================================================
     # Constructors
     # ==========================================================================
@@ -460,6 +492,35 @@ class Transformation(Data):
 
     inverted = inverse
 
+    def apply_to(self, objects):
+        """Apply this transformation to a collection of geometric objects.
+
+        Parameters
+        ----------
+        objects : list[:class:`compas.geometry.Geometry`]
+            The objects to transform.
+
+        Returns
+        -------
+        None
+            The objects are transformed in-place.
+
+        See Also
+        --------
+        :func:`compas.geometry.transform_many`
+
+        Examples
+        --------
+        >>> from compas.geometry import Point, Translation
+        >>> points = [Point(0, 0, 0), Point(1, 0, 0)]
+        >>> T = Translation.from_vector([0, 0, 1])
+        >>> T.apply_to(points)
+        >>> points[1]
+        Point(x=1.0, y=0.0, z=1.0)
+
+        """
+        transform_many(objects, self)
+
     def decomposed(self):
         """Decompose the `Transformation` into its components.
 
@@ -551,3 +612,167 @@ class Transformation(Data):
         if isinstance(other, cls):
             return cls(multiply_matrices(self.matrix, other.matrix))
         return Transformation(multiply_matrices(self.matrix, other.matrix))
+
+
+# ==============================================================================
+# Batch transformation
+# ==============================================================================
+
+
+def _is_similarity(affine, tol=1e-9):
+    # check that the linear part is a rotation combined with a uniform scale
+    a, b, c, _, e, f, g, _, i, j, k, _ = affine
+    x = (a, e, i)
+    y = (b, f, j)
+    z = (c, g, k)
+    xx = x[0] ** 2 + x[1] ** 2 + x[2] ** 2
+    yy = y[0] ** 2 + y[1] ** 2 + y[2] ** 2
+    zz = z[0] ** 2 + z[1] ** 2 + z[2] ** 2
+    xy = x[0] * y[0] + x[1] * y[1] + x[2] * y[2]
+    yz = y[0] * z[0] + y[1] * z[1] + y[2] * z[2]
+    zx = z[0] * x[0] + z[1] * x[1] + z[2] * x[2]
+    scale = max(xx, yy, zz)
+    if scale < tol:
+        return False
+    if abs(xx - yy) > tol * scale or abs(yy - zz) > tol * scale:
+        return False
+    if abs(xy) > tol * scale or abs(yz) > tol * scale or abs(zx) > tol * scale:
+        return False
+    det = a * (f * k - g * j) - b * (e * k - g * i) + c * (e * j - f * i)
+    return det > 0
+
+
+def _transform_affine(items, affine, w):
+    # transform the items in place with the affine coefficients
+    # w is 1.0 for points and 0.0 for vectors
+    if not items:
+        return
+    a, b, c, d, e, f, g, h, i, j, k, m = affine
+    if not w:
+        d = h = m = 0.0
+    for item in items:
+        x = item.x
+        y = item.y
+        z = item.z
+        item.x = a * x + b * y + c * z + d
+        item.y = e * x + f * y + g * z + h
+        item.z = i * x + j * y + k * z + m
+
+
+def _transform_projective(items, T, w):
+    # transform the items in place with the full matrix
+    if not items:
+        return
+    if w:
+        result = transform_points(items, T)
+    else:
+        result = transform_vectors(items, T)
+    for item, (x, y, z) in zip(items, result):
+        item.x = x
+        item.y = y
+        item.z = z
+
+
+def transform_many(objects, T):
+    """Transform a collection of geometric objects with one transformation.
+
+    Parameters
+    ----------
+    objects : list[:class:`compas.geometry.Geometry`]
+        The objects to transform.
+    T : :class:`compas.geometry.Transformation` | list[list[float]]
+        The transformation.
+
+    Returns
+    -------
+    None
+        The objects are transformed in-place.
+
+    Notes
+    -----
+    The objects are grouped by type, and the coordinates of all points and vectors of the groups
+    are transformed together, instead of object per object.
+    Points, vectors, planes, frames, point clouds, polylines and polygons are transformed in batch.
+    Frames are transformed in batch only if the transformation preserves angles and orientation,
+    i.e. if it is a combination of rotation, uniform scale and translation.
+    All other objects are transformed with their own ``transform`` method.
+
+    The result is the same as transforming every object separately.
+
+    Examples
+    --------
+    >>> from compas.geometry import Point, Vector, Frame, Translation
+    >>> objects = [Point(0, 0, 0), Vector(1, 0, 0), Frame.worldXY()]
+    >>> T = Translation.from_vector([1, 2, 3])
+    >>> transform_many(objects, T)
+    >>> objects[0]
+    Point(x=1.0, y=2.0, z=3.0)
+    >>> objects[1]
+    Vector(x=1.0, y=0.0, z=0.0)
+    >>> objects[2].point
+    Point(x=1.0, y=2.0, z=3.0)
+
+    """
+    from compas.geometry import Frame
+    from compas.geometry import Plane
+    from compas.geometry import Point
+    from compas.geometry import Pointcloud
+    from compas.geometry import Polygon
+    from compas.geometry import Polyline
+    from compas.geometry import Vector
+
+    if isinstance(T, Transformation):
+        affine = T.affine
+    else:
+        affine = affine_from_matrix(T)
+
+    points = []
+    vectors = []
+    frames = []
+    clouds = []
+    others = []
+    similarity = None
+
+    for obj in objects:
+        cls = type(obj)
+        if cls is Point:
+            points.append(obj)
+        elif cls is Vector:
+            vectors.append(obj)
+        elif cls is Plane:
+            points.append(obj.point)
+            vectors.append(obj.normal)
+        elif cls is Pointcloud:
+            clouds.append(obj)
+            points.extend(obj.points)
+        elif cls is Polyline or cls is Polygon:
+            points.extend(obj.points)
+        elif cls is Frame:
+            if similarity is None:
+                similarity = affine is not None and _is_similarity(affine)
+            if similarity:
+                frames.append(obj)
+                points.append(obj.point)
+                vectors.append(obj.xaxis)
+                vectors.append(obj.yaxis)
+            else:
+                others.append(obj)
+        else:
+            others.append(obj)
+
+    if affine is None:
+        _transform_projective(points, T, 1.0)
+        _transform_projective(vectors, T, 0.0)
+    else:
+        _transform_affine(points, affine, 1.0)
+        _transform_affine(vectors, affine, 0.0)
+
+    for frame in frames:
+        frame.xaxis = frame.xaxis
+        frame.yaxis = frame.yaxis
+
+    for cloud in clouds:
+        cloud._tree = None
+
+    for obj in others:
+        obj.transform(T)
@@ -18,8 +18,12 @@ from __future__ import division
 from __future__ import print_function
 
 import functools
+import hashlib
 import inspect
+import json
+import os
 import pkgutil
+import sys
 import threading
 
 __all__ = [
@@ -103,20 +107,114 @@ class PluginImpl(object):
         return "<PluginImpl id={}, plugin_module={}>".format(self.id, self.plugin)
 
 
+class LazyPluginImpl(PluginImpl):
+    """Internal data class to keep track of a plugin implementation restored from the plugin manifest.
+
+    The module containing the implementation is only imported when the plugin is selected.
+
+    Parameters
+    ----------
+    manager : :class:`PluginManager`
+        The plugin manager owning the plugin.
+    module_name : str
+        Name of the module containing the plugin implementation.
+    method_name : str
+        Name of the attribute of the module holding the implementation.
+    plugin_opts : dict
+        Dictionary containing plugin options.
+        If the requirements of the plugin could not be stored in the manifest,
+        ``"requires"`` is ``None`` and the options are read from the implementation once it is loaded.
+
+    """
+
+    def __init__(self, manager, module_name, method_name, plugin_opts):
+        super(LazyPluginImpl, self).__init__(None, None, plugin_opts)
+        self.manager = manager
+        self.module_name = module_name
+        self.method_name = method_name
+        self._loaded = False
+
+    def load(self):
+        """Import the module of the plugin and retrieve the implementation.
+
+        Returns
+        -------
+        bool
+            True if the implementation is available, otherwise False.
+
+        """
+        if not self._loaded:
+            module = self.manager.importer.try_import(self.module_name)
+            method = getattr(module, self.method_name, None) if module else None
+            opts = self.manager._parse_plugin_opts(method) if method is not None else None
+            if opts is not None:
+                self.plugin = module
+                self.method = method
+                if self.opts.get("requires") is None:
+                    self.opts = opts
+            elif self.manager.DEBUG:
+                print("Error loading plugin {}.{} from the plugin manifest, skipping.".format(self.module_name, self.method_name))
+            self._loaded = True
+        return self.method is not None
+
+    @property
+    def id(self):
+        """Identifier of the plugin implementation."""
+        return "{}.{}".format(self.module_name, self.method_name)
+
+    def __repr__(self):
+        return "<LazyPluginImpl id={}, loaded={}>".format(self.id, self._loaded)
+
+
 class PluginManager(object):
     """Plugin Manager handles discovery and registry of plugins.
 
     Usually there is only one instance of a plugin manager per host.
 
+    The result of the discovery of plugins is stored in a manifest on disk.
+    As long as the manifest is valid, the plugins are registered from the manifest
+    without importing any of the installed packages,
+    and the module of a plugin is only imported when the plugin is selected.
+
+    The manifest is considered valid as long as the installed ``compas*`` packages and distributions
+    and the modules containing plugins are unchanged, i.e. have the same modification times.
+    Use :meth:`invalidate_cache` to force a new discovery of the plugins,
+    for example after adding plugins to an editable install.
+
+    Attributes
+    ----------
+    cache_path : str
+        Location of the plugin manifest.
+        By default, the manifest is stored in the COMPAS directory in APPDATA,
+        in a file that is specific to the Python version, the platform and the environment (``sys.prefix``).
+
     """
 
     DEBUG = False
+    CACHE = True
+    MANIFEST_VERSION = 1
 
     def __init__(self):
         self.importer = Importer()
         self._registry = {}
         self._discovery_done = False
         self._discovery_lock = threading.Lock()
+        self._cache_path = None
+
+    @property
+    def cache_path(self):
+        if not self._cache_path:
+            from compas._os import user_data_dir
+
+            # every environment has its own manifest, since the installed packages differ between environments
+            environment = hashlib.sha1(sys.prefix.encode("utf-8")).hexdigest()[:12]
+            name = "manifest-{}{}-{}-{}.json".format(sys.version_info[0], sys.version_info[1], sys.platform, environment)
+            self._cache_path = os.path.join(user_data_dir("COMPAS", "compas-dev", roaming=True), "plugins", name)
+        return self._cache_path
+
+    @cache_path.setter
+    def cache_path(self, path):
+        self._cache_path = path
 
     @property
     def registry(self):
@@ -148,6 +246,12 @@ class PluginManager(object):
         # Since we modify global state,
         # let's lock around this.
         with self._discovery_lock:
+            if self.CACHE:
+                count = self._load_manifest()
+                if count is not None:
+                    self._discovery_done = True
+                    return count
+
             count = 0
 
             modules = [module_name for _importer, module_name, is_pkg in pkgutil.iter_modules() if is_pkg and module_name.startswith("compas")]
@@ -178,10 +282,145 @@ class PluginManager(object):
             for plugin_module in modules_to_inspect.values():
                 count += self.register_module(plugin_module)
 
+            if self.CACHE:
+                self._write_manifest(modules_to_inspect)
+
             self._discovery_done = True
 
         return count
 
+    def invalidate_cache(self):
+        """Remove the plugin manifest and reset the plugin registry.
+
+        The plugins are discovered again on the next use of the registry.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._discovery_lock:
+            if os.path.exists(self.cache_path):
+                try:
+                    os.remove(self.cache_path)
+                except OSError:
+                    if self.DEBUG:
+                        print("Error removing plugin manifest {}.".format(self.cache_path))
+            self._registry = {}
+            self._discovery_done = False
+
+    def _fingerprint(self):
+        # The installed compas packages and distributions with their modification times.
+        # Only the directory listings of the entries of the path are needed for this,
+        # no packages are imported.
+        entries = []
+        for path in sys.path:
+            path = path or os.getcwd()
+            try:
+                names = sorted(os.listdir(path))
+            except (OSError, TypeError):
+                continue
+            for name in names:
+                if name.lower().startswith("compas"):
+                    filepath = os.path.join(path, name)
+                    try:
+                        entries.append([filepath, os.path.getmtime(filepath)])
+                    except OSError:
+                        continue
+        return entries
+
+    def _load_manifest(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if manifest.get("version") != self.MANIFEST_VERSION:
+            return None
+        if manifest.get("fingerprint") != self._fingerprint():
+            return None
+        for filepath, mtime in manifest.get("files", []):
+            try:
+                if os.path.getmtime(filepath) != mtime:
+                    return None
+            except OSError:
+                return None
+
+        count = 0
+        registry = {}
+        for extension_point_url, plugins in manifest["registry"].items():
+            plugins_list = registry.setdefault(extension_point_url, [])
+            for module_name, method_name, plugin_opts in plugins:
+                plugins_list.append(LazyPluginImpl(self, module_name, method_name, plugin_opts))
+                count += 1
+
+        for extension_point_url, plugins in self._registry.items():
+            registry.setdefault(extension_point_url, []).extend(plugins)
+            registry[extension_point_url].sort(key=lambda p: p.key)
+
+        self._registry = registry
+
+        if self.DEBUG:
+            print("Registered {} plugins from plugin manifest {}".format(count, self.cache_path))
+
+        return count
+
+    def _write_manifest(self, modules):
+        registry = {}
+        for extension_point_url, plugins in self._registry.items():
+            entries = registry.setdefault(extension_point_url, [])
+            for plugin in plugins:
+                module_name = getattr(plugin.plugin, "__name__", None)
+                if module_name not in modules:
+                    # plugins registered manually are not part of the manifest
+                    continue
+                method_name = None
+                for name in dir(plugin.plugin):
+                    if getattr(plugin.plugin, name) is plugin.method:
+                        method_name = name
+                        break
+                if method_name is None:
+                    return
+                opts = dict(plugin.opts)
+                requires = opts.get("requires")
+                if requires and not all(isinstance(requirement, str) for requirement in requires):
+                    # callable requirements are re-evaluated from the implementation
+                    opts["requires"] = None
+                elif requires is None:
+                    opts["requires"] = []
+                entries.append([module_name, method_name, opts])
+
+        files = []
+        for module in modules.values():
+            filepath = getattr(module, "__file__", None)
+            if filepath:
+                try:
+                    files.append([filepath, os.path.getmtime(filepath)])
+                except OSError:
+                    continue
+
+        manifest = {
+            "version": self.MANIFEST_VERSION,
+            "fingerprint": self._fingerprint(),
+            "files": files,
+            "registry": registry,
+        }
+
+        try:
+            folder = os.path.dirname(self.cache_path)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            temp = "{}.{}.tmp".format(self.cache_path, os.getpid())
+            with open(temp, "w") as f:
+                json.dump(manifest, f)
+            if os.path.exists(self.cache_path):
+                os.remove(self.cache_path)
+            os.rename(temp, self.cache_path)
+        except (IOError, OSError, TypeError, ValueError):
+            if self.DEBUG:
+                print("Error writing plugin manifest {}.".format(self.cache_path))
+
     def register_module(self, plugin_module):
         """Register a module that potentially contains plugin implementations.
 
@@ -446,6 +685,11 @@ class PluginValidator(object):
         return self.manager.importer.check_importable(requirement)
 
     def is_plugin_selectable(self, plugin):
+        if isinstance(plugin, LazyPluginImpl) and plugin.opts["requires"] is None:
+            # the requirements can only be evaluated on the implementation
+            if not plugin.load():
+                return False
+
         if plugin.opts["requires"]:
             importable_requirements = (self.verify_requirement(requirement) for requirement in plugin.opts["requires"])
 
@@ -463,6 +707,8 @@ class PluginValidator(object):
         plugins = self.manager.registry.get(extension_point_url) or []
         for plugin in plugins:
             if self.is_plugin_selectable(plugin):
+                if isinstance(plugin, LazyPluginImpl) and not plugin.load():
+                    continue
                 return plugin
 
         # Nothing found, raise
@@ -473,7 +719,8 @@ class PluginValidator(object):
             print("Extension Point URL {} invoked. Will select a matching plugin".format(extension_point_url))
 
         plugins = self.manager.registry.get(extension_point_url) or []
-        return [plugin for plugin in plugins if self.is_plugin_selectable(plugin)]
+        plugins = [plugin for plugin in plugins if self.is_plugin_selectable(plugin)]
+        return [plugin for plugin in plugins if not isinstance(plugin, LazyPluginImpl) or plugin.load()]
 
     @staticmethod
     def ensure_implementations(cls):
@@ -12,9 +12,14 @@ when working in Rhino. Or to use COMPAS in a browser application.
 from __future__ import absolute_import
 
 from .errors import RPCClientError, RPCServerError
+from .futures import RPCFuture
+from .handles import RPCHandle
+from .batch import RPCBatch
+from .binary import BinaryServer, BinaryServerProxy
 from .proxy import Proxy
 from .server import Server
+from .server import ThreadedServer
 from .dispatcher import Dispatcher
 
 
-__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "Dispatcher"]
+__all__ = ["RPCClientError", "RPCServerError", "RPCFuture", "RPCHandle", "RPCBatch", "Proxy", "Server", "ThreadedServer", "BinaryServer", "BinaryServerProxy", "Dispatcher"]
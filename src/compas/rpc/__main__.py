@@ -1,5 +1,6 @@
 import time
 
+from compas.rpc import BinaryServerProxy
 from compas.rpc.services.default import start_service
 
 try:
@@ -8,13 +9,14 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, workers=None, executor="thread", transport="xmlrpc", **kwargs):
+    start_service(port, autoreload, workers=workers, executor=executor, transport=transport)
 
 
-def stop(port, **kwargs):
+def stop(port, transport="xmlrpc", **kwargs):
     print("Trying to stop remote RPC proxy...")
-    server = ServerProxy("http://127.0.0.1:{}".format(port))
+    address = "http://127.0.0.1:{}".format(port)
+    server = ServerProxy(address) if transport != "binary" else BinaryServerProxy(address)
 
     success = False
     count = 5
@@ -58,11 +60,15 @@ def main():
         action="store_false",
         help="Do not autoreload modules",
     )
+    start_command.add_argument("--workers", "-w", action="store", default=None, type=int, help="Number of workers for handling concurrent requests")
+    start_command.add_argument("--executor", action="store", default="thread", choices=["thread", "process"], help="Type of workers")
+    start_command.add_argument("--transport", action="store", default="xmlrpc", choices=["xmlrpc", "binary"], help="Wire protocol")
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
     stop_command = commands.add_parser("stop", help="Try to stop a remote RPC server")
     stop_command.add_argument("--port", "-p", action="store", default=1753, type=int, help="RPC port number")
+    stop_command.add_argument("--transport", action="store", default="xmlrpc", choices=["xmlrpc", "binary"], help="Wire protocol")
     stop_command.set_defaults(func=stop)
 
     # Invoke
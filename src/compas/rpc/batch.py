@@ -0,0 +1,126 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from functools import partial
+
+from compas.rpc.errors import RPCServerError
+from compas.rpc.futures import RPCFuture
+
+
+class RPCBatch(object):
+    """Batch of remote calls that are sent to the server in a single request.
+
+    Calls are added to the batch like regular calls on a proxy,
+    but instead of the result of the call, a future result is returned.
+    The calls are executed on the server when the batch is executed,
+    which happens automatically at the end of a ``with`` block.
+
+    Batches are created with :meth:`compas.rpc.Proxy.batch`.
+
+    Parameters
+    ----------
+    proxy : :class:`compas.rpc.Proxy`
+        The proxy of the server.
+    parallel : bool, optional
+        If True, the server executes the calls in parallel, if it has a pool of workers.
+        Otherwise, the calls are executed one after the other, in order.
+
+    Attributes
+    ----------
+    parallel : bool
+        If True, the server executes the calls in parallel, if it has a pool of workers.
+
+    Examples
+    --------
+    >>> from compas.rpc import Proxy  # doctest: +SKIP
+    >>> with Proxy("compas.geometry") as geometry:  # doctest: +SKIP
+    ...     with geometry.batch() as batch:  # doctest: +SKIP
+    ...         areas = [batch.area_polygon(polygon) for polygon in polygons]  # doctest: +SKIP
+    ...     areas = [area.result() for area in areas]  # doctest: +SKIP
+
+    """
+
+    def __init__(self, proxy, parallel=False):
+        self._proxy = proxy
+        self._calls = []
+        self._futures = []
+        self.parallel = parallel
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return partial(self.call, name)
+
+    def call(self, name, *args, **kwargs):
+        """Add a call to the batch.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to the package of the proxy.
+        *args : list
+            Positional arguments to be passed to the remote function.
+        **kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCFuture`
+            The future result of the call, which is available after the batch is executed.
+
+        """
+        if self._proxy.package:
+            name = "{}.{}".format(self._proxy.package, name)
+        future = RPCFuture()
+        self._calls.append({"name": name, "args": args, "kwargs": kwargs})
+        self._futures.append(future)
+        return future
+
+    def execute(self):
+        """Send the calls of the batch to the server, and wait for the results.
+
+        After execution, the batch is empty, and can be used for new calls.
+
+        Returns
+        -------
+        list[:class:`compas.rpc.RPCFuture`]
+            The future results of the calls, which are all completed.
+            The results of successful calls are available through :meth:`RPCFuture.result`.
+            The errors of failed calls are available through :meth:`RPCFuture.exception`.
+
+        Raises
+        ------
+        RPCServerError
+            If the batch could not be executed.
+            Errors of individual calls are not raised.
+
+        """
+        calls, futures = self._calls, self._futures
+        self._calls, self._futures = [], []
+        if not calls:
+            return futures
+
+        try:
+            results = self._proxy._call_batch(calls, parallel=self.parallel)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            raise
+
+        for future, result in zip(futures, results):
+            if result["error"]:
+                future.set_exception(RPCServerError(result["error"]))
+            else:
+                future.set_result(result["data"])
+        return futures
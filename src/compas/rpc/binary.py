@@ -0,0 +1,407 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import socket
+import struct
+import tempfile
+import threading
+import traceback
+
+from compas.data import binary_dumps
+from compas.data import binary_load
+from compas.data import binary_loads
+from compas.rpc.errors import RPCServerError
+
+try:
+    from SocketServer import BaseRequestHandler
+    from SocketServer import ThreadingTCPServer
+except ImportError:
+    from socketserver import BaseRequestHandler
+    from socketserver import ThreadingTCPServer
+
+# ==============================================================================
+# Wire protocol
+# ==============================================================================
+#
+# Requests and responses are sent as messages over a TCP connection.
+# Every message is a frame consisting of a one-byte kind, the size of the payload as 8-byte little-endian integer,
+# and the payload.
+#
+# The payload of an inline frame is the message encoded in the COMPAS binary format (see compas.data.binary_dumps),
+# in which numeric arrays, including NumPy arrays, are stored as raw little-endian buffers.
+# The payload of a shared frame is the path to a file in shared memory (or in the temp folder),
+# which contains the encoded message.
+# The receiver of a shared frame maps the file into memory, decodes the message and removes the file.
+# Only files in the shared memory folder with the name pattern of send_message are accepted.
+#
+# Requests have the following structure:
+# {"name": ..., "idict": {"args": ..., "kwargs": ...}, "path": ..., "shared": ...}
+# where "shared" is the minimum size of responses that should be sent through shared memory, if any.
+# Responses are output dicts with "data", "error" and "profile".
+
+FRAME = struct.Struct("<BQ")
+
+INLINE = 0
+SHARED = 1
+
+# messages smaller than this are always sent inline
+SHARED_MINSIZE = 1 << 20
+
+# the prefix of the names of the files through which messages are passed in shared memory
+SHARED_PREFIX = "compas-rpc-"
+SHARED_SUFFIX = ".bin"
+
+CHUNKSIZE = 1 << 24
+
+
+def shared_memory_folder():
+    """Folder for the files through which messages are passed in shared memory.
+
+    Returns
+    -------
+    str
+        On Linux, the in-memory file system at ``/dev/shm``.
+        Otherwise, the temp folder.
+
+    """
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _is_shared_message_path(path):
+    # only files created by send_message in the shared memory folder are accepted,
+    # such that a peer can't make the receiver read or remove arbitrary files
+    if not os.path.isabs(path) or os.path.islink(path):
+        return False
+    folder = os.path.normcase(os.path.abspath(shared_memory_folder()))
+    if os.path.normcase(os.path.dirname(path)) != folder:
+        return False
+    name = os.path.basename(path)
+    return name.startswith(SHARED_PREFIX) and name.endswith(SHARED_SUFFIX)
+
+
+def _recv_exactly(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < size:
+        count = sock.recv_into(view[offset:], min(size - offset, CHUNKSIZE))
+        if not count:
+            raise EOFError("The connection was closed.")
+        offset += count
+    return buffer
+
+
+def send_message(sock, message, shared=None):
+    """Encode a message and send it over a socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+    message : object
+        Any data that can be encoded in the COMPAS binary format.
+    shared : int, optional
+        If provided, messages of at least this size (in bytes) are passed through shared memory.
+        This is only possible if sender and receiver run on the same machine.
+
+    Returns
+    -------
+    None
+
+    """
+    payload = binary_dumps(message)
+    kind = INLINE
+    if shared is not None and len(payload) >= shared:
+        fd, path = tempfile.mkstemp(prefix=SHARED_PREFIX, suffix=SHARED_SUFFIX, dir=shared_memory_folder())
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        payload = path.encode("utf-8")
+        kind = SHARED
+    sock.sendall(FRAME.pack(kind, len(payload)))
+    sock.sendall(payload)
+
+
+def recv_message(sock, arrays=False):
+    """Receive a message from a socket and decode it.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+    arrays : bool, optional
+        If True, and NumPy is available, decode numeric arrays as read-only NumPy arrays, without copying.
+
+    Returns
+    -------
+    object
+
+    Raises
+    ------
+    EOFError
+        If the connection was closed.
+    ValueError
+        If the message is passed through a file that was not created by :func:`send_message` in the shared memory folder.
+        The file is neither read nor removed.
+
+    """
+    kind, size = FRAME.unpack(bytes(_recv_exactly(sock, FRAME.size)))
+    payload = _recv_exactly(sock, size)
+    if kind == INLINE:
+        return binary_loads(payload, arrays=arrays)
+    path = bytes(payload).decode("utf-8")
+    if not _is_shared_message_path(path):
+        raise ValueError("Refused to read a message from a file outside of the shared memory folder: {}".format(path))
+    try:
+        return binary_load(path, mmap=True, arrays=arrays)
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            # on Windows, a file can't be removed while it is mapped
+            pass
+
+
+def _parse_address(address):
+    if "://" in address:
+        address = address.split("://", 1)[1]
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+class _BinaryRequestHandler(BaseRequestHandler):
+    def handle(self):
+        server = self.server
+        sock = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            try:
+                request = recv_message(sock)
+            except EOFError:
+                return
+            except Exception:
+                # the frame was received completely, so the connection can be used for the response
+                send_message(sock, {"data": None, "error": traceback.format_exc(), "profile": None})
+                continue
+            try:
+                response = server.dispatch(request)
+            except Exception:
+                response = {"data": None, "error": traceback.format_exc(), "profile": None}
+            try:
+                send_message(sock, response, shared=request.get("shared"))
+            except Exception:
+                response = {"data": None, "error": traceback.format_exc(), "profile": None}
+                send_message(sock, response)
+
+
+class BinaryServer(ThreadingTCPServer):
+    """RPC server using length-prefixed binary frames over TCP, instead of JSON inside XML-RPC.
+
+    Every client connection is handled in a separate thread,
+    and numeric arrays are transferred as raw buffers.
+    Like :class:`compas.rpc.Server`, the server can be pinged to check if it is alive,
+    and can be cleanly terminated from the client side.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and the port of the server.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import BinaryServer
+        from compas.rpc import Dispatcher
+
+        server = BinaryServer(("localhost", 8888))
+        server.register_instance(Dispatcher())
+        server.serve_forever()
+
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, *args, **kwargs):
+        ThreadingTCPServer.__init__(self, address, _BinaryRequestHandler, *args, **kwargs)
+        self.instance = None
+
+    def register_instance(self, instance):
+        """Register the service handling the API calls.
+
+        Parameters
+        ----------
+        instance : :class:`compas.rpc.Dispatcher`
+            The service.
+
+        Returns
+        -------
+        None
+
+        """
+        self.instance = instance
+
+    def ping(self):
+        """Simple function used to check if a remote server can be reached.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        return 1
+
+    def remote_shutdown(self):
+        """Stop the server through a call from the client side.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        threading.Thread(target=self.shutdown).start()
+        return 1
+
+    def dispatch(self, request):
+        """Dispatch a request to the registered service.
+
+        Parameters
+        ----------
+        request : dict
+            The decoded request.
+
+        Returns
+        -------
+        dict
+            The output dictionary.
+
+        """
+        name = request["name"]
+        if name in ("ping", "remote_shutdown"):
+            return {"data": getattr(self, name)(), "error": None, "profile": None}
+        if self.instance is None:
+            return {"data": None, "error": "No service is registered with the server.", "profile": None}
+        return self.instance._dispatch_object(name, request.get("idict"), request.get("path"))
+
+
+class _BinaryMethod(object):
+    def __init__(self, proxy, name):
+        self._proxy = proxy
+        self._name = name
+
+    def __call__(self, idict, path=None):
+        return self._proxy._request({"name": self._name, "idict": idict, "path": path})
+
+
+class BinaryServerProxy(object):
+    """Client of a :class:`compas.rpc.BinaryServer`.
+
+    The client has the same interface as an XML-RPC server proxy,
+    except that remote functions take the decoded input dictionary,
+    and return the decoded output dictionary, instead of JSON strings.
+
+    Parameters
+    ----------
+    address : str
+        The address of the server, for example ``"http://127.0.0.1:1753"``.
+        The scheme of the address is ignored.
+    shared_memory : bool, optional
+        If True, large requests and responses are passed through shared memory instead of the socket.
+        This is only possible if client and server run on the same machine.
+    arrays : bool, optional
+        If True, and NumPy is available, numeric arrays in the results are returned as read-only NumPy arrays.
+        Otherwise, they are returned as lists.
+    timeout : float, optional
+        Timeout in seconds for connecting to the server.
+
+    Notes
+    -----
+    The client keeps the connection to the server open.
+    Calls from different threads are sent one after the other over the same connection.
+
+    """
+
+    def __init__(self, address, shared_memory=False, arrays=False, timeout=None):
+        self._address = _parse_address(address)
+        self._shared = SHARED_MINSIZE if shared_memory else None
+        self._arrays = arrays
+        self._timeout = timeout
+        self._socket = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _BinaryMethod(self, name)
+
+    def __call__(self, attr):
+        # same interface as ``xmlrpc.client.ServerProxy``
+        if attr == "close":
+            return self.close
+        raise AttributeError("Attribute {} not found".format(attr))
+
+    def _connect(self):
+        sock = socket.create_connection(self._address, self._timeout)
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _request(self, request):
+        request["shared"] = self._shared
+        with self._lock:
+            if self._socket is None:
+                self._socket = self._connect()
+            try:
+                send_message(self._socket, request, shared=self._shared)
+                return recv_message(self._socket, arrays=self._arrays)
+            except Exception:
+                # the state of the connection is unknown
+                self.close()
+                raise
+
+    def close(self):
+        """Close the connection to the server.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            finally:
+                self._socket = None
+
+    def ping(self):
+        """Check if the server can be reached.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._result(self._request({"name": "ping"}))
+
+    def remote_shutdown(self):
+        """Stop the server.
+
+        Returns
+        -------
+        int
+
+        """
+        result = self._result(self._request({"name": "remote_shutdown"}))
+        self.close()
+        return result
+
+    def _result(self, odict):
+        if odict["error"]:
+            raise RPCServerError(odict["error"])
+        return odict["data"]
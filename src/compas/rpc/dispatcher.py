@@ -6,10 +6,13 @@ import importlib
 import json
 import pstats
 import sys
+import threading
 import traceback
 
 from compas.data import DataDecoder
 from compas.data import DataEncoder
+from compas.rpc.handles import HandleStore
+from compas.rpc.handles import RPCHandle
 
 try:
     from cStringIO import StringIO
@@ -25,9 +28,63 @@ except ImportError:
     from profile import Profile
 
 
+# name of the API call for executing a batch of calls
+BATCH = "_batch"
+
+# API methods for managing the objects kept on the server
+HANDLE_METHODS = ("handle_value", "handle_release", "handle_info")
+
+_worker_dispatcher = None
+
+
+def _dispatch_in_worker(cls, method, *args):
+    # entry point of calls that are dispatched to a worker process
+    # every worker process has its own instance of the dispatcher
+    global _worker_dispatcher
+    if type(_worker_dispatcher) is not cls:
+        _worker_dispatcher = cls()
+    return getattr(_worker_dispatcher, method)(*args)
+
+
+def _uses_handles(call):
+    # calls that use handles have to be executed in the process where the objects are kept
+    if call.get("keep") or call.get("name") in HANDLE_METHODS:
+        return True
+    for value in call.get("args", ()):
+        if isinstance(value, RPCHandle):
+            return True
+    for value in call.get("kwargs", {}).values():
+        if isinstance(value, RPCHandle):
+            return True
+    return False
+
+
+class _Completed(object):
+    # result of a call that was executed without an executor
+    def __init__(self, odict):
+        self._odict = odict
+
+    def result(self):
+        return self._odict
+
+
 class Dispatcher(object):
     """Base class for remote services.
 
+    Attributes
+    ----------
+    executor : ``concurrent.futures.Executor``
+        A pool of workers to which the calls are dispatched.
+        With a thread pool, the calls are executed in the process of the server.
+        With a process pool, every worker process has its own instance of the dispatcher.
+        Default is None, in which case the calls are executed in the thread handling the request.
+    handles : :class:`compas.rpc.handles.HandleStore`, read-only
+        The objects that are kept on the server, and can be referenced in calls with a :class:`compas.rpc.RPCHandle`.
+    handles_maxsize : int
+        The maximum total size in bytes of the objects that are kept on the server.
+        If the limit is exceeded, the least recently used objects are evicted.
+        Default is 1 GiB.
+
     Notes
     -----
     This object is used to dispatch API calls to the corresponding functions or methods.
@@ -35,8 +92,31 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    The number of calls that are executed concurrently is limited by the number of workers of the executor.
+    To handle requests of multiple clients concurrently,
+    the dispatcher should be registered with a :class:`compas.rpc.ThreadedServer`.
+
+    The results of calls can be kept on the server, instead of being returned to the client.
+    The client receives a handle, which can be used as argument of later calls, instead of the object itself.
+    Calls that use handles are always executed in the process of the server.
+
     """
 
+    executor = None
+    handles_maxsize = 1 << 30
+
+    _handles_lock = threading.Lock()
+
+    @property
+    def handles(self):
+        handles = self.__dict__.get("_handles")
+        if handles is None:
+            with self._handles_lock:
+                handles = self.__dict__.get("_handles")
+                if handles is None:
+                    handles = self._handles = HandleStore(self.handles_maxsize)
+        return handles
+
     def on_module_imported(self, module, newly_loaded_modules):
         """Event triggered when a module is successfully imported.
 
@@ -57,6 +137,54 @@ class Dispatcher(object):
         """
         pass
 
+    def handle_value(self, value):
+        """Return the value of the input.
+
+        Combined with handles, this is used to put objects on the server and to fetch them from the server.
+        With `'keep'` enabled, the input value is kept on the server, and a handle is returned.
+        With a handle as input, the object of the handle is returned.
+
+        Parameters
+        ----------
+        value : object
+
+        Returns
+        -------
+        object
+
+        """
+        return value
+
+    def handle_release(self, *ids):
+        """Release objects kept on the server.
+
+        Parameters
+        ----------
+        *ids : str
+            The identifiers of the objects.
+
+        Returns
+        -------
+        int
+            The number of released objects.
+            Objects that were already released or evicted are ignored.
+
+        """
+        return sum(self.handles.remove(id) for id in ids)
+
+    def handle_info(self):
+        """Information about the objects kept on the server.
+
+        Returns
+        -------
+        dict
+            The number of objects (`'count'`), their estimated total size in bytes (`'size'`),
+            and the maximum total size in bytes (`'maxsize'`).
+
+        """
+        handles = self.handles
+        return {"count": len(handles), "size": handles.size, "maxsize": handles.maxsize}
+
     def _dispatch(self, name, args):
         """Dispatcher method for XMLRPC API calls.
 
@@ -85,6 +213,76 @@ class Dispatcher(object):
             * `'error'`   : The error message of any error that may have been thrown in the processes of dispatching to or execution of the API function.
             * `'profile'` : A profile of the function execution.
 
+        """
+        if name != BATCH and self.executor is None:
+            return self._dispatch_call(name, args)
+
+        # batches and calls that are dispatched to the executor are handled as decoded objects
+        try:
+            idict = json.loads(args[0], cls=DataDecoder)
+        except (IndexError, TypeError):
+            odict = {"data": None, "error": "API methods require a single JSON encoded dictionary as input.", "profile": None}
+        else:
+            odict = self._dispatch_object(name, idict, args[1] if len(args) > 1 else None)
+        return json.dumps(odict, cls=DataEncoder)
+
+    def _dispatch_object(self, name, idict, path=None):
+        """Dispatcher method for API calls of which the input is already decoded.
+
+        This method is used by servers that don't use JSON for encoding the input and output,
+        such as the :class:`compas.rpc.BinaryServer`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        idict : dict
+            The input dictionary, with the `'args'` and `'kwargs'` of the call,
+            or with the `'calls'` of a batch.
+        path : str, optional
+            Path to the folder containing the module of the function.
+
+        Returns
+        -------
+        dict
+            The output dictionary.
+
+        """
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+        if name == BATCH:
+            odict = {"data": None, "error": None, "profile": None}
+            try:
+                calls = idict["calls"]
+            except (TypeError, KeyError):
+                odict["error"] = "Batches require a list of calls as input."
+            else:
+                odict["data"] = self._execute_batch(calls, idict.get("parallel"), path)
+            return odict
+
+        try:
+            call = {"name": name, "args": idict["args"], "kwargs": idict["kwargs"], "keep": idict.get("keep", False)}
+        except (TypeError, KeyError):
+            return {"data": None, "error": "API methods require a dictionary with args and kwargs as input.", "profile": None}
+
+        return self._submit(self.executor, call, path).result()
+
+    def _dispatch_call(self, name, args):
+        """Import and call the function corresponding to an API call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        args : list
+            List of positional arguments.
+
+        Returns
+        -------
+        str
+            A JSON serialized string representation of the output dictionary.
+
         """
         odict = {"data": None, "error": None, "profile": None}
 
@@ -92,6 +290,122 @@ class Dispatcher(object):
             if args[1] not in sys.path:
                 sys.path.insert(0, args[1])
 
+        function = self._resolve(name, odict)
+
+        if function is not None:
+            try:
+                idict = json.loads(args[0], cls=DataDecoder)
+            except (IndexError, TypeError):
+                odict["error"] = "API methods require a single JSON encoded dictionary as input.\n" "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
+
+            else:
+                self._invoke(function, idict, odict)
+
+        return json.dumps(odict, cls=DataEncoder)
+
+    def _execute_batch(self, calls, parallel=False, path=None):
+        """Execute the calls of a batch.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            The calls, each with a `'name'`, `'args'` and `'kwargs'`.
+        parallel : bool, optional
+            If True, the calls are dispatched to the executor of the dispatcher, if it has one.
+        path : str, optional
+            Path to the folder containing the modules of the functions.
+
+        Returns
+        -------
+        list[dict]
+            The `'data'` and the `'error'` of every call, in order.
+
+        """
+        executor = self.executor if parallel else None
+        futures = [self._submit(executor, call, path) for call in calls]
+        results = [future.result() for future in futures]
+        return [{"data": result["data"], "error": result["error"]} for result in results]
+
+    def _submit(self, executor, call, path=None):
+        """Submit a call to an executor.
+
+        Parameters
+        ----------
+        executor : ``concurrent.futures.Executor`` | None
+            The executor.
+            If None, the call is executed immediately.
+        call : dict
+            The call, with a `'name'`, `'args'` and `'kwargs'`.
+        path : str, optional
+            Path to the folder containing the module of the function.
+
+        Returns
+        -------
+        ``concurrent.futures.Future``
+            The future output dictionary of the call.
+            If the call is executed immediately, an object with the same ``result`` method.
+
+        Notes
+        -----
+        Calls that use handles are not sent to worker processes,
+        because the objects of the handles only exist in the process of the server.
+
+        """
+        if executor is not None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            if not isinstance(executor, ProcessPoolExecutor):
+                return executor.submit(self._execute, call)
+            if not _uses_handles(call):
+                return executor.submit(_dispatch_in_worker, type(self), "_execute", call, path)
+
+        return _Completed(self._execute(call))
+
+    def _execute(self, call, path=None):
+        """Execute a single call.
+
+        Parameters
+        ----------
+        call : dict
+            The call, with a `'name'`, `'args'` and `'kwargs'`.
+        path : str, optional
+            Path to the folder containing the module of the function.
+
+        Returns
+        -------
+        dict
+            The output dictionary of the call.
+
+        """
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+        odict = {"data": None, "error": None, "profile": None}
+        function = self._resolve(call["name"], odict)
+        if function is not None:
+            self._invoke(function, call, odict)
+        return odict
+
+    def _resolve(self, name, odict):
+        """Find the function corresponding to an API call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        odict : dict
+            The output dictionary.
+
+        Returns
+        -------
+        callable | None
+            The function, or None if it can't be found.
+
+        Notes
+        -----
+        If the function can't be found, the error is assigned to the output dictionary.
+
+        """
         parts = name.split(".")
 
         functionname = parts[-1]
@@ -111,23 +425,57 @@ class Dispatcher(object):
                 module = self
         except Exception:
             odict["error"] = traceback.format_exc()
+            return None
 
-        else:
-            try:
-                function = getattr(module, functionname)
-            except AttributeError:
-                odict["error"] = "This function is not part of the API: {0}".format(functionname)
+        try:
+            return getattr(module, functionname)
+        except AttributeError:
+            odict["error"] = "This function is not part of the API: {0}".format(functionname)
+            return None
 
-            else:
-                try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
-                    odict["error"] = "API methods require a single JSON encoded dictionary as input.\n" "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
+    def _invoke(self, function, idict, odict):
+        """Call a function, using the objects kept on the server for its handle arguments.
 
-                else:
-                    self._call(function, idict, odict)
+        Parameters
+        ----------
+        function : callable
+            The callable object corresponding to the requested API call.
+        idict : dict
+            The input dictionary.
+            If the value of `'keep'` is True, the result of the call is kept on the server,
+            and a handle to the result is returned instead.
+        odict : dict
+            The output dictionary.
 
-        return json.dumps(odict, cls=DataEncoder)
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The output dictionary will be modified in place.
+
+        """
+        if _uses_handles(idict):
+            try:
+                idict = {
+                    "args": [self._unwrap(arg) for arg in idict["args"]],
+                    "kwargs": {key: self._unwrap(value) for key, value in idict["kwargs"].items()},
+                    "keep": idict.get("keep", False),
+                }
+            except KeyError as e:
+                odict["error"] = e.args[0]
+                return
+
+        self._call(function, idict, odict)
+
+        if idict.get("keep") and not odict["error"]:
+            odict["data"] = self.handles.add(odict["data"])
+
+    def _unwrap(self, value):
+        if isinstance(value, RPCHandle):
+            return self.handles.get(value.id)
+        return value
 
     def _call(self, function, idict, odict):
         """Method that handles the actual call to the function corresponding to the API call.
@@ -0,0 +1,155 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import threading
+
+
+class RPCFuture(object):
+    """Result of a remote call that is executed in the background.
+
+    Futures are returned by :meth:`compas.rpc.Proxy.submit`.
+    Since ``concurrent.futures`` is not available in IronPython,
+    this class provides the subset of its interface that is needed to wait for remote calls.
+
+    Attributes
+    ----------
+    profile : str
+        A profile of the code executed by the server, if the call was completed successfully.
+
+    Examples
+    --------
+    >>> from compas.rpc import Proxy  # doctest: +SKIP
+    >>> with Proxy("numpy") as np:  # doctest: +SKIP
+    ...     futures = [np.submit("linspace", 0, 1, n) for n in range(10)]  # doctest: +SKIP
+    ...     results = [future.result() for future in futures]  # doctest: +SKIP
+
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self.profile = None
+
+    def done(self):
+        """Check if the call is completed.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Wait for the call to complete and return its result.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait.
+            Default is None, in which case there is no limit.
+
+        Returns
+        -------
+        object
+            The result of the remote function.
+
+        Raises
+        ------
+        RPCClientError
+            If the call is not completed within the timeout.
+        Exception
+            The error raised by the call, typically a :class:`compas.rpc.RPCServerError`.
+
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for the call to complete and return the error raised by the call, if any.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait.
+            Default is None, in which case there is no limit.
+
+        Returns
+        -------
+        Exception | None
+
+        Raises
+        ------
+        RPCClientError
+            If the call is not completed within the timeout.
+
+        """
+        from compas.rpc import RPCClientError
+
+        if not self._event.wait(timeout):
+            raise RPCClientError("The remote call did not complete within {} seconds.".format(timeout))
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Add a function that is called with the future as only argument when the call is completed.
+
+        If the call is already completed, the function is called immediately.
+
+        Parameters
+        ----------
+        callback : callable
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def set_result(self, result):
+        """Complete the call with a result.
+
+        Parameters
+        ----------
+        result : object
+
+        Returns
+        -------
+        None
+
+        """
+        self._result = result
+        self._complete()
+
+    def set_exception(self, exception):
+        """Complete the call with an error.
+
+        Parameters
+        ----------
+        exception : Exception
+
+        Returns
+        -------
+        None
+
+        """
+        self._exception = exception
+        self._complete()
+
+    def _complete(self):
+        with self._lock:
+            self._event.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            callback(self)
@@ -0,0 +1,238 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+import threading
+import types
+import uuid
+from collections import OrderedDict
+
+from compas.data import Data
+
+
+def sizeof(obj):
+    """Estimate the memory used by an object, including the objects it refers to.
+
+    Parameters
+    ----------
+    obj : object
+
+    Returns
+    -------
+    int
+        The estimated size in bytes.
+
+    Notes
+    -----
+    The estimate includes the items of containers and the attributes of objects.
+    Classes, modules and functions are not included.
+    Objects that are referenced multiple times are counted only once.
+
+    """
+    size = 0
+    seen = set()
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, types.ModuleType, types.FunctionType, types.MethodType)):
+            continue
+        seen.add(id(obj))
+        try:
+            size += sys.getsizeof(obj)
+        except TypeError:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return size
+
+
+class RPCHandle(Data):
+    """Reference to an object that is kept in the memory of an RPC server.
+
+    Handles are returned by :meth:`compas.rpc.Proxy.keep` and :meth:`compas.rpc.Proxy.put`.
+    When a handle is passed as argument to a remote function,
+    the server replaces it with the object it refers to.
+
+    Parameters
+    ----------
+    id : str
+        The identifier of the object on the server.
+    typename : str, optional
+        The name of the type of the object.
+    size : int, optional
+        The estimated size of the object in bytes.
+
+    Attributes
+    ----------
+    id : str
+        The identifier of the object on the server.
+    typename : str
+        The name of the type of the object.
+    size : int
+        The estimated size of the object in bytes.
+
+    """
+
+    @property
+    def __data__(self):
+        return {"id": self.id, "typename": self.typename, "size": self.size}
+
+    def __init__(self, id, typename=None, size=None):
+        super(RPCHandle, self).__init__()
+        self.id = id
+        self.typename = typename
+        self.size = size
+
+    def __repr__(self):
+        return "{0}(id={1!r}, typename={2!r}, size={3!r})".format(type(self).__name__, self.id, self.typename, self.size)
+
+    def __eq__(self, other):
+        return isinstance(other, RPCHandle) and self.id == other.id
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class HandleStore(object):
+    """Memory-bounded store of the objects that are kept on an RPC server.
+
+    When the estimated total size of the stored objects exceeds the maximum size,
+    the least recently used objects are evicted.
+    The most recently added object is never evicted, even if it is larger than the maximum size.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum total size of the stored objects in bytes.
+        Default is None, in which case the size is not limited.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum total size of the stored objects in bytes.
+    size : int, read-only
+        The estimated total size of the stored objects in bytes.
+
+    Examples
+    --------
+    >>> store = HandleStore(maxsize=1024)
+    >>> handle = store.add([1, 2, 3])
+    >>> store.get(handle.id)
+    [1, 2, 3]
+    >>> store.remove(handle.id)
+    True
+    >>> len(store)
+    0
+
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._objects = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, id):
+        return id in self._objects
+
+    @property
+    def size(self):
+        return self._size
+
+    def add(self, obj):
+        """Add an object to the store.
+
+        Parameters
+        ----------
+        obj : object
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCHandle`
+            The handle of the object.
+
+        """
+        id = uuid.uuid4().hex
+        size = sizeof(obj)
+        with self._lock:
+            self._objects[id] = (obj, size)
+            self._size += size
+            if self.maxsize is not None:
+                while self._size > self.maxsize and len(self._objects) > 1:
+                    _, (_, evicted) = self._objects.popitem(last=False)
+                    self._size -= evicted
+        return RPCHandle(id, typename=type(obj).__name__, size=size)
+
+    def get(self, id):
+        """Get a stored object, and mark it as most recently used.
+
+        Parameters
+        ----------
+        id : str
+            The identifier of the object.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        KeyError
+            If there is no object with this identifier,
+            because it was released or evicted.
+
+        """
+        with self._lock:
+            try:
+                obj, size = self._objects.pop(id)
+            except KeyError:
+                raise KeyError("No object with id {0} is kept on the server. It was released or evicted.".format(id))
+            self._objects[id] = (obj, size)
+        return obj
+
+    def remove(self, id):
+        """Remove an object from the store.
+
+        Parameters
+        ----------
+        id : str
+            The identifier of the object.
+
+        Returns
+        -------
+        bool
+            True if the object was removed.
+            False if there was no object with this identifier.
+
+        """
+        with self._lock:
+            try:
+                _, size = self._objects.pop(id)
+            except KeyError:
+                return False
+            self._size -= size
+        return True
+
+    def clear(self):
+        """Remove all objects from the store.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._objects.clear()
+            self._size = 0
@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import threading
 import time
 
 import compas
@@ -10,6 +11,10 @@ import compas._os
 from compas.data import DataDecoder
 from compas.data import DataEncoder
 from compas.rpc import RPCServerError
+from compas.rpc.batch import RPCBatch
+from compas.rpc.binary import BinaryServerProxy
+from compas.rpc.dispatcher import BATCH
+from compas.rpc.futures import RPCFuture
 
 try:
     from xmlrpclib import ServerProxy
@@ -23,6 +28,9 @@ except ImportError:
     from System.Diagnostics import Process
 
 
+TRANSPORTS = ("xmlrpc", "binary")
+
+
 class Proxy(object):
     """Create a proxy object as intermediary between client code and remote functionality.
 
@@ -62,6 +70,25 @@ class Proxy(object):
     working_directory : str, optional
         Current working directory for the process that will be started to run the server.
         This is useful for cases where a custom service is used and the service is not on the PYTHONPATH.
+    workers : int, optional
+        The number of workers of the server that is started by the proxy.
+        If provided, the server handles requests concurrently and dispatches the calls to a pool of workers.
+        Default is None, in which case the server handles one request at a time.
+    executor : Literal["thread", "process"], optional
+        The type of workers of the server that is started by the proxy.
+        Default is ``"thread"``.
+    transport : Literal["xmlrpc", "binary"], optional
+        The wire protocol.
+        With ``"xmlrpc"``, the input and output of calls are encoded as JSON strings inside XML-RPC requests.
+        With ``"binary"``, they are encoded in the COMPAS binary format and sent as length-prefixed frames over a socket,
+        such that numeric arrays are transferred as raw buffers (see :class:`compas.rpc.BinaryServer`).
+        Default is ``"xmlrpc"``.
+    shared_memory : bool, optional
+        If True, and the transport is ``"binary"``, large inputs and outputs are passed through shared memory.
+        This is only possible if the client and the server run on the same machine.
+    arrays : bool, optional
+        If True, the transport is ``"binary"``, and NumPy is available,
+        numeric arrays in the results are returned as read-only NumPy arrays instead of lists.
 
     Attributes
     ----------
@@ -102,6 +129,13 @@ class Proxy(object):
     Starting a new proxy server...                          # doctest: +SKIP
     New proxy server started.                               # doctest: +SKIP
     Stopping the server proxy.                              # doctest: +SKIP
+
+    Non-blocking calls to a server with a pool of workers:
+
+    >>> with Proxy("numpy", workers=4) as np:  # doctest: +SKIP
+    ...     futures = [np.submit("linspace", 0, 1, n) for n in range(10)]  # doctest: +SKIP
+    ...     results = [future.result() for future in futures]  # doctest: +SKIP
+
     """
 
     def __init__(
@@ -116,7 +150,15 @@ class Proxy(object):
         capture_output=True,
         path=None,
         working_directory=None,
+        workers=None,
+        executor=None,
+        transport="xmlrpc",
+        shared_memory=False,
+        arrays=False,
     ):
+        if transport not in TRANSPORTS:
+            raise ValueError("Transport not supported: {}".format(transport))
+
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -128,6 +170,11 @@ class Proxy(object):
         self._profile = None
         self._path = path
         self._working_directory = working_directory
+        self._workers = workers
+        self._executor = executor
+        self._transport = transport
+        self._shared_memory = shared_memory
+        self._arrays = arrays
 
         self.service = service
         self.package = package
@@ -196,7 +243,7 @@ class Proxy(object):
         if self._implicitely_started_server:
             self.stop_server()
         else:
-            self._server.__close()
+            self._server("close")()
 
     def __getattr__(self, name):
         """Find server attributes (methods) corresponding to attributes that do not exist on the proxy itself.
@@ -223,6 +270,18 @@ class Proxy(object):
     # methods
     # ==========================================================================
 
+    def _server_proxy(self):
+        """Create a client for the server, for the selected transport.
+
+        Returns
+        -------
+        ServerProxy | :class:`compas.rpc.BinaryServerProxy`
+
+        """
+        if self._transport == "binary":
+            return BinaryServerProxy(self.address, shared_memory=self._shared_memory, arrays=self._arrays)
+        return ServerProxy(self.address)
+
     def _try_reconnect(self):
         """Try and reconnect to an existing proxy server.
 
@@ -232,7 +291,7 @@ class Proxy(object):
             Instance of the proxy if reconnection succeeded, otherwise ``None``.
 
         """
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         try:
             server.ping()
         except Exception:
@@ -284,17 +343,10 @@ class Proxy(object):
             self._process.StartInfo.RedirectStandardOutput = self.capture_output
             self._process.StartInfo.RedirectStandardError = self.capture_output
             self._process.StartInfo.FileName = self.python
-            self._process.StartInfo.Arguments = "-m {0} --port {1} --{2}autoreload".format(self.service, self._port, "" if self.autoreload else "no-")
+            self._process.StartInfo.Arguments = " ".join(["-m", self.service] + self._service_arguments())
             self._process.Start()
         else:
-            args = [
-                self.python,
-                "-m",
-                self.service,
-                "--port",
-                str(self._port),
-                "--{}autoreload".format("" if self.autoreload else "no-"),
-            ]
+            args = [self.python, "-m", self.service] + self._service_arguments()
             kwargs = dict(env=env)
             if self.capture_output:
                 kwargs["stdout"] = PIPE
@@ -307,7 +359,7 @@ class Proxy(object):
         # this starts the client side
         # it creates a proxy for the server
         # and tries to connect the proxy to the actual server
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
 
         print("Starting a new proxy server...")
         success = False
@@ -330,6 +382,25 @@ class Proxy(object):
 
         return server
 
+    def _service_arguments(self):
+        """Command line arguments of the service started by the proxy.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        args = ["--port", str(self._port), "--{}autoreload".format("" if self.autoreload else "no-")]
+        # the concurrency options are only passed if they are used
+        # such that custom services don't have to support them
+        if self._workers:
+            args += ["--workers", str(self._workers)]
+        if self._executor:
+            args += ["--executor", self._executor]
+        if self._transport != "xmlrpc":
+            args += ["--transport", self._transport]
+        return args
+
     def stop_server(self):
         """Stop the remote server and terminate/kill the python process that was used to start it.
 
@@ -409,7 +480,34 @@ class Proxy(object):
         Numpy objects are automatically converted to their built-in Python equivalents.
 
         """
-        idict = {"args": args, "kwargs": kwargs}
+        data, profile = self._call(self._function, {"args": args, "kwargs": kwargs})
+        self.profile = profile
+        return data
+
+    def _call(self, function, idict):
+        """Call a remote function.
+
+        Parameters
+        ----------
+        function : callable
+            The remote function of a server proxy.
+        idict : dict
+            The input dictionary of the call.
+            For regular calls, this contains the positional and named arguments of the remote function.
+
+        Returns
+        -------
+        tuple[object, str]
+            The result of the remote function, and the profile of the code executed by the server.
+
+        """
+        if self._transport == "binary":
+            # the binary transport encodes and decodes the dicts itself
+            result = function(idict, self._path or "")
+            if result["error"]:
+                raise RPCServerError(result["error"])
+            return result["data"], result["profile"]
+
         istring = json.dumps(idict, cls=DataEncoder)
         # it makes sense that there is a broken pipe error
         # because the process is not the one receiving the feedback
@@ -417,7 +515,7 @@ class Proxy(object):
         # this counts as output
         # it should be sent as part of RPC communication
         try:
-            ostring = self._function(istring, self._path or "")
+            ostring = function(istring, self._path or "")
         except Exception:
             # not clear what the point of this is
             # self.stop_server()
@@ -433,5 +531,217 @@ class Proxy(object):
         if result["error"]:
             raise RPCServerError(result["error"])
 
-        self.profile = result["profile"]
-        return result["data"]
+        return result["data"], result["profile"]
+
+    def _call_batch(self, calls, parallel=False):
+        """Execute a batch of calls in a single request.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            The calls, each with a fully qualified `'name'`, and the `'args'` and `'kwargs'` of the call.
+        parallel : bool, optional
+            If True, the server executes the calls in parallel, if it has a pool of workers.
+
+        Returns
+        -------
+        list[dict]
+            The `'data'` and the `'error'` of every call.
+
+        """
+        data, _ = self._call(getattr(self._server, BATCH), {"calls": calls, "parallel": parallel})
+        return data
+
+    def batch(self, parallel=False):
+        """Create a batch of calls that are sent to the server in a single request.
+
+        Parameters
+        ----------
+        parallel : bool, optional
+            If True, the server executes the calls in parallel, if it has a pool of workers.
+            Otherwise, the calls are executed one after the other, in order.
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCBatch`
+
+        Examples
+        --------
+        >>> with Proxy("numpy") as np:  # doctest: +SKIP
+        ...     with np.batch() as batch:  # doctest: +SKIP
+        ...         a = batch.arange(10)  # doctest: +SKIP
+        ...         b = batch.linspace(0, 1, 5)  # doctest: +SKIP
+        ...     a.result()  # doctest: +SKIP
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+        """
+        return RPCBatch(self, parallel=parallel)
+
+    def map(self, name, *iterables, **kwargs):
+        """Call a remote function for every item of one or more iterables, in a single request.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *iterables : iterable
+            The iterables providing the positional arguments of the calls.
+        parallel : bool, optional
+            If True, the server executes the calls in parallel, if it has a pool of workers.
+
+        Returns
+        -------
+        list
+            The results of the calls, in order.
+
+        Raises
+        ------
+        RPCServerError
+            If any of the calls failed.
+            Use :meth:`batch` to handle the errors of individual calls.
+
+        Examples
+        --------
+        >>> with Proxy("math") as math:  # doctest: +SKIP
+        ...     math.map("pow", [1, 2, 3], [2, 2, 2])  # doctest: +SKIP
+        [1.0, 4.0, 9.0]
+
+        """
+        batch = self.batch(parallel=kwargs.get("parallel", False))
+        futures = [batch.call(name, *args) for args in zip(*iterables)]
+        batch.execute()
+        return [future.result() for future in futures]
+
+    def keep(self, name, *args, **kwargs):
+        """Call a remote function, and keep the result on the server.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *args : list
+            Positional arguments to be passed to the remote function.
+        **kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCHandle`
+            The handle of the result,
+            which can be passed to later calls instead of the result itself.
+
+        Examples
+        --------
+        >>> with Proxy("numpy") as np:  # doctest: +SKIP
+        ...     a = np.keep("random.rand", 1000, 1000)  # doctest: +SKIP
+        ...     b = np.keep("dot", a, a)  # doctest: +SKIP
+        ...     np.trace(b)  # doctest: +SKIP
+
+        """
+        if self.package:
+            name = "{}.{}".format(self.package, name)
+        data, self.profile = self._call(getattr(self._server, name), {"args": args, "kwargs": kwargs, "keep": True})
+        return data
+
+    def put(self, value):
+        """Send an object to the server, and keep it there.
+
+        Parameters
+        ----------
+        value : object
+            The object.
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCHandle`
+            The handle of the object on the server.
+
+        """
+        data, _ = self._call(self._server.handle_value, {"args": [value], "kwargs": {}, "keep": True})
+        return data
+
+    def fetch(self, handle):
+        """Get an object that is kept on the server.
+
+        The object is not released.
+
+        Parameters
+        ----------
+        handle : :class:`compas.rpc.RPCHandle`
+            The handle of the object.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        RPCServerError
+            If the object was released or evicted.
+
+        """
+        data, _ = self._call(self._server.handle_value, {"args": [handle], "kwargs": {}})
+        return data
+
+    def release(self, *handles):
+        """Release objects that are kept on the server.
+
+        Parameters
+        ----------
+        *handles : :class:`compas.rpc.RPCHandle`
+            The handles of the objects.
+
+        Returns
+        -------
+        int
+            The number of released objects.
+            Objects that were already released or evicted are ignored.
+
+        """
+        data, _ = self._call(self._server.handle_release, {"args": [handle.id for handle in handles], "kwargs": {}})
+        return data
+
+    def submit(self, name, *args, **kwargs):
+        """Call a remote function without waiting for the result.
+
+        Every call is sent to the server over a separate connection, from a background thread.
+        The calls are executed concurrently if the server handles requests concurrently,
+        for example if it was started with a number of ``workers``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *args : list
+            Positional arguments to be passed to the remote function.
+        **kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`compas.rpc.RPCFuture`
+            The future result of the call.
+
+        """
+        if self.package:
+            name = "{}.{}".format(self.package, name)
+
+        future = RPCFuture()
+
+        def run():
+            # server proxies can't be shared between threads
+            server = self._server_proxy()
+            try:
+                data, profile = self._call(getattr(server, name), {"args": args, "kwargs": kwargs})
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.profile = profile
+                future.set_result(data)
+            finally:
+                server("close")()
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return future
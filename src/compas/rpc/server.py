@@ -9,6 +9,11 @@ try:
 except ImportError:
     from xmlrpc.server import SimpleXMLRPCServer
 
+try:
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from socketserver import ThreadingMixIn
+
 
 class Server(SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
@@ -77,3 +82,35 @@ class Server(SimpleXMLRPCServer):
 
     def _shutdown_thread(self):
         self.shutdown()
+
+
+class ThreadedServer(ThreadingMixIn, Server):
+    """Version of :class:`Server` that handles every request in a separate thread.
+
+    Notes
+    -----
+    Multiple clients can be served at the same time,
+    and calls to :meth:`Server.ping` and :meth:`Server.remote_shutdown`
+    are answered while other requests are being processed.
+    To limit the number of calls that are executed concurrently,
+    the service registered with the server should dispatch the calls to a pool of workers
+    (see :attr:`compas.rpc.Dispatcher.executor`).
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        from compas.rpc import Dispatcher
+        from compas.rpc import ThreadedServer
+
+        server = ThreadedServer(("localhost", 8888))
+        service = Dispatcher()
+        service.executor = ThreadPoolExecutor(4)
+        server.register_instance(service)
+        server.serve_forever()
+
+    """
+
+    daemon_threads = True
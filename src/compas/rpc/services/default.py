@@ -5,8 +5,14 @@ it listens to requests on port ``1753``.
 
 """
 
+import os
+import threading
+import time
+
+from compas.rpc import BinaryServer
 from compas.rpc import Dispatcher
 from compas.rpc import Server
+from compas.rpc import ThreadedServer
 
 from .watcher import FileWatcherService
 
@@ -19,14 +25,61 @@ class DefaultService(Dispatcher):
         return "special"
 
 
-def start_service(port=1753, autoreload=True, **kwargs):
+def _exit_with_parent(pid):
+    # worker processes are not stopped when the server process is killed
+    # therefore, they stop themselves when their parent process is gone
+    def watch():
+        while os.getppid() == pid:
+            time.sleep(1.0)
+        os._exit(0)
+
+    thread = threading.Thread(target=watch)
+    thread.daemon = True
+    thread.start()
+
+
+def create_executor(workers, executor="thread"):
+    """Create a pool of workers for dispatching calls to.
+
+    Parameters
+    ----------
+    workers : int
+        The number of workers.
+    executor : Literal["thread", "process"], optional
+        The type of workers.
+
+    Returns
+    -------
+    ``concurrent.futures.Executor``
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
+
+    if executor == "thread":
+        return ThreadPoolExecutor(workers)
+    if executor == "process":
+        return ProcessPoolExecutor(workers, initializer=_exit_with_parent, initargs=(os.getpid(),))
+    raise ValueError("Executor type not supported: {}".format(executor))
+
+
+def start_service(port=1753, autoreload=True, workers=None, executor="thread", transport="xmlrpc", **kwargs):
     print("Starting default RPC service on port {0}...".format(port))
 
     # start the server on *localhost*
     # and listen to requests on port *1753*
+    # if a number of workers is specified
+    # every request is handled in a separate thread
+    # and the calls are dispatched to a pool of workers
+    # the binary server always handles every connection in a separate thread
     host = "0.0.0.0"
     address = host, port
-    server = Server(address)
+    if transport == "binary":
+        server = BinaryServer(address)
+    elif workers:
+        server = ThreadedServer(address)
+    else:
+        server = Server(address)
 
     # register an instance of the default service
     # the default service extends the base service
@@ -35,11 +88,19 @@ def start_service(port=1753, autoreload=True, **kwargs):
     # and redirect either to an explicitly defined method of the service
     # or to a function that is available on the PYTHONPATH
     service = DefaultService() if not autoreload else FileWatcherService()
+    if workers:
+        service.executor = create_executor(workers, executor)
     server.register_instance(service)
 
     print("Listening{}...".format(" with autoreload of modules enabled" if autoreload else ""))
+    if workers:
+        print("Dispatching calls to {} {} workers".format(workers, executor))
     print("Press CTRL+C to abort")
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    finally:
+        if service.executor:
+            service.executor.shutdown(wait=False)
 
 
 # ==============================================================================
@@ -74,6 +135,31 @@ if __name__ == "__main__":
         help="Do not autoreload modules",
     )
 
+    parser.add_argument(
+        "--workers",
+        "-w",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of workers for handling concurrent requests",
+    )
+
+    parser.add_argument(
+        "--executor",
+        action="store",
+        default="thread",
+        choices=["thread", "process"],
+        help="Type of workers",
+    )
+
+    parser.add_argument(
+        "--transport",
+        action="store",
+        default="xmlrpc",
+        choices=["xmlrpc", "binary"],
+        help="Wire protocol",
+    )
+
     parser.set_defaults(
         autoreload=True,
         func=start_service,
@@ -91,18 +91,10 @@ class GraphObject(SceneObject):
         # type: (compas.datastructures.Graph) -> None
         self._item = graph
         self._transformation = None
-        self._node_xyz = None
-
-    @property
-    def transformation(self):
-        # type: () -> compas.geometry.Transformation | None
-        return self._transformation
+        self.invalidate()
 
-    @transformation.setter
-    def transformation(self, transformation):
-        # type: (compas.geometry.Transformation) -> None
+    def _clear_cache(self):
         self._node_xyz = None
-        self._transformation = transformation
 
     @property
     def node_xyz(self):
@@ -107,18 +107,10 @@ class MeshObject(SceneObject):
         # type: (compas.datastructures.Mesh) -> None
         self._item = mesh
         self._transformation = None
-        self._vertex_xyz = None
-
-    @property
-    def transformation(self):
-        # type: () -> compas.geometry.Transformation | None
-        return self._transformation
+        self.invalidate()
 
-    @transformation.setter
-    def transformation(self, transformation):
-        # type: (compas.geometry.Transformation) -> None
+    def _clear_cache(self):
         self._vertex_xyz = None
-        self._transformation = transformation
 
     @property
     def vertex_xyz(self):
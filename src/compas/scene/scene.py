@@ -36,6 +36,11 @@ class Scene(Tree):
     >>> boxobj = scene.add(box)
     >>> scene.draw()  # doctest: +SKIP
 
+    After changing some of the objects, only those objects have to be redrawn.
+
+    >>> boxobj.color = (1.0, 0.0, 0.0)
+    >>> scene.redraw()  # doctest: +SKIP
+
     """
 
     @property
@@ -70,6 +75,7 @@ class Scene(Tree):
         super(Scene, self).__init__(name=name)
         super(Scene, self).add(TreeNode(name="ROOT"))
         self.context = context or detect_current_context()
+        self._drawn = set()
 
     @property
     def objects(self):
@@ -106,6 +112,7 @@ class Scene(Tree):
                 del kwargs["context"]  # otherwist the SceneObject receives "context" twice, which results in an error
             sceneobject = SceneObject(item=item, context=self.context, **kwargs)  # type: ignore
         super(Scene, self).add(sceneobject, parent=parent)
+        sceneobject.invalidate()
         return sceneobject
 
     def clear(self):
@@ -122,6 +129,12 @@ class Scene(Tree):
         for sceneobject in self.objects:
             guids += sceneobject.guids
             sceneobject._guids = None
+            sceneobject._dirty = True
+        for sceneobject in self._drawn:
+            if sceneobject.guids:
+                guids += sceneobject.guids
+                sceneobject._guids = None
+        self._drawn = set()
         clear(guids=guids)
 
     def draw(self):
@@ -134,10 +147,89 @@ class Scene(Tree):
 
         self.clear_objects()
 
+        # frames, transformations and items may have been modified in place
+        for sceneobject in self.root.children:
+            sceneobject.invalidate()
+
         drawn_objects = []
         for sceneobject in self.objects:
             if sceneobject.show:
                 drawn_objects += sceneobject.draw()
+            sceneobject._digests = sceneobject._compute_digests()
+            sceneobject._dirty = False
+            self._drawn.add(sceneobject)
+
+        after_draw(drawn_objects)
+
+        return drawn_objects
+
+    def redraw(self):
+        """Redraw the objects of the scene that have changed since the scene was last drawn.
+
+        An object is redrawn if its item, its settings, its frame or its transformation have changed,
+        if the frame or transformation of one of its ancestors has changed,
+        or if it was invalidated explicitly with :meth:`compas.scene.SceneObject.invalidate`.
+        Objects that were removed from the scene are cleared.
+        All other objects are left as they are.
+
+        Returns
+        -------
+        list
+            The objects that were drawn.
+
+        Notes
+        -----
+        Changes are detected by comparing the hashes of the items and the settings of the objects
+        with the hashes at the time they were last drawn.
+        Data structures that cache their hash, such as meshes, are not rehashed if they are unchanged.
+
+        """
+
+        if not self.context:
+            raise ValueError("No context detected.")
+
+        before_draw()
+
+        objects = list(self.objects)
+
+        guids = []
+        for sceneobject in self._drawn.difference(objects):
+            guids += sceneobject.guids
+            sceneobject._guids = None
+            sceneobject._digests = None
+
+        changed = []
+        for sceneobject in objects:
+            # parents come before their children,
+            # such that a change of placement of a parent invalidates the children before they are checked
+            digests = sceneobject._compute_digests()
+            previous = sceneobject._digests
+            if previous is None:
+                sceneobject._dirty = True
+            else:
+                if digests[0] != previous[0]:
+                    sceneobject.invalidate()
+                elif digests[2] != previous[2]:
+                    sceneobject._clear_cache()
+                    sceneobject._dirty = True
+                elif digests[1] != previous[1]:
+                    sceneobject._dirty = True
+            if sceneobject._dirty:
+                guids += sceneobject.guids
+                sceneobject._guids = None
+                sceneobject._digests = digests
+                changed.append(sceneobject)
+
+        if guids:
+            clear(guids=guids)
+
+        drawn_objects = []
+        for sceneobject in changed:
+            if sceneobject.show:
+                drawn_objects += sceneobject.draw()
+            sceneobject._dirty = False
+
+        self._drawn = set(objects)
 
         after_draw(drawn_objects)
 
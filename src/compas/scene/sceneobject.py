@@ -2,8 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from functools import reduce
-from operator import mul
+import hashlib
 
 import compas.colors  # noqa: F401
 import compas.data  # noqa: F401
@@ -12,6 +11,8 @@ import compas.geometry  # noqa: F401
 import compas.scene  # noqa: F401
 from compas.colors import Color
 from compas.data import Data
+from compas.data.hashing import hash_data
+from compas.data.hashing import hash_digests
 from compas.datastructures import TreeNode
 from compas.geometry import Transformation
 
@@ -59,8 +60,11 @@ class SceneObject(TreeNode):
         The local frame of the scene object, in relation to its parent frame.
     transformation : :class:`compas.geometry.Transformation`
         The local transformation of the scene object in relation to its frame.
-    worldtransformation : :class:`compas.geometry.Transformation`
+    worldtransformation : :class:`compas.geometry.Transformation`, read-only
         The transformation of the scene object in world coordinates.
+        The transformation is cached until the frame or transformation of the object or one of its ancestors is replaced,
+        or until the object is invalidated or the scene is drawn.
+        Every access returns an independent copy of the cached transformation.
     color : :class:`compas.colors.Color`
         The color of the object.
     contrastcolor : :class:`compas.colors.Color`, readon-only
@@ -76,6 +80,15 @@ class SceneObject(TreeNode):
         The context in which the scene object is created.
     scene : :class:`compas.scene.Scene`
         The scene to which the scene object belongs.
+    is_dirty : bool, read-only
+        True if the scene object has been invalidated since it was last drawn by the scene.
+        Changes of the item data or the settings are only detected by :meth:`compas.scene.Scene.redraw`.
+
+    Notes
+    -----
+    Assigning a new frame or transformation invalidates the cached world transformations of the object and its descendants.
+    If the frame or transformation is modified in place, call :meth:`invalidate` to update the cached world transformations immediately.
+    Otherwise they are updated by the next call to :meth:`compas.scene.Scene.redraw`.
 
     """
 
@@ -116,6 +129,10 @@ class SceneObject(TreeNode):
         self._frame = frame
         self._transformation = transformation
         self._contrastcolor = None
+        self._frametransformation = None
+        self._worldtransformation = None
+        self._dirty = True
+        self._digests = None
         self.color = color or self.color
         self.opacity = opacity
         self.show = show
@@ -138,6 +155,13 @@ class SceneObject(TreeNode):
         # type: () -> str
         return "<{}: {}>".format(self.__class__.__name__, self.name)
 
+    def _hash_content(self, h):
+        # the item and the children contribute their own digest
+        children = hash_data(h, self.settings)
+        hash_digests(h, children, [self.item])
+        hash_digests(h, children, self.children)
+        return children
+
     @property
     def scene(self):
         # type: () -> compas.scene.Scene | None
@@ -162,6 +186,7 @@ class SceneObject(TreeNode):
     def frame(self, frame):
         # type: (compas.geometry.Frame) -> None
         self._frame = frame
+        self.invalidate()
 
     @property
     def transformation(self):
@@ -172,26 +197,37 @@ class SceneObject(TreeNode):
     def transformation(self, transformation):
         # type: (compas.geometry.Transformation) -> None
         self._transformation = transformation
+        self.invalidate()
+
+    def _get_frametransformation(self):
+        # type: () -> compas.geometry.Transformation
+        # the combined transformation of the frames of the object and its ancestors
+        # the transformations of the ancestors are not included
+        if self._frametransformation is None:
+            parent = self.parent
+            if isinstance(parent, SceneObject):
+                frametransformation = parent._get_frametransformation()
+            else:
+                frametransformation = Transformation()
+            if self.frame:
+                frametransformation = frametransformation * Transformation.from_frame(self.frame)
+            self._frametransformation = frametransformation
+        return self._frametransformation
 
     @property
     def worldtransformation(self):
         # type: () -> compas.geometry.Transformation
-        frame_stack = [self.frame] if self.frame else []
-        parent = self.parent
-        while parent and not parent.is_root:
-            if parent.frame:
-                frame_stack.append(parent.frame)
-            parent = parent.parent
-        matrices = [Transformation.from_frame(f) for f in frame_stack]
-        if matrices:
-            worldtransformation = reduce(mul, matrices[::-1])
-        else:
-            worldtransformation = Transformation()
-
-        if self.transformation:
-            worldtransformation *= self.transformation
+        if self._worldtransformation is None:
+            worldtransformation = self._get_frametransformation()
+            if self.transformation:
+                worldtransformation = worldtransformation * self.transformation
+            self._worldtransformation = worldtransformation
+        return self._worldtransformation.copy()
 
-        return worldtransformation
+    @property
+    def is_dirty(self):
+        # type: () -> bool
+        return self._dirty
 
     @property
     def contrastcolor(self):
@@ -257,8 +293,44 @@ class SceneObject(TreeNode):
             sceneobject = SceneObject(item=item, context=self.context, **kwargs)  # type: ignore
 
         super(SceneObject, self).add(sceneobject)
+        sceneobject.invalidate()
         return sceneobject
 
+    def invalidate(self):
+        # type: () -> None
+        """Mark the scene object and its descendants as changed.
+
+        The cached world transformations of the objects are cleared,
+        and the objects are redrawn by the next call to :meth:`compas.scene.Scene.redraw`.
+
+        Returns
+        -------
+        None
+
+        """
+        for sceneobject in self.traverse():
+            sceneobject._dirty = True
+            sceneobject._frametransformation = None
+            sceneobject._worldtransformation = None
+            sceneobject._clear_cache()
+
+    def _clear_cache(self):
+        # clear the values that are derived from the item and the world transformation
+        pass
+
+    def _compute_digests(self):
+        # the digests of the placement of the object (frame and transformation),
+        # of the other settings, and of the item
+        settings = self.settings
+        placement = [settings.pop("frame", None), settings.pop("transformation", None)]
+        digests = []
+        for data in (placement, settings):
+            h = hashlib.sha256()
+            hash_data(h, data)
+            digests.append(h.digest())
+        digests.append(self.item.sha256())
+        return tuple(digests)
+
     def draw(self):
         """The main drawing method."""
         raise NotImplementedError
@@ -267,3 +339,4 @@ class SceneObject(TreeNode):
         """The main clearing method."""
         clear(guids=self.guids)
         self._guids = None
+        self._dirty = True
@@ -14,6 +14,11 @@ from compas.data import Data
 __all__ = ["Tolerance", "TOL"]
 
 
+def _decimal_key(value, precision):
+    # the integer formed by the digits of the value formatted with the given number of decimals
+    return int("{0:.{1}f}".format(value, precision).replace(".", ""))
+
+
 class Tolerance(Data):
     """Tolerance settings for geometric operations.
 
@@ -808,6 +813,172 @@ class Tolerance(Data):
 
         return "{0:.{2}f},{1:.{2}f}".format(x, y, precision)
 
+    def geometric_key_numeric(self, xyz, precision=None):
+        """Compute the numeric geometric key of a point.
+
+        The numeric key is a tuple of integers obtained by quantising the coordinates
+        with the same precision semantics as :meth:`geometric_key`.
+        Two points have the same numeric key if and only if they have the same string key,
+        but numeric keys are cheaper to compute and to hash.
+
+        Parameters
+        ----------
+        xyz : list of float
+            The XYZ coordinates of the point.
+        precision : int, optional
+            The precision of the quantisation.
+            Default is ``None``, in which case ``self.precision`` is used.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            The numeric geometric key.
+
+        Raises
+        ------
+        ValueError
+            If the precision is zero.
+
+        See Also
+        --------
+        :meth:`geometric_key`, :meth:`geometric_keys_numpy`
+
+        Examples
+        --------
+        >>> tol = Tolerance()
+        >>> tol.geometric_key_numeric([1.0, 2.0, 3.0])
+        (1000, 2000, 3000)
+
+        >>> tol = Tolerance()
+        >>> tol.geometric_key_numeric([1.05725, 2.0195, -0.0001], precision=3)
+        (1057, 2019, 0)
+
+        >>> tol = Tolerance()
+        >>> tol.geometric_key_numeric([1.0, 2.0, 3.0], precision=-1)
+        (1, 2, 3)
+
+        >>> tol = Tolerance()
+        >>> tol.geometric_key_numeric([1103, 205, 30145], precision=-3)
+        (1100, 200, 30100)
+
+        Values half-way between two keys are rounded like the string key.
+
+        >>> tol = Tolerance()
+        >>> tol.geometric_key([0.0025, 2.5005, 0.125], precision=3)
+        '0.003,2.501,0.125'
+        >>> tol.geometric_key_numeric([0.0025, 2.5005, 0.125], precision=3)
+        (3, 2501, 125)
+
+        """
+        x, y, z = xyz
+        if not precision:
+            precision = self.precision
+
+        if precision == 0:
+            raise ValueError("Precision cannot be zero.")
+
+        if precision == -1:
+            return int(x), int(y), int(z)
+
+        if precision < -1:
+            factor = 10 ** (-precision - 1)
+            return (
+                int(round(x / factor)) * factor,
+                int(round(y / factor)) * factor,
+                int(round(z / factor)) * factor,
+            )
+
+        # the scaled values are rounded directly,
+        # unless they are close to half-way between two integers,
+        # or too large for the scaling error to be negligible.
+        # in those cases, the key is read from the string formatting used by geometric_key.
+        factor = 10**precision
+        X = round(x * factor)
+        Y = round(y * factor)
+        Z = round(z * factor)
+        if abs(x * factor - X) > 0.4999 or abs(X) > 1e11:
+            X = _decimal_key(x, precision)
+        if abs(y * factor - Y) > 0.4999 or abs(Y) > 1e11:
+            Y = _decimal_key(y, precision)
+        if abs(z * factor - Z) > 0.4999 or abs(Z) > 1e11:
+            Z = _decimal_key(z, precision)
+        return int(X), int(Y), int(Z)
+
+    def geometric_keys_numpy(self, points, precision=None):
+        """Compute the numeric geometric keys of multiple points in one vectorised pass.
+
+        Parameters
+        ----------
+        points : array_like
+            The XYZ coordinates of the points, as an array of shape (n, 3).
+        precision : int, optional
+            The precision of the quantisation.
+            Default is ``None``, in which case ``self.precision`` is used.
+
+        Returns
+        -------
+        ndarray
+            The numeric geometric keys as an array of integers of shape (n, 3).
+            Row ``i`` contains the same values as ``self.geometric_key_numeric(points[i])``.
+
+        Raises
+        ------
+        ValueError
+            If the precision is zero.
+
+        See Also
+        --------
+        :meth:`geometric_key_numeric`
+
+        Notes
+        -----
+        Duplicate points can be identified by finding the unique rows of the result,
+        for example with ``numpy.unique(keys, axis=0, return_inverse=True)``.
+
+        Examples
+        --------
+        >>> tol = Tolerance()
+        >>> tol.geometric_keys_numpy([[1.0, 2.0, 3.0], [1.0004, 2.0, 3.0]]).tolist()
+        [[1000, 2000, 3000], [1000, 2000, 3000]]
+
+        """
+        from numpy import absolute
+        from numpy import asarray
+        from numpy import flatnonzero
+        from numpy import int64
+        from numpy import rint
+        from numpy import trunc
+
+        points = asarray(points, dtype=float).reshape((-1, 3))
+        if not precision:
+            precision = self.precision
+
+        if precision == 0:
+            raise ValueError("Precision cannot be zero.")
+
+        if precision == -1:
+            return trunc(points).astype(int64)
+
+        if precision < -1:
+            factor = 10 ** (-precision - 1)
+            return rint(points / factor).astype(int64) * factor
+
+        # see geometric_key_numeric for the rounding of values close to half-way between two integers
+        factor = 10**precision
+        scaled = points * factor
+        keys = rint(scaled)
+        residual = absolute(scaled - keys)
+        ambiguous = residual > 0.4999
+        magnitude = absolute(keys)
+        if magnitude.max(initial=0) > 1e11:
+            ambiguous |= magnitude > 1e11
+        keys = keys.ravel()
+        values = points.ravel()
+        keys = keys.astype(int64)
+        for index in flatnonzero(ambiguous):
+            keys[index] = _decimal_key(float(values[index]), precision)
+        return keys.reshape(points.shape)
+
     def format_number(self, number, precision=None):
         """Format a number as a string.
 
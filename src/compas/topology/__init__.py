@@ -14,6 +14,8 @@ from .traversal import (
     astar_shortest_path,
     dijkstra_distances,
     dijkstra_path,
+    dijkstra_shortest_paths,
+    path_from_predecessors,
 )
 from .combinatorics import vertex_coloring, connected_components
 from .orientation import face_adjacency, unify_cycles
@@ -34,9 +36,11 @@ __all__ = [
     "depth_first_ordering",
     "dijkstra_distances",
     "dijkstra_path",
+    "dijkstra_shortest_paths",
     "edges_from_faces",
     "face_adjacency",
     "faces_from_edges",
+    "path_from_predecessors",
     "shortest_path",
     "unify_cycles",
     "vertex_adjacency_from_edges",
@@ -33,7 +33,7 @@ def _closest_faces(vertices, faces, nmax=10, radius=10.0):
             from compas.geometry import KDTree
 
             tree = KDTree(points)
-            closest = [tree.nearest_neighbors(point, k) for point in points]
+            closest = tree.nearest_neighbors_batch(points, k)
             closest = [[index for xyz, index, d in nnbrs] for nnbrs in closest]
 
         else:
@@ -2,12 +2,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-try:
-    from queue import PriorityQueue
-except ImportError:
-    from Queue import PriorityQueue  # type: ignore
-
 from collections import deque
+from heapq import heappop
+from heapq import heappush
+from itertools import count
 
 from compas.geometry import distance_point_point
 
@@ -389,41 +387,14 @@ def astar_lightest_path(adjacency, weights, heuristic, root, goal):
     https://en.wikipedia.org/wiki/A*_search_algorithm
 
     """
-    visited_set = set()
-
-    candidates_set = {root}
-    best_candidate_heap = PriorityQueue()
-    best_candidate_heap.put((heuristic[root], root))
-
-    came_from = dict()
-
-    g_score = dict()
-    for v in adjacency:
-        g_score[v] = float("inf")
-    g_score[root] = 0
-
-    while not best_candidate_heap.empty():
-        _, current = best_candidate_heap.get()
-        if current == goal:
-            break
-
-        visited_set.add(current)
-        for neighbor in adjacency[current]:
-            if neighbor in visited_set:
-                continue
-
-            tentative_g_score = g_score[current] + weights[(current, neighbor)]
-            if neighbor not in candidates_set:
-                candidates_set.add(neighbor)
-            elif tentative_g_score >= g_score[neighbor]:
-                continue
-
-            came_from[neighbor] = current
-            g_score[neighbor] = tentative_g_score
-            new_f_score = g_score[neighbor] + heuristic[neighbor]
-            best_candidate_heap.put((new_f_score, neighbor))
-
-    return reconstruct_path(came_from, goal)
+    distances, predecessors = _priority_first_search(
+        adjacency,
+        lambda u, v: weights[(u, v)],
+        [root],
+        targets=[goal],
+        heuristic=heuristic.__getitem__,
+    )
+    return reconstruct_path(predecessors, goal)
 
 
 def _get_coordinates(key, structure):
@@ -464,23 +435,23 @@ def astar_shortest_path(graph, root, goal):
     https://en.wikipedia.org/wiki/A*_search_algorithm
 
     """
-    adjacency = graph.adjacency
-    weights = {}
-    for u, v in graph.edges():
-        u_coords = _get_coordinates(u, graph)
-        v_coords = _get_coordinates(v, graph)
-        distance = distance_point_point(u_coords, v_coords)
-        weights[(u, v)] = distance
-        weights[(v, u)] = distance
+    xyz = {}
+
+    def coordinates(key):
+        if key not in xyz:
+            xyz[key] = _get_coordinates(key, graph)
+        return xyz[key]
 
-    heuristic = {}
-    goal_coords = _get_coordinates(goal, graph)
-    points = _get_points(graph)
-    for u in points:
-        u_coords = _get_coordinates(u, graph)
-        heuristic[u] = distance_point_point(u_coords, goal_coords)
+    goal_coords = coordinates(goal)
 
-    return astar_lightest_path(adjacency, weights, heuristic, root, goal)
+    distances, predecessors = _priority_first_search(
+        graph.adjacency,
+        lambda u, v: distance_point_point(coordinates(u), coordinates(v)),
+        [root],
+        targets=[goal],
+        heuristic=lambda u: distance_point_point(coordinates(u), goal_coords),
+    )
+    return reconstruct_path(predecessors, goal)
 
 
 def dijkstra_distances(adjacency, weight, target):
@@ -507,20 +478,8 @@ def dijkstra_distances(adjacency, weight, target):
         A dictionary of distances to the target.
 
     """
-    adjacency = {key: set(nbrs) for key, nbrs in adjacency.items()}
-    distance = {key: (0 if key == target else 1e17) for key in adjacency}
-    tovisit = set(adjacency.keys())
-    visited = set()
-
-    while tovisit:
-        u = min(tovisit, key=lambda k: distance[k])
-        tovisit.remove(u)
-        visited.add(u)
-        for v in adjacency[u] - visited:
-            d = distance[u] + weight[(u, v)]
-            if d < distance[v]:
-                distance[v] = d
-    return distance
+    distances, _ = _priority_first_search(adjacency, lambda u, v: weight[(u, v)], [target])
+    return {key: distances.get(key, 1e17) for key in adjacency}
 
 
 def dijkstra_path(adjacency, weight, source, target, dist=None):
@@ -542,11 +501,18 @@ def dijkstra_path(adjacency, weight, source, target, dist=None):
         The start vertex.
     target : hashable
         The end vertex.
+    dist : dict[hashable, float], optional
+        Precomputed distances of all nodes to the target, as returned by :func:`dijkstra_distances`.
+        If not provided, the path is found with a search from the source that stops as soon as the target is reached.
 
     Returns
     -------
-    list[hashable]
-        The shortest path.
+    list[hashable] | None
+        The shortest path, or None if no path exists between the nodes.
+
+    See Also
+    --------
+    :func:`dijkstra_shortest_paths`
 
     Notes
     -----
@@ -555,13 +521,117 @@ def dijkstra_path(adjacency, weight, source, target, dist=None):
     For an undirected graph, add the same weight for an edge in both directions.
 
     """
-    if not dist:
-        dist = dijkstra_distances(adjacency, weight, target)
-    path = [source]
-    node = source
-    node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
-    path.append(node)
-    while node != target:
-        node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
-        path.append(node)
+    if dist:
+        path = [source]
+        node = source
+        while node != target:
+            node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
+            path.append(node)
+        return path
+
+    distances, predecessors = _priority_first_search(adjacency, lambda u, v: weight[(u, v)], [source], targets=[target])
+    if target not in distances:
+        return None
+    return path_from_predecessors(predecessors, target)
+
+
+def dijkstra_shortest_paths(adjacency, weight, sources, targets=None):
+    """Compute the shortest paths from one or more source nodes to all other nodes, or to a selection of target nodes.
+
+    Parameters
+    ----------
+    adjacency : dict[hashable, dict[hashable, None]] | dict[hashable, sequence[hashable]]
+        An adjacency dictionary representing the connectivity of the graph
+        by mapping nodes identifiers to neighbour identifiers.
+    weight : dict[tuple[hashable, hashable], float]
+        A dictionary of edge weights.
+    sources : sequence[hashable]
+        The start nodes.
+        The distance of every node is the distance to the closest of the start nodes.
+    targets : sequence[hashable], optional
+        The target nodes.
+        If provided, the search stops as soon as the shortest paths to all targets are known.
+
+    Returns
+    -------
+    dict[hashable, float]
+        The distances of the nodes reached by the search.
+    dict[hashable, hashable]
+        The predecessors of the nodes on their shortest path.
+        Use :func:`path_from_predecessors` to reconstruct the path to any of the reached nodes.
+
+    Notes
+    -----
+    The edge weights should all be positive.
+
+    Examples
+    --------
+    >>> adjacency = {0: [1, 2], 1: [0, 3], 2: [0, 3], 3: [1, 2]}
+    >>> weight = {(u, v): 1.0 for u in adjacency for v in adjacency[u]}
+    >>> weight[(0, 1)] = weight[(1, 0)] = 5.0
+    >>> distances, predecessors = dijkstra_shortest_paths(adjacency, weight, [0])
+    >>> distances[1]
+    3.0
+    >>> path_from_predecessors(predecessors, 1)
+    [0, 2, 3, 1]
+
+    """
+    return _priority_first_search(adjacency, lambda u, v: weight[(u, v)], sources, targets=targets)
+
+
+def path_from_predecessors(predecessors, target):
+    """Reconstruct a path from a map of predecessors.
+
+    Parameters
+    ----------
+    predecessors : dict[hashable, hashable]
+        The predecessors of the nodes on their shortest path,
+        as returned by :func:`dijkstra_shortest_paths`.
+    target : hashable
+        The end node of the path.
+
+    Returns
+    -------
+    list[hashable]
+        The path from the start node to the end node.
+        If the target has no predecessor, the path contains only the target.
+
+    """
+    path = [target]
+    while path[-1] in predecessors:
+        path.append(predecessors[path[-1]])
+    path.reverse()
     return path
+
+
+def _priority_first_search(adjacency, weight, sources, targets=None, heuristic=None):
+    # Dijkstra's algorithm with a binary heap and lazy deletion,
+    # or A* if a heuristic is provided.
+    # the counter avoids comparing nodes with equal priority
+    distances = {}
+    predecessors = {}
+    tentative = {}
+    heap = []
+    counter = count()
+    for source in sources:
+        tentative[source] = 0
+        heappush(heap, (heuristic(source) if heuristic else 0, next(counter), source))
+    remaining = set(targets) if targets else None
+    while heap:
+        _, _, u = heappop(heap)
+        if u in distances:
+            continue
+        d = distances[u] = tentative[u]
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+        for v in adjacency[u]:
+            if v in distances:
+                continue
+            dv = d + weight(u, v)
+            if v not in tentative or dv < tentative[v]:
+                tentative[v] = dv
+                predecessors[v] = u
+                heappush(heap, (dv + heuristic(v) if heuristic else dv, next(counter), v))
+    return distances, predecessors
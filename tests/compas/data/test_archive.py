@@ -0,0 +1,117 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+import compas
+from compas.data import DataArchiveReader
+from compas.data import DataArchiveWriter
+from compas.datastructures import Mesh
+from compas.geometry import Point
+
+
+@pytest.fixture
+def objects():
+    mesh = Mesh.from_meshgrid(dx=3, nx=3)
+    mesh.name = "grid"
+    points = [Point(i, 0, 0, name="point") for i in range(5)]
+    return [mesh] + points + [{"a": [1, 2, 3]}]
+
+
+@pytest.mark.parametrize("filename", ["objects.jsonl", "objects.jsonl.gz", "objects.zip"])
+def test_archive_roundtrip(tmpdir, objects, filename):
+    filepath = os.path.join(str(tmpdir), filename)
+
+    with DataArchiveWriter(filepath) as archive:
+        for obj in objects:
+            archive.write(obj)
+
+    with DataArchiveReader(filepath) as archive:
+        assert len(archive) == len(objects)
+        assert archive.entries[0]["dtype"] == "compas.datastructures/Mesh"
+        assert archive.entries[0]["name"] == "grid"
+        assert archive.entries[-1]["dtype"] is None
+
+        mesh = archive.get(objects[0].guid)
+        assert mesh.guid == objects[0].guid
+        assert mesh.number_of_faces() == objects[0].number_of_faces()
+
+        points = archive.find("point")
+        assert points == objects[1:-1]
+        assert archive.read(3).guid == objects[3].guid
+        assert archive[-1] == {"a": [1, 2, 3]}
+
+        everything = list(archive)
+        assert len(everything) == len(objects)
+
+        with pytest.raises(KeyError):
+            archive.get("not a guid")
+
+
+@pytest.mark.parametrize("format", ["jsonl", "zip"])
+def test_archive_file_object(objects, format):
+    stream = io.BytesIO()
+    with DataArchiveWriter(stream, format=format, compresslevel=1) as archive:
+        for obj in objects:
+            archive.write(obj)
+
+    stream.seek(0)
+    with DataArchiveReader(stream) as archive:
+        assert archive.format == format
+        assert archive.guids()[:-1] == [str(obj.guid) for obj in objects[:-1]]
+
+
+def test_archive_minimal(tmpdir, objects):
+    filepath = os.path.join(str(tmpdir), "objects.jsonl")
+
+    with DataArchiveWriter(filepath, minimal=True) as archive:
+        for obj in objects:
+            archive.write(obj)
+
+    with DataArchiveReader(filepath) as archive:
+        assert all(guid is None for guid in archive.guids())
+        assert archive.read(0).guid != objects[0].guid
+
+
+def test_archive_zip_without_index(tmpdir, objects):
+    filepath = os.path.join(str(tmpdir), "objects.zip")
+
+    archive = DataArchiveWriter(filepath)
+    for obj in objects:
+        archive.write(obj)
+    # simulate an archive that was not closed properly
+    archive._zipfile.close()
+    archive._file.close()
+
+    with zipfile.ZipFile(filepath) as zf:
+        assert "index.json" not in zf.namelist()
+
+    with DataArchiveReader(filepath) as archive:
+        assert len(archive) == len(objects)
+        assert archive.get(objects[2].guid) == objects[2]
+
+
+def test_archive_foreign_key_order():
+    stream = io.BytesIO()
+    stream.write(compas.json_dumps(Point(1, 2, 3, name="p"), pretty=True).replace("\n", "").encode("utf-8"))
+    stream.write(b"\n")
+    stream.seek(0)
+
+    with DataArchiveReader(stream) as archive:
+        assert archive.entries[0]["dtype"] == "compas.geometry/Point"
+        assert archive.entries[0]["name"] == "p"
+        assert archive.read(0) == Point(1, 2, 3)
+
+
+def test_json_dumpz_compresslevel(tmpdir):
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    stored = os.path.join(str(tmpdir), "stored.zip")
+    deflated = os.path.join(str(tmpdir), "deflated.zip")
+
+    compas.json_dumpz(mesh, stored, compresslevel=0)
+    compas.json_dumpz(mesh, deflated, compresslevel=9)
+
+    assert os.path.getsize(deflated) < os.path.getsize(stored)
+    assert compas.json_loadz(stored).number_of_faces() == 100
+    assert compas.json_loadz(deflated).number_of_faces() == 100
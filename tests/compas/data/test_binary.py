@@ -0,0 +1,119 @@
+import pytest
+
+import compas
+from compas.data import DecoderError
+from compas.data import binary_dump
+from compas.data import binary_dumps
+from compas.data import binary_load
+from compas.data import binary_loads
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
+from compas.datastructures import VolMesh
+from compas.geometry import Box
+from compas.geometry import Point
+from compas.geometry import Pointcloud
+from compas.geometry import Transformation
+
+
+def test_binary_native():
+    before = [[], (), {}, "", 1, 1.0, True, None, -(2**70), "é", b"\x00\x01"]
+    after = binary_loads(binary_dumps(before))
+    assert after == [[], [], {}, "", 1, 1.0, True, None, -(2**70), "é", b"\x00\x01"]
+
+
+def test_binary_containers():
+    before = {
+        "floats": [float(i) for i in range(100)],
+        "ints": [0, 1, -300, 70000],
+        "bigints": [2**70, 1],
+        "mixed": [1, 2.0, "a", None],
+        "rows": [[1.0, 2.0], [3.0, 4.0]],
+        "ragged": [[0, 1, 2], [3, 4, 5, 6]],
+        "keys": ["0", "1", "2"],
+        "strings": ["1", "01", "a"],
+        "table": {"a": {"x": 1.0, "y": 2}, "b": {"x": 3.0, "y": 4}},
+        "empty": {"a": {}, "b": {}},
+        "tuples": {(0, 1): "a"},
+        1: "one",
+    }
+    after = binary_loads(binary_dumps(before))
+    assert after == before
+    assert list(after["table"]["a"]) == ["x", "y"]
+
+
+def test_binary_primitive():
+    before = Point(0, 0, 0)
+    after = binary_loads(binary_dumps(before))
+    assert before.__dtype__ == after.__dtype__
+    assert before == after
+    assert before.guid == after.guid
+
+
+def test_binary_minimal():
+    before = Point(0, 0, 0)
+    after = binary_loads(binary_dumps(before, minimal=True))
+    assert before == after
+    assert before.guid != after.guid
+
+
+def test_binary_shapes_and_xforms():
+    before = [Box(1), Transformation.from_matrix([[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])]
+    after = binary_loads(binary_dumps(before))
+    assert after[0].__data__ == before[0].__data__
+    assert after[1] == before[1]
+
+
+def test_binary_datastructures():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    mesh.vertex_attribute(0, "is_fixed", True)
+    graph = Graph.from_obj(compas.get("lines.obj"))
+    volmesh = VolMesh.from_obj(compas.get("boxes.obj"))
+    for before in (mesh, graph, volmesh):
+        after = binary_loads(binary_dumps(before))
+        assert type(after) is type(before)
+        assert after.__data__ == compas.json_loads(compas.json_dumps(before)).__data__
+        assert after.guid == before.guid
+    assert len(binary_dumps(mesh)) < len(compas.json_dumps(mesh))
+
+
+def test_binary_file(tmp_path):
+    before = [Pointcloud.from_bounds(10, 10, 10, 100), {"values": [1.0, 2.0, 3.0]}]
+    filepath = str(tmp_path / "data.bin")
+    binary_dump(before, filepath)
+    after = binary_load(filepath)
+    assert after[0] == before[0]
+    assert after[1] == before[1]
+    after = binary_load(filepath, mmap=True)
+    assert after[0] == before[0]
+
+
+def test_binary_invalid():
+    with pytest.raises(DecoderError):
+        binary_loads(compas.json_dumps(Point(0, 0, 0)).encode("utf-8"))
+
+
+try:
+    import numpy as np
+
+    def test_binary_numpy(tmp_path):
+        before = {
+            "a": np.arange(10, dtype=np.int32),
+            "b": np.random.rand(100, 3),
+            "c": np.float64(1.0),
+            "point": Point(0, 0, 0),
+        }
+        after = binary_loads(binary_dumps(before))
+        assert after["a"] == list(range(10))
+        assert after["b"] == before["b"].tolist()
+        assert after["c"] == 1.0
+
+        filepath = str(tmp_path / "data.bin")
+        binary_dump(before, filepath)
+        after = binary_load(filepath, mmap=True, arrays=True)
+        assert isinstance(after["b"], np.ndarray)
+        assert after["b"].shape == (100, 3)
+        assert np.all(after["b"] == before["b"])
+        assert after["point"] == before["point"]
+
+except ImportError:
+    pass
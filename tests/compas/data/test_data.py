@@ -1,4 +1,7 @@
 from compas.data import Data
+from compas.geometry import Point
+from compas.geometry import Polyline
+from compas.geometry import Vector
 
 
 def test_string_casting():
@@ -11,3 +14,25 @@ def test_string_casting():
 
     test = TestClass(42)
     assert str(test) == "TestClass 42"
+
+
+def test_sha256():
+    a = Point(1.0, 2.0, 3.0)
+    b = Point(1.0, 2.0, 3.0)
+    c = Point(1.0, 2.0, 3.5)
+
+    assert a.sha256() == b.sha256()
+    assert a.sha256() != c.sha256()
+    assert a.sha256() != Vector(1.0, 2.0, 3.0).sha256()
+    assert a.sha256(as_string=True) == b.sha256(as_string=True)
+    assert len(a.sha256(as_string=True)) == 64
+
+
+def test_sha256_nested():
+    a = Polyline([[0, 0, 0], [1, 0, 0]])
+    b = Polyline([[0, 0, 0], [1, 0, 0]])
+
+    assert a.sha256() == b.sha256()
+
+    b.points[1].x = 2.0
+    assert a.sha256() != b.sha256()
@@ -1,7 +1,13 @@
 import os
 import tempfile
+from uuid import UUID
+
+import pytest
 
 import compas
+from compas.data import DecoderError
+from compas.data import encoders
+from compas.data import register_dtype
 from compas.datastructures import Mesh
 from compas.datastructures import Graph
 from compas.datastructures import VolMesh
@@ -127,6 +133,36 @@ def test_json_zip():
     assert before.guid == after.guid
 
 
+def test_json_guid():
+    before = Point(0, 0, 0)
+    string = compas.json_dumps(before)
+    after = compas.json_loads(string)
+    assert compas.json_dumps(after) == string
+    assert isinstance(after.guid, UUID)
+    assert after.guid == before.guid
+
+
+def test_json_register_dtype(monkeypatch):
+    # the registrations are made in a copy of the registry, which is restored afterwards
+    monkeypatch.setattr(encoders, "DTYPES", dict(encoders.DTYPES))
+
+    class CustomPoint(Point):
+        pass
+
+    point = CustomPoint(1, 2, 3)
+    string = compas.json_dumps(point)
+    with pytest.raises(DecoderError):
+        compas.json_loads(string)
+
+    register_dtype(CustomPoint)
+    after = compas.json_loads(string)
+    assert isinstance(after, CustomPoint)
+
+    register_dtype(Point, "compas.geometry/OldPoint")
+    after = compas.json_loads(string.replace(point.__dtype__, "compas.geometry/OldPoint"))
+    assert type(after) is Point
+
+
 # temporarily commented because folder does not exist yet on main
 # def test_json_url():
 #     data = compas.json_load('https://raw.githubusercontent.com/compas-dev/compas/main/src/compas/data/schemas/graph.json')
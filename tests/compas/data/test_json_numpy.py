@@ -13,5 +13,11 @@ try:
         after = compas.json_loads(compas.json_dumps(before))
         assert after == [[1, 2, 3], [1.0, 2.0, 3.0], 1.0, 1]
 
+    def test_json_numpy_scalars():
+        before = [np.float16(0.5), np.float32(0.5), np.uint8(1), np.int64(-1), np.bool_(True)]
+        after = compas.json_loads(compas.json_dumps(before))
+        assert after == [0.5, 0.5, 1, -1, True]
+        assert [type(value) for value in after] == [float, float, int, int, bool]
+
 except ImportError:
     pass
@@ -121,3 +121,22 @@ def test_find_by_key_after_deserialization():
     assert deserialized_part.key == part.key
     assert deserialized_part.guid == part.guid
     assert deserialized_part.attributes == part.attributes
+
+
+def test_sha256():
+    assembly = Assembly()
+    part1 = Part()
+    part2 = Part()
+    assembly.add_part(part1)
+    assembly.add_part(part2)
+    assembly.add_connection(part1, part2)
+    digest = assembly.sha256()
+
+    assert assembly.sha256() == digest
+
+    part1.attributes["weight"] = 1.0
+    assert assembly.sha256() != digest
+
+    digest = assembly.sha256()
+    assembly.delete_connection((part1.key, part2.key))
+    assert assembly.sha256() != digest
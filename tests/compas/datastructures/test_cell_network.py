@@ -76,6 +76,20 @@ def test_cell_network_data(example_cell_network):
     assert other.face_attribute(11, "canopy") is True
 
 
+def test_cell_network_copy(example_cell_network):
+    ds = example_cell_network
+    ds.face_attribute(11, "canopy", True)
+
+    other = ds.copy()
+
+    assert other.__data__ == ds.__data__
+
+    other.face_attribute(11, "canopy", False)
+    other.delete_cell(1)
+    assert ds.face_attribute(11, "canopy") is True
+    assert ds.number_of_cells() == 2
+
+
 def test_cell_network_boundary(example_cell_network):
     ds = example_cell_network
     assert set(ds.cells_on_boundaries()) == {0, 1}
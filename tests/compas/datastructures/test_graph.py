@@ -117,6 +117,93 @@ def test_graph_data2():
         assert Graph.validate_data(other.__data__)
 
 
+def test_graph_data_keys():
+    graph = Graph()
+    graph.add_edge(0, 1, weight=1.0)
+    graph.add_edge("a", (1, 2))
+    graph.add_node(-3, x=1.0)
+    other = Graph.__from_data__(json.loads(json.dumps(graph.__data__)))
+
+    assert sorted(other.nodes(), key=repr) == sorted(graph.nodes(), key=repr)
+    assert other.edge == graph.edge
+    assert other.adjacency == graph.adjacency
+    assert other.edge_attribute((0, 1), "weight") == 1.0
+    assert other.node_attribute(-3, "x") == 1.0
+
+
+def test_graph_copy(graph):
+    graph.update_default_edge_attributes(weight=1.0)
+    graph.edge_attribute(graph.edge_sample(1)[0], "weight", 2.0)
+    other = graph.copy()
+
+    assert other.__data__ == graph.__data__
+
+    u, v = graph.edge_sample(1)[0]
+    other.edge_attribute((u, v), "weight", 3.0)
+    other.delete_node(u)
+    assert graph.edge_attribute((u, v), "weight") != 3.0
+    assert graph.has_node(u)
+    assert other.add_node() == graph.add_node()
+
+
+def test_graph_copy_on_write():
+    graph = Graph()
+    graph.add_edge(0, 1, weight=1.0)
+    graph.add_edge(1, 2, weight=1.0)
+    other = graph.copy(copy_on_write=True)
+
+    assert other.edge[0][1] is graph.edge[0][1]
+
+    other.edge_attribute((0, 1), "weight", 2.0)
+    graph.node_attribute(0, "x", 1.0)
+    other.add_edge(1, 2, weight=3.0)
+    assert graph.edge_attribute((0, 1), "weight") == 1.0
+    assert graph.edge_attribute((1, 2), "weight") == 1.0
+    assert other.node_attribute(0, "x") == 0.0
+
+
+def test_graph_copy_on_write_mutable_values():
+    graph = Graph()
+    graph.add_edge(0, 1, loads=[1.0])
+    graph.add_node(2, loads=[1.0])
+    other = graph.copy(copy_on_write=True)
+
+    other.edge_attribute((0, 1), "loads").append(2.0)
+    other.node_attribute(2, "loads").append(2.0)
+    assert graph.edge_attribute((0, 1), "loads") == [1.0]
+    assert graph.node_attribute(2, "loads") == [1.0]
+
+
+def test_graph_sha256():
+    graph = Graph()
+    graph.add_edge(0, 1, weight=1.0)
+    digest = graph.sha256()
+
+    assert graph.sha256() == digest
+
+    graph.edge_attribute((0, 1), "weight", 2.0)
+    assert graph.sha256() != digest
+
+    digest = graph.sha256()
+    graph.add_edge(1, 2)
+    assert graph.sha256() != digest
+
+    digest = graph.sha256()
+    graph.delete_node(2)
+    assert graph.sha256() != digest
+
+    edge = graph.edge_attributes((0, 1))
+    node = graph.node_attributes(0)
+
+    digest = graph.sha256()
+    edge["weight"] = 3.0
+    assert graph.sha256() != digest
+
+    digest = graph.sha256()
+    node["x"] = 3.0
+    assert graph.sha256() != digest
+
+
 # ==============================================================================
 # Properties
 # ==============================================================================
@@ -1,3 +1,4 @@
+import sys
 import tempfile
 import pytest
 import json
@@ -5,6 +6,7 @@ import random
 import compas
 
 from compas.datastructures import Mesh
+from compas.datastructures import CompactMesh
 from compas.geometry import Sphere
 from compas.geometry import Box
 from compas.geometry import Polygon
@@ -291,6 +293,34 @@ def test_mesh_data(halfedge):
         assert Mesh.validate_data(other.__data__)
 
 
+def test_mesh_data_halfedge():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    mesh.face_attribute(0, "name", "a")
+    other = Mesh.__from_data__(json.loads(json.dumps(mesh.__data__)))
+
+    assert other.vertex == mesh.vertex
+    assert other.face == mesh.face
+    assert other.facedata == mesh.facedata
+    assert other.halfedge == mesh.halfedge
+    assert other.face_attribute(0, "name") == "a"
+
+    other.add_vertex()
+    assert other.add_face([0, 1, other.number_of_vertices() - 1]) == mesh.number_of_faces()
+
+
+def test_from_vertices_and_faces_cleanup():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    faces = [[0, 1, 2, 0], [0, 2, 2, 3], [0, 1, 1]]
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+
+    assert mesh.number_of_faces() == 2
+    assert mesh.face_vertices(0) == [0, 1, 2]
+    assert mesh.face_vertices(1) == [0, 2, 3]
+
+    with pytest.raises(KeyError):
+        Mesh.from_vertices_and_faces(vertices, [[0, 1, 4]])
+
+
 # --------------------------------------------------------------------------
 # converters
 # --------------------------------------------------------------------------
@@ -353,6 +383,127 @@ def test_copy():
     assert mesh1.number_of_edges() == mesh2.number_of_edges()
 
 
+def test_copy_is_independent():
+    mesh1 = Mesh.from_obj(compas.get("faces.obj"))
+    mesh1.update_default_face_attributes(tags=[])
+    mesh1.face_attribute(0, "tags", ["a"])
+    mesh1.edge_attribute(mesh1.edge_sample(1)[0], "weight", 2.0)
+    mesh2 = mesh1.copy()
+
+    assert mesh2.__data__ == mesh1.__data__
+
+    mesh2.vertex_attribute(0, "z", 1.0)
+    mesh2.face_attribute(0, "tags").append("b")
+    mesh2.delete_face(1)
+    assert mesh1.vertex_attribute(0, "z") == 0.0
+    assert mesh1.face_attribute(0, "tags") == ["a"]
+    assert mesh1.has_face(1)
+    assert mesh2.add_vertex() == mesh1.add_vertex()
+
+
+def test_copy_on_write():
+    mesh1 = Mesh.from_meshgrid(10, 10)
+    mesh2 = mesh1.copy(copy_on_write=True)
+
+    assert mesh2.vertex[0] is mesh1.vertex[0]
+
+    x = mesh1.vertex_attribute(1, "x")
+    mesh2.vertex_attribute(0, "z", 1.0)
+    mesh1.vertex_attributes(1)["x"] = -1.0
+    mesh2.face_attribute(0, "a", 1)
+    assert mesh1.vertex_attribute(0, "z") == 0.0
+    assert mesh2.vertex_attribute(1, "x") == x
+    assert mesh1.face_attribute(0, "a") is None
+
+    mesh2.transform(Translation.from_vector([0, 0, 1]))
+    assert mesh1.vertex_attribute(2, "z") == 0.0
+
+
+def test_copy_on_write_mutable_values():
+    mesh1 = Mesh.from_meshgrid(10, 10)
+    mesh1.vertex_attribute(0, "lst", [1])
+    mesh1.face_attribute(0, "lst", [1])
+    mesh1.edge_attribute((0, 1), "lst", [1])
+    mesh2 = mesh1.copy(copy_on_write=True)
+
+    assert mesh2.vertex[1] is mesh1.vertex[1]
+    assert mesh2.vertex[0] is not mesh1.vertex[0]
+
+    mesh2.vertex_attribute(0, "lst").append(2)
+    mesh2.face_attribute(0, "lst").append(2)
+    mesh2.edge_attribute((0, 1), "lst").append(2)
+    mesh1.vertex_attribute(0, "lst").append(3)
+    assert mesh1.vertex_attribute(0, "lst") == [1, 3]
+    assert mesh1.face_attribute(0, "lst") == [1]
+    assert mesh1.edge_attribute((0, 1), "lst") == [1]
+    assert mesh2.vertex_attribute(0, "lst") == [1, 2]
+
+
+def test_copy_cls():
+    mesh = Mesh.from_meshgrid(3, 3)
+    other = mesh.copy(cls=CompactMesh)
+
+    assert isinstance(other, CompactMesh)
+    assert other.number_of_faces() == mesh.number_of_faces()
+
+
+def test_sha256():
+    mesh = Mesh.from_meshgrid(10, 10)
+    digest = mesh.sha256()
+
+    assert mesh.sha256() == digest
+    assert mesh.copy().sha256() == digest
+    assert Mesh.__from_data__(json.loads(json.dumps(mesh.__data__))).sha256() == digest
+
+    mesh.vertex_attribute(0, "z", 1.0)
+    assert mesh.sha256() != digest
+    mesh.vertex_attribute(0, "z", 0.0)
+    assert mesh.sha256() == digest
+
+    mesh.delete_face(0)
+    assert mesh.sha256() != digest
+
+    digest = mesh.sha256()
+    mesh.attributes["name"] = "grid"
+    assert mesh.sha256() != digest
+
+    digest = mesh.sha256()
+    mesh.face_attributes(1)["a"] = 1
+    assert mesh.sha256() != digest
+
+
+def test_sha256_attribute_views():
+    from compas.data import Data
+
+    mesh = Mesh.from_meshgrid(10, 10)
+    vertex = mesh.vertex_attributes(0)
+    face = mesh.face_attributes(1)
+    edge = mesh.edge_attributes((0, 1))
+
+    for view, name in ((vertex, "x"), (face, "a"), (edge, "b")):
+        digest = mesh.sha256()
+        view[name] = 7
+        assert mesh.sha256() != digest
+        assert mesh.sha256() == Data.sha256(mesh)
+        digest = mesh.sha256()
+        del view[name]
+        assert mesh.sha256() != digest
+        assert mesh.sha256() == Data.sha256(mesh)
+
+
+def test_attribute_views_copy_on_write():
+    mesh = Mesh.from_meshgrid(10, 10)
+    vertex = mesh.vertex_attributes(0)
+    face = mesh.face_attributes(1)
+    other = mesh.copy(copy_on_write=True)
+    vertex["x"] = 7
+    face["a"] = 1
+    assert mesh.vertex_attribute(0, "x") == 7
+    assert mesh.face_attribute(1, "a") == 1
+    assert other.vertex_attribute(0, "x") == 0
+    assert other.face_attribute(1, "a") is None
+
+
 def test_clear():
     mesh = Mesh.from_obj(compas.get("faces.obj"))
     mesh.clear()
@@ -1192,6 +1343,51 @@ def test_face_curvature():
     assert mesh.face_curvature(0) == 0
 
 
+# --------------------------------------------------------------------------
+# bulk geometry
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture(params=[False, True], ids=["numpy", "python"])
+def bulk(request, monkeypatch):
+    if request.param:
+        # hide the vectorised implementation to test the pure Python fallback
+        monkeypatch.setitem(sys.modules, "compas.datastructures.mesh.geometry_numpy", None)
+    return request.param
+
+
+def test_faces_normals(bulk, sphere):
+    mesh = Mesh.from_obj(compas.get("quadmesh.obj"))
+    for mesh in (mesh, sphere):
+        assert TOL.is_allclose(mesh.faces_normals(), [mesh.face_normal(face) for face in mesh.faces()])
+        assert TOL.is_allclose(mesh.faces_normals(unitized=False), [mesh.face_normal(face, unitized=False) for face in mesh.faces()])
+    faces = [3, 1]
+    assert TOL.is_allclose(sphere.faces_normals(faces), [sphere.face_normal(face) for face in faces])
+    assert Mesh().faces_normals() == []
+
+
+def test_faces_areas(bulk, sphere):
+    mesh = Mesh.from_obj(compas.get("quadmesh.obj"))
+    for mesh in (mesh, sphere):
+        assert TOL.is_allclose(mesh.faces_areas(), [mesh.face_area(face) for face in mesh.faces()])
+
+
+def test_faces_centroids(bulk, sphere):
+    assert TOL.is_allclose(sphere.faces_centroids(), [sphere.face_centroid(face) for face in sphere.faces()])
+
+
+def test_edges_lengths(bulk, sphere):
+    assert TOL.is_allclose(sphere.edges_lengths(), [sphere.edge_length(edge) for edge in sphere.edges()])
+    edges = [(1, 0), (2, 3)]
+    assert TOL.is_allclose(sphere.edges_lengths(edges), [sphere.edge_length(edge) for edge in edges])
+
+
+def test_vertices_normals(bulk, sphere):
+    mesh = Mesh.from_obj(compas.get("quadmesh.obj"))
+    for mesh in (mesh, sphere):
+        assert TOL.is_allclose(mesh.vertices_normals(), [mesh.vertex_normal(vertex) for vertex in mesh.vertices()])
+
+
 # --------------------------------------------------------------------------
 # boundary
 # --------------------------------------------------------------------------
@@ -0,0 +1,236 @@
+import tracemalloc
+
+import pytest
+import compas
+
+from compas.datastructures import CompactMesh
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.tolerance import TOL
+
+
+def _grid_vertices_and_faces(n):
+    vertices = [[float(i), float(j), 0.0] for i in range(n + 1) for j in range(n + 1)]
+    faces = []
+    for i in range(n):
+        for j in range(n):
+            faces.append([i * (n + 1) + j, (i + 1) * (n + 1) + j, (i + 1) * (n + 1) + j + 1, i * (n + 1) + j + 1])
+    return vertices, faces
+
+
+@pytest.fixture
+def meshes():
+    return Mesh.from_obj(compas.get("faces.obj")), CompactMesh.from_obj(compas.get("faces.obj"))
+
+
+# ==============================================================================
+# Constructors
+# ==============================================================================
+
+
+def test_compactmesh_from_vertices_and_faces():
+    vertices, faces = _grid_vertices_and_faces(3)
+    mesh = CompactMesh.from_vertices_and_faces(vertices, faces)
+    assert mesh.number_of_vertices() == 16
+    assert mesh.number_of_faces() == 9
+    assert mesh.number_of_edges() == 24
+    assert mesh.vertex_coordinates(5) == vertices[5]
+    assert mesh.face_vertices(4) == faces[4]
+    assert mesh.is_valid()
+
+
+def test_compactmesh_from_shape():
+    mesh = CompactMesh.from_shape(Box(1))
+    assert mesh.is_closed()
+    assert mesh.euler() == 2
+    assert TOL.is_close(mesh.area(), 6.0)
+
+
+# ==============================================================================
+# Equivalence with the dict backend
+# ==============================================================================
+
+
+def test_compactmesh_topology(meshes):
+    mesh, compact = meshes
+    assert compact.is_valid()
+    assert list(compact.vertices()) == list(mesh.vertices())
+    assert list(compact.faces()) == list(mesh.faces())
+    assert sorted(sorted(edge) for edge in compact.edges()) == sorted(sorted(edge) for edge in mesh.edges())
+    assert compact.vertices_on_boundaries() == mesh.vertices_on_boundaries()
+    for vertex in mesh.vertices():
+        assert sorted(compact.vertex_neighbors(vertex)) == sorted(mesh.vertex_neighbors(vertex))
+        assert sorted(compact.vertex_faces(vertex)) == sorted(mesh.vertex_faces(vertex))
+    for face in mesh.faces():
+        assert compact.face_vertices(face) == mesh.face_vertices(face)
+        assert sorted(compact.face_neighbors(face)) == sorted(mesh.face_neighbors(face))
+
+
+def test_compactmesh_geometry(meshes):
+    mesh, compact = meshes
+    for face in mesh.faces():
+        assert TOL.is_allclose(compact.face_normal(face), mesh.face_normal(face))
+        assert TOL.is_close(compact.face_area(face), mesh.face_area(face))
+    for vertex in mesh.vertices():
+        assert TOL.is_allclose(compact.vertex_normal(vertex), mesh.vertex_normal(vertex))
+    assert TOL.is_close(compact.area(), mesh.area())
+
+
+def test_compactmesh_attributes(meshes):
+    _, compact = meshes
+    compact.update_default_vertex_attributes(is_fixed=False)
+    compact.vertex_attribute(0, "z", 1.0)
+    compact.vertex_attribute(0, "is_fixed", True)
+    compact.face_attribute(0, "color", "red")
+    compact.edge_attribute((0, 1), "weight", 2.0)
+    assert compact.vertex_coordinates(0) == [0.0, 0.0, 1.0]
+    assert compact.vertex_attributes(0, "xyz") == [0.0, 0.0, 1.0]
+    assert compact.vertex_attribute(0, "is_fixed") is True
+    assert compact.vertex_attribute(1, "is_fixed") is False
+    assert dict(compact.vertex_attributes(0)) == {"x": 0.0, "y": 0.0, "z": 1.0, "is_fixed": True}
+    assert compact.face_attribute(0, "color") == "red"
+    assert compact.edge_attribute((1, 0), "weight") == 2.0
+    compact.unset_vertex_attribute(0, "z")
+    assert compact.vertex_attribute(0, "z") == 0.0
+
+
+# ==============================================================================
+# Modifiers
+# ==============================================================================
+
+
+def test_compactmesh_modifiers(meshes):
+    mesh, compact = meshes
+    for other in meshes:
+        other.delete_vertex(7)
+        other.delete_face(20)
+        other.cull_vertices()
+        other.quads_to_triangles()
+    assert compact.is_valid()
+    assert compact.number_of_vertices() == mesh.number_of_vertices()
+    assert compact.number_of_faces() == mesh.number_of_faces()
+    assert compact.number_of_edges() == mesh.number_of_edges()
+    assert 7 not in compact.vertex
+
+
+def test_compactmesh_delete_faces(meshes):
+    mesh, compact = meshes
+    compact.edges_attribute("weight", 2.0)
+    offsets = compact._halfedge_index()
+    for face in list(mesh.faces())[::3]:
+        mesh.delete_face(face)
+        compact.delete_face(face)
+    # the halfedge index is updated instead of rebuilt
+    assert compact._halfedge_offsets is offsets
+    for u in mesh.vertices():
+        assert dict(compact.halfedge[u]) == mesh.halfedge[u]
+    assert sorted(sorted(edge) for edge in compact.edges()) == sorted(sorted(edge) for edge in mesh.edges())
+    assert compact.vertices_on_boundaries() == mesh.vertices_on_boundaries()
+    assert len(compact.edgedata) == compact.number_of_edges()
+    compact.remove_unused_vertices()
+    mesh.remove_unused_vertices()
+    assert list(compact.vertices()) == list(mesh.vertices())
+    assert compact._halfedge_offsets is offsets
+
+
+def test_compactmesh_compact(meshes):
+    _, compact = meshes
+    faces = {face: compact.face_vertices(face) for face in compact.faces()}
+    for face in list(faces)[:5]:
+        compact.delete_face(face)
+        del faces[face]
+    compact.face[10] = faces[10] = faces[10] + [6]
+    assert len(compact._face_indices) > sum(len(vertices) for vertices in faces.values())
+    compact.compact()
+    assert len(compact._face_indices) == sum(len(vertices) for vertices in faces.values())
+    assert {face: compact.face_vertices(face) for face in compact.faces()} == faces
+    assert compact.face_neighbors(10) == Mesh.from_vertices_and_faces(compact.vertices_attributes("xyz"), faces).face_neighbors(10)
+
+
+def test_compactmesh_compact_automatically(meshes):
+    _, compact = meshes
+    size = len(compact._face_indices)
+    vertex = compact.add_vertex()
+    for _ in range(10):
+        for face in compact.faces():
+            vertices = compact.face_vertices(face)
+            compact.face[face] = vertices + [vertex]
+            compact.face[face] = vertices
+    assert len(compact._face_indices) <= 2 * size + 5
+
+
+def test_compactmesh_flip_and_unify_cycles(meshes):
+    _, compact = meshes
+    normal = compact.face_normal(0)
+    compact.flip_cycles()
+    assert TOL.is_allclose(compact.face_normal(0), [-axis for axis in normal])
+    compact.unify_cycles()
+    assert compact.is_valid()
+
+
+def test_compactmesh_remove_duplicate_vertices(meshes):
+    _, compact = meshes
+    for x, y, z in compact.vertices_attributes("xyz", keys=list(compact.vertices())[:5]):
+        compact.add_vertex(x=x, y=y, z=z)
+    assert compact.number_of_vertices() == 41
+    compact.remove_duplicate_vertices()
+    assert compact.number_of_vertices() == 36
+
+
+def test_compactmesh_subdivision(meshes):
+    mesh, compact = meshes
+    subd = compact.subdivided("catmullclark", k=2)
+    assert isinstance(subd, CompactMesh)
+    assert subd.number_of_faces() == mesh.subdivided("catmullclark", k=2).number_of_faces()
+
+
+# ==============================================================================
+# Conversions & Serialisation
+# ==============================================================================
+
+
+def test_compactmesh_data(meshes):
+    mesh, compact = meshes
+    compact.vertex_attribute(0, "is_fixed", True)
+    other = CompactMesh.__from_data__(compact.__data__)
+    assert other.vertex_attribute(0, "is_fixed") is True
+    assert other.to_vertices_and_faces() == compact.to_vertices_and_faces()
+    other = compas.json_loads(compas.json_dumps(compact))
+    assert isinstance(other, CompactMesh)
+    assert other.number_of_edges() == mesh.number_of_edges()
+
+
+def test_compactmesh_copy(meshes):
+    _, compact = meshes
+    other = compact.copy()
+    other.vertex_attribute(0, "z", 1.0)
+    assert isinstance(other, CompactMesh)
+    assert compact.vertex_attribute(0, "z") == 0.0
+    regular = compact.copy(cls=Mesh)
+    assert type(regular) is Mesh
+    assert regular.to_vertices_and_faces() == compact.to_vertices_and_faces()
+
+
+# ==============================================================================
+# Memory
+# ==============================================================================
+
+
+def _build(cls, vertices, faces):
+    mesh = cls.from_vertices_and_faces(vertices, faces)
+    # make sure the halfedge index of the compact mesh is built as well
+    mesh.vertex_neighbors(0)
+    return mesh
+
+
+@pytest.mark.skipif(compas.IPY, reason="tracemalloc is not available on IronPython")
+def test_compactmesh_memory():
+    vertices, faces = _grid_vertices_and_faces(50)
+    usage = {}
+    for cls in (Mesh, CompactMesh):
+        tracemalloc.start()
+        mesh = _build(cls, vertices, faces)
+        usage[cls], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert mesh.number_of_faces() == 2500
+    assert usage[CompactMesh] < usage[Mesh] / 4
@@ -197,3 +197,20 @@ def test_tree_to_graph(simple_tree):
     assert graph2.has_edge(("root", "branch2"))
     assert graph2.has_edge(("branch2", "leaf2_1"))
     assert graph2.has_edge(("branch2", "leaf2_2"))
+
+
+def test_tree_sha256(simple_tree):
+    digest = simple_tree.sha256()
+    other = json_loads(json_dumps(simple_tree))
+
+    assert other.sha256() == digest
+
+    leaf = simple_tree.get_node_by_name("leaf2_2")
+    leaf.attributes["value"] = 1
+    assert simple_tree.sha256() != digest
+
+    leaf.attributes.clear()
+    assert simple_tree.sha256() == digest
+
+    simple_tree.add(TreeNode(name="leaf2_3"), parent=leaf.parent)
+    assert simple_tree.sha256() != digest
@@ -60,6 +60,16 @@ def test_volmesh_data():
         assert VolMesh.validate_data(other.__data__)
 
 
+def test_volmesh_data_attributes(halfface):
+    halfface.cell_attribute(0, "name", "a")
+    halfface.vertex_attribute(0, "fixed", True)
+    other = VolMesh.__from_data__(json.loads(json.dumps(halfface.__data__)))
+
+    assert other.cell_attribute(0, "name") == "a"
+    assert other.vertex_attribute(0, "fixed") is True
+    assert other.__data__ == halfface.__data__
+
+
 # ==============================================================================
 # Builders
 # ==============================================================================
@@ -241,6 +251,22 @@ def test_cells_where_predicate():
 # Conversion
 # ==============================================================================
 
+
+def test_volmesh_copy():
+    volmesh = VolMesh.from_meshgrid(1, 1, 1, 2, 2, 2)
+    volmesh.cell_attribute(0, "a", [1])
+    other = volmesh.copy()
+
+    assert other.__data__ == volmesh.__data__
+
+    other.vertex_attribute(0, "x", -1.0)
+    other.cell_attribute(0, "a").append(2)
+    other.add_vertex()
+    assert volmesh.vertex_attribute(0, "x") == 0.0
+    assert volmesh.cell_attribute(0, "a") == [1]
+    assert other.number_of_vertices() == volmesh.number_of_vertices() + 1
+
+
 # ==============================================================================
 # Methods
 # ==============================================================================
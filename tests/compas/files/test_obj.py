@@ -0,0 +1,62 @@
+import pytest
+import compas
+
+from compas.datastructures import Mesh
+from compas.files import OBJ
+from compas.geometry import Translation
+
+
+@pytest.fixture
+def objects_obj(tmp_path):
+    meshes = []
+    for i in range(3):
+        mesh = Mesh.from_polyhedron(6)
+        mesh.name = "box {}".format(i)
+        mesh.transform(Translation.from_vector([3.0 * i, 0, 0]))
+        meshes.append(mesh)
+    filepath = str(tmp_path / "meshes.obj")
+    OBJ(filepath).write(meshes)
+    return filepath, meshes
+
+
+def test_iter_objects(objects_obj):
+    filepath, meshes = objects_obj
+    objects = list(OBJ(filepath, precision=3).iter_objects(chunksize=64))
+    assert [name for name, _, _ in objects] == [mesh.name for mesh in meshes]
+    for (name, vertices, faces), mesh in zip(objects, meshes):
+        other = Mesh.from_vertices_and_faces(vertices, faces)
+        assert other.number_of_vertices() == mesh.number_of_vertices()
+        assert other.number_of_faces() == mesh.number_of_faces()
+        assert compas.tolerance.TOL.is_allclose(other.centroid(), mesh.centroid())
+
+
+def test_iter_objects_matches_read():
+    obj = OBJ(compas.get("faces.obj"))
+    obj.read()
+    objects = list(obj.iter_objects())
+    assert len(objects) == 1
+    _, vertices, faces = objects[0]
+    assert vertices == obj.vertices
+    assert faces == obj.faces
+
+
+def test_iter_objects_welding_and_groups(tmp_path):
+    filepath = str(tmp_path / "groups.obj")
+    with open(filepath, "w") as f:
+        f.write("o first\n")
+        f.write("g a\n")
+        f.write("v 0 0 0\nv 1 0 0\nv 1 1 0\n")
+        f.write("f 1 2 3\n")
+        f.write("g b\n")
+        f.write("v 0 0 0.00001\nv 1 1 0\nv 0 1 0\n")
+        f.write("f -3 -2 -1\n")
+    objects = list(OBJ(filepath, precision=3).iter_objects())
+    assert len(objects) == 1
+    name, vertices, faces = objects[0]
+    assert name == "first"
+    assert len(vertices) == 4
+    assert faces == [[0, 1, 2], [0, 2, 3]]
+
+    objects = list(OBJ(filepath, precision=3).iter_objects(groups=True))
+    assert [name for name, _, _ in objects] == ["a", "b"]
+    assert objects[1][2] == [[0, 1, 2]]
@@ -0,0 +1,20 @@
+import compas
+
+from compas.datastructures import Mesh
+from compas.tolerance import TOL
+
+
+def test_ply_read():
+    mesh = Mesh.from_ply(compas.get("tubemesh.ply"))
+    assert mesh.number_of_vertices() > 0
+    assert mesh.number_of_faces() > 0
+
+
+def test_ply_write_read(tmp_path):
+    mesh = Mesh.from_meshgrid(dx=10, nx=5)
+    filepath = str(tmp_path / "grid.ply")
+    mesh.to_ply(filepath, precision=6)
+    other = Mesh.from_ply(filepath)
+    assert other.number_of_vertices() == mesh.number_of_vertices()
+    assert other.number_of_faces() == mesh.number_of_faces()
+    assert TOL.is_allclose(other.vertex_coordinates(7), mesh.vertex_coordinates(7))
@@ -43,3 +43,45 @@ def test_binary_read_write_fidelity():
     mesh_2 = Mesh.from_stl(fp)
     assert mesh.adjacency == mesh_2.adjacency
     assert mesh.vertex == mesh_2.vertex
+
+
+@pytest.mark.parametrize("numpy_support", [True, False])
+def test_binary_bulk_parse(binary_stl, monkeypatch, numpy_support):
+    from compas.files import stl
+
+    expected = STL(binary_stl)
+    expected.reader.read()
+    expected.reader.facets
+    expected.parser.parse()
+
+    monkeypatch.setattr(stl, "numpy_support", numpy_support and stl.numpy_support)
+    result = STL(binary_stl)
+    assert result.parser.vertices == [list(xyz) for xyz in expected.parser.vertices]
+    assert result.parser.faces == expected.parser.faces
+    assert result.reader.number_of_facets == len(expected.reader.facets)
+
+
+@pytest.mark.parametrize("numpy_support", [True, False])
+def test_binary_bulk_write(tmp_path, monkeypatch, numpy_support):
+    from compas.files import stl
+
+    monkeypatch.setattr(stl, "numpy_support", numpy_support and stl.numpy_support)
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    mesh.quads_to_triangles()
+    fp = str(tmp_path / "grid.stl")
+    mesh.to_stl(fp, binary=True)
+    assert os.path.getsize(fp) == 84 + 50 * mesh.number_of_faces()
+    other = Mesh.from_stl(fp)
+    assert other.number_of_faces() == mesh.number_of_faces()
+    assert other.number_of_vertices() == mesh.number_of_vertices()
+    assert TOL.is_close(other.area(), mesh.area())
+
+
+def test_binary_truncated(binary_stl, tmp_path):
+    fp = str(tmp_path / "truncated.stl")
+    with open(binary_stl, "rb") as f:
+        data = f.read()
+    with open(fp, "wb") as f:
+        f.write(data[:-10])
+    with pytest.raises(ValueError):
+        STL(fp).read()
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from compas.datastructures import Mesh
+from compas.geometry import AABBTree
+from compas.geometry import Box
+from compas.geometry import Sphere
+from compas.geometry import Translation
+from compas.geometry import distance_point_point
+from compas.geometry import intersection_mesh_mesh
+from compas.geometry import intersection_ray_mesh
+from compas.tolerance import TOL
+
+
+@pytest.fixture
+def sphere():
+    mesh = Mesh.from_shape(Sphere(1.0), u=32, v=32)
+    mesh.quads_to_triangles()
+    return mesh
+
+
+def test_aabbtree_intersect_ray(sphere):
+    tree = AABBTree.from_mesh(sphere)
+    assert len(tree) == sphere.number_of_faces()
+    hits = tree.intersect_ray(([0.1, 0.1, -5], [0, 0, 1]))
+    assert len(hits) == 2
+    assert hits[0][3] < hits[1][3]
+    assert TOL.is_close(hits[0][3], 4.0, atol=0.05)
+    assert TOL.is_close(hits[1][3], 6.0, atol=0.05)
+    for face, u, v, t in hits:
+        assert face in sphere.face
+    assert tree.intersect_ray(([0, 0, -5], [0, 0, -1])) == []
+    assert tree.intersect_rays([([0, 0, -5], [0, 1, 0])] * 2) == [[], []]
+
+
+def test_aabbtree_closest_point(sphere):
+    tree = AABBTree.from_mesh(sphere)
+    random.seed(0)
+    for _ in range(20):
+        point = [random.uniform(-2, 2) for _ in range(3)]
+        closest, face, distance = tree.closest_point(point)
+        assert TOL.is_close(distance, distance_point_point(point, closest))
+        # no vertex of the mesh can be closer than the closest point
+        for vertex in sphere.vertices():
+            assert distance_point_point(point, sphere.vertex_coordinates(vertex)) >= distance - 1e-9
+        assert face in sphere.face
+    assert len(tree.closest_points([[0, 0, 2], [0, 0, -2]])) == 2
+
+
+def test_aabbtree_contains_point(sphere):
+    tree = AABBTree.from_mesh(sphere)
+    assert tree.contains_point([0, 0, 0])
+    assert tree.contains_point([0.5, 0.2, -0.3])
+    assert not tree.contains_point([0, 0, 2])
+    assert not tree.contains_point([1.1, 0, 0])
+
+
+def test_aabbtree_intersection_candidates():
+    a = Mesh.from_shape(Box(2.0))
+    b = Mesh.from_shape(Box(2.0))
+    b.transform(Translation.from_vector([1.5, 0, 0]))
+    pairs = AABBTree.from_mesh(a).intersection_candidates(AABBTree.from_mesh(b))
+    assert pairs
+    assert all(face in a.face for face, _ in pairs)
+    assert all(face in b.face for _, face in pairs)
+    b.transform(Translation.from_vector([5, 0, 0]))
+    assert AABBTree.from_mesh(a).intersection_candidates(AABBTree.from_mesh(b)) == []
+
+
+def test_intersection_ray_mesh_plugin():
+    box = Box(2.0)
+    hits = intersection_ray_mesh(([0.5, 0.5, 5], [0, 0, -1]), box.to_vertices_and_faces())
+    assert [round(t, 6) for _, _, _, t in hits] == [4.0, 6.0]
+
+
+def test_intersection_ray_mesh_plugin_distance():
+    box = Box(2.0)
+    # a non-unit direction through the diagonals of the triangulated top and bottom faces
+    hits = intersection_ray_mesh(([0, 0, 5], [0, 0, -2]), box.to_vertices_and_faces(triangulated=True))
+    assert [round(t, 6) for _, _, _, t in hits] == [4.0, 6.0]
+    # a ray through the edges shared by the faces of the box
+    hits = intersection_ray_mesh(([2, 0, 2], [-3, 0, -3]), box.to_vertices_and_faces(triangulated=True))
+    assert [round(t, 6) for _, _, _, t in hits] == [round(2**0.5, 6), round(3 * 2**0.5, 6)]
+    with pytest.raises(ValueError):
+        intersection_ray_mesh(([0, 0, 5], [0, 0, 0]), box.to_vertices_and_faces())
+
+
+def test_intersection_mesh_mesh_plugin():
+    a = Box(2.0).to_vertices_and_faces(triangulated=True)
+    b = Box(2.0, 2.0, 1.0)
+    b.transform(Translation.from_vector([0.5, 0.5, 1.0]))
+    polylines = intersection_mesh_mesh(a, b.to_vertices_and_faces(triangulated=True))
+    assert len(polylines) == 1
+    polyline = polylines[0]
+    assert TOL.is_allclose(polyline[0], polyline[-1])
+    for point in polyline:
+        assert 0.5 - 1e-9 <= point[2] <= 1.0 + 1e-9
+        assert -0.5 - 1e-9 <= point[0] <= 1.0 + 1e-9
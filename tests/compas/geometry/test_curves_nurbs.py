@@ -0,0 +1,131 @@
+import pytest
+import json
+import compas
+
+from compas.tolerance import TOL
+from compas.geometry import Circle
+from compas.geometry import Line
+from compas.geometry import NurbsCurve
+from compas.geometry import Translation
+from compas.itertools import linspace
+
+
+# =============================================================================
+# Constructors
+# =============================================================================
+
+
+def test_nurbscurve_from_line():
+    curve = NurbsCurve.from_line(Line([0, 0, 0], [1, 2, 3]))
+
+    assert curve.degree == 1
+    assert curve.domain == (0.0, 1.0)
+    assert TOL.is_allclose(curve.point_at(0.0), [0, 0, 0])
+    assert TOL.is_allclose(curve.point_at(0.5), [0.5, 1, 1.5])
+    assert TOL.is_allclose(curve.point_at(1.0), [1, 2, 3])
+    assert curve.normal_at(0.5) is None
+
+
+def test_nurbscurve_from_points():
+    points = [[0, 0, 0], [1, 1, 0], [2, -1, 0], [3, 0, 1], [4, 1, 0]]
+    curve = NurbsCurve.from_points(points)
+
+    assert curve.degree == 3
+    assert curve.knotvector == [0.0, 0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0, 1.0]
+    assert not curve.is_rational
+    assert TOL.is_allclose(curve.point_at(0.0), points[0])
+    assert TOL.is_allclose(curve.point_at(1.0), points[-1])
+
+    with pytest.raises(ValueError):
+        curve.point_at(1.5)
+
+
+def test_nurbscurve_periodic():
+    with pytest.raises(NotImplementedError):
+        NurbsCurve.__from_data__(
+            {
+                "points": [[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                "weights": [1, 1, 1],
+                "knots": [0, 1],
+                "multiplicities": [3, 3],
+                "degree": 2,
+                "is_periodic": True,
+            }
+        )
+
+
+# =============================================================================
+# Data
+# =============================================================================
+
+
+def test_nurbscurve_data():
+    curve = NurbsCurve.from_circle(Circle(1.0))
+    other = NurbsCurve.__from_data__(json.loads(json.dumps(curve.__data__)))
+
+    assert curve.points == other.points
+    assert curve.weights == other.weights
+    assert curve.knots == other.knots
+    assert curve.multiplicities == other.multiplicities
+    assert curve.degree == other.degree
+
+    if not compas.IPY:
+        assert NurbsCurve.validate_data(curve.__data__)
+
+
+# =============================================================================
+# Evaluation
+# =============================================================================
+
+
+def test_nurbscurve_circle():
+    curve = NurbsCurve.from_circle(Circle(2.0))
+
+    assert curve.is_rational
+    assert curve.is_closed
+
+    for t in linspace(0, 1, 33):
+        point = curve.point_at(t)
+        assert TOL.is_close(point.distance_to_point([0, 0, 0]), 2.0)
+        assert TOL.is_close(curve.curvature_at(t).length, 0.5)
+        assert TOL.is_close(curve.tangent_at(t).dot(point), 0.0)
+        assert TOL.is_allclose(curve.normal_at(t), point.scaled(-0.5))
+
+    frame = curve.frame_at(0.25)
+    assert TOL.is_allclose(frame.point, curve.point_at(0.25))
+    assert TOL.is_allclose(frame.xaxis, curve.tangent_at(0.25))
+
+
+def test_nurbscurve_derivatives():
+    curve = NurbsCurve.from_points([[0, 0, 0], [1, 2, 0], [3, -1, 1], [4, 1, 0], [5, 0, 2]], degree=2)
+    h = 1e-6
+    for t in [0.1, 0.4, 0.6, 0.9]:
+        point, d1, d2, d3 = curve.derivatives_at(t, 3)
+        a = curve.point_at(t - h)
+        b = curve.point_at(t + h)
+        assert TOL.is_allclose(point, curve.point_at(t))
+        assert TOL.is_allclose(d1, (b - a) * (0.5 / h), atol=1e-5)
+        # the third derivative of a quadratic curve is zero
+        assert TOL.is_allclose(d3, [0, 0, 0])
+
+
+def test_nurbscurve_to_points():
+    curve = NurbsCurve.from_circle(Circle(1.0))
+    points = curve.to_points(n=101)
+
+    assert len(points) == 101
+    for point, t in zip(points, linspace(0, 1, 101)):
+        assert TOL.is_allclose(point, curve.point_at(t))
+
+    polyline = curve.to_polyline(n=64)
+    assert len(polyline.points) == 65
+
+
+def test_nurbscurve_transform():
+    curve = NurbsCurve.from_points([[0, 0, 0], [1, 1, 0], [2, -1, 0], [3, 0, 1]])
+    before = curve.to_points(n=5)
+    curve.transform(Translation.from_vector([0, 0, 1]))
+    after = curve.to_points(n=5)
+
+    for a, b in zip(before, after):
+        assert TOL.is_allclose(b - a, [0, 0, 1])
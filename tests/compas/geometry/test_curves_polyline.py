@@ -43,6 +43,16 @@ def test_polyline_data():
         assert Polyline.validate_data(other.__data__)
 
 
+def test_polyline_copy():
+    curve = Polyline([[0, 0, 0], [1, 0, 0]])
+    other = curve.copy()
+
+    assert other.points == curve.points
+    other[0] = [1, 1, 1]
+    other.points[1].x = 2
+    assert curve.points == [[0, 0, 0], [1, 0, 0]]
+
+
 # =============================================================================
 # Constructors
 # =============================================================================
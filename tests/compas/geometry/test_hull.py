@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+import compas
+from compas.geometry import Pointcloud
+from compas.geometry import convex_hull
+from compas.geometry import cross_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import subtract_vectors
+
+HULL_FUNCTIONS = [convex_hull]
+
+if not compas.IPY:
+    from compas.geometry import quickhull_numpy
+
+    HULL_FUNCTIONS.append(quickhull_numpy)
+
+
+def assert_is_hull(points, faces):
+    # every directed edge has an opposite edge, and no point is outside of any face
+    edges = set((face[i - 1], face[i]) for face in faces for i in range(3))
+    assert len(edges) == 3 * len(faces)
+    assert all((v, u) in edges for u, v in edges)
+    for face in faces:
+        a, b, c = [points[i] for i in face]
+        normal = cross_vectors(subtract_vectors(b, a), subtract_vectors(c, a))
+        assert all(dot_vectors(normal, subtract_vectors(point, a)) <= 1e-9 for point in points)
+
+
+@pytest.mark.parametrize("hull", HULL_FUNCTIONS)
+def test_convex_hull_cube(hull):
+    points = [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)] + [[0.5, 0.5, 0.5], [0.5, 0.5, 0.0]]
+    faces = hull(points)
+    assert len(faces) == 12
+    assert set(index for face in faces for index in face) == set(range(8))
+    assert_is_hull(points, faces)
+
+
+@pytest.mark.parametrize("hull", HULL_FUNCTIONS)
+def test_convex_hull_cloud(hull):
+    points = Pointcloud.from_bounds(10, 5, 3, 500).points
+    assert_is_hull(points, hull(points))
+
+
+@pytest.mark.parametrize("hull", HULL_FUNCTIONS)
+def test_convex_hull_sphere(hull):
+    points = []
+    for _ in range(200):
+        vector = [random.gauss(0, 1) for _ in range(3)]
+        length = sum(x**2 for x in vector) ** 0.5
+        points.append([x / length for x in vector])
+    faces = hull(points)
+    assert len(faces) == 2 * len(points) - 4
+    assert_is_hull(points, faces)
+
+
+@pytest.mark.parametrize("hull", HULL_FUNCTIONS)
+@pytest.mark.parametrize(
+    "points",
+    [
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+        [[1, 2, 3]] * 5,
+        [[0, 0, 0], [1, 1, 1], [2, 2, 2], [3, 3, 3]],
+    ],
+)
+def test_convex_hull_degenerate(hull, points):
+    with pytest.raises(ValueError):
+        hull(points)
+
+
+@pytest.mark.skipif(compas.IPY, reason="numpy is not available in IronPython")
+def test_quickhull_numpy_without_scipy(monkeypatch):
+    import importlib.util
+    import os
+    import sys
+
+    import compas.geometry
+
+    # the module is loaded from its file with scipy made unimportable
+    monkeypatch.setitem(sys.modules, "scipy", None)
+    path = os.path.join(os.path.dirname(compas.geometry.__file__), "quickhull_numpy.py")
+    spec = importlib.util.spec_from_file_location("quickhull_numpy_without_scipy", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.1, 0.1, 0.1]]
+    assert len(module.quickhull_numpy(points)) == 4
@@ -0,0 +1,59 @@
+import compas
+
+if not compas.IPY:
+    import numpy as np
+    import pytest
+
+    from compas.geometry import Rotation
+    from compas.geometry import Translation
+    from compas.geometry import icp_numpy
+    from compas.geometry.icp_numpy import voxel_downsample_numpy
+
+    def surface(n, seed):
+        random = np.random.RandomState(seed)
+        xy = random.uniform(-5, 5, (n, 2))
+        z = np.sin(xy[:, 0]) * np.cos(0.7 * xy[:, 1]) + 0.3 * xy[:, 0]
+        return np.column_stack([2 * xy[:, 0], xy[:, 1], z])
+
+    @pytest.fixture
+    def clouds():
+        T = Translation.from_vector([0.3, -0.2, 0.1]) * Rotation.from_axis_and_angle([0.2, 0.3, 1.0], 0.08)
+        T = np.asarray(T.matrix)
+        target = surface(5000, 0)
+        source = surface(5000, 1).dot(T[:3, :3].T) + T[:3, 3]
+        source[:100] += np.random.RandomState(2).normal(0, 3, (100, 3))
+        return source, target, np.linalg.inv(T)
+
+    def test_icp_numpy_identical():
+        target = surface(1000, 0)
+        T = np.asarray((Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], 0.1)).matrix)
+        source = target.dot(T[:3, :3].T) + T[:3, 3]
+        points, X = icp_numpy(source, target)
+        assert np.allclose(points, target)
+        assert np.allclose(X, np.linalg.inv(T))
+
+    def test_icp_numpy_point_to_plane(clouds):
+        source, target, expected = clouds
+        stats = []
+        points, X = icp_numpy(source, target, voxelsize=[0.5, None], samples=2000, method="point-to-plane", reject=95, callback=stats.append, seed=0)
+        assert np.abs(X - expected).max() < 1e-2
+        assert stats[-1]["level"] == 1
+        assert stats[-1]["matches"] <= 2000
+        assert stats[-1]["rmse"] < stats[0]["rmse"]
+        assert all(stat["time"] >= 0 for stat in stats)
+
+    def test_icp_numpy_maxdistance(clouds):
+        source, target, expected = clouds
+        points, X = icp_numpy(source, target, method="point-to-plane", maxdistance=0.5, seed=0)
+        assert np.abs(X - expected).max() < 1e-2
+
+    def test_icp_numpy_method():
+        with pytest.raises(ValueError):
+            icp_numpy(surface(10, 0), surface(10, 1), method="point-to-line")
+
+    def test_voxel_downsample_numpy():
+        points = surface(5000, 0)
+        centroids = voxel_downsample_numpy(points, 1.0)
+        assert len(centroids) < len(points)
+        assert np.allclose(centroids.min(axis=0), points.min(axis=0), atol=1.0)
+        assert np.allclose(centroids.max(axis=0), points.max(axis=0), atol=1.0)
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def cloud(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(KDTree, "NUMPY_THRESHOLD", 0)
+    else:
+        monkeypatch.setattr(KDTree, "NUMPY_THRESHOLD", float("inf"))
+    random.seed(0)
+    points = [[random.uniform(0, 10), random.uniform(0, 10), random.uniform(0, 1)] for _ in range(500)]
+    return points, KDTree(points)
+
+
+def _brute_force(points, point):
+    return sorted((distance_point_point(point, other), index) for index, other in enumerate(points))
+
+
+def test_kdtree_nearest_neighbor(cloud):
+    points, tree = cloud
+    assert len(tree) == len(points)
+    for point in [[5, 5, 0.5], [-1, 11, 3], points[10]]:
+        xyz, index, distance = tree.nearest_neighbor(point)
+        expected, i = _brute_force(points, point)[0]
+        assert index == i
+        assert xyz is points[i]
+        assert distance == pytest.approx(expected)
+
+
+def test_kdtree_nearest_neighbor_exclude(cloud):
+    points, tree = cloud
+    _, index, distance = tree.nearest_neighbor(points[10], exclude=[10])
+    assert index != 10
+    assert distance == pytest.approx(_brute_force(points, points[10])[1][0])
+
+
+def test_kdtree_nearest_neighbors(cloud):
+    points, tree = cloud
+    point = [3, 7, 0.5]
+    nnbrs = tree.nearest_neighbors(point, 12)
+    expected = _brute_force(points, point)[:12]
+    assert [index for _, index, _ in nnbrs] == [index for _, index in expected]
+    assert [d for _, _, d in nnbrs] == pytest.approx([d for d, _ in expected])
+
+
+def test_kdtree_nearest_neighbors_batch(cloud):
+    points, tree = cloud
+    batch = tree.nearest_neighbors_batch(points[:20], 5)
+    assert batch == [tree.nearest_neighbors(point, 5) for point in points[:20]]
+    assert all(nnbrs[0][1] == index for index, nnbrs in enumerate(batch))
+
+
+def test_kdtree_radius_neighbors(cloud):
+    points, tree = cloud
+    point = [5, 5, 0.5]
+    nbrs = tree.radius_neighbors(point, 1.5, distance_sort=True)
+    expected = [(d, index) for d, index in _brute_force(points, point) if d <= 1.5]
+    assert [index for _, index, _ in nbrs] == [index for _, index in expected]
+    assert tree.radius_neighbors_batch([point], 1.5, distance_sort=True) == [nbrs]
+
+
+def test_kdtree_empty():
+    tree = KDTree()
+    assert tree.nearest_neighbor([0, 0, 0]) == [None, None, float("inf")]
+    assert tree.nearest_neighbors([0, 0, 0], 3) == []
+    assert tree.radius_neighbors([0, 0, 0], 1.0) == []
@@ -38,6 +38,15 @@ def test_pointcloud_data():
         assert Pointcloud.validate_data(other.__data__)
 
 
+def test_pointcloud_copy():
+    pointcloud = Pointcloud.from_bounds(10, 10, 10, 10)
+    other = pointcloud.copy()
+
+    assert other == pointcloud
+    other.points[0].x = -1.0
+    assert pointcloud.points[0].x != -1.0
+
+
 def test_pointcloud__eq__():
     a = Pointcloud.from_bounds(10, 10, 10, 10)
     points = a.points[:]
@@ -54,3 +63,21 @@ def test_pointcloud__neq__():
     assert a != b
     b = Pointcloud.from_bounds(10, 10, 10, 10)
     assert a != b
+
+
+def test_pointcloud_closest_point_after_transform():
+    from compas.geometry import Translation
+    from compas.geometry import transform_many
+
+    cloud = Pointcloud([[0, 0, 0], [10, 0, 0]])
+    assert cloud.closest_point([1, 0, 0]) == Point(0, 0, 0)
+
+    T = Translation.from_vector([100, 0, 0])
+    cloud.transform(T)
+    assert cloud.closest_point([101, 0, 0]) == Point(100, 0, 0)
+
+    transform_many([cloud], T)
+    assert cloud.closest_point([201, 0, 0]) == Point(200, 0, 0)
+
+    cloud[0] = [300, 0, 0]
+    assert cloud.closest_point([299, 0, 0]) == Point(300, 0, 0)
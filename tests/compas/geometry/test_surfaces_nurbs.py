@@ -0,0 +1,90 @@
+import json
+from itertools import product
+
+from compas.tolerance import TOL
+from compas.geometry import NurbsSurface
+from compas.geometry import Translation
+
+
+def sphere_octant():
+    # a rational biquadratic patch on the unit sphere
+    w = 0.5 * 2**0.5
+    points = [
+        [[1, 0, 0], [1, 0, 1], [0, 0, 1]],
+        [[1, 1, 0], [1, 1, 1], [0, 0, 1]],
+        [[0, 1, 0], [0, 1, 1], [0, 0, 1]],
+    ]
+    weights = [
+        [1, w, 1],
+        [w, 0.5, w],
+        [1, w, 1],
+    ]
+    return NurbsSurface.from_parameters(points, weights, [0, 1], [0, 1], [3, 3], [3, 3], 2, 2)
+
+
+def test_nurbssurface_from_meshgrid():
+    surface = NurbsSurface.from_meshgrid(nu=5, nv=6)
+
+    assert surface.degree_u == 3
+    assert surface.degree_v == 3
+    assert surface.domain_u == (0.0, 1.0)
+    assert surface.domain_v == (0.0, 1.0)
+    assert TOL.is_allclose(surface.point_at(0.5, 0.5), [2.5, 3.0, 0.0])
+    assert TOL.is_allclose(surface.normal_at(0.3, 0.6), [0, 0, -1])
+
+
+def test_nurbssurface_data():
+    surface = sphere_octant()
+    other = NurbsSurface.__from_data__(json.loads(json.dumps(surface.__data__)))
+
+    assert other.weights == surface.weights
+    assert TOL.is_allclose(other.point_at(0.3, 0.7), surface.point_at(0.3, 0.7))
+
+
+def test_nurbssurface_sphere():
+    surface = sphere_octant()
+
+    for u, v in product(surface.space_u(7), surface.space_v(7)):
+        point = surface.point_at(u, v)
+        assert TOL.is_close(point.distance_to_point([0, 0, 0]), 1.0)
+
+    frame = surface.frame_at(0.5, 0.5)
+    assert TOL.is_allclose(frame.zaxis, frame.point)
+    assert TOL.is_allclose(surface.normal_at(0.5, 0.5), frame.zaxis)
+
+
+def test_nurbssurface_derivatives():
+    surface = sphere_octant()
+    h = 1e-6
+    u, v = 0.3, 0.6
+    point, du, dv = surface.derivatives_at(u, v)
+
+    assert TOL.is_allclose(point, surface.point_at(u, v))
+    assert TOL.is_allclose(du, (surface.point_at(u + h, v) - surface.point_at(u - h, v)) * (0.5 / h), atol=1e-5)
+    assert TOL.is_allclose(dv, (surface.point_at(u, v + h) - surface.point_at(u, v - h)) * (0.5 / h), atol=1e-5)
+
+
+def test_nurbssurface_pointgrid():
+    surface = sphere_octant()
+    points = surface.pointgrid(nu=5, nv=8)
+
+    assert len(points) == 40
+    for point, (u, v) in zip(points, product(surface.space_u(5), surface.space_v(8))):
+        assert TOL.is_allclose(point, surface.point_at(u, v))
+
+
+def test_nurbssurface_to_vertices_and_faces():
+    surface = NurbsSurface.from_meshgrid(nu=4, nv=4)
+    vertices, faces = surface.to_vertices_and_faces(nu=8, nv=4)
+
+    assert len(vertices) == 9 * 5
+    assert len(faces) == 8 * 4
+    assert TOL.is_allclose(vertices[faces[-1][2]], surface.point_at(1.0, 1.0))
+
+
+def test_nurbssurface_transform():
+    surface = sphere_octant()
+    point = surface.point_at(0.2, 0.4)
+    surface.transform(Translation.from_vector([1, 2, 3]))
+
+    assert TOL.is_allclose(surface.point_at(0.2, 0.4), point + [1, 2, 3])
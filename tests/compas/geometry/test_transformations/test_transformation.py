@@ -178,3 +178,43 @@ def test___eq__():
     assert not (i1 != i2)
     assert i1 != t
     assert not (i1 == t)
+
+
+def test_affine_cache():
+    T = Translation.from_vector([1, 2, 3])
+    assert T.affine == (1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 2.0, 0.0, 0.0, 1.0, 3.0)
+    T[0, 3] = 4
+    assert T.affine[3] == 4.0
+    T.matrix = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0.5, 1]]
+    assert T.affine is None
+
+
+def test_apply_to():
+    from compas.geometry import Circle
+    from compas.geometry import Line
+    from compas.geometry import Plane
+    from compas.geometry import Point
+    from compas.geometry import Polygon
+    from compas.geometry import Polyline
+
+    objects = [
+        Point(1, 2, 3),
+        Vector(1, 0, 0),
+        Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15]),
+        Plane([1, 2, 3], [0, 1, 1]),
+        Polyline([[0, 0, 0], [1, 0, 0], [1, 1, 0]]),
+        Polygon([[0, 0, 0], [1, 0, 0], [1, 1, 0]]),
+        Line([0, 0, 0], [1, 0, 0]),
+        Circle(1.0),
+    ]
+    transformations = [
+        Rotation.from_axis_and_angle([1, 2, 3], 0.7) * Translation.from_vector([1, 2, 3]) * Scale.from_factors([2, 2, 2]),
+        Scale.from_factors([1, 2, 3]),
+        Transformation([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0.5, 1]]),
+    ]
+    for T in transformations:
+        expected = [obj.transformed(T) for obj in objects]
+        result = [obj.copy() for obj in objects]
+        T.apply_to(result)
+        for a, b in zip(result, expected):
+            assert a == b
@@ -1,7 +1,18 @@
 # import os
+import time
+
+import pytest
+
+try:
+    from xmlrpclib import ServerProxy
+except ImportError:
+    from xmlrpc.client import ServerProxy
 
 from compas.tolerance import TOL
 from compas.rpc import Proxy
+from compas.rpc import RPCHandle
+from compas.rpc import RPCServerError
+from compas.rpc.handles import HandleStore
 
 
 def test_basic_rpc_call():
@@ -17,3 +28,188 @@ def test_switch_package():
         r = proxy.inv(A)
 
     assert TOL.is_allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+def test_concurrent_calls():
+    with Proxy("time", python="python", port=1754, workers=4, autoreload=False) as proxy:
+        start = time.time()
+        futures = [proxy.submit("sleep", 0.5) for _ in range(4)]
+        # the server stays responsive while the calls are executed
+        assert ServerProxy(proxy.address).ping() == 1
+        assert [future.result(timeout=10) for future in futures] == [None] * 4
+        assert time.time() - start < 1.5
+
+
+def test_concurrent_calls_process_pool():
+    with Proxy("numpy", python="python", port=1755, workers=2, executor="process") as proxy:
+        futures = [proxy.submit("arange", n) for n in range(5)]
+        assert [future.result(timeout=10) for future in futures] == [list(range(n)) for n in range(5)]
+        assert proxy.arange(3) == [0, 1, 2]
+
+
+def test_submit_error():
+    with Proxy("numpy", python="python", port=1756, workers=2) as proxy:
+        future = proxy.submit("not_a_function")
+        with pytest.raises(RPCServerError):
+            future.result(timeout=10)
+        assert future.done()
+
+
+def test_batch():
+    with Proxy("numpy", python="python", port=1757) as proxy:
+        with proxy.batch() as batch:
+            a = batch.arange(5)
+            b = batch.not_a_function()
+            c = batch.call("linspace", 0, 1, num=3)
+            assert len(batch) == 3
+
+        assert a.result() == [0, 1, 2, 3, 4]
+        assert isinstance(b.exception(), RPCServerError)
+        assert c.result() == [0.0, 0.5, 1.0]
+
+        assert proxy.map("arange", range(4)) == [list(range(n)) for n in range(4)]
+        with pytest.raises(RPCServerError):
+            proxy.map("not_a_function", range(4))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_batch_parallel(executor):
+    with Proxy("numpy", python="python", port=1758, workers=2, executor=executor) as proxy:
+        results = proxy.map("full", [2, 3, 4], [1, 2, 3], parallel=True)
+        assert results == [[1, 1], [2, 2, 2], [3, 3, 3, 3]]
+
+
+@pytest.mark.parametrize("shared_memory", [False, True])
+def test_binary_transport(shared_memory):
+    with Proxy("numpy", python="python", port=1759, transport="binary", shared_memory=shared_memory) as proxy:
+        assert proxy.arange(20) == list(range(20))
+
+        A = proxy.ones([600, 600])
+        assert len(A) == 600
+        assert proxy.sum(A) == 360000
+
+        with pytest.raises(RPCServerError):
+            proxy.not_a_function()
+
+        assert proxy.map("arange", range(3)) == [[], [0], [0, 1]]
+        assert proxy.submit("arange", 3).result(timeout=10) == [0, 1, 2]
+
+
+def test_binary_transport_arrays():
+    np = pytest.importorskip("numpy")
+    with Proxy("numpy", python="python", port=1761, transport="binary", arrays=True, workers=2, executor="process") as proxy:
+        A = proxy.eye(3)
+        assert isinstance(A, np.ndarray)
+        assert np.allclose(A, np.eye(3))
+        assert proxy.trace(A) == 3.0
+
+
+@pytest.mark.parametrize(
+    "transport, workers, executor",
+    [
+        ("xmlrpc", None, None),
+        ("xmlrpc", 2, "process"),
+        ("binary", None, None),
+    ],
+)
+def test_handles(transport, workers, executor):
+    with Proxy("numpy", python="python", port=1763, transport=transport, workers=workers, executor=executor) as proxy:
+        a = proxy.keep("zeros", [3])
+        assert isinstance(a, RPCHandle)
+        assert a.typename == "ndarray"
+
+        # the object of the handle is modified in place on the server
+        proxy.copyto(a, [1, 2, 3])
+        assert proxy.fetch(a) == [1, 2, 3]
+        assert proxy.dot(a, a) == 14
+
+        b = proxy.put([4, 5, 6])
+        assert proxy.fetch(b) == [4, 5, 6]
+        assert proxy.dot(a, b) == 32
+
+        with proxy.batch() as batch:
+            c = batch.dot(a, b)
+        assert c.result() == 32
+
+        assert proxy.release(a, b) == 2
+        assert proxy.release(a) == 0
+        with pytest.raises(RPCServerError):
+            proxy.fetch(a)
+
+
+def test_handle_store_eviction():
+    store = HandleStore()
+    a = store.add(list(range(1000)))
+    b = store.add(list(range(1000)))
+    assert len(store) == 2
+    assert store.size == a.size + b.size
+
+    # there is room for two of the three objects
+    store.maxsize = 2.5 * a.size
+
+    # a is used more recently than b
+    store.get(a.id)
+    c = store.add(list(range(1000)))
+    assert a.id in store
+    assert b.id not in store
+    assert c.id in store
+    assert store.size <= store.maxsize
+
+    with pytest.raises(KeyError):
+        store.get(b.id)
+
+    # the newest object is kept, even if it exceeds the limit
+    d = store.add(list(range(100000)))
+    assert len(store) == 1
+    assert d.id in store
+
+
+def test_binary_shared_message_foreign_path(tmp_path):
+    import os
+    import socket
+    import threading
+
+    from compas.data import binary_dumps
+    from compas.rpc import BinaryServer
+    from compas.rpc.binary import FRAME
+    from compas.rpc.binary import SHARED
+    from compas.rpc.binary import recv_message
+    from compas.rpc.binary import send_message
+
+    foreign = tmp_path / "compas-rpc-foreign.bin"
+    foreign.write_bytes(binary_dumps({"name": "ping"}))
+    payload = str(foreign).encode("utf-8")
+
+    server = BinaryServer(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        sock = socket.create_connection(server.server_address)
+        try:
+            sock.sendall(FRAME.pack(SHARED, len(payload)))
+            sock.sendall(payload)
+            response = recv_message(sock)
+            assert response["data"] is None
+            assert "Refused" in response["error"]
+            assert os.path.exists(str(foreign))
+
+            # the connection can still be used
+            send_message(sock, {"name": "ping"})
+            assert recv_message(sock)["data"] == 1
+        finally:
+            sock.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    a, b = socket.socketpair()
+    try:
+        a.sendall(FRAME.pack(SHARED, len(payload)))
+        a.sendall(payload)
+        with pytest.raises(ValueError):
+            recv_message(b)
+        assert os.path.exists(str(foreign))
+    finally:
+        a.close()
+        b.close()
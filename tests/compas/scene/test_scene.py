@@ -99,3 +99,79 @@ if not compas.IPY:
             sceneobj3.worldtransformation
             == sceneobj1.frame.to_transformation() * sceneobj2.frame.to_transformation() * sceneobj3.frame.to_transformation() * sceneobj3.transformation
         )
+
+    class CountingSceneObject(SceneObject):
+        def __init__(self, **kwargs):
+            super(CountingSceneObject, self).__init__(**kwargs)
+            self.count = 0
+
+        def draw(self):
+            self.count += 1
+            self._guids = [self.name]
+            return self.guids
+
+    @pytest.fixture
+    def counting_scene(monkeypatch):
+        from compas.geometry import Point
+
+        register(Point, CountingSceneObject, context="fake")
+        cleared = []
+        monkeypatch.setattr("compas.scene.scene.clear", lambda guids=None: cleared.extend(guids or []))
+        scene = Scene(context="fake")
+        a = scene.add(Point(0, 0, 0), name="a")
+        b = scene.add(Point(1, 0, 0), name="b", parent=a)
+        c = scene.add(Point(2, 0, 0), name="c")
+        scene.draw()
+        del cleared[:]
+        return scene, a, b, c, cleared
+
+    def test_scene_redraw_unchanged(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        assert scene.redraw() == []
+        assert cleared == []
+        assert [a.count, b.count, c.count] == [1, 1, 1]
+
+    def test_scene_redraw_item_and_settings(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        c.item.x = 5
+        assert scene.redraw() == ["c"]
+        assert cleared == ["c"]
+        b.color = (1.0, 0.0, 0.0)
+        assert scene.redraw() == ["b"]
+        b.show = False
+        assert scene.redraw() == []
+        assert b.guids == []
+        assert [a.count, b.count, c.count] == [1, 2, 2]
+
+    def test_scene_redraw_placement(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        b.worldtransformation
+        a.frame = Frame([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+        assert a.is_dirty and b.is_dirty and not c.is_dirty
+        assert b.worldtransformation == a.frame.to_transformation()
+        assert scene.redraw() == ["a", "b"]
+        assert not a.is_dirty and not b.is_dirty
+        a.frame.point.x = 3.0
+        assert sorted(scene.redraw()) == ["a", "b"]
+        assert b.worldtransformation == a.frame.to_transformation()
+
+    def test_scene_draw_placement(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        a.frame = Frame([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+        assert b.worldtransformation == a.frame.to_transformation()
+        a.frame.point.x = 5.0
+        scene.draw()
+        assert b.worldtransformation == a.frame.to_transformation()
+
+    def test_sceneobject_worldtransformation_copy(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        a.frame = Frame([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+        W = b.worldtransformation
+        W.matrix[0][3] = 999
+        assert b.worldtransformation == a.frame.to_transformation()
+
+    def test_scene_redraw_removed(counting_scene):
+        scene, a, b, c, cleared = counting_scene
+        scene.remove(c)
+        assert scene.redraw() == []
+        assert cleared == ["c"]
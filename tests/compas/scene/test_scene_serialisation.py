@@ -115,3 +115,16 @@ if not compas.IPY:
 
         scene2 = Scene.from_jsonstring(scene1.to_jsonstring())
         assert assert_is_data_equal(scene1, scene2)
+
+    def test_scene_sha256(items):
+        scene1 = Scene()
+        for item in items:
+            scene1.add(item)
+        digest = scene1.sha256()
+
+        scene2 = Scene.from_jsonstring(scene1.to_jsonstring())
+        assert scene2.sha256() == digest
+
+        mesh = items[-3]
+        mesh.vertex_attribute(0, "z", 10.0)
+        assert scene1.sha256() != digest
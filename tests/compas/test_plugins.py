@@ -1,8 +1,13 @@
+import json
+import os
+import sys
 from abc import abstractmethod
 
 import pytest
 
 from compas.plugins import IncompletePluginImplError
+from compas.plugins import LazyPluginImpl
+from compas.plugins import PluginManager
 from compas.plugins import PluginValidator
 
 
@@ -36,3 +41,61 @@ def test_ensure_implementations_fails_with_incomplete_impl():
 
 def test_ensure_implementations_with_valid_impl():
     PluginValidator.ensure_implementations(CompleteImpl)
+
+
+def test_plugin_manifest(tmp_path):
+    url = "https:/plugins.compas.dev/intersections/intersection_ray_mesh"
+
+    manager = PluginManager()
+    manager.cache_path = str(tmp_path / "manifest.json")
+    count = manager.load_plugins()
+    assert os.path.exists(manager.cache_path)
+    method = manager.registry[url][0].method
+
+    cached = PluginManager()
+    cached.cache_path = manager.cache_path
+    assert cached.load_plugins() == count
+    plugin = cached.registry[url][0]
+    assert isinstance(plugin, LazyPluginImpl)
+    assert plugin.method is None
+
+    selected = PluginValidator(cached).select_plugin(url)
+    assert selected is plugin
+    assert plugin.method is method
+
+
+def test_plugin_manifest_invalid(tmp_path):
+    manager = PluginManager()
+    manager.cache_path = str(tmp_path / "manifest.json")
+    manager.load_plugins()
+
+    with open(manager.cache_path, "r") as f:
+        manifest = json.load(f)
+    manifest["files"][0][1] -= 1.0
+    with open(manager.cache_path, "w") as f:
+        json.dump(manifest, f)
+
+    other = PluginManager()
+    other.cache_path = manager.cache_path
+    other.load_plugins()
+    assert not any(isinstance(plugin, LazyPluginImpl) for plugins in other.registry.values() for plugin in plugins)
+
+
+def test_plugin_manifest_invalidate_cache(tmp_path):
+    manager = PluginManager()
+    manager.cache_path = str(tmp_path / "manifest.json")
+    manager.load_plugins()
+    manager.invalidate_cache()
+    assert not os.path.exists(manager.cache_path)
+    assert not manager._discovery_done
+    assert manager.registry
+    assert os.path.exists(manager.cache_path)
+
+
+def test_plugin_manifest_cache_path(monkeypatch):
+    monkeypatch.setattr(sys, "prefix", "/envs/a")
+    a = PluginManager().cache_path
+    monkeypatch.setattr(sys, "prefix", "/envs/b")
+    b = PluginManager().cache_path
+    assert a != b
+    assert os.path.dirname(a) == os.path.dirname(b)
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+import compas
+
+from compas.tolerance import TOL
+
+
+@pytest.mark.parametrize("precision", [3, 1, -1, -3])
+def test_geometric_key_numeric(precision):
+    random.seed(0)
+    points = [[random.uniform(-100, 100) for _ in range(3)] for _ in range(1000)]
+    points += [[0.0, -0.0, -0.0001], [0.0001, 0.0, 0.0]]
+    strings = {}
+    numbers = {}
+    for index, point in enumerate(points):
+        strings.setdefault(TOL.geometric_key(point, precision), []).append(index)
+        numbers.setdefault(TOL.geometric_key_numeric(point, precision), []).append(index)
+    assert sorted(strings.values()) == sorted(numbers.values())
+
+
+@pytest.mark.parametrize("precision", [1, 3, 6])
+def test_geometric_key_numeric_halfway(precision):
+    random.seed(0)
+    step = 10**-precision
+    points = [[round(random.uniform(-100, 100), precision) + 0.5 * step for _ in range(3)] for _ in range(1000)]
+    points += [[0.0025, 2.5005, -0.0005], [0.125, 0.375, -0.625]]
+    points += [[random.uniform(-1e12, 1e12) for _ in range(3)] for _ in range(100)]
+    for point in points:
+        key = TOL.geometric_key(point, precision)
+        assert TOL.geometric_key_numeric(point, precision) == tuple(int(value.replace(".", "")) for value in key.split(","))
+    if not compas.IPY:
+        keys = TOL.geometric_keys_numpy(points, precision)
+        assert [tuple(key) for key in keys.tolist()] == [TOL.geometric_key_numeric(point, precision) for point in points]
+
+
+@pytest.mark.skipif(compas.IPY, reason="numpy is not available on IronPython")
+@pytest.mark.parametrize("precision", [3, -1, -3])
+def test_geometric_keys_numpy(precision):
+    random.seed(0)
+    points = [[random.uniform(-100, 100) for _ in range(3)] for _ in range(1000)]
+    keys = TOL.geometric_keys_numpy(points, precision)
+    assert keys.shape == (1000, 3)
+    assert [tuple(key) for key in keys.tolist()] == [TOL.geometric_key_numeric(point, precision) for point in points]
@@ -2,6 +2,10 @@ from compas.datastructures import Mesh
 from compas.datastructures import Graph
 from compas.geometry import Box, Frame
 from compas.topology import astar_shortest_path
+from compas.topology import dijkstra_distances
+from compas.topology import dijkstra_path
+from compas.topology import dijkstra_shortest_paths
+from compas.topology import path_from_predecessors
 from compas.topology.traversal import astar_lightest_path
 
 
@@ -64,3 +68,72 @@ def test_astar_lightest_path():
     heuristic = {i: 1 for i in range(4)}
     path = astar_lightest_path(g.adjacency, weights, heuristic, 0, 3)
     assert path == [0, 2, 3]
+
+
+def _grid_graph(n):
+    graph = Graph()
+    for i in range(n):
+        for j in range(n):
+            graph.add_node((i, j), x=i, y=j, z=0)
+    for i in range(n):
+        for j in range(n):
+            if i + 1 < n:
+                graph.add_edge((i, j), (i + 1, j))
+            if j + 1 < n:
+                graph.add_edge((i, j), (i, j + 1))
+    weight = {}
+    for u, v in graph.edges():
+        weight[(u, v)] = weight[(v, u)] = 1.0 + 0.1 * ((u[0] * 7 + v[1] * 3) % 5)
+    return graph, weight
+
+
+def test_dijkstra_distances():
+    graph, weight = _grid_graph(6)
+    distances = dijkstra_distances(graph.adjacency, weight, (0, 0))
+    assert distances[(0, 0)] == 0
+    assert distances[(1, 0)] == weight[((0, 0), (1, 0))]
+    # the distances are consistent with the edge weights
+    for u, v in weight:
+        assert distances[v] <= distances[u] + weight[(u, v)] + 1e-12
+
+
+def test_dijkstra_path():
+    graph, weight = _grid_graph(6)
+    distances = dijkstra_distances(graph.adjacency, weight, (5, 5))
+    path = dijkstra_path(graph.adjacency, weight, (0, 0), (5, 5))
+    assert path[0] == (0, 0)
+    assert path[-1] == (5, 5)
+    length = sum(weight[(u, v)] for u, v in zip(path[:-1], path[1:]))
+    assert abs(length - distances[(0, 0)]) < 1e-12
+    assert dijkstra_path(graph.adjacency, weight, (0, 0), (5, 5), dist=distances)[-1] == (5, 5)
+
+
+def test_dijkstra_path_disconnected():
+    adjacency = {0: [1], 1: [0], 2: []}
+    weight = {(0, 1): 1.0, (1, 0): 1.0}
+    assert dijkstra_path(adjacency, weight, 0, 2) is None
+
+
+def test_dijkstra_shortest_paths_multi_source():
+    graph, weight = _grid_graph(6)
+    sources = [(0, 0), (5, 5)]
+    distances, predecessors = dijkstra_shortest_paths(graph.adjacency, weight, sources)
+    assert len(distances) == graph.number_of_nodes()
+    for node in graph.nodes():
+        single = min(dijkstra_distances(graph.adjacency, weight, source)[node] for source in sources)
+        assert abs(distances[node] - single) < 1e-12
+        path = path_from_predecessors(predecessors, node)
+        assert path[0] in sources
+        assert path[-1] == node
+
+    distances, _ = dijkstra_shortest_paths(graph.adjacency, weight, [(0, 0)], targets=[(1, 1)])
+    assert (1, 1) in distances
+    assert len(distances) < graph.number_of_nodes()
+
+
+def test_graph_shortest_path():
+    graph, _ = _grid_graph(4)
+    path = graph.shortest_path((0, 0), (3, 3))
+    assert path[0] == (0, 0)
+    assert path[-1] == (3, 3)
+    assert len(path) == 7